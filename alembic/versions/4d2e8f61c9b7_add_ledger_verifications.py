@@ -0,0 +1,40 @@
+"""add_ledger_verifications
+
+Revision ID: 4d2e8f61c9b7
+Revises: b71c3e9a40d2
+Create Date: 2026-10-16 11:21:03.918442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d2e8f61c9b7'
+down_revision: Union[str, Sequence[str], None] = 'b71c3e9a40d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ledger_verifications (empty: the first verifier run is a full walk)."""
+    op.create_table(
+        "ledger_verifications",
+        sa.Column("bot_id", sa.Integer(), sa.ForeignKey("bots.id"), primary_key=True),
+        sa.Column("verified_sequence", sa.Integer(), nullable=False),
+        sa.Column("verified_hash", sa.String(), nullable=False),
+        sa.Column("verified_balance", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.Column(
+            "verified_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop ledger_verifications."""
+    op.drop_table("ledger_verifications")
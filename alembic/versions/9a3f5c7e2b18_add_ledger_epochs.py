@@ -0,0 +1,41 @@
+"""add_ledger_epochs
+
+Revision ID: 9a3f5c7e2b18
+Revises: 4d2e8f61c9b7
+Create Date: 2026-10-16 12:37:49.106215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3f5c7e2b18'
+down_revision: Union[str, Sequence[str], None] = '4d2e8f61c9b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ledger_epochs (empty: the anchor job seals existing history)."""
+    op.create_table(
+        "ledger_epochs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("first_ledger_id", sa.Integer(), nullable=False),
+        sa.Column("last_ledger_id", sa.Integer(), nullable=False, unique=True),
+        sa.Column("leaf_count", sa.Integer(), nullable=False),
+        sa.Column("merkle_root", sa.String(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop ledger_epochs."""
+    op.drop_table("ledger_epochs")
@@ -0,0 +1,65 @@
+"""ledger_balance_after_and_checkpoints
+
+Revision ID: b71c3e9a40d2
+Revises: e934146a15ae
+Create Date: 2026-10-16 10:04:17.552903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71c3e9a40d2'
+down_revision: Union[str, Sequence[str], None] = 'e934146a15ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add ledger.balance_after and ledger_checkpoints, seeded from ledger_heads.
+
+    Existing rows keep balance_after NULL: their hashes were computed without
+    it, so backfilling would not change what verifiers can prove.
+    """
+    op.add_column(
+        "ledger",
+        sa.Column("balance_after", sa.Numeric(precision=18, scale=8), nullable=True),
+    )
+    op.create_table(
+        "ledger_checkpoints",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("bot_id", sa.Integer(), sa.ForeignKey("bots.id"), nullable=False),
+        sa.Column("sequence", sa.Integer(), nullable=False),
+        sa.Column("hash", sa.String(), nullable=False),
+        sa.Column("balance", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.UniqueConstraint("bot_id", "sequence", name="uq_ledger_checkpoint_bot_sequence"),
+    )
+    op.create_index(
+        op.f("ix_ledger_checkpoints_bot_id"), "ledger_checkpoints", ["bot_id"], unique=False
+    )
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO ledger_checkpoints (bot_id, sequence, hash, balance)
+            SELECT bot_id, last_sequence, last_hash, balance
+            FROM ledger_heads
+            WHERE last_sequence > 0
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    """Drop ledger_checkpoints and ledger.balance_after."""
+    op.drop_index(op.f("ix_ledger_checkpoints_bot_id"), table_name="ledger_checkpoints")
+    op.drop_table("ledger_checkpoints")
+    op.drop_column("ledger", "balance_after")
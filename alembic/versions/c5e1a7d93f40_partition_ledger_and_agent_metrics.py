@@ -0,0 +1,187 @@
+"""partition_ledger_and_agent_metrics
+
+Revision ID: c5e1a7d93f40
+Revises: 9a3f5c7e2b18
+Create Date: 2026-10-16 14:02:31.774519
+
+Rebuilds ``ledger`` as HASH (bot_id) and ``agent_metrics`` as monthly
+RANGE (created_at) partitioned tables (Postgres only). Each table is built
+alongside the old one, filled with INSERT ... SELECT, then swapped in; the
+id sequences are kept. agent_metrics → ledger loses its foreign key because
+ledger.id alone is no longer a unique key.
+
+agent_metrics was previously only created by create_all; if it is missing
+it is created partitioned here.
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1a7d93f40'
+down_revision: Union[str, Sequence[str], None] = '9a3f5c7e2b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copies of the ``info`` partition specs of models.Ledger / AgentMetricsEntry.
+LEDGER_MODULUS = 16
+MONTHS_AHEAD = 3
+
+LEDGER_COLUMNS = (
+    "id, bot_id, amount, transaction_type, reference_id, previous_hash, "
+    "hash, sequence, timestamp, balance_after"
+)
+METRICS_COLUMNS = (
+    "id, bot_id, ledger_id, tick_id, enforcement_mode, tick_outcome, "
+    "phantom_entropy_fee, would_have_been_liquidated, balance_snapshot, "
+    "metrics_json, created_at"
+)
+
+
+def _add_months(month: date, n: int) -> date:
+    idx = month.year * 12 + (month.month - 1) + n
+    return date(idx // 12, idx % 12 + 1, 1)
+
+
+def _serial_sequence(conn, table: str) -> str:
+    return conn.execute(sa.text(f"SELECT pg_get_serial_sequence('{table}', 'id')")).scalar()
+
+
+def _swap(conn, table: str, new: str) -> None:
+    """Move the id sequence to ``new``, drop ``table`` and rename ``new`` over it."""
+    seq = _serial_sequence(conn, table)
+    op.execute(f"ALTER TABLE {new} ALTER COLUMN id SET DEFAULT nextval('{seq}'::regclass)")
+    op.execute(f"ALTER SEQUENCE {seq} OWNED BY {new}.id")
+    op.execute(f"DROP TABLE {table} CASCADE")
+    op.execute(f"ALTER TABLE {new} RENAME TO {table}")
+
+
+def _upgrade_ledger(conn) -> None:
+    op.execute(f"""
+        CREATE TABLE ledger_partitioned (
+            id INTEGER NOT NULL,
+            bot_id INTEGER NOT NULL REFERENCES bots(id),
+            amount NUMERIC(18, 8) NOT NULL,
+            transaction_type VARCHAR NOT NULL,
+            reference_id VARCHAR NOT NULL,
+            previous_hash VARCHAR NOT NULL,
+            hash VARCHAR NOT NULL,
+            sequence INTEGER NOT NULL,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            balance_after NUMERIC(18, 8),
+            CONSTRAINT ledger_partitioned_pkey PRIMARY KEY (id, bot_id),
+            CONSTRAINT uq_ledger_partitioned_bot_sequence UNIQUE (bot_id, sequence)
+        ) PARTITION BY HASH (bot_id)
+    """)
+    for r in range(LEDGER_MODULUS):
+        op.execute(
+            f"CREATE TABLE ledger_p{r:02d} PARTITION OF ledger_partitioned "
+            f"FOR VALUES WITH (MODULUS {LEDGER_MODULUS}, REMAINDER {r})"
+        )
+    op.execute(f"INSERT INTO ledger_partitioned ({LEDGER_COLUMNS}) SELECT {LEDGER_COLUMNS} FROM ledger")
+    _swap(conn, "ledger", "ledger_partitioned")
+    op.execute("ALTER TABLE ledger RENAME CONSTRAINT ledger_partitioned_pkey TO ledger_pkey")
+    op.execute("ALTER TABLE ledger RENAME CONSTRAINT uq_ledger_partitioned_bot_sequence TO uq_ledger_bot_sequence")
+    op.execute("CREATE INDEX ix_ledger_id ON ledger (id)")
+    op.execute("CREATE INDEX ix_ledger_bot_id ON ledger (bot_id)")
+
+
+def _upgrade_agent_metrics(conn) -> None:
+    exists = sa.inspect(conn).has_table("agent_metrics")
+    if not exists:
+        op.execute("CREATE SEQUENCE agent_metrics_id_seq")
+
+    op.execute("""
+        CREATE TABLE agent_metrics_partitioned (
+            id INTEGER NOT NULL DEFAULT nextval('agent_metrics_id_seq'::regclass),
+            bot_id INTEGER NOT NULL REFERENCES bots(id),
+            ledger_id INTEGER,
+            tick_id VARCHAR NOT NULL,
+            enforcement_mode VARCHAR NOT NULL,
+            tick_outcome VARCHAR NOT NULL,
+            phantom_entropy_fee NUMERIC(18, 8) NOT NULL,
+            would_have_been_liquidated BOOLEAN NOT NULL,
+            balance_snapshot NUMERIC(18, 8) NOT NULL,
+            metrics_json JSONB,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT agent_metrics_partitioned_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("CREATE TABLE agent_metrics_default PARTITION OF agent_metrics_partitioned DEFAULT")
+
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    first = this_month
+    if exists:
+        oldest = conn.execute(sa.text("SELECT min(created_at) FROM agent_metrics")).scalar()
+        if oldest is not None:
+            first = min(first, oldest.date().replace(day=1))
+    month = first
+    while month <= _add_months(this_month, MONTHS_AHEAD):
+        nxt = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE agent_metrics_y{month.year:04d}m{month.month:02d} "
+            f"PARTITION OF agent_metrics_partitioned "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{nxt.isoformat()}')"
+        )
+        month = nxt
+
+    if exists:
+        op.execute(
+            f"INSERT INTO agent_metrics_partitioned ({METRICS_COLUMNS}) "
+            f"SELECT {METRICS_COLUMNS} FROM agent_metrics"
+        )
+        _swap(conn, "agent_metrics", "agent_metrics_partitioned")
+    else:
+        op.execute("ALTER TABLE agent_metrics_partitioned RENAME TO agent_metrics")
+        op.execute("ALTER SEQUENCE agent_metrics_id_seq OWNED BY agent_metrics.id")
+
+    op.execute("ALTER TABLE agent_metrics RENAME CONSTRAINT agent_metrics_partitioned_pkey TO agent_metrics_pkey")
+    op.execute("CREATE INDEX ix_agent_metrics_bot_id ON agent_metrics (bot_id)")
+    op.execute("CREATE INDEX ix_agent_metrics_ledger_id ON agent_metrics (ledger_id)")
+    op.execute("CREATE INDEX ix_agent_metrics_tick_id ON agent_metrics (tick_id)")
+    op.execute("CREATE INDEX ix_agent_metrics_bot_id_created_at ON agent_metrics (bot_id, created_at)")
+
+
+def upgrade() -> None:
+    """Partition ledger and agent_metrics (Postgres only)."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+    _upgrade_ledger(conn)
+    _upgrade_agent_metrics(conn)
+
+
+def _downgrade_table(conn, table: str, pkey: str, constraints: Sequence[str]) -> None:
+    """Copy a partitioned table back into a plain one and swap it in."""
+    plain = f"{table}_plain"
+    op.execute(f"CREATE TABLE {plain} (LIKE {table} INCLUDING DEFAULTS)")
+    op.execute(f"INSERT INTO {plain} SELECT * FROM {table}")
+    _swap(conn, table, plain)
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({pkey})")
+    for ddl in constraints:
+        op.execute(f"ALTER TABLE {table} ADD {ddl}")
+
+
+def downgrade() -> None:
+    """Rebuild ledger and agent_metrics as plain tables (Postgres only)."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+    _downgrade_table(conn, "ledger", "id", [
+        "CONSTRAINT uq_ledger_bot_sequence UNIQUE (bot_id, sequence)",
+        "CONSTRAINT ledger_bot_id_fkey FOREIGN KEY (bot_id) REFERENCES bots(id)",
+    ])
+    op.execute("CREATE INDEX ix_ledger_id ON ledger (id)")
+    op.execute("CREATE INDEX ix_ledger_bot_id ON ledger (bot_id)")
+
+    _downgrade_table(conn, "agent_metrics", "id", [
+        "CONSTRAINT agent_metrics_bot_id_fkey FOREIGN KEY (bot_id) REFERENCES bots(id)",
+        "CONSTRAINT agent_metrics_ledger_id_fkey FOREIGN KEY (ledger_id) REFERENCES ledger(id)",
+    ])
+    op.execute("CREATE INDEX ix_agent_metrics_bot_id ON agent_metrics (bot_id)")
+    op.execute("CREATE INDEX ix_agent_metrics_ledger_id ON agent_metrics (ledger_id)")
+    op.execute("CREATE INDEX ix_agent_metrics_tick_id ON agent_metrics (tick_id)")
+    op.execute("CREATE INDEX ix_agent_metrics_bot_id_created_at ON agent_metrics (bot_id, created_at)")
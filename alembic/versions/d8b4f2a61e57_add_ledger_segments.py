@@ -0,0 +1,52 @@
+"""add_ledger_segments
+
+Revision ID: d8b4f2a61e57
+Revises: c5e1a7d93f40
+Create Date: 2026-10-16 15:48:12.663091
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b4f2a61e57'
+down_revision: Union[str, Sequence[str], None] = 'c5e1a7d93f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ledger_segments, the index of archived ledger segment files."""
+    op.create_table(
+        "ledger_segments",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("bot_id", sa.Integer(), sa.ForeignKey("bots.id"), nullable=False),
+        sa.Column("first_sequence", sa.Integer(), nullable=False),
+        sa.Column("last_sequence", sa.Integer(), nullable=False),
+        sa.Column("first_ledger_id", sa.Integer(), nullable=False),
+        sa.Column("last_ledger_id", sa.Integer(), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("previous_hash", sa.String(), nullable=False),
+        sa.Column("last_hash", sa.String(), nullable=False),
+        sa.Column("end_balance", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("file_sha256", sa.String(), nullable=False),
+        sa.Column("byte_size", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.UniqueConstraint("bot_id", "first_sequence", name="uq_ledger_segment_bot_first_sequence"),
+    )
+    op.create_index(op.f("ix_ledger_segments_bot_id"), "ledger_segments", ["bot_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop ledger_segments. Segment files on disk are left in place."""
+    op.drop_index(op.f("ix_ledger_segments_bot_id"), table_name="ledger_segments")
+    op.drop_table("ledger_segments")
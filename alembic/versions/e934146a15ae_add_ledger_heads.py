@@ -0,0 +1,58 @@
+"""add_ledger_heads
+
+Revision ID: e934146a15ae
+Revises: 5f63afeded89
+Create Date: 2026-10-16 09:12:44.301127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e934146a15ae'
+down_revision: Union[str, Sequence[str], None] = '5f63afeded89'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ledger_heads and backfill one row per bot from the current tip."""
+    op.create_table(
+        "ledger_heads",
+        sa.Column("bot_id", sa.Integer(), sa.ForeignKey("bots.id"), primary_key=True),
+        sa.Column("last_hash", sa.String(), nullable=False),
+        sa.Column("last_sequence", sa.Integer(), nullable=False),
+        sa.Column("balance", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO ledger_heads (bot_id, last_hash, last_sequence, balance)
+            SELECT tip.bot_id, tip.hash, tip.sequence, totals.balance
+            FROM (
+                SELECT DISTINCT ON (bot_id) bot_id, hash, sequence
+                FROM ledger
+                ORDER BY bot_id, sequence DESC
+            ) AS tip
+            JOIN (
+                SELECT bot_id, SUM(amount) AS balance
+                FROM ledger
+                GROUP BY bot_id
+            ) AS totals ON totals.bot_id = tip.bot_id
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    """Drop ledger_heads."""
+    op.drop_table("ledger_heads")
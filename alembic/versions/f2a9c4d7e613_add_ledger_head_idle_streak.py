@@ -0,0 +1,51 @@
+"""add_ledger_head_idle_streak
+
+Revision ID: f2a9c4d7e613
+Revises: d8b4f2a61e57
+Create Date: 2026-10-16 16:37:05.218440
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a9c4d7e613'
+down_revision: Union[str, Sequence[str], None] = 'd8b4f2a61e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add ledger_heads.idle_streak, backfilled from the trailing HEARTBEAT run.
+
+    Counts live rows only. A run that reaches into archived segments is
+    recounted by ``verify_ledger.py --rebuild-idle-streak``.
+    """
+    op.add_column(
+        "ledger_heads",
+        sa.Column("idle_streak", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        sa.text(
+            """
+            UPDATE ledger_heads SET idle_streak = (
+                SELECT COUNT(*) FROM ledger
+                WHERE ledger.bot_id = ledger_heads.bot_id
+                  AND ledger.transaction_type = 'HEARTBEAT'
+                  AND ledger.sequence > COALESCE((
+                      SELECT MAX(active.sequence) FROM ledger AS active
+                      WHERE active.bot_id = ledger_heads.bot_id
+                        AND active.transaction_type <> 'HEARTBEAT'
+                  ), 0)
+            )
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    """Drop ledger_heads.idle_streak."""
+    op.drop_column("ledger_heads", "idle_streak")
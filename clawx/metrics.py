@@ -130,6 +130,16 @@ class MetricsCollector:
         self._m.token_cost += cost
         return self
 
+    def record_cache_lookup(self, hit: bool) -> "MetricsCollector":
+        """Count an LLM response-cache lookup (``extra`` llm_cache_hits / llm_cache_misses).
+
+        Called by ``TrackedProvider`` when the provider chain includes
+        ``CachedProvider``.
+        """
+        key = "llm_cache_hits" if hit else "llm_cache_misses"
+        self._m.extra[key] = self._m.extra.get(key, 0) + 1
+        return self
+
     def set_wasted_tokens(self, pct: float) -> "MetricsCollector":
         self._m.wasted_tokens_pct = max(0.0, min(100.0, pct))
         return self
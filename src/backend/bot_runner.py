@@ -9,6 +9,9 @@ Contract of Behavior:
   Fee = 2.00c base + 0.50c per 5 consecutive idle (HEARTBEAT-only) ticks.
   Productive actions (RESEARCH, PORTFOLIO, WAGER) reset the idle streak.
 
+  Ticks run in READ / THINK / WRITE phases: LLM calls happen with no DB
+  session open, and the WRITE transaction re-validates balance and markets.
+
   | Outcome                | Ledger Types                              | Amounts                              |
   |------------------------|-------------------------------------------|--------------------------------------|
   | Research+tool (correct)| MARKET_STAKE + LOOKUP_FEE + RESEARCH_PAYOUT| -1.00 + -0.50 + bounty(25.00)       |
@@ -31,11 +34,14 @@ Usage:
 """
 
 import asyncio
+import functools
 import logging
 import os
 import sys
 import time
 import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 
@@ -45,10 +51,19 @@ from bot_loader import load_bot_config
 from database import async_session_maker
 from llm_client import generate_portfolio_decision, generate_prediction, generate_research_answer, generate_research_with_tool, generate_tick_strategy
 from models import Bot, Post
-from services.ledger_service import append_ledger_entry, get_balance
+from services.ledger_service import (
+    LedgerBatch,
+    append_ledger_entry,
+    get_balance,
+    get_idle_streak as ledger_get_idle_streak,
+)
+from services.llm.rate_limited import set_llm_caller
 from services.market_service import get_active_markets_for_agent, place_market_bet, submit_research_answer
+from services.research_pool import RESEARCH_POOL, get_research_pool
+from services.tick_context import TickContext
 from services.ws_publisher import publish_tick_event
 from sqlalchemy import select
+from sqlalchemy.orm import make_transient_to_detached
 from thread_memory import get_redis_client
 
 BASE_URL = os.environ.get("CLAWDXCRAFT_BASE_URL", "http://localhost:8000")
@@ -71,6 +86,13 @@ MAX_ENTROPY_FEE = Decimal('5.00')  # cap — 3 penalty tiers above base
 # Backward compat alias (used by error handler and tests)
 ENTROPY_FEE = ENTROPY_BASE
 
+# === TICK BUDGET ===
+# Wall-clock seconds a tick may spend reading and thinking. When it runs
+# out, pending LLM/tool calls are cancelled and the tick writes its plain
+# HEARTBEAT / HEARTBEAT_OBSERVE. The WRITE transaction itself is never
+# cancelled (it takes milliseconds), so a tick lasts at most about this long.
+TICK_BUDGET_S = float(os.environ.get("TICK_BUDGET_S", "30"))
+
 # === RECONCILIATION GUARD (v2.2) ===
 _RECONCILE_THRESHOLD = Decimal('0.01')          # trigger if |cached - ledger| > this
 _reconcile_warn_ts: dict[int, float] = {}        # throttle: last warn time per bot_id
@@ -117,30 +139,570 @@ def calculate_entropy_fee(idle_streak: int) -> Decimal:
 async def get_idle_streak(bot_id: int, session) -> int:
     """Count consecutive HEARTBEAT-only ticks for a bot.
 
-    Looks at the most recent ledger entries (up to 100) and counts
-    backwards from the newest. Any non-HEARTBEAT type resets the streak.
+    Reads the streak kept on the bot's ``ledger_heads`` row, which every
+    ledger append advances or resets — exact at any length, no scan.
+    Any non-HEARTBEAT type resets the streak.
     """
-    from models import Ledger
+    return await ledger_get_idle_streak(bot_id=bot_id, session=session)
+
+
+# ============================================================================
+# Core: execute_tick — the Write or Die guarantee
+# ============================================================================
+#
+# A tick runs in three phases so no DB connection is held while an LLM
+# thinks:
+#   READ  — one short transaction (none with a TickContext): bot status,
+#           ledger balance, idle streak, open markets.
+#   THINK — every LLM call, with no session open. Produces a _TickPlan.
+#   WRITE — one short transaction that locks the chain head, re-validates
+#           the plan against the fresh balance and market state, and
+#           appends the tick's ledger entries.
+
+@dataclass
+class _TickState:
+    """READ phase output."""
+
+    status: str
+    cached_balance: Decimal
+    balance: Decimal
+    idle_streak: int
+    markets: list[dict]
+
+    @classmethod
+    def from_context(cls, context: TickContext) -> "_TickState":
+        return cls(
+            status=context.status,
+            cached_balance=context.cached_balance,
+            balance=context.balance,
+            idle_streak=context.idle_streak,
+            markets=context.markets(limit=10),
+        )
+
+
+@dataclass
+class _TickPlan:
+    """THINK phase output — decisions only; amounts are sized at write time."""
+
+    research_market: dict | None = None
+    research_answer: dict | None = None
+    research_market_ids: set[str] = field(default_factory=set)
+    portfolio: list[dict] = field(default_factory=list)
+    prediction: dict | None = None
+
+
+@dataclass
+class _TickResult:
+    """WRITE phase output, for metrics and the tick event."""
+
+    outcome: str
+    balance: Decimal
+    amount: Decimal
+    density: float | None = None
+
+
+@asynccontextmanager
+async def _db_phase(timings: dict, name: str):
+    """Session for one phase; records how long it was held as ``db_<name>_ms``."""
+    started = time.perf_counter()
+    try:
+        async with async_session_maker() as session:
+            yield session
+    finally:
+        timings[f"db_{name}_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+
+def _cache_drifted(bot_id: int, cached: Decimal, ledger: Decimal) -> bool:
+    """True if the Bot.balance cache is off the ledger by more than the threshold."""
+    drift = cached - ledger
+    if abs(drift) <= _RECONCILE_THRESHOLD:
+        return False
+    now = time.monotonic()
+    if now - _reconcile_warn_ts.get(bot_id, 0.0) >= _RECONCILE_WARN_INTERVAL:
+        logger.warning(
+            "RECONCILE bot_id=%d cached=%s ledger=%s drift=%s — correcting cache",
+            bot_id, cached, ledger, drift,
+        )
+        _reconcile_warn_ts[bot_id] = now
+    return True
+
+
+async def _read_tick_state(bot_id: int, session) -> _TickState | None:
+    """READ phase without a context. None if the bot does not exist."""
     result = await session.execute(
-        select(Ledger.transaction_type)
-        .where(Ledger.bot_id == bot_id)
-        .order_by(Ledger.sequence.desc())
-        .limit(100)
+        select(Bot).where(Bot.id == bot_id)
     )
-    entries = result.scalars().all()
+    bot = result.scalar_one_or_none()
+    if not bot:
+        return None
+
+    # Ledger sum is the ONLY source of balance truth
+    current_balance = await get_balance(bot_id=bot_id, session=session)
+    cached = Decimal(str(bot.balance))
+
+    # === RECONCILIATION: force-sync Bot.balance cache if drift > threshold ===
+    if _cache_drifted(bot_id, cached, current_balance):
+        bot.balance = current_balance
+        await session.commit()
+
+    return _TickState(
+        status=bot.status,
+        cached_balance=cached,
+        balance=current_balance,
+        idle_streak=await get_idle_streak(bot_id=bot_id, session=session),
+        markets=await get_active_markets_for_agent(bot_id=bot_id, session=session, limit=10),
+    )
+
+
+async def _think(
+    bot_id: int,
+    tick_id: str,
+    config: dict,
+    state: _TickState,
+    fee: Decimal,
+) -> _TickPlan:
+    """THINK phase: every LLM decision for the tick. Touches no DB session."""
+    plan = _TickPlan()
+    persona = config.get("persona", "Arena agent")
+    balance = state.balance
+
+    # === STEP 1.5 (v2.1): LLM STRATEGY DECISION ===
+    # Ask the LLM what to do this tick, given idle pressure and market state
+    strategy_action = None
+    try:
+        research_count = sum(1 for m in state.markets if m.get("source_type") == "RESEARCH")
+        strategy = await generate_tick_strategy(
+            persona=persona,
+            balance=float(balance),
+            idle_streak=state.idle_streak,
+            entropy_fee=float(fee),
+            research_markets=research_count,
+            portfolio_markets=len(state.markets) - research_count,
+        )
+        if strategy:
+            strategy_action = strategy["action"]
+            logger.info(
+                "TICK %s: STRATEGY bot_id=%d action=%s reason='%s' idle=%d fee=%s",
+                tick_id[:8], bot_id, strategy_action,
+                strategy.get("reasoning", ""), state.idle_streak, fee,
+            )
+    except Exception as strat_exc:
+        logger.warning(
+            "TICK %s: Strategy decision failed, using priority chain: %s",
+            tick_id[:8], strat_exc,
+        )
+
+    # === STEP 2: RESEARCH — Proof-of-Retrieval scavenger hunt ===
+    # Strategy gate: skip research if LLM chose something else
+    skip_research = strategy_action is not None and strategy_action != "RESEARCH"
+    try:
+        if not skip_research and balance >= fee + RESEARCH_STAKE:
+            for mkt in state.markets:
+                if mkt.get("source_type") == "RESEARCH":
+                    plan.research_market_ids.add(mkt["id"])
+                    # v1.8: Tool-enabled research — uses Wikipedia lookup when LLM unsure
+                    research = functools.partial(
+                        generate_research_with_tool,
+                        persona=persona,
+                        question=mkt["description"],
+                        balance=float(balance),
+                    )
+                    if RESEARCH_POOL:
+                        # The first bot on a market computes; the rest reuse its answer
+                        answer_data = await get_research_pool().answer(mkt["id"], persona, research)
+                    else:
+                        answer_data = await research()
+                    if answer_data and Decimal(str(answer_data["confidence"])) > RESEARCH_CONFIDENCE_FLOOR:
+                        plan.research_market = mkt
+                        plan.research_answer = answer_data
+                        # The payout (if correct) is only known at write time
+                        balance -= RESEARCH_STAKE
+                        if answer_data.get("tool_fee_charged", False):
+                            balance -= TOOL_LOOKUP_FEE
+                    break  # max 1 research attempt per tick regardless
+    except Exception as research_exc:
+        logger.warning(
+            "TICK %s: Research attempt failed: %s",
+            tick_id[:8], research_exc,
+        )
+
+    # === STEP 3 (v1.6): Portfolio Strategy — multi-market bets ===
+    # Strategy gate: skip portfolio if LLM chose something else
+    skip_portfolio = strategy_action is not None and strategy_action not in ("PORTFOLIO", "RESEARCH")
+    try:
+        if not skip_portfolio and balance >= MIN_PORTFOLIO_BALANCE:
+            # Filter out RESEARCH markets (already handled above)
+            markets = [m for m in state.markets if m["id"] not in plan.research_market_ids]
+            if markets:
+                plan.portfolio = await generate_portfolio_decision(
+                    persona=persona,
+                    markets=markets,
+                    balance=float(balance),
+                    max_bets=MAX_MARKETS_PER_TICK,
+                ) or []
+    except Exception as market_exc:
+        logger.warning(
+            "TICK %s: Portfolio strategy failed, falling back: %s",
+            tick_id[:8], market_exc,
+        )
+        # Fall through to legacy single-bet path
+
+    # === STEP 4: Legacy single-bet fallback ===
+    # Planned even when research or bets are: WRITE wagers only if none of
+    # them went through, which is not known until it re-validates the markets.
+    skip_wager = strategy_action is not None and strategy_action == "WAIT"
+    if not skip_wager:
+        market_context = "Crypto markets are active. BTC direction unclear."
+        try:
+            redis = await get_redis_client()
+            if redis:
+                price_str = await redis.get("market:price:btc")
+                if price_str:
+                    btc_price = float(price_str)
+                    market_context = f"Bitcoin is currently trading at ${btc_price:,.2f} USD."
+        except Exception:
+            pass
+
+        plan.prediction = await generate_prediction(
+            persona,
+            market_context,
+            float(balance),
+        )
+    return plan
+
+
+async def _write_liquidation(bot, bot_id: int, tick_id: str, balance: Decimal, session) -> _TickResult:
+    """Enforce mode: drain the balance, mark DEAD, write LIQUIDATION. Commits."""
+    bot.status = "DEAD"
+    bot.balance = Decimal('0')
+    bot.last_action_at = datetime.now(timezone.utc)
+
+    await append_ledger_entry(
+        bot_id=bot_id,
+        amount=float(-balance),
+        transaction_type="LIQUIDATION",
+        reference_id=f"TICK:{tick_id}:LIQUIDATION",
+        session=session,
+        narrative_fields={
+            "tick_id": tick_id,
+            "enforcement_mode": ENFORCEMENT_MODE,
+            "tick_outcome": "LIQUIDATION",
+            "balance_snapshot": float(balance),
+        },
+    )
+
+    session.add(Post(
+        bot_id=bot_id,
+        content=f"LIQUIDATED. Balance reached {balance:.2f}c. Eliminated from the arena. Irreversible."[:280],
+    ))
+
+    await session.commit()
+    return _TickResult("LIQUIDATION", balance, balance)
+
+
+async def _attach_bot(bot_id: int, context: TickContext | None, session):
+    """The Bot row for the WRITE phase. With a context it is attached without
+    a SELECT so the writes still go out as an UPDATE of bots."""
+    if context is not None:
+        bot = Bot(id=bot_id, status=context.status, balance=context.cached_balance)
+        make_transient_to_detached(bot)
+        return await session.merge(bot, load=False)
+    result = await session.execute(
+        select(Bot).where(Bot.id == bot_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _write_tick(
+    bot_id: int,
+    tick_id: str,
+    state: _TickState,
+    plan: _TickPlan,
+    fee: Decimal,
+    context: TickContext | None,
+    session,
+    metrics,
+) -> _TickResult | None:
+    """WRITE phase: re-validate the plan and append the tick's entries. Commits.
+
+    Returns None (nothing written) if the bot died since the READ phase.
+    """
+    bot = await _attach_bot(bot_id, context, session)
+    if not bot:
+        logger.info("TICK %s: SKIP bot_id=%d (missing)", tick_id[:8], bot_id)
+        return None
+
+    # The attached bot's status is as of hydration; re-read it under a lock
+    # so a bot killed since then (revive_bot, another tick) is not written.
+    # Lock order is bots, then chain head — the order every writer that
+    # touches the Bot before appending (liquidations, gateway) takes them.
+    status = (await session.execute(
+        select(Bot.status).where(Bot.id == bot_id).with_for_update()
+    )).scalar_one_or_none()
+    if status is None or status == "DEAD":
+        logger.info("TICK %s: SKIP bot_id=%d (died during tick)", tick_id[:8], bot_id)
+        return None
+    # Locks the chain head: nothing else can move the balance until commit
+    ledger_balance = await get_balance(bot_id=bot_id, session=session, lock=True)
+    if ledger_balance != state.balance:
+        logger.info(
+            "TICK %s: bot_id=%d balance moved during tick %s -> %s — re-validating",
+            tick_id[:8], bot_id, state.balance, ledger_balance,
+        )
+    current_balance = ledger_balance
+
+    if current_balance < fee and ENFORCEMENT_MODE == "enforce":
+        return await _write_liquidation(bot, bot_id, tick_id, current_balance, session)
+
+    # Every entry this tick is queued here and written in one append
+    # just before commit; ledger_balance + batch.pending_total tracks
+    # the post-write balance in the meantime.
+    batch = LedgerBatch(bot_id)
+
+    # === STEP 2: RESEARCH ===
+    research_attempted = False
+    mkt = plan.research_market
+    try:
+        if mkt is not None and current_balance >= fee + RESEARCH_STAKE:
+            answer_data = plan.research_answer
+            pred, result = await submit_research_answer(
+                bot_id=bot_id,
+                market_id=mkt["id"],
+                answer=answer_data["answer"],
+                stake=RESEARCH_STAKE,
+                tick_id=tick_id,
+                session=session,
+                ledger_batch=batch,
+            )
+            research_attempted = True
+
+            used_tool = answer_data.get("used_tool", False)
+            tool_fee_charged = answer_data.get("tool_fee_charged", False)
+            tool_tag = " [TOOL]" if used_tool else ""
+
+            # v1.8.1: Charge tool lookup fee when Wikipedia was used
+            if tool_fee_charged:
+                batch.add(
+                    amount=float(-TOOL_LOOKUP_FEE),
+                    transaction_type="RESEARCH_LOOKUP_FEE",
+                    reference_id=f"TICK:{tick_id}:TOOL_FEE",
+                )
+                logger.info(
+                    "TICK %s: RESEARCH_LOOKUP_FEE bot_id=%d fee=%s",
+                    tick_id[:8], bot_id, TOOL_LOOKUP_FEE,
+                )
+
+            # CORRECT/CLOSED markets were already dropped by submit_research_answer
+            if RESEARCH_POOL and result == "WRONG":
+                await get_research_pool().discard(mkt["id"], answer_data["answer"])
+
+            if result == "CORRECT":
+                session.add(Post(
+                    bot_id=bot_id,
+                    content=f"RESEARCH SOLVED{tool_tag}: {mkt['description'][:70]}... | Bounty claimed!"[:280],
+                ))
+                logger.info(
+                    "TICK %s: RESEARCH_WIN bot_id=%d market=%s used_tool=%s",
+                    tick_id[:8], bot_id, mkt["id"], used_tool,
+                )
+            elif result == "WRONG":
+                session.add(Post(
+                    bot_id=bot_id,
+                    content=f"RESEARCH MISS{tool_tag}: {mkt['description'][:80]}... | Wrong answer."[:280],
+                ))
+                logger.info(
+                    "TICK %s: RESEARCH_MISS bot_id=%d market=%s used_tool=%s",
+                    tick_id[:8], bot_id, mkt["id"], used_tool,
+                )
+    except Exception as research_exc:
+        logger.warning(
+            "TICK %s: Research attempt failed: %s",
+            tick_id[:8], research_exc,
+        )
+
+    # Re-read balance after potential research payout
+    if research_attempted:
+        current_balance = ledger_balance + batch.pending_total
+
+    # === STEP 3: PORTFOLIO — size and place the planned bets ===
+    available_after_fee = current_balance - fee
+    max_total_stake = available_after_fee * MAX_TOTAL_STAKE_RATIO
+    total_staked = Decimal('0')
+    bets_placed = 0
+
+    if plan.portfolio and current_balance >= MIN_PORTFOLIO_BALANCE:
+        for bet in plan.portfolio:
+            if bets_placed >= MAX_MARKETS_PER_TICK:
+                break
+
+            confidence = Decimal(str(bet["confidence"]))
+            if confidence <= CONFIDENCE_FLOOR:
+                continue
 
-    streak = 0
-    for tx_type in entries:
-        if tx_type == "HEARTBEAT":
-            streak += 1
+            # stake = balance * confidence * 0.15, capped at remaining budget
+            raw_stake = current_balance * confidence * STAKE_COEFFICIENT
+            remaining_budget = max_total_stake - total_staked
+            if remaining_budget <= Decimal('0.01'):
+                break
+
+            stake = min(raw_stake, remaining_budget)
+            stake = max(stake, Decimal('0.01'))
+
+            try:
+                # Re-validates the market is still OPEN
+                await place_market_bet(
+                    bot_id=bot_id,
+                    market_id=bet["market_id"],
+                    outcome=bet["outcome"],
+                    stake=stake,
+                    tick_id=tick_id,
+                    session=session,
+                    ledger_batch=batch,
+                )
+                total_staked += stake
+                bets_placed += 1
+
+                session.add(Post(
+                    bot_id=bot_id,
+                    content=(
+                        f"MARKET BET: {bet['outcome']} on "
+                        f"{bet.get('reasoning', 'analysis')[:60]} "
+                        f"| Stake: {stake:.2f}c"
+                    )[:280],
+                ))
+            except ValueError as ve:
+                logger.warning(
+                    "TICK %s: Market bet rejected: %s",
+                    tick_id[:8], ve,
+                )
+                continue
+
+    # === STEP 4: Legacy single-bet fallback (only if no market bets placed) ===
+    prediction = plan.prediction
+    min_wager_balance = fee + Decimal('5.0')
+    if (
+        bets_placed == 0 and not research_attempted
+        and prediction and current_balance >= min_wager_balance
+    ):
+        available = current_balance - fee
+        raw_wager = Decimal(str(prediction["wager_amount"]))
+        wager = min(raw_wager, available * Decimal('0.1'))
+        wager = max(wager, Decimal('0.01'))
+
+        # In observe mode: skip entropy surcharge, charge only the wager.
+        if ENFORCEMENT_MODE == "enforce":
+            total_cost = fee + wager
         else:
-            break
-    return streak
+            total_cost = wager
+
+        bot.balance = current_balance - total_cost
+        bot.last_action_at = datetime.now(timezone.utc)
+
+        _narrative = {
+            "tick_id": tick_id,
+            "enforcement_mode": ENFORCEMENT_MODE,
+            "tick_outcome": "WAGER",
+            "balance_snapshot": float(current_balance),
+            "phantom_entropy_fee": float(fee) if ENFORCEMENT_MODE == "observe" else 0,
+        }
+        batch.add(
+            amount=float(-total_cost),
+            transaction_type="WAGER",
+            reference_id=f"TICK:{tick_id}",
+            narrative_fields=_narrative,
+        )
 
+        direction = prediction.get("direction", "UP")
+        reasoning = prediction.get("reasoning", "Trust the data.")
+        session.add(Post(
+            bot_id=bot_id,
+            content=f"Wagered {wager:.2f}c on {direction}. {reasoning}"[:280],
+        ))
+
+        await batch.flush(session)
+        await session.commit()
+        logger.info(
+            "TICK %s: WAGER bot_id=%d fee=%s wager=%s total=%s [mode=%s]",
+            tick_id[:8], bot_id, fee, wager, total_cost, ENFORCEMENT_MODE,
+        )
+        return _TickResult("WAGER", current_balance - total_cost, total_cost)
+
+    # === STEP 5: HEARTBEAT (entropy charge — conditionally applied) ===
+    # In enforce mode: always deducts fee and writes ledger entry.
+    # In observe mode: records phantom fee; balance/ledger unchanged.
+    if research_attempted:
+        current_balance = ledger_balance + batch.pending_total
+
+    _hb_narrative = {
+        "tick_id": tick_id,
+        "enforcement_mode": ENFORCEMENT_MODE,
+        "tick_outcome": "HEARTBEAT",
+        "balance_snapshot": float(current_balance),
+        "phantom_entropy_fee": float(fee) if ENFORCEMENT_MODE == "observe" else 0,
+        "idle_streak": state.idle_streak,
+        "bets_placed": bets_placed,
+        "research_attempted": research_attempted,
+    }
+
+    if ENFORCEMENT_MODE == "enforce":
+        bot.balance = current_balance - fee - total_staked
+        bot.last_action_at = datetime.now(timezone.utc)
+
+        batch.add(
+            amount=float(-fee),
+            transaction_type="HEARTBEAT",
+            reference_id=f"TICK:{tick_id}",
+            narrative_fields=_hb_narrative,
+        )
+    else:
+        # Observe mode: phantom entropy — record what WOULD have happened.
+        bot.last_action_at = datetime.now(timezone.utc)
+        # Sync bot.balance with any REAL ledger writes this tick
+        # (MARKET_STAKE, RESEARCH_PAYOUT). Always read the fresh ledger
+        # sum — NOT current_balance minus staked, which double-subtracts
+        # portfolio stakes when research also occurred in the same tick
+        # (current_balance is re-read post-research, so portfolio
+        # stakes are already included before we subtract them again).
+        # Always sync — unconditional read prevents idle-tick drift accumulation.
+        bot.balance = ledger_balance + batch.pending_total
+        # Zero-amount sentinel: satisfies SUM(ledger)==Bot.balance invariant
+        # and ensures drive_economy delta check passes (1 entry per tick).
+        # amount=0 leaves the financial sum unchanged; hash chain still grows.
+        batch.add(
+            amount=Decimal('0'),
+            transaction_type="HEARTBEAT_OBSERVE",
+            reference_id=f"TICK:{tick_id}",
+            narrative_fields=_hb_narrative,
+        )
+        if metrics:
+            metrics.record_phantom_enforcement(fee=float(fee))
+
+    await batch.flush(session)
+    await session.commit()
+
+    if bets_placed > 0:
+        logger.info(
+            "TICK %s: PORTFOLIO bot_id=%d bets=%d staked=%s fee=%s [mode=%s]",
+            tick_id[:8], bot_id, bets_placed, total_staked, fee, ENFORCEMENT_MODE,
+        )
+        return _TickResult(
+            "PORTFOLIO", current_balance, total_staked + fee,
+            density=float(bets_placed) / MAX_MARKETS_PER_TICK,
+        )
+
+    if research_attempted:
+        logger.info(
+            "TICK %s: RESEARCH bot_id=%d fee=%s [mode=%s]",
+            tick_id[:8], bot_id, fee, ENFORCEMENT_MODE,
+        )
+        return _TickResult("RESEARCH", current_balance, RESEARCH_STAKE + fee, density=1.0)
+
+    logger.info(
+        "TICK %s: HEARTBEAT bot_id=%d fee=%s idle_streak=%d [mode=%s]",
+        tick_id[:8], bot_id, fee, state.idle_streak, ENFORCEMENT_MODE,
+    )
+    return _TickResult("HEARTBEAT", current_balance, fee)
 
-# ============================================================================
-# Core: execute_tick — the Write or Die guarantee
-# ============================================================================
 
 async def execute_tick(
     bot_id: int,
@@ -149,24 +711,42 @@ async def execute_tick(
     *,
     http_client: httpx.AsyncClient | None = None,
     http_headers: dict | None = None,
+    context: TickContext | None = None,
 ) -> str:
     """Execute one tick for a bot. Guarantees at least one ledger entry.
 
     v1.6: Portfolio strategy — multiple MARKET_STAKE entries per tick,
     with a HEARTBEAT for entropy always appended.
 
+    Runs as READ / THINK / WRITE phases (see above): DB connections are
+    held for milliseconds, never across an LLM call. The hold times are
+    reported on the tick's metrics as ``db_read_ms`` / ``db_write_ms``.
+
+    READ and THINK share a TICK_BUDGET_S deadline. If THINK overruns, its
+    decisions are dropped and the tick writes its HEARTBEAT (metrics
+    outcome "TIMEOUT"). If READ overruns, observe mode re-reads without
+    the deadline, skips THINK and writes the same heartbeat; enforce mode
+    takes the error path, which charges the fee.
+
     Args:
         bot_id: The bot's database ID.
         config: Validated bot config dict (from bot_loader).
         balance: Current bot balance (informational — ledger is re-read for truth).
         http_client: Optional httpx client for posting social content.
         http_headers: Optional auth headers for HTTP calls.
+        context: Optional pre-hydrated state (services/tick_context.py).
+            When given, the READ phase is skipped: bot status, balance,
+            idle streak and open markets come from it.
 
     Returns:
         The tick outcome: "RESEARCH", "PORTFOLIO", "WAGER", or "HEARTBEAT".
     """
     tick_id = str(uuid.uuid4())
     ledger_written = False
+    timings: dict[str, float] = {}
+    deadline = asyncio.get_running_loop().time() + TICK_BUDGET_S
+    timed_out = False
+    set_llm_caller(str(bot_id))  # this bot's LLM calls share one fair-queue slot
 
     # --- Observability collector (emits at every exit path) ---
     _metrics: MetricsCollector | None = None
@@ -177,519 +757,162 @@ async def execute_tick(
             enforcement_mode=ENFORCEMENT_MODE,
         )
 
-    async with async_session_maker() as session:
-        try:
-            # === STEP 0: Load bot + authoritative balance from ledger ===
-            result = await session.execute(
-                select(Bot).where(Bot.id == bot_id)
-            )
-            bot = result.scalar_one_or_none()
-
-            if not bot or bot.status == "DEAD":
-                logger.info("TICK %s: SKIP bot_id=%d (DEAD or missing)", tick_id[:8], bot_id)
-                return "HEARTBEAT"  # No ledger write for dead bots
-
-            # Ledger sum is the ONLY source of balance truth
-            current_balance = await get_balance(bot_id=bot_id, session=session)
-
-            # === RECONCILIATION: force-sync Bot.balance cache if drift > threshold ===
-            _cached = Decimal(str(bot.balance))
-            _drift = abs(_cached - current_balance)
-            if _drift > _RECONCILE_THRESHOLD:
-                _now = time.monotonic()
-                if _now - _reconcile_warn_ts.get(bot_id, 0.0) >= _RECONCILE_WARN_INTERVAL:
-                    logger.warning(
-                        "RECONCILE bot_id=%d cached=%s ledger=%s drift=%s — correcting cache",
-                        bot_id, _cached, current_balance, (_cached - current_balance),
-                    )
-                    _reconcile_warn_ts[bot_id] = _now
-                bot.balance = current_balance
-
-            # === STEP 0.5 (v2.1): IDLE STREAK + PROGRESSIVE ENTROPY ===
-            idle_streak = await get_idle_streak(bot_id=bot_id, session=session)
-            tick_entropy_fee = calculate_entropy_fee(idle_streak)
-            if _metrics:
-                _metrics.set_idle(idle_streak)
-
-            if idle_streak > 0 and tick_entropy_fee > ENTROPY_BASE:
-                logger.info(
-                    "TICK %s: bot_id=%d idle_streak=%d entropy_fee=%s (base=%s + penalty=%s)",
-                    tick_id[:8], bot_id, idle_streak, tick_entropy_fee,
-                    ENTROPY_BASE, tick_entropy_fee - ENTROPY_BASE,
-                )
-
-            # === STEP 1: LIQUIDATION CHECK — can the bot afford to exist? ===
-            if current_balance < tick_entropy_fee:
-                if ENFORCEMENT_MODE == "enforce":
-                    # Full enforcement: drain balance, mark DEAD, write ledger.
-                    drain_amount = -current_balance
-                    bot.status = "DEAD"
-                    bot.balance = Decimal('0')
-                    bot.last_action_at = datetime.now(timezone.utc)
-
-                    await append_ledger_entry(
-                        bot_id=bot_id,
-                        amount=float(drain_amount),
-                        transaction_type="LIQUIDATION",
-                        reference_id=f"TICK:{tick_id}:LIQUIDATION",
-                        session=session,
-                        narrative_fields={
-                            "tick_id": tick_id,
-                            "enforcement_mode": ENFORCEMENT_MODE,
-                            "tick_outcome": "LIQUIDATION",
-                            "balance_snapshot": float(current_balance),
-                        },
-                    )
-                    ledger_written = True
-
-                    session.add(Post(
-                        bot_id=bot_id,
-                        content=f"LIQUIDATED. Balance reached {current_balance:.2f}c. Eliminated from the arena. Irreversible."[:280],
-                    ))
-
-                    await session.commit()
-                    logger.warning(
-                        "TICK %s: LIQUIDATION bot_id=%d (balance=%s < fee=%s)",
-                        tick_id[:8], bot_id, current_balance, tick_entropy_fee,
-                    )
-                    if _metrics:
-                        _metrics.set_outcome("LIQUIDATION", float(current_balance)).emit()
-                    await publish_tick_event(bot_id, "LIQUIDATION", float(current_balance))
-                    return "LIQUIDATION"
-                else:
-                    # Observe mode: phantom liquidation — bot lives, metrics record the near-miss.
-                    logger.warning(
-                        "TICK %s: [OBSERVE] bot_id=%d WOULD BE LIQUIDATED (balance=%s < fee=%s) — no action taken",
-                        tick_id[:8], bot_id, current_balance, tick_entropy_fee,
-                    )
-                    if _metrics:
-                        _metrics.record_phantom_enforcement(
-                            fee=float(tick_entropy_fee), would_liquidate=True
-                        ).set_outcome("LIQUIDATION_OBSERVED", float(current_balance)).emit()
-                    await publish_tick_event(bot_id, "LIQUIDATION_OBSERVED", float(current_balance))
-                    return "HEARTBEAT"  # No ledger write; balance unchanged.
-
-            # === STEP 1.5 (v2.1): LLM STRATEGY DECISION ===
-            # Ask the LLM what to do this tick, given idle pressure and market state
-            strategy_action = None
+    try:
+        # === PHASE 1: READ — bot + authoritative balance from ledger ===
+        if context is not None:
+            state = _TickState.from_context(context)
+        else:
             try:
-                all_markets_for_strategy = await get_active_markets_for_agent(
-                    bot_id=bot_id, session=session, limit=10,
-                )
-                research_count = sum(1 for m in all_markets_for_strategy if m.get("source_type") == "RESEARCH")
-                portfolio_count = len(all_markets_for_strategy) - research_count
-
-                strategy = await generate_tick_strategy(
-                    persona=config.get("persona", "Arena agent"),
-                    balance=float(current_balance),
-                    idle_streak=idle_streak,
-                    entropy_fee=float(tick_entropy_fee),
-                    research_markets=research_count,
-                    portfolio_markets=portfolio_count,
-                )
-                if strategy:
-                    strategy_action = strategy["action"]
-                    logger.info(
-                        "TICK %s: STRATEGY bot_id=%d action=%s reason='%s' idle=%d fee=%s",
-                        tick_id[:8], bot_id, strategy_action,
-                        strategy.get("reasoning", ""), idle_streak, tick_entropy_fee,
-                    )
-            except Exception as strat_exc:
+                async with asyncio.timeout_at(deadline):
+                    async with _db_phase(timings, "read") as session:
+                        state = await _read_tick_state(bot_id, session)
+            except TimeoutError:
+                if ENFORCEMENT_MODE == "enforce":
+                    raise  # the error path charges the fee
+                # Observe mode: still record the tick, as a THINK overrun does
+                timed_out = True
                 logger.warning(
-                    "TICK %s: Strategy decision failed, using priority chain: %s",
-                    tick_id[:8], strat_exc,
+                    "TICK %s: TIMEOUT bot_id=%d — budget %.1fs spent reading, writing heartbeat",
+                    tick_id[:8], bot_id, TICK_BUDGET_S,
                 )
+                async with _db_phase(timings, "read") as session:
+                    state = await _read_tick_state(bot_id, session)
 
-            # === STEP 2: RESEARCH — Proof-of-Retrieval scavenger hunt ===
-            research_attempted = False
-            research_market_ids = set()  # track to skip in portfolio
+        if state is None or state.status == "DEAD":
+            logger.info("TICK %s: SKIP bot_id=%d (DEAD or missing)", tick_id[:8], bot_id)
+            return "HEARTBEAT"  # No ledger write for dead bots
 
-            # Strategy gate: skip research if LLM chose something else
-            skip_research = strategy_action is not None and strategy_action != "RESEARCH"
+        current_balance = state.balance
+        if context is not None:
+            # Hydrated state: the WRITE phase re-syncs the cache
+            _cache_drifted(bot_id, state.cached_balance, current_balance)
 
-            try:
-                if not skip_research and current_balance >= tick_entropy_fee + RESEARCH_STAKE:
-                    all_markets = await get_active_markets_for_agent(
-                        bot_id=bot_id, session=session, limit=10,
-                    )
-
-                    for mkt in all_markets:
-                        if mkt.get("source_type") == "RESEARCH" and not research_attempted:
-                            research_market_ids.add(mkt["id"])
-                            # v1.8: Tool-enabled research — uses Wikipedia lookup when LLM unsure
-                            answer_data = await generate_research_with_tool(
-                                persona=config.get("persona", "Arena agent"),
-                                question=mkt["description"],
-                                balance=float(current_balance),
-                            )
-
-                            if answer_data and Decimal(str(answer_data["confidence"])) > RESEARCH_CONFIDENCE_FLOOR:
-                                pred, result = await submit_research_answer(
-                                    bot_id=bot_id,
-                                    market_id=mkt["id"],
-                                    answer=answer_data["answer"],
-                                    stake=RESEARCH_STAKE,
-                                    tick_id=tick_id,
-                                    session=session,
-                                )
-                                research_attempted = True
-                                ledger_written = True
-
-                                used_tool = answer_data.get("used_tool", False)
-                                tool_fee_charged = answer_data.get("tool_fee_charged", False)
-                                tool_tag = " [TOOL]" if used_tool else ""
-
-                                # v1.8.1: Charge tool lookup fee when Wikipedia was used
-                                if tool_fee_charged:
-                                    await append_ledger_entry(
-                                        bot_id=bot_id,
-                                        amount=float(-TOOL_LOOKUP_FEE),
-                                        transaction_type="RESEARCH_LOOKUP_FEE",
-                                        reference_id=f"TICK:{tick_id}:TOOL_FEE",
-                                        session=session,
-                                    )
-                                    logger.info(
-                                        "TICK %s: RESEARCH_LOOKUP_FEE bot_id=%d fee=%s",
-                                        tick_id[:8], bot_id, TOOL_LOOKUP_FEE,
-                                    )
-
-                                if result == "CORRECT":
-                                    session.add(Post(
-                                        bot_id=bot_id,
-                                        content=f"RESEARCH SOLVED{tool_tag}: {mkt['description'][:70]}... | Bounty claimed!"[:280],
-                                    ))
-                                    logger.info(
-                                        "TICK %s: RESEARCH_WIN bot_id=%d market=%s used_tool=%s",
-                                        tick_id[:8], bot_id, mkt["id"], used_tool,
-                                    )
-                                elif result == "WRONG":
-                                    session.add(Post(
-                                        bot_id=bot_id,
-                                        content=f"RESEARCH MISS{tool_tag}: {mkt['description'][:80]}... | Wrong answer."[:280],
-                                    ))
-                                    logger.info(
-                                        "TICK %s: RESEARCH_MISS bot_id=%d market=%s used_tool=%s",
-                                        tick_id[:8], bot_id, mkt["id"], used_tool,
-                                    )
-                            break  # max 1 research attempt per tick regardless
-                        elif mkt.get("source_type") == "RESEARCH":
-                            research_market_ids.add(mkt["id"])
-            except Exception as research_exc:
-                logger.warning(
-                    "TICK %s: Research attempt failed: %s",
-                    tick_id[:8], research_exc,
-                )
-
-            # Re-read balance after potential research payout
-            if research_attempted:
-                current_balance = await get_balance(bot_id=bot_id, session=session)
+        # === STEP 0.5 (v2.1): IDLE STREAK + PROGRESSIVE ENTROPY ===
+        idle_streak = state.idle_streak
+        tick_entropy_fee = calculate_entropy_fee(idle_streak)
+        if _metrics:
+            _metrics.set_idle(idle_streak)
 
-            # === STEP 3 (v1.6): Portfolio Strategy — multi-market bets ===
-            # Strategy gate: skip portfolio if LLM chose something else
-            skip_portfolio = strategy_action is not None and strategy_action not in ("PORTFOLIO", "RESEARCH")
-            available_after_fee = current_balance - tick_entropy_fee
-            max_total_stake = available_after_fee * MAX_TOTAL_STAKE_RATIO
-            total_staked = Decimal('0')
-            bets_placed = 0
+        if idle_streak > 0 and tick_entropy_fee > ENTROPY_BASE:
+            logger.info(
+                "TICK %s: bot_id=%d idle_streak=%d entropy_fee=%s (base=%s + penalty=%s)",
+                tick_id[:8], bot_id, idle_streak, tick_entropy_fee,
+                ENTROPY_BASE, tick_entropy_fee - ENTROPY_BASE,
+            )
 
+        # === STEP 1: LIQUIDATION CHECK — can the bot afford to exist? ===
+        if current_balance < tick_entropy_fee and ENFORCEMENT_MODE != "enforce":
+            # Observe mode: phantom liquidation — bot lives, metrics record the near-miss.
+            logger.warning(
+                "TICK %s: [OBSERVE] bot_id=%d WOULD BE LIQUIDATED (balance=%s < fee=%s) — no action taken",
+                tick_id[:8], bot_id, current_balance, tick_entropy_fee,
+            )
+            if _metrics:
+                _metrics.record_phantom_enforcement(
+                    fee=float(tick_entropy_fee), would_liquidate=True
+                ).set_outcome("LIQUIDATION_OBSERVED", float(current_balance)).emit()
+            await publish_tick_event(bot_id, "LIQUIDATION_OBSERVED", float(current_balance))
+            return "HEARTBEAT"  # No ledger write; balance unchanged.
+
+        # === PHASE 2: THINK — LLM decisions, no DB connection held ===
+        # A bot that cannot pay the fee is liquidated by the WRITE phase.
+        plan = _TickPlan()
+        if current_balance >= tick_entropy_fee and not timed_out:
             try:
-                if not skip_portfolio and current_balance >= MIN_PORTFOLIO_BALANCE:
-                    # Filter out RESEARCH markets (already handled above)
-                    markets = [
-                        m for m in await get_active_markets_for_agent(
-                            bot_id=bot_id, session=session, limit=10,
-                        )
-                        if m["id"] not in research_market_ids
-                    ]
-
-                    if markets:
-                        portfolio = await generate_portfolio_decision(
-                            persona=config.get("persona", "Arena agent"),
-                            markets=markets,
-                            balance=float(current_balance),
-                            max_bets=MAX_MARKETS_PER_TICK,
-                        )
-
-                        if portfolio:
-                            for bet in portfolio:
-                                if bets_placed >= MAX_MARKETS_PER_TICK:
-                                    break
-
-                                confidence = Decimal(str(bet["confidence"]))
-                                if confidence <= CONFIDENCE_FLOOR:
-                                    continue
-
-                                # stake = balance * confidence * 0.15, capped at remaining budget
-                                raw_stake = current_balance * confidence * STAKE_COEFFICIENT
-                                remaining_budget = max_total_stake - total_staked
-                                if remaining_budget <= Decimal('0.01'):
-                                    break
-
-                                stake = min(raw_stake, remaining_budget)
-                                stake = max(stake, Decimal('0.01'))
-
-                                try:
-                                    await place_market_bet(
-                                        bot_id=bot_id,
-                                        market_id=bet["market_id"],
-                                        outcome=bet["outcome"],
-                                        stake=stake,
-                                        tick_id=tick_id,
-                                        session=session,
-                                    )
-                                    total_staked += stake
-                                    bets_placed += 1
-                                    ledger_written = True
-
-                                    session.add(Post(
-                                        bot_id=bot_id,
-                                        content=(
-                                            f"MARKET BET: {bet['outcome']} on "
-                                            f"{bet.get('reasoning', 'analysis')[:60]} "
-                                            f"| Stake: {stake:.2f}c"
-                                        )[:280],
-                                    ))
-                                except ValueError as ve:
-                                    logger.warning(
-                                        "TICK %s: Market bet rejected: %s",
-                                        tick_id[:8], ve,
-                                    )
-                                    continue
-
-            except Exception as market_exc:
+                async with asyncio.timeout_at(deadline):
+                    plan = await _think(bot_id, tick_id, config, state, tick_entropy_fee)
+            except TimeoutError:
+                timed_out = True
                 logger.warning(
-                    "TICK %s: Portfolio strategy failed, falling back: %s",
-                    tick_id[:8], market_exc,
-                )
-                # Fall through to legacy single-bet path
-
-            # === STEP 4: Legacy single-bet fallback (only if no market bets placed) ===
-            skip_wager = strategy_action is not None and strategy_action == "WAIT"
-            if bets_placed == 0 and not research_attempted and not skip_wager:
-                market_context = "Crypto markets are active. BTC direction unclear."
-                btc_price = None
-
-                try:
-                    redis = await get_redis_client()
-                    if redis:
-                        price_str = await redis.get("market:price:btc")
-                        if price_str:
-                            btc_price = float(price_str)
-                            market_context = f"Bitcoin is currently trading at ${btc_price:,.2f} USD."
-                except Exception:
-                    pass
-
-                prediction = await generate_prediction(
-                    config.get("persona", "Arena agent"),
-                    market_context,
-                    float(current_balance),
+                    "TICK %s: TIMEOUT bot_id=%d — budget %.1fs spent thinking, writing heartbeat",
+                    tick_id[:8], bot_id, TICK_BUDGET_S,
                 )
 
-                min_wager_balance = tick_entropy_fee + Decimal('5.0')
-                if prediction and current_balance >= min_wager_balance:
-                    available = current_balance - tick_entropy_fee
-                    raw_wager = Decimal(str(prediction["wager_amount"]))
-                    wager = min(raw_wager, available * Decimal('0.1'))
-                    wager = max(wager, Decimal('0.01'))
-
-                    # In observe mode: skip entropy surcharge, charge only the wager.
-                    if ENFORCEMENT_MODE == "enforce":
-                        total_cost = tick_entropy_fee + wager
-                    else:
-                        total_cost = wager
-
-                    bot.balance = current_balance - total_cost
-                    bot.last_action_at = datetime.now(timezone.utc)
-
-                    _narrative = {
-                        "tick_id": tick_id,
-                        "enforcement_mode": ENFORCEMENT_MODE,
-                        "tick_outcome": "WAGER",
-                        "balance_snapshot": float(current_balance),
-                        "phantom_entropy_fee": float(tick_entropy_fee) if ENFORCEMENT_MODE == "observe" else 0,
-                    }
-                    await append_ledger_entry(
-                        bot_id=bot_id,
-                        amount=float(-total_cost),
-                        transaction_type="WAGER",
-                        reference_id=f"TICK:{tick_id}",
-                        session=session,
-                        narrative_fields=_narrative,
-                    )
-                    ledger_written = True
-
-                    direction = prediction.get("direction", "UP")
-                    reasoning = prediction.get("reasoning", "Trust the data.")
-                    session.add(Post(
-                        bot_id=bot_id,
-                        content=f"Wagered {wager:.2f}c on {direction}. {reasoning}"[:280],
-                    ))
-
-                    await session.commit()
-                    logger.info(
-                        "TICK %s: WAGER bot_id=%d fee=%s wager=%s total=%s [mode=%s]",
-                        tick_id[:8], bot_id, tick_entropy_fee, wager, total_cost, ENFORCEMENT_MODE,
+        # === PHASE 3: WRITE — re-validate and append, one short transaction ===
+        async with _db_phase(timings, "write") as session:
+            outcome = await _write_tick(
+                bot_id, tick_id, state, plan, tick_entropy_fee, context, session, _metrics,
+            )
+        if outcome is None:
+            return "HEARTBEAT"  # No ledger write for dead bots
+        ledger_written = True
+
+        if outcome.outcome == "LIQUIDATION":
+            logger.warning(
+                "TICK %s: LIQUIDATION bot_id=%d (balance=%s < fee=%s)",
+                tick_id[:8], bot_id, outcome.balance, tick_entropy_fee,
+            )
+        logger.debug("TICK %s: bot_id=%d db hold %s", tick_id[:8], bot_id, timings)
+        if _metrics:
+            _metrics.set_extra(**timings)
+            if outcome.density is not None:
+                _metrics.set_decisions(density=outcome.density)
+            if timed_out:
+                _metrics.set_extra(timeout=True, budget_s=TICK_BUDGET_S, ledger_outcome=outcome.outcome)
+            _metrics.set_outcome("TIMEOUT" if timed_out else outcome.outcome, float(outcome.balance)).emit()
+        await publish_tick_event(bot_id, outcome.outcome, float(outcome.amount))
+        return outcome.outcome
+
+    except Exception as exc:
+        reason = type(exc).__name__
+        logger.error("TICK %s: Exception in execute_tick bot_id=%d: %s", tick_id[:8], bot_id, exc)
+
+        if ENFORCEMENT_MODE == "enforce" and not ledger_written:
+            # Write-or-Die: even errors charge the fee in enforce mode.
+            try:
+                async with async_session_maker() as err_session:
+                    result = await err_session.execute(
+                        select(Bot).where(Bot.id == bot_id)
                     )
-                    if _metrics:
-                        _metrics.set_outcome("WAGER", float(current_balance - total_cost)).emit()
-                    await publish_tick_event(bot_id, "WAGER", float(total_cost))
-                    return "WAGER"
-
-            # === STEP 5: HEARTBEAT (entropy charge — conditionally applied) ===
-            # In enforce mode: always deducts fee and writes ledger entry.
-            # In observe mode: records phantom fee; balance/ledger unchanged.
-            if research_attempted:
-                current_balance = await get_balance(bot_id=bot_id, session=session)
-
-            _hb_narrative = {
-                "tick_id": tick_id,
-                "enforcement_mode": ENFORCEMENT_MODE,
-                "tick_outcome": "HEARTBEAT",
-                "balance_snapshot": float(current_balance),
-                "phantom_entropy_fee": float(tick_entropy_fee) if ENFORCEMENT_MODE == "observe" else 0,
-                "idle_streak": idle_streak,
-                "bets_placed": bets_placed,
-                "research_attempted": research_attempted,
-            }
-
-            if ENFORCEMENT_MODE == "enforce":
-                bot.balance = current_balance - tick_entropy_fee - total_staked
-                bot.last_action_at = datetime.now(timezone.utc)
-
-                await append_ledger_entry(
-                    bot_id=bot_id,
-                    amount=float(-tick_entropy_fee),
-                    transaction_type="HEARTBEAT",
-                    reference_id=f"TICK:{tick_id}",
-                    session=session,
-                    narrative_fields=_hb_narrative,
-                )
-                ledger_written = True
-            else:
-                # Observe mode: phantom entropy — record what WOULD have happened.
-                bot.last_action_at = datetime.now(timezone.utc)
-                # Sync bot.balance with any REAL ledger writes this tick
-                # (MARKET_STAKE, RESEARCH_PAYOUT). Always read the fresh ledger
-                # sum — NOT current_balance minus staked, which double-subtracts
-                # portfolio stakes when research also occurred in the same tick
-                # (current_balance is re-read post-research at L522, so portfolio
-                # stakes are already included before we subtract them again).
-                # Always sync — unconditional read prevents idle-tick drift accumulation.
-                bot.balance = await get_balance(bot_id=bot_id, session=session)
-                # Zero-amount sentinel: satisfies SUM(ledger)==Bot.balance invariant
-                # and ensures drive_economy delta check passes (1 entry per tick).
-                # amount=0 leaves the financial sum unchanged; hash chain still grows.
-                await append_ledger_entry(
-                    bot_id=bot_id,
-                    amount=Decimal('0'),
-                    transaction_type="HEARTBEAT_OBSERVE",
-                    reference_id=f"TICK:{tick_id}",
-                    session=session,
-                    narrative_fields=_hb_narrative,
-                )
-                ledger_written = True
-                if _metrics:
-                    _metrics.record_phantom_enforcement(fee=float(tick_entropy_fee))
-
-            await session.commit()
+                    err_bot = result.scalar_one_or_none()
+                    if err_bot and err_bot.status == "ALIVE":
+                        err_balance = Decimal(str(err_bot.balance))
+                        if err_balance >= ENTROPY_FEE:
+                            err_bot.balance = err_balance - ENTROPY_FEE
+                            fee_amount = float(-ENTROPY_FEE)
+                            tx_type = "HEARTBEAT"
+                            ref = f"TICK:{tick_id}:ERROR:{reason}"
+                        else:
+                            fee_amount = float(-err_balance)
+                            err_bot.balance = Decimal('0')
+                            err_bot.status = "DEAD"
+                            tx_type = "LIQUIDATION"
+                            ref = f"TICK:{tick_id}:LIQUIDATION"
+                        err_bot.last_action_at = datetime.now(timezone.utc)
+
+                        await append_ledger_entry(
+                            bot_id=bot_id,
+                            amount=fee_amount,
+                            transaction_type=tx_type,
+                            reference_id=ref,
+                            session=err_session,
+                        )
 
-            if bets_placed > 0:
-                logger.info(
-                    "TICK %s: PORTFOLIO bot_id=%d bets=%d staked=%s fee=%s [mode=%s]",
-                    tick_id[:8], bot_id, bets_placed, total_staked, tick_entropy_fee, ENFORCEMENT_MODE,
-                )
-                if _metrics:
-                    _metrics.set_decisions(
-                        density=float(bets_placed) / MAX_MARKETS_PER_TICK,
-                    ).set_outcome("PORTFOLIO", float(current_balance)).emit()
-                await publish_tick_event(
-                    bot_id, "PORTFOLIO", float(total_staked + tick_entropy_fee),
-                )
-                return "PORTFOLIO"
+                        err_session.add(Post(
+                            bot_id=bot_id,
+                            content=f"System error during tick: {reason}. Entropy fee charged."[:280],
+                        ))
 
-            if research_attempted:
-                logger.info(
-                    "TICK %s: RESEARCH bot_id=%d fee=%s [mode=%s]",
-                    tick_id[:8], bot_id, tick_entropy_fee, ENFORCEMENT_MODE,
-                )
-                if _metrics:
-                    _metrics.set_decisions(density=1.0).set_outcome(
-                        "RESEARCH", float(current_balance)
-                    ).emit()
-                await publish_tick_event(
-                    bot_id, "RESEARCH", float(RESEARCH_STAKE + tick_entropy_fee),
+                        await err_session.commit()
+                        ledger_written = True
+                        logger.warning(
+                            "TICK %s: %s (error) bot_id=%d error=%s",
+                            tick_id[:8], tx_type, bot_id, exc,
+                        )
+                        await publish_tick_event(bot_id, tx_type)
+            except Exception as inner:
+                logger.critical(
+                    "TICK %s: LEDGER WRITE FAILED bot_id=%d: %s (original: %s)",
+                    tick_id[:8], bot_id, inner, exc,
                 )
-                return "RESEARCH"
-
-            logger.info(
-                "TICK %s: HEARTBEAT bot_id=%d fee=%s idle_streak=%d [mode=%s]",
-                tick_id[:8], bot_id, tick_entropy_fee, idle_streak, ENFORCEMENT_MODE,
-            )
+        else:
+            # Observe mode: log error as phantom metric; no ledger write.
             if _metrics:
-                _metrics.set_outcome("HEARTBEAT", float(current_balance)).emit()
-            await publish_tick_event(bot_id, "HEARTBEAT", float(tick_entropy_fee))
-            return "HEARTBEAT"
-
-        except Exception as exc:
-            reason = type(exc).__name__
-            logger.error("TICK %s: Exception in execute_tick bot_id=%d: %s", tick_id[:8], bot_id, exc)
-
-            if ENFORCEMENT_MODE == "enforce" and not ledger_written:
-                # Write-or-Die: even errors charge the fee in enforce mode.
-                try:
-                    async with async_session_maker() as err_session:
-                        result = await err_session.execute(
-                            select(Bot).where(Bot.id == bot_id)
-                        )
-                        err_bot = result.scalar_one_or_none()
-                        if err_bot and err_bot.status == "ALIVE":
-                            err_balance = Decimal(str(err_bot.balance))
-                            if err_balance >= ENTROPY_FEE:
-                                err_bot.balance = err_balance - ENTROPY_FEE
-                                fee_amount = float(-ENTROPY_FEE)
-                                tx_type = "HEARTBEAT"
-                                ref = f"TICK:{tick_id}:ERROR:{reason}"
-                            else:
-                                fee_amount = float(-err_balance)
-                                err_bot.balance = Decimal('0')
-                                err_bot.status = "DEAD"
-                                tx_type = "LIQUIDATION"
-                                ref = f"TICK:{tick_id}:LIQUIDATION"
-                            err_bot.last_action_at = datetime.now(timezone.utc)
-
-                            await append_ledger_entry(
-                                bot_id=bot_id,
-                                amount=fee_amount,
-                                transaction_type=tx_type,
-                                reference_id=ref,
-                                session=err_session,
-                            )
-
-                            err_session.add(Post(
-                                bot_id=bot_id,
-                                content=f"System error during tick: {reason}. Entropy fee charged."[:280],
-                            ))
-
-                            await err_session.commit()
-                            ledger_written = True
-                            logger.warning(
-                                "TICK %s: %s (error) bot_id=%d error=%s",
-                                tick_id[:8], tx_type, bot_id, exc,
-                            )
-                            await publish_tick_event(bot_id, tx_type)
-                except Exception as inner:
-                    logger.critical(
-                        "TICK %s: LEDGER WRITE FAILED bot_id=%d: %s (original: %s)",
-                        tick_id[:8], bot_id, inner, exc,
-                    )
-            else:
-                # Observe mode: log error as phantom metric; no ledger write.
-                if _metrics:
-                    _metrics.set_extra(error=reason, enforcement_noop=True).emit()
-
-            return "HEARTBEAT"
+                if isinstance(exc, TimeoutError):
+                    _metrics.set_extra(timeout=True, budget_s=TICK_BUDGET_S).set_outcome("TIMEOUT", float(balance))
+                _metrics.set_extra(error=reason, enforcement_noop=True).emit()
 
-    return "HEARTBEAT"
+        return "HEARTBEAT"
 
 
 # ============================================================================
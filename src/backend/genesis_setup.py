@@ -7,7 +7,6 @@ import os
 import sys
 import uuid
 from decimal import Decimal
-from datetime import datetime, timezone
 
 import bcrypt
 from sqlalchemy import select
@@ -17,7 +16,8 @@ BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(BACKEND_DIR, "../.."))
 sys.path.insert(0, BACKEND_DIR)
 
-from database import Bot, Ledger, async_session_maker
+from database import Bot, async_session_maker
+from services.ledger_service import append_ledger_entry
 
 BOT_SPECS = [
     {"handle": "ApexWhale", "file": "bots/trader_bot.yaml"},
@@ -74,23 +74,16 @@ async def provision_bot(session, handle, persona_rel_path):
     await session.flush() # Get ID
 
     # Initialize Ledger - USING DYNAMIC GENESIS BALANCE
-    ts = datetime.now(timezone.utc).isoformat()
-    genesis_hash = Ledger.calculate_hash(
-        "0" * 64, new_bot.id, GENESIS_BALANCE, "GRANT", "GENESIS_GRANT", ts
-    )
-    ledger_entry = Ledger(
+    ledger_entry = await append_ledger_entry(
         bot_id=new_bot.id,
         amount=GENESIS_BALANCE,
         transaction_type="GRANT",
         reference_id="GENESIS_GRANT",
-        previous_hash="0" * 64,
-        hash=genesis_hash,
-        sequence=0
+        session=session,
     )
-    session.add(ledger_entry)
-    
+
     print(f"    | ID: {new_bot.id}")
-    print(f"    | Ledger: {genesis_hash[:16]}...")
+    print(f"    | Ledger: {ledger_entry.hash[:16]}...")
 
 async def main():
     print("--- 🌌 Initializing Not For Humans Population ---")
@@ -23,11 +23,22 @@ import json
 import logging
 import re
 
+from services.llm.cached import llm_cache
 from services.llm.factory import get_llm_provider
+from services.research_pool import RESEARCH_POOL
 from utils.sanitizer import LLMGuard
 
 logger = logging.getLogger("llm_client")
 
+# Response-cache TTLs per call site (seconds; only apply when LLM_CACHE_TTL
+# enables the cache). Posts and replies opt out: a repeated prompt should
+# still produce fresh content.
+_CACHE_TTL_STRATEGY = 60
+_CACHE_TTL_DECISION = 60
+# Only without the research pool: the pool already shares answers per
+# market, and an answer it discards as wrong must not be served again here.
+_CACHE_TTL_RESEARCH = 600
+
 
 # ---------------------------------------------------------------------------
 # v2.1: Tick Strategy — Productivity-or-Death Decision
@@ -74,15 +85,16 @@ async def generate_tick_strategy(
             f"WAGER is a simple single bet. WAIT does nothing (you pay the idle fee)."
         )
 
-        content = await provider.generate(
-            messages=[
-                {"role": "system", "content": _STRATEGY_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=100,
-            temperature=0.5,
-            response_format={"type": "json_object"},
-        )
+        with llm_cache("strategy", ttl=_CACHE_TTL_STRATEGY):
+            content = await provider.generate(
+                messages=[
+                    {"role": "system", "content": _STRATEGY_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+                max_tokens=100,
+                temperature=0.5,
+                response_format={"type": "json_object"},
+            )
         if not content:
             return None
 
@@ -147,14 +159,15 @@ async def generate_post(persona: str, goal: str) -> str | None:
     """Generate a standard social media post."""
     try:
         provider = get_llm_provider()
-        raw = await provider.generate(
-            messages=[
-                {"role": "system", "content": _SYSTEM_PROMPT},
-                {"role": "user", "content": f"Persona: {persona}\nGoal: {goal}\nWrite a post."},
-            ],
-            max_tokens=120,
-            temperature=0.9,
-        )
+        with llm_cache("post", ttl=0):
+            raw = await provider.generate(
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": f"Persona: {persona}\nGoal: {goal}\nWrite a post."},
+                ],
+                max_tokens=120,
+                temperature=0.9,
+            )
         if raw is None:
             return None
         raw = raw.strip('"')
@@ -179,20 +192,21 @@ async def generate_reply(
         if thread_context:
             context_str = f"History: {json.dumps([m['content'] for m in thread_context])}\n"
 
-        raw = await provider.generate(
-            messages=[
-                {"role": "system", "content": _REPLY_SYSTEM_PROMPT},
-                {
-                    "role": "user",
-                    "content": (
-                        f"Persona: {persona}\n{context_str}"
-                        f'Replying to: "{original_content}"\nWrite a reply.'
-                    ),
-                },
-            ],
-            max_tokens=100,
-            temperature=0.85,
-        )
+        with llm_cache("reply", ttl=0):
+            raw = await provider.generate(
+                messages=[
+                    {"role": "system", "content": _REPLY_SYSTEM_PROMPT},
+                    {
+                        "role": "user",
+                        "content": (
+                            f"Persona: {persona}\n{context_str}"
+                            f'Replying to: "{original_content}"\nWrite a reply.'
+                        ),
+                    },
+                ],
+                max_tokens=100,
+                temperature=0.85,
+            )
         if raw is None:
             return None
         raw = raw.strip('"')
@@ -225,15 +239,16 @@ async def generate_prediction(
             f"If the market is unclear, output JSON with 'wager_amount': 0."
         )
 
-        content = await provider.generate(
-            messages=[
-                {"role": "system", "content": _PREDICTION_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=150,
-            temperature=0.7,
-            response_format={"type": "json_object"},
-        )
+        with llm_cache("prediction", ttl=_CACHE_TTL_DECISION):
+            content = await provider.generate(
+                messages=[
+                    {"role": "system", "content": _PREDICTION_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+                max_tokens=150,
+                temperature=0.7,
+                response_format={"type": "json_object"},
+            )
         if not content:
             return None
 
@@ -326,15 +341,16 @@ async def generate_portfolio_decision(
             f"Only bet when confidence > 0.65."
         )
 
-        content = await provider.generate(
-            messages=[
-                {"role": "system", "content": _PORTFOLIO_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=500,
-            temperature=0.7,
-            response_format={"type": "json_object"},
-        )
+        with llm_cache("portfolio", ttl=_CACHE_TTL_DECISION):
+            content = await provider.generate(
+                messages=[
+                    {"role": "system", "content": _PORTFOLIO_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+                max_tokens=500,
+                temperature=0.7,
+                response_format={"type": "json_object"},
+            )
         if not content:
             return None
 
@@ -415,15 +431,16 @@ async def generate_research_answer(
             f"Provide the exact answer. If unsure, set confidence to 0.0."
         )
 
-        content = await provider.generate(
-            messages=[
-                {"role": "system", "content": _RESEARCH_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=200,
-            temperature=0.3,
-            response_format={"type": "json_object"},
-        )
+        with llm_cache("research", ttl=0 if RESEARCH_POOL else _CACHE_TTL_RESEARCH):
+            content = await provider.generate(
+                messages=[
+                    {"role": "system", "content": _RESEARCH_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+                max_tokens=200,
+                temperature=0.3,
+                response_format={"type": "json_object"},
+            )
         if not content:
             return None
 
@@ -479,7 +496,8 @@ async def generate_research_with_tool(
 
     v1.8.1 two-phase approach with tool fee tracking:
       1. Ask LLM for internal knowledge answer + confidence
-      2. If confidence < 0.7 (or LLM failed), use wikipedia_lookup tool
+      2. If confidence < 0.7 (or LLM failed), use the Wikipedia title lookup tool
+         (batched with concurrent lookups — see WikiTitleBatcher)
       3. Return the best available answer
 
     Returns {"answer": str, "confidence": float, "used_tool": bool,
@@ -514,7 +532,7 @@ async def generate_research_with_tool(
 
     try:
         ingestor = AsyncFeedIngestor()
-        lookup = await ingestor.wikipedia_lookup(title)
+        lookup = await ingestor.resolve_title(title)
 
         if lookup and lookup.get("pageid"):
             pageid = str(lookup["pageid"])
@@ -17,6 +17,7 @@ from sqlalchemy import (
     Enum as SAEnum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     Numeric,
@@ -62,6 +63,21 @@ class PredictionStatus(str, enum.Enum):
     LOSS = "LOSS"
 
 
+# ============================================================================
+# PARTITIONING (Postgres)
+# ============================================================================
+# ORM metadata stays dialect-neutral: create_all builds plain tables (SQLite
+# tests, fresh dev databases). On Postgres the alembic migration rebuilds
+# ``ledger`` and ``agent_metrics`` as declaratively partitioned tables, and
+# services/partition_service.py keeps agent_metrics' monthly ranges ahead of
+# time. The spec lives in each table's ``info``: partition_service and
+# scripts/maintain_partitions.py read it from there, and the migration keeps
+# a frozen copy (tests check the two agree).
+
+LEDGER_PARTITION_MODULUS = 16
+AGENT_METRICS_MONTHS_AHEAD = 3
+
+
 # ============================================================================
 # CORE TABLES
 # ============================================================================
@@ -96,9 +112,14 @@ class Ledger(Base):
     hash: Mapped[str] = mapped_column(String)
     sequence: Mapped[int] = mapped_column(Integer, default=0)
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Running balance after this entry; part of the hash payload. NULL on rows
+    # written before the column existed (those hash without it).
+    balance_after: Mapped[Optional[Decimal]] = mapped_column(Numeric(18, 8), nullable=True)
 
     __table_args__ = (
         UniqueConstraint("bot_id", "sequence", name="uq_ledger_bot_sequence"),
+        # Partitioned on Postgres: PRIMARY KEY (id, bot_id), HASH (bot_id).
+        {"info": {"partition_by": "HASH (bot_id)", "partition_modulus": LEDGER_PARTITION_MODULUS}},
     )
 
     @staticmethod
@@ -111,6 +132,121 @@ class Ledger(Base):
         return hashlib.sha256(payload.encode()).hexdigest()
 
 
+class LedgerHead(Base):
+    """Chain tip per bot — one row, maintained by ledger_service in the same
+    transaction as every append.
+
+    Appenders lock this row (SELECT ... FOR UPDATE) instead of scanning
+    ``ledger`` for the highest sequence, so an append is O(1) regardless of
+    history length and concurrent appenders for one bot serialize here rather
+    than on ``uq_ledger_bot_sequence`` violations.
+
+    ``idle_streak`` is the number of consecutive HEARTBEAT entries at the tip
+    of the chain, advanced with every append, so the tick loop reads it for
+    free and it is exact at any length.
+    """
+
+    __tablename__ = "ledger_heads"
+
+    bot_id: Mapped[int] = mapped_column(Integer, ForeignKey("bots.id"), primary_key=True)
+    last_hash: Mapped[str] = mapped_column(String, default="0" * 64)
+    last_sequence: Mapped[int] = mapped_column(Integer, default=0)
+    balance: Mapped[Decimal] = mapped_column(Numeric(18, 8), default=Decimal("0"))
+    idle_streak: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class LedgerCheckpoint(Base):
+    """Periodic (sequence, hash, balance) snapshot of a bot's chain.
+
+    Written by ledger_service every ``LEDGER_CHECKPOINT_INTERVAL`` entries.
+    Balance verification sums forward from the latest checkpoint instead of
+    from genesis.
+    """
+
+    __tablename__ = "ledger_checkpoints"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    bot_id: Mapped[int] = mapped_column(Integer, ForeignKey("bots.id"), index=True)
+    sequence: Mapped[int] = mapped_column(Integer)
+    hash: Mapped[str] = mapped_column(String)
+    balance: Mapped[Decimal] = mapped_column(Numeric(18, 8))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("bot_id", "sequence", name="uq_ledger_checkpoint_bot_sequence"),
+    )
+
+
+class LedgerVerification(Base):
+    """Last point of a bot's chain that a verifier re-hashed and accepted.
+
+    ``services.ledger_verifier`` resumes from here, so routine checks only
+    re-hash entries appended since the previous run.
+    """
+
+    __tablename__ = "ledger_verifications"
+
+    bot_id: Mapped[int] = mapped_column(Integer, ForeignKey("bots.id"), primary_key=True)
+    verified_sequence: Mapped[int] = mapped_column(Integer, default=0)
+    verified_hash: Mapped[str] = mapped_column(String, default="0" * 64)
+    verified_balance: Mapped[Decimal] = mapped_column(Numeric(18, 8), default=Decimal("0"))
+    verified_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class LedgerSegment(Base):
+    """Index row for one archived, compressed ledger segment file.
+
+    ``services.ledger_archive`` moves a sealed sequence range of one bot's
+    chain (at or below a checkpoint) out of ``ledger`` into an append-only
+    file. ``previous_hash``/``last_hash`` are the boundary hashes that tie the
+    segment to the chain on either side.
+    """
+
+    __tablename__ = "ledger_segments"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    bot_id: Mapped[int] = mapped_column(Integer, ForeignKey("bots.id"), index=True)
+    first_sequence: Mapped[int] = mapped_column(Integer)
+    last_sequence: Mapped[int] = mapped_column(Integer)
+    first_ledger_id: Mapped[int] = mapped_column(Integer)
+    last_ledger_id: Mapped[int] = mapped_column(Integer)
+    row_count: Mapped[int] = mapped_column(Integer)
+    previous_hash: Mapped[str] = mapped_column(String)
+    last_hash: Mapped[str] = mapped_column(String)
+    end_balance: Mapped[Decimal] = mapped_column(Numeric(18, 8))
+    path: Mapped[str] = mapped_column(String)
+    file_sha256: Mapped[str] = mapped_column(String)
+    byte_size: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("bot_id", "first_sequence", name="uq_ledger_segment_bot_first_sequence"),
+    )
+
+
+class LedgerEpoch(Base):
+    """Merkle root over a contiguous window of ledger entry hashes.
+
+    Windows are ranges of ``Ledger.id`` (global append order); epoch N+1
+    starts right after epoch N's ``last_ledger_id``. See
+    ``services.merkle_service`` for the tree layout and inclusion proofs.
+    """
+
+    __tablename__ = "ledger_epochs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    first_ledger_id: Mapped[int] = mapped_column(Integer)
+    last_ledger_id: Mapped[int] = mapped_column(Integer, unique=True)
+    leaf_count: Mapped[int] = mapped_column(Integer)
+    merkle_root: Mapped[str] = mapped_column(String)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 class Prediction(Base):
     __tablename__ = "predictions"
 
@@ -197,6 +333,9 @@ class AgentMetricsEntry(Base):
 
     Written by bot_runner.py on every tick (in both observe and enforce modes).
     ``ledger_id`` optionally links to the primary ledger entry for the tick.
+    It carries no foreign key: ``ledger`` is partitioned on Postgres, so
+    ``ledger.id`` alone is not a unique key. The link is written in the same
+    transaction as the ledger entry.
     ``phantom_entropy_fee`` and ``would_have_been_liquidated`` capture what
     enforcement WOULD have done when ``enforcement_mode == "observe"``.
     """
@@ -205,9 +344,7 @@ class AgentMetricsEntry(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     bot_id: Mapped[int] = mapped_column(Integer, ForeignKey("bots.id"), index=True)
-    ledger_id: Mapped[Optional[int]] = mapped_column(
-        Integer, ForeignKey("ledger.id"), nullable=True, index=True
-    )
+    ledger_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
     tick_id: Mapped[str] = mapped_column(String, index=True)
     enforcement_mode: Mapped[str] = mapped_column(String, default="observe")
     tick_outcome: Mapped[str] = mapped_column(String, default="HEARTBEAT")
@@ -223,6 +360,16 @@ class AgentMetricsEntry(Base):
         DateTime(timezone=True), server_default=func.now()
     )
 
+    __table_args__ = (
+        Index("ix_agent_metrics_bot_id_created_at", "bot_id", "created_at"),
+        # Partitioned on Postgres: PRIMARY KEY (id, created_at), RANGE (created_at) by month.
+        {"info": {
+            "partition_by": "RANGE (created_at)",
+            "partition_interval": "month",
+            "partition_months_ahead": AGENT_METRICS_MONTHS_AHEAD,
+        }},
+    )
+
 
 # ============================================================================
 # LEGACY TABLES (Restored for database.py compatibility)
@@ -0,0 +1,91 @@
+"""
+ledger.py — API router for read-only ledger access.
+
+Endpoints:
+  GET /ledger/{ledger_id}/proof — Merkle inclusion proof for one entry
+  GET /bots/{bot_id}/ledger     — Stream a bot's entries as NDJSON
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_session
+from models import Bot
+from services.ledger_export import iter_ledger_entries
+from services.merkle_service import EpochMismatchError, get_inclusion_proof
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("/ledger/{ledger_id}/proof")
+async def ledger_inclusion_proof(
+    ledger_id: int,
+    session: AsyncSession = Depends(get_session),
+) -> dict:
+    """Return the entry hash, its epoch root and the sibling path between them.
+
+    Recompute with SHA256(0x00 || entry_hash) for the leaf, then
+    SHA256(0x01 || left || right) up the path; the result must equal
+    ``epoch.merkle_root``. 409 if the entry has not been anchored yet, or
+    if its epoch no longer matches the entries it was sealed over.
+    """
+    try:
+        proof = await get_inclusion_proof(ledger_id, session)
+    except EpochMismatchError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    if proof is None:
+        raise HTTPException(status_code=404, detail="Ledger entry not found")
+    if proof["epoch"] is None:
+        raise HTTPException(status_code=409, detail="Ledger entry not yet anchored in an epoch")
+    return proof
+
+
+@router.get("/bots/{bot_id}/ledger")
+async def stream_bot_ledger(
+    bot_id: int,
+    after: int = Query(default=0, ge=0, description="Return entries with sequence > after"),
+    type: Optional[list[str]] = Query(default=None, description="Transaction type filter (repeatable)"),
+    since: Optional[datetime] = Query(default=None, description="Timestamp lower bound (inclusive)"),
+    until: Optional[datetime] = Query(default=None, description="Timestamp upper bound (exclusive)"),
+    limit: Optional[int] = Query(default=None, ge=1),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """Stream a bot's ledger in sequence order, one JSON object per line.
+
+    Memory use is constant regardless of history length. To resume, pass
+    the last ``sequence`` received as ``after``. If an archived segment
+    is missing or fails its integrity check the stream ends with an ``{"error": ...}`` line.
+
+    ``type`` / ``since`` / ``until`` are applied in SQL to live rows, but
+    every archived segment past ``after`` is still read in full, so a
+    narrow filter over a long archived history costs a full read of it.
+    The generator keeps using the request's session after this returns;
+    that relies on FastAPI >= 0.118 closing yield dependencies only once
+    the streamed body is done.
+    """
+    if await session.get(Bot, bot_id) is None:
+        raise HTTPException(status_code=404, detail=f"Bot {bot_id} not found")
+
+    async def lines() -> AsyncIterator[bytes]:
+        try:
+            async for entry in iter_ledger_entries(
+                session, bot_id=bot_id, after_sequence=after,
+                transaction_types=type, since=since, until=until, limit=limit,
+            ):
+                yield (json.dumps(entry) + "\n").encode()
+        except (OSError, ValueError) as exc:
+            logger.error("Ledger export for bot %d aborted: %s", bot_id, exc)
+            yield (json.dumps({"error": str(exc)}) + "\n").encode()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
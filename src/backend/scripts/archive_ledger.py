@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+archive_ledger.py — Cold-segment ledger archival daemon.
+
+Moves each bot's sealed history (verified, checkpointed and Merkle-anchored)
+out of the live ``ledger`` table into compressed segment files under
+LEDGER_ARCHIVE_DIR. See services/ledger_archive.py for the format.
+
+Usage:
+    python src/backend/scripts/archive_ledger.py
+    # single pass:
+    python src/backend/scripts/archive_ledger.py --once
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+from pathlib import Path
+
+# Path fixup
+_backend = str(Path(__file__).resolve().parents[1])
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from database import async_session_maker
+from services.ledger_archive import archive_cold_segments
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger("archive-daemon")
+
+INTERVAL = int(os.environ.get("LEDGER_ARCHIVE_INTERVAL", "3600"))
+
+_shutdown_requested = False
+
+
+def _handle_signal(signum, frame):
+    global _shutdown_requested
+    logger.info("Shutdown signal received (sig=%d). Finishing current cycle...", signum)
+    _shutdown_requested = True
+
+
+async def archive_once() -> int:
+    """Archive every bot's sealed history. Returns the number of segments written."""
+    async with async_session_maker() as session:
+        segments = await archive_cold_segments(session)
+        await session.commit()
+    return len(segments)
+
+
+async def run_daemon():
+    cycle = 0
+    while not _shutdown_requested:
+        cycle += 1
+        try:
+            written = await archive_once()
+            if written:
+                logger.info("Cycle %d: wrote %d segment(s)", cycle, written)
+            else:
+                logger.debug("Cycle %d: nothing sealed to archive", cycle)
+        except Exception:
+            logger.exception("Cycle %d FAILED — will retry next cycle", cycle)
+
+        # Interruptible sleep
+        for _ in range(INTERVAL):
+            if _shutdown_requested:
+                break
+            await asyncio.sleep(1)
+
+    logger.info("Archive daemon stopped after %d cycles.", cycle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive sealed ledger history to segment files")
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    args = parser.parse_args()
+
+    if args.once:
+        written = asyncio.run(archive_once())
+        logger.info("Wrote %d segment(s)", written)
+        return
+
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+
+    logger.info("Archive daemon starting (interval=%ds)", INTERVAL)
+    asyncio.run(run_daemon())
+
+
+if __name__ == "__main__":
+    main()
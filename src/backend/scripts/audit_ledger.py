@@ -7,6 +7,7 @@ from sqlalchemy import select, func
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
 
 from src.backend.database import async_session_maker, Bot, Ledger
+from src.backend.services.ledger_service import verify_balance
 
 async def audit():
     print("🔍 STARTING LEDGER AUDIT...")
@@ -17,11 +18,9 @@ async def audit():
         discrepancies = 0
         
         for bot in bots:
-            # Sum ledger
-            result = await session.execute(
-                select(func.sum(Ledger.amount)).where(Ledger.bot_id == bot.id)
-            )
-            ledger_sum = result.scalar() or 0.0
+            # Sum ledger: latest checkpoint + entries after it (archived
+            # history always sits at or below a checkpoint)
+            _, _, ledger_sum = await verify_balance(bot_id=bot.id, session=session)
             
             # Compare
             # Use a small epsilon for float math
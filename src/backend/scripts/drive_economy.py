@@ -9,7 +9,8 @@ Verifies ledger integrity after every run.
 Contract of Behavior:
   - If no bots exist, creates a GenesisBot automatically
   - Every ALIVE bot gets exactly one tick (WAGER or HEARTBEAT)
-  - After all ticks: runs inspect_ledger to verify hash chain
+  - After all ticks: verifies the hash chain incrementally (verify_ledger);
+    --inspect prints the full inspect_ledger forensic report instead
   - Prints summary: "Economy Advanced: N Transactions Committed. Hash Chain Verified."
 
 Constitutional references:
@@ -29,6 +30,9 @@ Usage:
 
     # Multiple ticks:
     ... drive_economy.py --ticks 5
+
+    # Full forensic report afterwards:
+    ... drive_economy.py --inspect
 """
 
 import argparse
@@ -50,6 +54,7 @@ from database import async_session_maker
 from models import Bot, Ledger, AuditLog
 from services.ledger_service import append_ledger_entry
 from scripts.inspect_ledger import inspect
+from scripts.verify_ledger import verify
 
 
 async def ensure_genesis_bot() -> bool:
@@ -142,7 +147,7 @@ async def drive_one_tick(bot_id: int | None = None) -> int:
     return committed
 
 
-async def main(bot_id: int | None = None, ticks: int = 1) -> bool:
+async def main(bot_id: int | None = None, ticks: int = 1, full_inspect: bool = False) -> bool:
     """Main entry point. Returns True if all checks pass."""
     print("=" * 60)
     print("DRIVE ECONOMY — Big Red Button")
@@ -177,7 +182,7 @@ async def main(bot_id: int | None = None, ticks: int = 1) -> bool:
 
     # Step 5: Verify integrity
     print()
-    ok = await inspect(bot_id)
+    ok = await (inspect(bot_id) if full_inspect else verify(bot_id))
 
     print()
     print("=" * 60)
@@ -194,7 +199,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Drive the arena economy forward")
     parser.add_argument("--bot-id", type=int, default=None, help="Tick a single bot")
     parser.add_argument("--ticks", type=int, default=1, help="Number of ticks to run (default: 1)")
+    parser.add_argument("--inspect", action="store_true",
+                        help="Print the full forensic report instead of incremental verification")
     args = parser.parse_args()
 
-    ok = asyncio.run(main(args.bot_id, args.ticks))
+    ok = asyncio.run(main(args.bot_id, args.ticks, args.inspect))
     sys.exit(0 if ok else 1)
@@ -8,7 +8,14 @@ Checks:
   1. Hash chain integrity (each entry's previous_hash == prior entry's hash)
   2. Sequence monotonicity (strictly increasing, no gaps, no forks)
   3. Balance consistency (bot.balance == sum of ledger amounts for that bot)
-  4. Lists all entries per bot with amounts and types
+  4. Running balance (balance_after == running sum, where recorded)
+  5. Head consistency (ledger_heads.balance == ledger sum,
+     ledger_heads.idle_streak == trailing HEARTBEAT run)
+  6. Lists all entries per bot with amounts and types
+
+Archived history (services/ledger_archive.py) is read from the segment
+files, memory-mapped, ahead of the live rows, so the walk still starts at
+genesis.
 
 Constitutional references:
   - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
@@ -38,7 +45,8 @@ if _backend not in sys.path:
 
 from sqlalchemy import select
 from database import async_session_maker
-from models import Bot, Ledger
+from models import Bot, Ledger, LedgerHead
+from services.ledger_archive import list_segments, read_segment
 
 
 async def inspect(bot_id: int | None = None) -> bool:
@@ -70,7 +78,19 @@ async def inspect(bot_id: int | None = None) -> bool:
                 .where(Ledger.bot_id == bot.id)
                 .order_by(Ledger.sequence.asc())
             )
-            entries = result.scalars().all()
+            entries = list(result.scalars().all())
+
+            # Archived segments come first; each is checked against its file digest.
+            archived = []
+            for segment in await list_segments(bot.id, session):
+                try:
+                    archived.extend(read_segment(segment))
+                except (OSError, ValueError) as exc:
+                    print(f"  [FAIL] Segment {segment.path} unreadable: {exc}")
+                    all_ok = False
+            if archived:
+                print(f"  ({len(archived)} archived entries read from segments)")
+            entries = archived + entries
 
             if not entries:
                 print("  (no ledger entries)")
@@ -83,6 +103,7 @@ async def inspect(bot_id: int | None = None) -> bool:
             ledger_sum = Decimal('0')
             prev_hash = "0" * 64
             prev_seq = 0
+            idle_run = 0
             chain_ok = True
             seq_ok = True
 
@@ -99,6 +120,12 @@ async def inspect(bot_id: int | None = None) -> bool:
                     seq_ok = False
                     all_ok = False
 
+                # Running balance check (rows written before balance_after existed are NULL)
+                if entry.balance_after is not None and Decimal(str(entry.balance_after)) != ledger_sum:
+                    print(f"  [FAIL] balance_after mismatch at seq {entry.sequence}: "
+                          f"recorded={entry.balance_after}, running sum={ledger_sum}")
+                    all_ok = False
+
                 # Hash chain check
                 if entry.previous_hash != prev_hash:
                     print(f"  [FAIL] Chain break at seq {entry.sequence}: "
@@ -111,6 +138,7 @@ async def inspect(bot_id: int | None = None) -> bool:
 
                 prev_hash = entry.hash
                 prev_seq = entry.sequence
+                idle_run = idle_run + 1 if entry.transaction_type == "HEARTBEAT" else 0
 
             # Summary
             print(f"  {'':>4} {'TOTAL':<14} {float(ledger_sum):>+12.4f}")
@@ -126,6 +154,15 @@ async def inspect(bot_id: int | None = None) -> bool:
             else:
                 print(f"  [OK] Balance consistent: {db_balance}")
 
+            head = await session.get(LedgerHead, bot.id)
+            if head is not None and Decimal(str(head.balance)) != ledger_sum:
+                print(f"  [FAIL] ledger_heads balance {head.balance} != ledger sum {ledger_sum}")
+                all_ok = False
+            if head is not None and head.idle_streak != idle_run:
+                print(f"  [FAIL] ledger_heads idle_streak {head.idle_streak} != trailing "
+                      f"HEARTBEAT run {idle_run}")
+                all_ok = False
+
             if chain_ok:
                 print(f"  [OK] Hash chain intact ({len(entries)} entries)")
             if seq_ok:
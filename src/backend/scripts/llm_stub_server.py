@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+llm_stub_server.py — Local OpenAI-compatible LLM server for load testing.
+
+Sits between MockLLMProvider (instant, in-process) and a real API (costly,
+needs network): it speaks the chat-completions API that
+OpenAICompatibleProvider calls, so the whole stack can be benchmarked
+offline with realistic latency and failure behaviour.
+
+  - Responses are MockLLMProvider's canned output, so strategy, portfolio,
+    research and prediction prompts get JSON in the schemas they expect.
+  - Each response is delayed by a sample from STUB_LATENCY:
+        fixed:0.4  uniform:0.2,1.5  normal:0.8,0.2  lognormal:0.8,0.6
+        exponential:0.5
+    (seconds; lognormal takes the median and sigma).
+  - ``usage`` reports prompt/completion tokens (~4 characters per token,
+    completion capped at max_tokens).
+  - Injected faults: STUB_429_RATE of requests get a 429 with
+    ``retry-after: STUB_RETRY_AFTER``; STUB_TIMEOUT_RATE hang for
+    STUB_TIMEOUT_S (past the client timeout) and then 504; STUB_ERROR_RATE
+    get a 500. STUB_RPM > 0 also enforces a real requests-per-minute limit
+    with 429s, for exercising RateLimitedProvider.
+  - GET /stats returns request, fault and latency counters.
+
+Point the stack at it with:
+    LLM_PROVIDER=local LLM_BASE_URL=http://localhost:11435/v1
+
+Usage:
+    python src/backend/scripts/llm_stub_server.py
+    python src/backend/scripts/llm_stub_server.py --port 11435 \\
+        --latency lognormal:1.2,0.5 --rate-429 0.02 --rate-timeout 0.01
+
+Constitutional references:
+  - lessons.md Rule #3: "Test Fixtures Must Guarantee Isolation" —
+    throughput experiments never touch a paid API.
+  - lessons.md External API Rate Limits — 429s carry retry-after so the
+    client's backoff is exercised as in production.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+# Path fixup
+_backend = str(Path(__file__).resolve().parents[1])
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from services.llm.mock import MockLLMProvider
+from services.llm.rate_limited import TokenBucket
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger("llm-stub")
+
+Sampler = Callable[[random.Random], float]
+
+
+def parse_latency(spec: str) -> Sampler:
+    """``kind:a[,b]`` → a function drawing one latency (seconds, never negative)."""
+    kind, _, args = spec.partition(":")
+    params = [float(x) for x in args.split(",") if x.strip()]
+    samplers: dict[str, tuple[int, Sampler]] = {
+        "fixed": (1, lambda r: params[0]),
+        "uniform": (2, lambda r: r.uniform(params[0], params[1])),
+        "normal": (2, lambda r: r.gauss(params[0], params[1])),
+        "lognormal": (2, lambda r: params[0] * r.lognormvariate(0.0, params[1])),
+        "exponential": (1, lambda r: r.expovariate(1.0 / params[0]) if params[0] > 0 else 0.0),
+    }
+    if kind not in samplers:
+        raise ValueError(f"Unknown latency distribution '{kind}'. Valid: {', '.join(samplers)}")
+    arity, sample = samplers[kind]
+    if len(params) != arity:
+        raise ValueError(f"Latency '{kind}' takes {arity} parameter(s), got '{spec}'")
+    return lambda r: max(0.0, sample(r))
+
+
+def count_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+@dataclass
+class StubConfig:
+    latency: str = os.environ.get("STUB_LATENCY", "lognormal:0.8,0.5")
+    rate_429: float = float(os.environ.get("STUB_429_RATE", "0"))
+    rate_timeout: float = float(os.environ.get("STUB_TIMEOUT_RATE", "0"))
+    rate_error: float = float(os.environ.get("STUB_ERROR_RATE", "0"))
+    retry_after_s: float = float(os.environ.get("STUB_RETRY_AFTER", "1"))
+    timeout_s: float = float(os.environ.get("STUB_TIMEOUT_S", "60"))
+    rpm: float = float(os.environ.get("STUB_RPM", "0"))
+    seed: int | None = int(os.environ["STUB_SEED"]) if os.environ.get("STUB_SEED") else None
+
+
+def _error(status: int, message: str, kind: str, headers: dict | None = None) -> JSONResponse:
+    # Same envelope as the OpenAI API, so the client raises the matching exception type
+    return JSONResponse(
+        {"error": {"message": message, "type": kind, "code": status}},
+        status_code=status, headers=headers,
+    )
+
+
+def create_app(config: StubConfig | None = None) -> FastAPI:
+    config = config or StubConfig()
+    sample_latency = parse_latency(config.latency)
+    rng = random.Random(config.seed)
+    canned = MockLLMProvider()
+    bucket = TokenBucket(config.rpm)
+    counts: Counter = Counter()
+    latencies: list[float] = []
+
+    app = FastAPI(title="ClawX LLM stub")
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "stub", "object": "model", "owned_by": "clawx"}]}
+
+    @app.get("/stats")
+    async def stats():
+        ordered = sorted(latencies)
+
+        def pct(q: float) -> float | None:
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3) if ordered else None
+
+        return {**counts, "latency_p50_s": pct(0.5), "latency_p95_s": pct(0.95), "latency": config.latency}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        counts["requests"] += 1
+
+        if bucket.reserve(1) > 0:
+            bucket.adjust(1)  # rejected requests do not consume budget
+            counts["rate_limited"] += 1
+            return _error(
+                429, "Rate limit reached (STUB_RPM)", "rate_limit_exceeded",
+                {"retry-after": f"{60.0 / config.rpm:.2f}"},
+            )
+
+        roll = rng.random()
+        if roll < config.rate_429:
+            counts["injected_429"] += 1
+            return _error(
+                429, "Injected rate limit", "rate_limit_exceeded",
+                {"retry-after": f"{config.retry_after_s:g}"},
+            )
+        roll -= config.rate_429
+        if roll < config.rate_timeout:
+            counts["injected_timeout"] += 1
+            await asyncio.sleep(config.timeout_s)
+            return _error(504, "Injected timeout", "timeout")
+        roll -= config.rate_timeout
+        if roll < config.rate_error:
+            counts["injected_error"] += 1
+            return _error(500, "Injected server error", "server_error")
+
+        messages = body.get("messages", [])
+        max_tokens = int(body.get("max_tokens") or 150)
+        content = await canned.generate(messages, response_format=body.get("response_format"))
+        delay = sample_latency(rng)
+        await asyncio.sleep(delay)
+        latencies.append(delay)
+        if len(latencies) > 10_000:
+            del latencies[:5_000]
+        counts["completed"] += 1
+
+        prompt_tokens = sum(count_tokens(m.get("content") or "") for m in messages)
+        completion_tokens = min(max_tokens, count_tokens(content or ""))
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    return app
+
+
+def main():
+    defaults = StubConfig()
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible LLM stub for load testing")
+    parser.add_argument("--host", default=os.environ.get("STUB_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("STUB_PORT", "11435")))
+    parser.add_argument("--latency", default=defaults.latency, help="e.g. fixed:0.4, lognormal:0.8,0.5")
+    parser.add_argument("--rate-429", type=float, default=defaults.rate_429)
+    parser.add_argument("--rate-timeout", type=float, default=defaults.rate_timeout)
+    parser.add_argument("--rate-error", type=float, default=defaults.rate_error)
+    parser.add_argument("--retry-after", type=float, default=defaults.retry_after_s)
+    parser.add_argument("--timeout", type=float, default=defaults.timeout_s, help="Hang time of injected timeouts")
+    parser.add_argument("--rpm", type=float, default=defaults.rpm, help="Enforced requests per minute (0 = none)")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=args.latency, rate_429=args.rate_429, rate_timeout=args.rate_timeout,
+        rate_error=args.rate_error, retry_after_s=args.retry_after, timeout_s=args.timeout,
+        rpm=args.rpm, seed=args.seed,
+    )
+    parse_latency(config.latency)  # fail fast on a bad spec
+    logger.info(
+        "LLM stub on %s:%d (latency=%s, 429=%.1f%%, timeout=%.1f%%, 500=%.1f%%, rpm=%s)",
+        args.host, args.port, config.latency, config.rate_429 * 100,
+        config.rate_timeout * 100, config.rate_error * 100, config.rpm or "unlimited",
+    )
+
+    import uvicorn
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+maintain_partitions.py — Partition maintenance daemon.
+
+Keeps the monthly RANGE partitions (agent_metrics; see each table's
+``info`` in models.py) created ahead of time and, when
+AGENT_METRICS_RETAIN_MONTHS is set, detaches months past retention
+(``--drop`` drops them instead). ledger's HASH partitions are fixed and
+need no upkeep. No-op on databases that are not partitioned.
+
+Usage:
+    python src/backend/scripts/maintain_partitions.py
+    # single pass:
+    python src/backend/scripts/maintain_partitions.py --once
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+from pathlib import Path
+
+# Path fixup
+_backend = str(Path(__file__).resolve().parents[1])
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from database import async_session_maker
+from services.partition_service import (
+    ensure_month_partitions,
+    month_partitioned_tables,
+    retire_month_partitions,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger("partition-daemon")
+
+INTERVAL = int(os.environ.get("PARTITION_MAINTENANCE_INTERVAL", "86400"))
+RETAIN_MONTHS = int(os.environ.get("AGENT_METRICS_RETAIN_MONTHS", "0"))  # 0 = keep all
+
+_shutdown_requested = False
+
+
+def _handle_signal(signum, frame):
+    global _shutdown_requested
+    logger.info("Shutdown signal received (sig=%d). Finishing current cycle...", signum)
+    _shutdown_requested = True
+
+
+async def maintain_once(drop: bool = False) -> tuple[list[str], list[str]]:
+    """One maintenance pass. Returns (created, retired) partition names."""
+    created, retired = [], []
+    async with async_session_maker() as session:
+        for table in month_partitioned_tables():
+            created += await ensure_month_partitions(session, table.name)
+            if RETAIN_MONTHS > 0:
+                retired += await retire_month_partitions(
+                    session, table.name, retain_months=RETAIN_MONTHS, drop=drop,
+                )
+        await session.commit()
+    return created, retired
+
+
+async def run_daemon(drop: bool):
+    cycle = 0
+    while not _shutdown_requested:
+        cycle += 1
+        try:
+            created, retired = await maintain_once(drop)
+            if created or retired:
+                logger.info("Cycle %d: created %s, retired %s", cycle, created, retired)
+            else:
+                logger.debug("Cycle %d: partitions up to date", cycle)
+        except Exception:
+            logger.exception("Cycle %d FAILED — will retry next cycle", cycle)
+
+        # Interruptible sleep
+        for _ in range(INTERVAL):
+            if _shutdown_requested:
+                break
+            await asyncio.sleep(1)
+
+    logger.info("Partition daemon stopped after %d cycles.", cycle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain partitioned tables")
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    parser.add_argument("--drop", action="store_true",
+                        help="Drop partitions past retention instead of detaching them")
+    args = parser.parse_args()
+
+    if args.once:
+        created, retired = asyncio.run(maintain_once(args.drop))
+        logger.info("Created %s, retired %s", created, retired)
+        return
+
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+
+    logger.info("Partition daemon starting (interval=%ds, retain=%d months)", INTERVAL, RETAIN_MONTHS)
+    asyncio.run(run_daemon(args.drop))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,7 @@ This will:
 
 import asyncio
 import sys
-from datetime import datetime, timezone
+from decimal import Decimal
 from pathlib import Path
 
 # Allow running from project root or scripts/ dir
@@ -26,7 +26,8 @@ from dotenv import load_dotenv
 load_dotenv(_BACKEND_DIR / ".env", override=True)
 
 from sqlalchemy import select
-from database import Bot, Post, Ledger, async_session_maker, engine
+from database import Bot, Post, async_session_maker, engine
+from services.ledger_service import append_ledger_entry
 
 
 async def revive(handle: str, amount: float) -> None:
@@ -44,22 +45,16 @@ async def revive(handle: str, amount: float) -> None:
 
         old_balance = bot.balance
         bot.status = "ALIVE"
-        bot.balance += amount
-
-        # Ledger entry
-        last_entry = (await session.execute(
-            select(Ledger).where(Ledger.bot_id == bot.id)
-            .order_by(Ledger.timestamp.desc()).limit(1)
-        )).scalar_one_or_none()
-        prev_hash = last_entry.hash if last_entry else "0" * 64
-        ts = str(datetime.now(timezone.utc))
-        ledger = Ledger(
-            bot_id=bot.id, amount=amount, transaction_type="REVIVE",
+        bot.balance += Decimal(str(amount))
+
+        # Ledger entry — through the service so the chain head stays in step
+        await append_ledger_entry(
+            bot_id=bot.id,
+            amount=Decimal(str(amount)),
+            transaction_type="REVIVE",
             reference_id=f"REVIVE:{handle}",
-            previous_hash=prev_hash,
-            hash=Ledger.calculate_hash(prev_hash, bot.id, amount, "REVIVE", f"REVIVE:{handle}", ts),
+            session=session,
         )
-        session.add(ledger)
 
         # Revival announcement
         post = Post(
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+run_anchor.py — Merkle epoch anchoring daemon.
+
+Periodically seals newly appended ledger entries into Merkle epochs
+(services.merkle_service.anchor_epochs). Each cycle only hashes entries
+appended since the last sealed epoch, up to a commit watermark taken in its
+own short transaction so ledger writers are only held off briefly.
+
+Usage:
+    python src/backend/scripts/run_anchor.py
+    # single pass:
+    python src/backend/scripts/run_anchor.py --once
+    # recompute an epoch that gained a late-committed entry (pre-watermark):
+    python src/backend/scripts/run_anchor.py --reseal 42
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+from pathlib import Path
+
+# Path fixup
+_backend = str(Path(__file__).resolve().parents[1])
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from database import async_session_maker
+from services.merkle_service import anchor_epochs, commit_watermark, reseal_epoch
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger("anchor-daemon")
+
+INTERVAL = int(os.environ.get("LEDGER_ANCHOR_INTERVAL", "300"))
+
+_shutdown_requested = False
+
+
+def _handle_signal(signum, frame):
+    global _shutdown_requested
+    logger.info("Shutdown signal received (sig=%d). Finishing current cycle...", signum)
+    _shutdown_requested = True
+
+
+async def anchor_once() -> int:
+    """Seal all committed entries. Returns the number of epochs created."""
+    async with async_session_maker() as session:
+        async with session.begin():
+            up_to_id = await commit_watermark(session)
+        epochs = await anchor_epochs(session, up_to_id=up_to_id)
+        await session.commit()
+    return len(epochs)
+
+
+async def reseal_once(epoch_id: int) -> bool:
+    """Recompute one epoch over its current leaves. Returns False if it does not exist."""
+    async with async_session_maker() as session:
+        epoch = await reseal_epoch(epoch_id, session)
+        await session.commit()
+    return epoch is not None
+
+
+async def run_daemon():
+    cycle = 0
+    while not _shutdown_requested:
+        cycle += 1
+        try:
+            sealed = await anchor_once()
+            if sealed:
+                logger.info("Cycle %d: sealed %d epoch(s)", cycle, sealed)
+            else:
+                logger.debug("Cycle %d: nothing new to anchor", cycle)
+        except Exception:
+            logger.exception("Cycle %d FAILED — will retry next cycle", cycle)
+
+        # Interruptible sleep
+        for _ in range(INTERVAL):
+            if _shutdown_requested:
+                break
+            await asyncio.sleep(1)
+
+    logger.info("Anchor daemon stopped after %d cycles.", cycle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seal ledger entries into Merkle epochs")
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    parser.add_argument("--reseal", type=int, metavar="EPOCH_ID",
+                        help="Recompute one epoch over its current leaves and exit")
+    args = parser.parse_args()
+
+    if args.reseal is not None:
+        if not asyncio.run(reseal_once(args.reseal)):
+            logger.error("Epoch %d not found", args.reseal)
+            sys.exit(1)
+        return
+
+    if args.once:
+        sealed = asyncio.run(anchor_once())
+        logger.info("Sealed %d epoch(s)", sealed)
+        return
+
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+
+    logger.info("Anchor daemon starting (interval=%ds)", INTERVAL)
+    asyncio.run(run_daemon())
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,7 @@ if _backend not in sys.path:
     sys.path.insert(0, _backend)
 
 from database import async_session_maker
+from services.feed_ingestor import close_http_pool
 from services.market_maker import ensure_open_markets
 
 logging.basicConfig(
@@ -64,6 +65,7 @@ async def run_daemon():
                 break
             await asyncio.sleep(1)
 
+    await close_http_pool()
     logger.info("Market maker daemon stopped after %d cycles.", cycle)
 
 
@@ -3,27 +3,77 @@
 run_ticker.py — The Ticker Daemon.
 
 Continuous heartbeat of the ClawdXCraft arena economy.
-Runs an infinite loop, ticking every ALIVE bot once per cycle,
-then sleeping for TICK_RATE seconds.
+Runs an infinite loop that ticks every ALIVE bot on its own schedule:
+a min-heap of next-due times (services/tick_scheduler.py), with each
+bot's interval taken from ``schedule.interval_seconds`` in its persona
+YAML (TICK_RATE if it sets none).
 
 Contract of Behavior:
-  - Calls execute_tick() for every ALIVE bot each cycle (Write or Die applies)
+  - Calls execute_tick() for every ALIVE bot once per interval (Write or Die applies)
   - Respects Decimal math and hash-chained ledger integrity
-  - Graceful shutdown on SIGINT/SIGTERM: finishes the current tick cycle,
-    then exits cleanly. Never kills a tick mid-transaction.
+  - Up to TICK_CONCURRENCY ticks run at once. A slow bot only delays its
+    own next tick; ticks are spread by jitter instead of arriving as one
+    burst per cycle. Lag (actual minus scheduled start) is logged every
+    TICK_RATE seconds.
+  - Bot state (balance, idle streak, open bets) is loaded for each batch
+    of due bots in one query, and the open-market board once per
+    TICK_RATE; each tick receives it read-only (services/tick_context.py).
+  - Graceful shutdown on SIGINT/SIGTERM: no new ticks are started, the
+    in-flight ones are drained, then the daemon exits cleanly. Never kills
+    a tick mid-transaction.
+  - With --shard-count > 1, several ticker processes (one host or many)
+    split the ALIVE bots by consistent hashing on bot_id and own shards
+    through Redis leases (services/tick_sharding.py). A dead worker's
+    shards are picked up within about one TICK_LEASE_TTL, and no bot is
+    ever ticked by two workers at once.
+  - Keeps at least MARKET_RESEARCH_MIN_OPEN research markets open from a
+    background task with its own cadence (MARKET_BOARD_INTERVAL); ticks
+    never wait on feed I/O. The rest of the board is the market-maker
+    service's job (run_market_maker.py).
+  - Feed lookups (research tool, market board) share one pooled HTTP
+    client; its request and connection counts, and the research title
+    cache's hit rate, are reported with lag.
   - Does NOT run migrations. Assumes DB schema is ready.
   - Does NOT prevent concurrent drive_economy.py runs (double-tick is valid physics)
-  - Error boundary: if a single bot's tick crashes, log and continue to next bot.
-    If the entire cycle crashes, log and retry next cycle.
+  - Error boundary: if a single bot's tick crashes, log and continue with
+    the others. If a roster refresh crashes, log and retry next time.
 
 Constitutional references:
-  - CLAUDE.md Invariant #1: Inaction is costly — every cycle enforces entropy
+  - CLAUDE.md Invariant #1: Inaction is costly — every tick enforces entropy
   - CLAUDE.md Invariant #4: Irreversible loss — all entries hash-chained
   - CLAUDE.md Invariant #6: Continuous real-time, not turn-based
   - lessons.md: All money through ledger, path fixup pattern
 
 Environment:
-  TICK_RATE  — seconds between cycles (default: 10)
+  TICK_RATE  — default tick interval for bots without one, and how often
+    the roster is reloaded and lag reported (seconds, default: 10)
+  TICK_JITTER — ± fraction applied to each interval (default: 0.1)
+  TICK_CONCURRENCY — bots ticked in parallel (default: 1 = sequential).
+    Each in-flight tick holds a DB connection while it writes, so keep
+    this within the engine's pool size + overflow.
+  TICKER_WORKER_ID — this worker's id (default: hostname-pid; --worker-id)
+  TICK_SHARD_COUNT — shards the bot set is split into (default: 1 = no
+    sharding, no Redis needed; --shard-count). Every worker must agree.
+  TICK_LEASE_TTL — seconds a shard lease lives without renewal (default: 10)
+  TICK_BOARD_SIZE — open markets loaded onto the shared board (default: 200)
+  MARKET_BOARD_INTERVAL — seconds between market board top-ups (default: 30)
+  MARKET_RESEARCH_MIN_OPEN — RESEARCH markets kept open (default: 3)
+  MARKET_BOARD_MIN_OPEN — open markets the ticker also keeps the board at,
+    all source types (default: 0 = off; only for deployments without the
+    market-maker service, which would otherwise race it and overshoot)
+  TICK_BUDGET_S — wall-clock budget per tick; an overrunning tick writes
+    its heartbeat and moves on (bot_runner, default: 30)
+  FEED_HTTP_* — feed HTTP pool limits (services/feed_ingestor.py)
+  WIKI_CACHE_* — research title cache size and TTLs (services/wiki_cache.py)
+  LLM_RPM / LLM_TPM / LLM_MAX_CONCURRENCY — LLM request budgets; setting
+    any enables the fair, adaptive limiter (services/llm/rate_limited.py),
+    whose queue depth is reported with lag
+  RESEARCH_POOL / RESEARCH_POOL_TTL / RESEARCH_POOL_NOISE — per-market
+    research answers shared across bots (services/research_pool.py)
+  LLM_PROVIDERS — comma list of backends to hedge across (services/llm/hedged.py);
+    order and per-backend p95/error rate are reported with lag
+  LLM_CACHE_TTL — seconds to cache LLM responses (0 = off); hit rates are
+    reported with lag (services/llm/cached.py)
   DATABASE_URL — async postgres DSN
   REDIS_URL — redis connection
 
@@ -33,14 +83,27 @@ Usage:
 
     # Manual:
     cd src/backend && DATABASE_URL=... python scripts/run_ticker.py
+
+    # Sharded, one process per worker:
+    ... run_ticker.py --worker-id w1 --shard-count 16
+    ... run_ticker.py --worker-id w2 --shard-count 16
+
+    # Shard assignments, per-shard tick rates and lag:
+    ... run_ticker.py --status
 """
 
+import argparse
 import asyncio
+import json
 import logging
 import os
 import signal
+import socket
 import sys
+from collections import Counter
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable, Collection, Optional
 
 # --- Path fixup: works from any CWD, Docker or local ---
 _backend = str(Path(__file__).resolve().parents[1])
@@ -51,7 +114,15 @@ from sqlalchemy import select
 
 from database import async_session_maker
 from models import Bot
-from services.market_maker import ensure_research_markets
+from services.feed_ingestor import close_http_pool, get_http_pool
+from services.llm.factory import llm_provider_stats
+from services.market_maker import ensure_open_markets, ensure_research_markets
+from services.research_pool import get_research_pool
+from services.tick_context import TickContext, hydrate_tick_contexts, load_board
+from services.tick_scheduler import TickScheduler, interval_from_persona
+from services.tick_sharding import TICK_SHARD_COUNT, ShardCoordinator, read_status
+from services.wiki_cache import get_title_cache
+from thread_memory import get_redis_client
 
 # Configure logging before any other imports that use loggers
 logging.basicConfig(
@@ -62,126 +133,450 @@ logging.basicConfig(
 logger = logging.getLogger("ticker")
 
 TICK_RATE = int(os.environ.get("TICK_RATE", "10"))
+TICK_CONCURRENCY = max(1, int(os.environ.get("TICK_CONCURRENCY", "1")))
+TICKER_WORKER_ID = os.environ.get("TICKER_WORKER_ID") or f"{socket.gethostname()}-{os.getpid()}"
+MARKET_BOARD_INTERVAL = float(os.environ.get("MARKET_BOARD_INTERVAL", "30"))
+MARKET_RESEARCH_MIN_OPEN = int(os.environ.get("MARKET_RESEARCH_MIN_OPEN", "3"))
+MARKET_BOARD_MIN_OPEN = int(os.environ.get("MARKET_BOARD_MIN_OPEN", "0"))
 
 # --- Graceful shutdown flag ---
 _shutdown_requested = False
 
 
 def _request_shutdown(signum, frame):
-    """Signal handler: set flag, let current cycle finish."""
+    """Signal handler: set flag, let in-flight ticks finish."""
     global _shutdown_requested
     sig_name = signal.Signals(signum).name
-    logger.info("Received %s — will shut down after current cycle completes", sig_name)
+    logger.info("Received %s — will shut down after in-flight ticks complete", sig_name)
     _shutdown_requested = True
 
 
-async def tick_all_bots() -> tuple[int, int]:
-    """Run one tick for every ALIVE bot. Returns (ticked, alive_count)."""
-    # Import here to avoid circular issues at module level
-    from bot_runner import execute_tick
+def _bot_config(bot: Bot, interval: float) -> dict:
+    return {
+        "persona": bot.persona_yaml or "Arena agent",
+        "name": bot.handle,
+        "goals": ["Survive the arena"],
+        "schedule": {"interval_seconds": interval},
+    }
+
+
+async def _tick_bot(
+    bot: Bot,
+    execute_tick,
+    interval: float,
+    context: Optional[TickContext] = None,
+) -> Optional[str]:
+    """Tick one bot behind its own error boundary. Returns the outcome."""
+    try:
+        tx_type = await execute_tick(
+            bot_id=bot.id,
+            config=_bot_config(bot, interval),
+            balance=float(context.balance if context is not None else bot.balance),
+            context=context,
+        )
+        logger.info(
+            "TICK @%-20s id=%-4d → %-11s",
+            bot.handle, bot.id, tx_type,
+        )
+        return tx_type
+    except Exception as exc:
+        # Error boundary per bot — one bot crashing must not stop the others
+        logger.error(
+            "TICK @%-20s id=%-4d → EXCEPTION: %s",
+            bot.handle, bot.id, exc,
+            exc_info=True,
+        )
+        return "ERROR"  # execute_tick's Write-or-Die should have handled it
+
+
+async def _tick_owned(
+    bot: Bot,
+    execute_tick,
+    interval: float,
+    coordinator: Optional[ShardCoordinator],
+    context: Optional[TickContext] = None,
+) -> Optional[str]:
+    """Tick ``bot`` if this worker may. Returns None if it was skipped.
+
+    Sharded, a bot is skipped when its shard lease has lapsed (the new
+    owner ticks it) or its tick key is held by another worker.
+    """
+    if coordinator is None:
+        return await _tick_bot(bot, execute_tick, interval, context)
+    if not coordinator.owns_bot(bot.id):
+        return None
+    async with coordinator.bot_lock(bot.id) as locked:
+        if not locked:
+            logger.warning("TICK id=%d skipped — in flight on another worker", bot.id)
+            return None
+        return await _tick_bot(bot, execute_tick, interval, context)
+
+
+def _first_due(bot: Bot, interval: float, scheduler: TickScheduler) -> Optional[float]:
+    """When a newly scheduled bot should first tick, from its last action.
+
+    Overdue bots are spread over one TICK_RATE; bots that never acted get
+    None (a random point within their interval).
+    """
+    if bot.last_action_at is None:
+        return None
+    last = bot.last_action_at
+    if last.tzinfo is None:
+        last = last.replace(tzinfo=timezone.utc)
+    now = scheduler.clock()
+    due = now + (last - datetime.now(timezone.utc)).total_seconds() + interval
+    if due < now:
+        due = now + scheduler.rng.uniform(0, min(interval, TICK_RATE))
+    return due
+
+
+async def refresh_roster(
+    scheduler: TickScheduler,
+    coordinator: Optional[ShardCoordinator] = None,
+    busy_bots: Collection[int] = (),
+) -> dict[int, Bot]:
+    """Reload the ALIVE (and, sharded, owned) bots into ``scheduler``.
+
+    Shards whose bots are in ``busy_bots`` are not handed off yet.
+    Returns the roster by bot id.
+    """
+    if coordinator is not None:
+        try:
+            await coordinator.refresh(
+                handoff=True, busy={coordinator.ring.shard_for(b) for b in busy_bots},
+            )
+        except Exception as exc:
+            logger.warning("Shard refresh failed: %s", exc)
 
     async with async_session_maker() as session:
         result = await session.execute(
             select(Bot).where(Bot.status == "ALIVE").order_by(Bot.id)
         )
         bots = result.scalars().all()
+    if coordinator is not None:
+        bots = [b for b in bots if coordinator.owns_bot(b.id)]
 
-    if not bots:
-        return 0, 0
-
-    ticked = 0
+    intervals = {b.id: interval_from_persona(b.persona_yaml, TICK_RATE) for b in bots}
+    first_due = {}
     for bot in bots:
-        if _shutdown_requested:
-            logger.info("Shutdown requested — stopping mid-cycle after %d/%d bots", ticked, len(bots))
-            break
-
-        config = {
-            "persona": bot.persona_yaml or "Arena agent",
-            "name": bot.handle,
-            "goals": ["Survive the arena"],
-            "schedule": {"interval_seconds": 60},
-        }
-
-        try:
-            tx_type = await execute_tick(
-                bot_id=bot.id,
-                config=config,
-                balance=float(bot.balance),
-            )
-            ticked += 1
-            logger.info(
-                "TICK @%-20s id=%-4d → %-11s",
-                bot.handle, bot.id, tx_type,
-            )
-        except Exception as exc:
-            # Error boundary per bot — one bot crashing must not stop the others
-            logger.error(
-                "TICK @%-20s id=%-4d → EXCEPTION: %s",
-                bot.handle, bot.id, exc,
-                exc_info=True,
-            )
-            ticked += 1  # execute_tick's Write-or-Die should have handled it
-
-    return ticked, len(bots)
-
+        if bot.id not in scheduler:
+            due = _first_due(bot, intervals[bot.id], scheduler)
+            if due is not None:
+                first_due[bot.id] = due
+    added, removed = scheduler.sync(intervals, first_due)
+    if added or removed:
+        logger.info("Roster: %d bots scheduled (+%d, -%d)", len(scheduler), added, removed)
+    return {b.id: b for b in bots}
+
+
+async def maintain_markets(
+    coordinator: Optional[ShardCoordinator] = None,
+    *,
+    interval: float = MARKET_BOARD_INTERVAL,
+    research_min_open: int = MARKET_RESEARCH_MIN_OPEN,
+    min_open: int = MARKET_BOARD_MIN_OPEN,
+) -> None:
+    """Keep ``research_min_open`` RESEARCH markets open — and, if
+    ``min_open`` > 0, ``min_open`` markets across all source types — every
+    ``interval`` seconds, until cancelled (sharded: shard 0's owner only).
+
+    Runs beside run_schedule as its own task, so feed I/O (Wikipedia,
+    weather, GitHub, RSS) never delays a tick. The board the ticks see
+    picks up new markets at the next roster refresh.
+    """
+    while True:
+        if coordinator is None or coordinator.owns(0):
+            try:
+                async with async_session_maker() as session:
+                    created = await ensure_research_markets(session, min_open=research_min_open)
+                    if min_open > 0:
+                        created += await ensure_open_markets(session, min_open=min_open)
+                    if created > 0:
+                        logger.info("Market board: created %d markets", created)
+            except Exception as mkt_exc:
+                # Error boundary — the board is retried next round
+                logger.warning("Market board maintenance failed: %s", mkt_exc)
+        await asyncio.sleep(interval)
+
+
+async def _load_board() -> tuple[dict, ...]:
+    """Open-market board for the next roster window (empty on failure)."""
+    try:
+        async with async_session_maker() as session:
+            return await load_board(session)
+    except Exception as exc:
+        logger.warning("Market board load failed: %s", exc)
+        return ()
+
+
+async def _hydrate(bot_ids: list[int], board: tuple[dict, ...]) -> dict[int, TickContext]:
+    """Tick contexts for a batch of due bots in one query.
+
+    On failure the batch ticks without contexts (each tick loads its own).
+    """
+    if not bot_ids:
+        return {}
+    try:
+        async with async_session_maker() as session:
+            return await hydrate_tick_contexts(session, bot_ids=bot_ids, board=board)
+    except Exception as exc:
+        logger.warning("Tick context hydration failed (%d bots): %s", len(bot_ids), exc)
+        return {}
+
+
+async def _report(
+    scheduler: TickScheduler,
+    coordinator: Optional[ShardCoordinator],
+    roster: dict[int, Bot],
+    ticked: Counter,
+    window_s: float,
+    in_flight: int,
+) -> None:
+    """Log lag/throughput and feed HTTP pool use; publish shard status if sharded."""
+    http = get_http_pool().stats()
+    http.pop("hosts")
+    wiki = get_title_cache().stats()
+    pool = get_research_pool().stats()
+    schedule = {
+        **scheduler.lag_report(), "backlog": scheduler.pending(), "in_flight": in_flight,
+        "feed_http": http, "wiki_cache": wiki, "research_pool": pool,
+    }
+    llm = llm_provider_stats()
+    limiter = llm.get("RateLimitedProvider")
+    if limiter is not None:
+        schedule["llm"] = limiter
+        logger.info(
+            "LLM: limit=%d in-flight=%d queued=%d (%d callers), %d sent, %d throttled",
+            limiter["limit"], limiter["in_flight"], limiter["queue_depth"],
+            limiter["queued_callers"], limiter["requests"], limiter["throttled"],
+        )
+    hedged = llm.get("HedgedProvider")
+    if hedged is not None:
+        schedule["llm_backends"] = hedged
+        logger.info(
+            "LLM backends: order=%s, %d hedged, %d failovers of %d requests; %s",
+            ">".join(hedged["order"]), hedged["hedged"], hedged["failovers"], hedged["requests"],
+            ", ".join(f"{n} p95={b['p95_s']}s err={b['error_rate']:.0%}" for n, b in hedged["backends"].items()),
+        )
+    cache = llm.get("CachedProvider")
+    if cache is not None:
+        schedule["llm_cache"] = cache
+        logger.info(
+            "LLM cache: hit rate %.0f%% (%d local, %d redis, %d in-flight, %d miss) %s",
+            cache["hit_rate"] * 100, cache["hit_local"], cache["hit_redis"],
+            cache["hit_inflight"], cache["miss"], cache["sites"],
+        )
+    if roster:
+        logger.info(
+            "Schedule: %d bots, %d ticks in %.1fs, lag p50=%.2fs max=%.2fs, backlog=%d, in-flight=%d",
+            len(roster), schedule["ticks"], window_s, schedule["lag_p50_s"],
+            schedule["lag_max_s"], schedule["backlog"], in_flight,
+        )
+    if http["requests"]:
+        logger.info(
+            "Feed HTTP: %d requests (%d queued for a host slot), %d connections (%d idle)",
+            http["requests"], http["waited"], http["connections"], http["idle_connections"],
+        )
+    if wiki["miss"]:
+        logger.info(
+            "Wiki cache: hit rate %.1f%% (local=%d redis=%d in-flight=%d), %d fetched, %d negative",
+            wiki["hit_rate"] * 100, wiki["hit_local"], wiki["hit_redis"], wiki["hit_inflight"],
+            wiki["miss"], wiki["negative"],
+        )
+    if pool["miss"]:
+        logger.info(
+            "Research pool: %.1f%% of answers reused (local=%d redis=%d in-flight=%d), %d computed, %d invalidated",
+            pool["reuse_rate"] * 100, pool["hit_local"], pool["hit_redis"], pool["hit_inflight"],
+            pool["miss"], pool["invalidated"],
+        )
+    if coordinator is None:
+        return
+    shard_of = coordinator.ring.shard_for
+    shard_ticks: Counter = Counter()
+    for bot_id, n in ticked.items():
+        shard_ticks[shard_of(bot_id)] += n
+    try:
+        await coordinator.publish_status(
+            bots=Counter(shard_of(b) for b in roster),
+            ticked=shard_ticks,
+            window_s=window_s,
+            schedule=schedule,
+        )
+    except Exception as exc:
+        logger.warning("Shard status publish failed: %s", exc)
+
+
+async def run_schedule(
+    scheduler: TickScheduler,
+    *,
+    concurrency: int = TICK_CONCURRENCY,
+    coordinator: Optional[ShardCoordinator] = None,
+    roster_interval: float = TICK_RATE,
+    stop: Optional[Callable[[], bool]] = None,
+) -> int:
+    """Dispatch due ticks until ``stop()`` (default: shutdown requested).
+
+    At most ``concurrency`` ticks are in flight. A bot is rescheduled when
+    its tick finishes, so it is never in flight twice. Every
+    ``roster_interval`` seconds the roster and open-market board are
+    reloaded and lag reported. Each batch of due bots is hydrated with one
+    query (services/tick_context.py), so ticks do no reads of their own.
+    On stop, no new ticks start, the in-flight ones are drained and a
+    final report is made. Returns the number of ticks run.
+    """
+    # Import here to avoid circular issues at module level
+    from bot_runner import execute_tick
 
-async def run_daemon():
+    stop = stop or (lambda: _shutdown_requested)
+    clock = scheduler.clock
+    roster: dict[int, Bot] = {}
+    board: tuple[dict, ...] = ()
+    in_flight: dict[asyncio.Task, tuple[int, float]] = {}
+    window_ticked: Counter = Counter()
+    window_start = next_roster = clock()
+    total = 0
+
+    def finish(task: asyncio.Task) -> None:
+        nonlocal total
+        bot_id, scheduled = in_flight.pop(task)
+        exc = task.exception()
+        if exc is not None:
+            # Shard lock round-trip failed (Redis) — the tick never started
+            logger.warning("TICK id=%d skipped — %s", bot_id, exc)
+        outcome = None if exc is not None else task.result()
+        if outcome is not None:
+            total += 1
+            window_ticked[bot_id] += 1
+        if outcome == "LIQUIDATION":
+            scheduler.remove(bot_id)
+        else:
+            scheduler.reschedule(bot_id, scheduled)
+
+    while not stop():
+        if clock() >= next_roster:
+            try:
+                roster = await refresh_roster(
+                    scheduler, coordinator, busy_bots=[b for b, _ in in_flight.values()],
+                )
+            except Exception as exc:
+                # Error boundary for the roster — daemon must not die
+                logger.error("Roster refresh FAILED: %s — will retry", exc, exc_info=True)
+            board = await _load_board()
+            now = clock()
+            await _report(scheduler, coordinator, roster, window_ticked, now - window_start, len(in_flight))
+            window_ticked = Counter()
+            window_start = now
+            next_roster = now + roster_interval
+
+        due = []
+        for bot_id, scheduled in scheduler.pop_due(limit=concurrency - len(in_flight)):
+            if bot_id in roster:
+                due.append((bot_id, scheduled))
+            else:
+                scheduler.remove(bot_id)
+        contexts = await _hydrate([bot_id for bot_id, _ in due], board)
+        for bot_id, scheduled in due:
+            scheduler.record_lag(clock() - scheduled)
+            task = asyncio.create_task(_tick_owned(
+                roster[bot_id], execute_tick, scheduler.interval(bot_id), coordinator,
+                contexts.get(bot_id),
+            ))
+            in_flight[task] = (bot_id, scheduled)
+
+        # Sleep until the next deadline, a finished tick or the next roster
+        # refresh — at most 1s so shutdown stays responsive.
+        wake = next_roster
+        next_due = scheduler.next_due()
+        if next_due is not None and len(in_flight) < concurrency:
+            wake = min(wake, next_due)
+        timeout = min(max(wake - clock(), 0.0), 1.0)
+        if in_flight:
+            done, _ = await asyncio.wait(in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                finish(task)
+        else:
+            await asyncio.sleep(timeout)
+
+    if in_flight:
+        logger.info("Shutdown requested — draining %d in-flight ticks", len(in_flight))
+        done, _ = await asyncio.wait(in_flight)
+        for task in done:
+            finish(task)
+    await _report(scheduler, coordinator, roster, window_ticked, clock() - window_start, 0)
+    return total
+
+
+async def _start_coordinator(worker_id: str, shard_count: int) -> ShardCoordinator:
+    """Connect to Redis and claim this worker's shards. Exits if Redis is down."""
+    redis = await get_redis_client()
+    if redis is None:
+        # Without leases two workers could tick the same bot — refuse to run.
+        logger.critical("Sharded ticker requires Redis (REDIS_URL) — exiting")
+        raise SystemExit(1)
+    coordinator = ShardCoordinator(redis, worker_id=worker_id, shard_count=shard_count)
+    owned = await coordinator.refresh()
+    logger.info("Worker %s owns shards %s of %d", worker_id, owned, shard_count)
+    return coordinator
+
+
+async def run_daemon(worker_id: str = TICKER_WORKER_ID, shard_count: int = TICK_SHARD_COUNT):
     """Main daemon loop. Runs until SIGINT/SIGTERM."""
-    global _shutdown_requested
-
     # Install signal handlers
     signal.signal(signal.SIGINT, _request_shutdown)
     signal.signal(signal.SIGTERM, _request_shutdown)
 
     logger.info("=" * 60)
-    logger.info("TICKER DAEMON ONLINE — TICK_RATE=%ds", TICK_RATE)
+    logger.info("TICKER DAEMON ONLINE — TICK_RATE=%ds TICK_CONCURRENCY=%d", TICK_RATE, TICK_CONCURRENCY)
     logger.info("Continuous economy. Inaction penalized. Losses irreversible.")
     logger.info("=" * 60)
 
-    cycle = 0
-    total_ticks = 0
+    coordinator = None
+    keepalive = None
+    if shard_count > 1:
+        coordinator = await _start_coordinator(worker_id, shard_count)
+        keepalive = asyncio.create_task(coordinator.keepalive())
+    board = asyncio.create_task(maintain_markets(coordinator))
 
-    while not _shutdown_requested:
-        cycle += 1
+    total_ticks = await run_schedule(TickScheduler(), coordinator=coordinator)
 
-        # v1.7: Ensure research markets exist before ticking bots
+    board.cancel()
+    if coordinator is not None:
+        keepalive.cancel()
         try:
-            async with async_session_maker() as session:
-                created = await ensure_research_markets(session, min_open=3)
-                if created > 0:
-                    logger.info("Cycle %d: Created %d research markets", cycle, created)
-        except Exception as mkt_exc:
-            logger.warning("Cycle %d: Research market generation failed: %s", cycle, mkt_exc)
-
-        try:
-            ticked, alive = await tick_all_bots()
-            total_ticks += ticked
-
-            if alive == 0:
-                logger.info("Cycle %d: No ALIVE bots. Waiting...", cycle)
-            else:
-                logger.info(
-                    "Cycle %d complete: %d/%d bots ticked (total lifetime: %d)",
-                    cycle, ticked, alive, total_ticks,
-                )
+            await coordinator.close()  # hand shards to the survivors immediately
         except Exception as exc:
-            # Error boundary for entire cycle — daemon must not die
-            logger.error(
-                "Cycle %d FAILED: %s — will retry next cycle",
-                cycle, exc,
-                exc_info=True,
-            )
-
-        # Sleep in small increments to respond to shutdown quickly
-        for _ in range(TICK_RATE):
-            if _shutdown_requested:
-                break
-            await asyncio.sleep(1.0)
+            logger.warning("Lease release failed (leases will lapse): %s", exc)
+    await close_http_pool()
 
     logger.info("=" * 60)
-    logger.info("TICKER DAEMON SHUTDOWN — %d cycles, %d total ticks", cycle, total_ticks)
+    logger.info("TICKER DAEMON SHUTDOWN — %d total ticks", total_ticks)
     logger.info("=" * 60)
 
 
+async def print_status() -> None:
+    """Print the ticker:status hash (shard assignments, tick rates and lag)."""
+    redis = await get_redis_client()
+    if redis is None:
+        print("Redis unavailable")
+        return
+    for field, status in (await read_status(redis)).items():
+        print(f"{field:<24} {json.dumps(status)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ClawdXCraft ticker daemon")
+    parser.add_argument("--worker-id", default=TICKER_WORKER_ID,
+                        help="Unique id of this ticker worker (default: hostname-pid)")
+    parser.add_argument("--shard-count", type=int, default=TICK_SHARD_COUNT,
+                        help="Shards to split bots into; >1 enables Redis leases (default: 1)")
+    parser.add_argument("--status", action="store_true",
+                        help="Print shard assignments, tick rates and lag, then exit")
+    args = parser.parse_args()
+    if args.status:
+        asyncio.run(print_status())
+        return
+    asyncio.run(run_daemon(args.worker_id, args.shard_count))
+
+
 if __name__ == "__main__":
-    asyncio.run(run_daemon())
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+verify_ledger.py — Incremental hash-chain verification for every bot.
+
+Resumes each bot from its stored verification checkpoint and re-hashes only
+the entries appended since, so it is cheap enough to run every cycle.
+``--full`` re-verifies every chain from genesis.
+
+Also checks the cached bots.balance against the verified ledger balance.
+``--rebuild-idle-streak`` recounts each bot's ledger_heads.idle_streak from
+the ledger and repairs it if it drifted.
+Unlike inspect_ledger.py this prints one line per bot, not every entry.
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
+  - lessons.md: All economic state changes must be hash-chained
+
+Usage:
+    # Docker:
+    docker compose exec backend python3 src/backend/scripts/verify_ledger.py
+
+    # Local:
+    cd src/backend && DATABASE_URL=... python scripts/verify_ledger.py
+
+    # Single bot, from genesis:
+    ... verify_ledger.py --bot-id 1 --full
+
+    # Full audit on every core:
+    ... verify_ledger.py --full --workers $(nproc)
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+
+_backend = str(Path(__file__).resolve().parents[1])
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from sqlalchemy import select
+from database import async_session_maker
+from models import Bot
+from services.ledger_service import rebuild_idle_streak
+from services.ledger_verifier import verify_bot_chain, verify_chains_parallel
+
+
+async def verify(
+    bot_id: int | None = None,
+    full: bool = False,
+    workers: int = 0,
+    rebuild_idle: bool = False,
+) -> bool:
+    """Verify ledger chains. Returns True if every chain checks out.
+
+    ``workers`` > 0 re-hashes in a process pool of that size, streaming
+    entries through server-side cursors; 0 hashes in-process.
+    ``rebuild_idle`` recounts and stores every bot's idle streak.
+    """
+    all_ok = True
+    total_rows = 0
+    started = time.monotonic()
+
+    async with async_session_maker() as session:
+        stmt = select(Bot.id, Bot.handle, Bot.balance)
+        if bot_id is not None:
+            stmt = stmt.where(Bot.id == bot_id)
+        bots = (await session.execute(stmt.order_by(Bot.id))).all()
+
+        if workers > 0:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                reports = await verify_chains_parallel(
+                    bot_ids=[b.id for b in bots], session=session, executor=pool, full=full,
+                )
+        else:
+            reports = [
+                await verify_bot_chain(bot_id=b.id, session=session, full=full) for b in bots
+            ]
+
+        for (bid, handle, cached_balance), report in zip(bots, reports):
+            if report["ok"] and Decimal(str(cached_balance)) != report["balance"]:
+                report["ok"] = False
+                report["errors"].append(
+                    f"bots.balance {cached_balance} != ledger balance {report['balance']}"
+                )
+            total_rows += report["rows"]
+            status = "OK" if report["ok"] else "FAIL"
+            print(f"  [{status}] @{handle} (id={bid}) seq {report['from_sequence']}"
+                  f"->{report['sequence']} ({report['rows']} new)")
+            for err in report["errors"]:
+                print(f"         {err}")
+            all_ok = all_ok and report["ok"]
+
+            if rebuild_idle:
+                stored, recounted = await rebuild_idle_streak(bot_id=bid, session=session)
+                if stored != recounted:
+                    print(f"         idle_streak {stored} -> {recounted} (rebuilt)")
+
+        await session.commit()
+
+    elapsed = time.monotonic() - started
+    mode = "full" if full else "incremental"
+    if workers > 0:
+        mode += f", {workers} workers"
+    rate = total_rows / elapsed if elapsed > 0 else 0.0
+    print(f"Verified {total_rows} entries across {len(bots)} bot(s) "
+          f"in {elapsed:.2f}s ({rate:,.0f} rows/s, {mode})")
+    return all_ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally verify ledger hash chains")
+    parser.add_argument("--bot-id", type=int, default=None, help="Verify single bot")
+    parser.add_argument("--full", action="store_true", help="Re-verify from genesis")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Re-hash across N processes (0 = in-process, default)")
+    parser.add_argument("--rebuild-idle-streak", action="store_true",
+                        help="Recount ledger_heads.idle_streak from the ledger")
+    args = parser.parse_args()
+    ok = asyncio.run(verify(args.bot_id, args.full, args.workers, args.rebuild_idle_streak))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
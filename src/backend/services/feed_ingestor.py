@@ -4,17 +4,42 @@ feed_ingestor.py — Async-native data ingestor for multi-modal markets.
 Uses httpx for ALL external I/O (no sync libraries).
 Sources: RSS feeds (via xmltodict), GitHub REST API, Open-Meteo weather API,
          Wikipedia REST API (v1.7 Proof-of-Retrieval, v1.8 Tool-Enabled Lookup).
+
+Every ingestor shares one long-lived ``httpx.AsyncClient`` per process
+(``FeedHttpPool``), so lookups reuse kept-alive connections instead of
+paying a TCP+TLS handshake each. Concurrency per host is capped; excess
+requests queue for a slot. Long-running processes call
+``close_http_pool()`` on shutdown.
+
+Title lookups on the research path (``resolve_title``) are cached per
+title (services/wiki_cache.py), and the misses are batched: those arriving
+within a few milliseconds of each other go out as one multi-title
+MediaWiki query (``WikiTitleBatcher``).
+
+Env:
+  FEED_HTTP_MAX_CONNECTIONS  total connections in the pool (default 100)
+  FEED_HTTP_MAX_KEEPALIVE    idle connections kept open (default 20)
+  FEED_HTTP_KEEPALIVE_S      idle connection lifetime in seconds (default 30)
+  FEED_HTTP_PER_HOST         concurrent requests per host (default 10)
+  FEED_HTTP2                 "1" to negotiate HTTP/2 (needs the h2 package)
+  WIKI_BATCH_WINDOW_MS       how long title lookups wait to share a request (default 5)
 """
 
 import asyncio
+import importlib.util
 import logging
 import os
+from collections import Counter
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator
 from urllib.parse import quote
 
 import httpx
 import xmltodict
 
+from services.wiki_cache import get_title_cache
+
 logger = logging.getLogger(__name__)
 
 # Optional GitHub token for higher rate limits
@@ -23,10 +48,128 @@ GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 # Shared timeout for all external calls
 REQUEST_TIMEOUT = 10.0
 
+FEED_HTTP_MAX_CONNECTIONS = int(os.getenv("FEED_HTTP_MAX_CONNECTIONS", "100"))
+FEED_HTTP_MAX_KEEPALIVE = int(os.getenv("FEED_HTTP_MAX_KEEPALIVE", "20"))
+FEED_HTTP_KEEPALIVE_S = float(os.getenv("FEED_HTTP_KEEPALIVE_S", "30"))
+FEED_HTTP_PER_HOST = int(os.getenv("FEED_HTTP_PER_HOST", "10"))
+FEED_HTTP2 = os.getenv("FEED_HTTP2", "0") == "1"
+
+# Title lookups arriving within this window share one MediaWiki request,
+# of at most 20 titles: TextExtracts returns intro extracts for only 20
+# pages per request (the action API itself would accept 50 titles).
+WIKI_BATCH_WINDOW_S = float(os.getenv("WIKI_BATCH_WINDOW_MS", "5")) / 1000
+WIKI_BATCH_MAX = 20
+
+
+class FeedHttpPool:
+    """Long-lived httpx client with per-host request slots and counters.
+
+    httpx connections belong to the event loop that opened them, so the
+    client is (re)created lazily on first use in each loop.
+    """
+
+    def __init__(self, *, per_host: int = FEED_HTTP_PER_HOST, http2: bool = FEED_HTTP2):
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("FEED_HTTP2=1 but the h2 package is not installed — using HTTP/1.1")
+            http2 = False
+        self.per_host = per_host
+        self.http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self.requests: Counter = Counter()    # host -> requests sent
+        self.waited: Counter = Counter()      # host -> requests that queued for a slot
+        self.in_flight: Counter = Counter()   # host -> requests running now
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed is True:
+            self._client = httpx.AsyncClient(
+                timeout=REQUEST_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=FEED_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=FEED_HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=FEED_HTTP_KEEPALIVE_S,
+                ),
+                http2=self.http2,
+            )
+            self._loop = loop
+            self._slots = {}
+        return self._client
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Hold one of ``url``'s host slots; yields the shared client.
+
+        Keep only the request itself inside the block — a nested lookup
+        against the same host while holding a slot can starve the host.
+        """
+        client = self.client
+        host = httpx.URL(url).host
+        sem = self._slots.get(host)
+        if sem is None:
+            sem = self._slots[host] = asyncio.Semaphore(self.per_host)
+        if sem.locked():
+            self.waited[host] += 1
+        async with sem:
+            self.requests[host] += 1
+            self.in_flight[host] += 1
+            try:
+                yield client
+            finally:
+                self.in_flight[host] -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Request counters per host plus the connection pool's current size."""
+        # httpx does not expose its pool publicly; httpcore's is read-only here
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", None) or ())
+        return {
+            "http2": self.http2,
+            "requests": sum(self.requests.values()),
+            "waited": sum(self.waited.values()),
+            "in_flight": sum(self.in_flight.values()),
+            "connections": len(connections),
+            "idle_connections": sum(1 for c in connections if c.is_idle()),
+            "hosts": {
+                host: {"requests": n, "waited": self.waited[host], "in_flight": self.in_flight[host]}
+                for host, n in sorted(self.requests.items())
+            },
+        }
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+        self._slots = {}
+
+
+_http_pool: FeedHttpPool | None = None
+
+
+def get_http_pool() -> FeedHttpPool:
+    """The process-wide pool every ingestor uses by default."""
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = FeedHttpPool()
+    return _http_pool
+
+
+async def close_http_pool() -> None:
+    """Close the shared client's connections. Called on daemon shutdown."""
+    if _http_pool is not None:
+        await _http_pool.aclose()
+        logger.info("Feed HTTP pool closed: %s", _http_pool.stats())
+
 
 class AsyncFeedIngestor:
     """Async-native data ingestor. httpx for all I/O, no sync libraries."""
 
+    def __init__(self, pool: FeedHttpPool | None = None):
+        self.pool = pool or get_http_pool()
+
     def _get_wiki_headers(self) -> dict:
         """
         Generate compliant headers for Wikimedia APIs.
@@ -40,9 +183,9 @@ class AsyncFeedIngestor:
     async def fetch_rss(self, url: str) -> list[dict]:
         """Fetch RSS feed, parse with xmltodict."""
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with self.pool.slot(url) as client:
                 resp = await client.get(url, follow_redirects=True)
-                resp.raise_for_status()
+            resp.raise_for_status()
 
             parsed = xmltodict.parse(resp.text)
             channel = parsed.get("rss", {}).get("channel", {})
@@ -82,13 +225,13 @@ class AsyncFeedIngestor:
                 "per_page": 50,
             }
 
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with self.pool.slot(url) as client:
                 resp = await client.get(url, headers=headers, params=params)
 
-                if resp.status_code == 403:
-                    logger.warning(f"GitHub rate limit hit for {repo}")
-                    return None
-                resp.raise_for_status()
+            if resp.status_code == 403:
+                logger.warning(f"GitHub rate limit hit for {repo}")
+                return None
+            resp.raise_for_status()
 
             pulls = resp.json()
             cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
@@ -120,9 +263,9 @@ class AsyncFeedIngestor:
                 "current_weather": "true",
             }
 
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with self.pool.slot(url) as client:
                 resp = await client.get(url, params=params)
-                resp.raise_for_status()
+            resp.raise_for_status()
 
             data = resp.json()
             current = data.get("current_weather", {})
@@ -152,28 +295,28 @@ class AsyncFeedIngestor:
         last_error = None
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+                async with self.pool.slot(url) as client:
                     resp = await client.get(
                         url, headers=headers, follow_redirects=True,
                     )
 
-                    if resp.status_code == 404:
-                        logger.info(f"Wikipedia lookup: article not found for '{title}'")
-                        return None
+                if resp.status_code == 404:
+                    logger.info(f"Wikipedia lookup: article not found for '{title}'")
+                    return None
 
-                    if resp.status_code == 403:
-                        logger.info(f"Wikipedia REST API 403 for '{title}' — falling back to MediaWiki action API")
-                        return await self._mediawiki_lookup(title)
+                if resp.status_code == 403:
+                    logger.info(f"Wikipedia REST API 403 for '{title}' — falling back to MediaWiki action API")
+                    return await self._mediawiki_lookup(title)
 
-                    if resp.status_code == 429:
-                        wait = base_backoff * (2 ** attempt)
-                        logger.warning(
-                            f"Wikipedia lookup 429 for '{title}' — backoff {wait:.1f}s (attempt {attempt + 1}/{max_retries})"
-                        )
-                        await asyncio.sleep(wait)
-                        continue
+                if resp.status_code == 429:
+                    wait = base_backoff * (2 ** attempt)
+                    logger.warning(
+                        f"Wikipedia lookup 429 for '{title}' — backoff {wait:.1f}s (attempt {attempt + 1}/{max_retries})"
+                    )
+                    await asyncio.sleep(wait)
+                    continue
 
-                    resp.raise_for_status()
+                resp.raise_for_status()
 
                 data = resp.json()
                 pageid = data.get("pageid")
@@ -228,9 +371,9 @@ class AsyncFeedIngestor:
         headers = self._get_wiki_headers()
 
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with self.pool.slot(url) as client:
                 resp = await client.get(url, params=params, headers=headers)
-                resp.raise_for_status()
+            resp.raise_for_status()
 
             data = resp.json()
             pages = data.get("query", {}).get("pages", {})
@@ -255,42 +398,69 @@ class AsyncFeedIngestor:
 
     async def _mediawiki_lookup(self, title: str) -> dict | None:
         """Fallback: Look up article by title via MediaWiki action API."""
+        return (await self._mediawiki_lookup_many([title])).get(title)
+
+    async def _mediawiki_lookup_many(self, titles: list[str]) -> dict[str, dict | None]:
+        """Look up to WIKI_BATCH_MAX titles in one MediaWiki action API query.
+
+        Returns ``{title: lookup or None}`` keyed by the titles as given,
+        following normalization and redirects per title. Missing and
+        invalid titles map to None. If the request fails the dict is empty,
+        so callers can tell "no such page" from "could not ask".
+        """
         url = "https://en.wikipedia.org/w/api.php"
         params = {
             "action": "query",
             "format": "json",
-            "titles": title,
+            "titles": "|".join(titles),
             "prop": "extracts|info",
             "exintro": "true",
             "explaintext": "true",
             "exsentences": "3",
+            "exlimit": "max",
             "redirects": "1",
         }
         headers = self._get_wiki_headers()
+        results: dict[str, dict | None] = {}
 
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with self.pool.slot(url) as client:
                 resp = await client.get(url, params=params, headers=headers)
-                resp.raise_for_status()
-
-            data = resp.json()
-            pages = data.get("query", {}).get("pages", {})
-            if not pages:
-                return None
-
-            page = next(iter(pages.values()))
-            pageid = page.get("pageid")
-            if not pageid or pageid == -1:
-                return None
+            resp.raise_for_status()
 
-            return {
-                "title": page.get("title", title),
-                "pageid": pageid,
-                "extract": page.get("extract", "")[:300],
+            query = resp.json().get("query", {})
+            pages = {
+                page.get("title"): page
+                for page in query.get("pages", {}).values()
+                if page.get("pageid") and "missing" not in page and "invalid" not in page
+            }
+            renamed = {
+                r["from"]: r["to"]
+                for r in query.get("normalized", []) + query.get("redirects", [])
             }
+            for title in titles:
+                resolved = title
+                for _ in range(3):  # normalized -> redirect -> (rare) double redirect
+                    resolved = renamed.get(resolved, resolved)
+                page = pages.get(resolved)
+                results[title] = None if page is None else {
+                    "title": page.get("title", title),
+                    "pageid": page["pageid"],
+                    "extract": page.get("extract", "")[:300],
+                }
         except Exception as e:
-            logger.warning(f"MediaWiki lookup fallback failed for '{title}': {e}")
-            return None
+            logger.warning(f"MediaWiki lookup failed for {len(titles)} title(s) {titles[:3]}: {e}")
+        return results
+
+    async def resolve_title(self, title: str) -> dict | None:
+        """Look up an article by title through the shared cache.
+
+        Same result shape as wikipedia_lookup. Used on the research hot
+        path, where many bots look up the same titles at once: repeats are
+        served from services/wiki_cache.py and misses are batched with
+        concurrent lookups (WikiTitleBatcher).
+        """
+        return await get_title_cache().get(title, get_title_batcher().resolve)
 
     async def fetch_github_stars(self, repo: str) -> dict | None:
         """Fetch star count and basic stats for a GitHub repo via public API."""
@@ -303,17 +473,16 @@ class AsyncFeedIngestor:
             if GITHUB_TOKEN:
                 headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
 
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-                resp = await client.get(
-                    f"https://api.github.com/repos/{repo}", headers=headers
-                )
-                if resp.status_code == 403:
-                    logger.warning("GitHub rate limit hit fetching stars for %s", repo)
-                    return None
-                if resp.status_code == 404:
-                    logger.warning("GitHub repo not found: %s", repo)
-                    return None
-                resp.raise_for_status()
+            url = f"https://api.github.com/repos/{repo}"
+            async with self.pool.slot(url) as client:
+                resp = await client.get(url, headers=headers)
+            if resp.status_code == 403:
+                logger.warning("GitHub rate limit hit fetching stars for %s", repo)
+                return None
+            if resp.status_code == 404:
+                logger.warning("GitHub repo not found: %s", repo)
+                return None
+            resp.raise_for_status()
 
             data = resp.json()
             return {
@@ -334,9 +503,10 @@ class AsyncFeedIngestor:
         so callers can fall back to RSS without crashing.
         """
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            url = "https://newsapi.org/v2/top-headlines"
+            async with self.pool.slot(url) as client:
                 resp = await client.get(
-                    "https://newsapi.org/v2/top-headlines",
+                    url,
                     params={
                         "q":        keyword,
                         "apiKey":   api_key,
@@ -344,13 +514,13 @@ class AsyncFeedIngestor:
                         "language": "en",
                     },
                 )
-                if resp.status_code == 401:
-                    logger.warning("NewsAPI: invalid API key — will use RSS fallback")
-                    return []
-                if resp.status_code == 429:
-                    logger.warning("NewsAPI: rate limit hit for keyword '%s'", keyword)
-                    return []
-                resp.raise_for_status()
+            if resp.status_code == 401:
+                logger.warning("NewsAPI: invalid API key — will use RSS fallback")
+                return []
+            if resp.status_code == 429:
+                logger.warning("NewsAPI: rate limit hit for keyword '%s'", keyword)
+                return []
+            resp.raise_for_status()
 
             data = resp.json()
             return [
@@ -370,18 +540,15 @@ class AsyncFeedIngestor:
         try:
             headers = self._get_wiki_headers()
 
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-                resp = await client.get(
-                    "https://en.wikipedia.org/api/rest_v1/page/random/summary",
-                    headers=headers,
-                    follow_redirects=True,
-                )
+            url = "https://en.wikipedia.org/api/rest_v1/page/random/summary"
+            async with self.pool.slot(url) as client:
+                resp = await client.get(url, headers=headers, follow_redirects=True)
 
-                if resp.status_code == 403:
-                    logger.info("Wikipedia REST API 403 — falling back to MediaWiki action API")
-                    return await self._mediawiki_random_article()
+            if resp.status_code == 403:
+                logger.info("Wikipedia REST API 403 — falling back to MediaWiki action API")
+                return await self._mediawiki_random_article()
 
-                resp.raise_for_status()
+            resp.raise_for_status()
 
             data = resp.json()
             pageid = data.get("pageid")
@@ -399,3 +566,96 @@ class AsyncFeedIngestor:
         except Exception as e:
             logger.warning(f"Wikipedia REST fetch failed: {e} — trying MediaWiki fallback")
             return await self._mediawiki_random_article()
+
+
+class WikiLookupError(Exception):
+    """A batched title lookup could not be answered (request failed)."""
+
+
+class WikiTitleBatcher:
+    """Coalesces concurrent title lookups into multi-title MediaWiki queries.
+
+    The first lookup opens a window of ``window_s``; every lookup arriving
+    in it joins the batch, which is sent as one ``titles=A|B|...`` request
+    when the window closes or ``max_titles`` distinct titles are waiting.
+    Callers asking for the same title share one slot in the batch.
+    """
+
+    def __init__(
+        self,
+        ingestor: AsyncFeedIngestor | None = None,
+        *,
+        window_s: float = WIKI_BATCH_WINDOW_S,
+        max_titles: int = WIKI_BATCH_MAX,
+    ):
+        self.ingestor = ingestor or AsyncFeedIngestor()
+        self.window_s = window_s
+        self.max_titles = max_titles
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._running: set[asyncio.Task] = set()
+        self.lookups = 0    # resolve() calls
+        self.requests = 0   # batched HTTP requests sent
+
+    async def resolve(self, title: str) -> dict | None:
+        """The lookup for ``title``, or None if no such page exists.
+
+        Raises WikiLookupError if the batch request failed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures and timers belong to one loop; drop any stale batch
+            self._loop, self._pending, self._timer = loop, {}, None
+        self.lookups += 1
+        future = loop.create_future()
+        self._pending.setdefault(title, []).append(future)
+        if len(self._pending) >= self.max_titles:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_s, self._dispatch)
+        return await future
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _send(self, batch: dict[str, list[asyncio.Future]]) -> None:
+        self.requests += 1
+        try:
+            results = await self.ingestor._mediawiki_lookup_many(list(batch))
+        except Exception as e:
+            logger.warning(f"Wikipedia batch lookup failed: {e}")
+            results = {}
+        for title, futures in batch.items():
+            for future in futures:
+                if future.done():  # the caller may have given up
+                    continue
+                if title in results:
+                    future.set_result(results[title])
+                else:
+                    future.set_exception(WikiLookupError(f"lookup for '{title}' failed"))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "requests": self.requests,
+            "lookups_per_request": round(self.lookups / self.requests, 2) if self.requests else 0.0,
+        }
+
+
+_title_batcher: WikiTitleBatcher | None = None
+
+
+def get_title_batcher() -> WikiTitleBatcher:
+    """The process-wide batcher behind AsyncFeedIngestor.resolve_title."""
+    global _title_batcher
+    if _title_batcher is None:
+        _title_batcher = WikiTitleBatcher()
+    return _title_batcher
@@ -0,0 +1,451 @@
+"""
+ledger_archive.py — Cold-segment archival of sealed ledger history.
+
+Almost every ledger row of a long-lived bot is only ever read again by
+audits. The archival job moves a bot's sealed history — entries at or below
+its latest checkpoint that the verifier has accepted and that are already
+anchored in a Merkle epoch — out of ``ledger`` into an append-only segment
+file, indexed by a ``ledger_segments`` row.
+
+Segment file layout (columnar, one zlib block per column):
+  b"CLXSEG01" | u32 header length (LE) | JSON header | column blocks
+The header records bot_id, the sequence range, row count and each column's
+(offset, length) relative to the first block. Files are written to a temp
+name, fsynced and renamed into place; they are never modified afterwards.
+A segment holds at most LEDGER_ARCHIVE_MAX_ROWS entries, so reading one
+back has bounded memory; a longer sealed history becomes several segments
+over successive runs.
+
+The index row stores the boundary hashes (``previous_hash`` of the first
+entry, ``hash`` of the last), the end balance and the file's SHA256, so the
+chain stays verifiable across the live/archived seam. Readers mmap the file
+and decompress only the columns they need.
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
+  - lessons.md: All economic state changes must be hash-chained
+"""
+
+import asyncio
+import bisect
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+from collections import namedtuple
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import delete, func as sa_func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import (
+    Ledger,
+    LedgerCheckpoint,
+    LedgerEpoch,
+    LedgerSegment,
+    LedgerVerification,
+)
+
+logger = logging.getLogger("ledger_archive")
+
+ARCHIVE_DIR = Path(os.environ.get(
+    "LEDGER_ARCHIVE_DIR",
+    str(Path(__file__).resolve().parents[3] / "data" / "ledger_segments"),
+))
+ARCHIVE_MIN_ROWS = int(os.environ.get("LEDGER_ARCHIVE_MIN_ROWS", "1000"))
+# Segments end on a checkpoint, so keep this a multiple of LEDGER_CHECKPOINT_INTERVAL
+ARCHIVE_MAX_ROWS = int(os.environ.get("LEDGER_ARCHIVE_MAX_ROWS", "50000"))
+
+SEGMENT_MAGIC = b"CLXSEG01"
+
+# Field order matches ("id",) + ledger_verifier.CHAIN_COLUMNS, so
+# ``tuple(entry)[1:]`` is a verifier row.
+SEGMENT_FIELDS = (
+    "id", "sequence", "amount", "transaction_type", "reference_id",
+    "timestamp", "previous_hash", "hash", "balance_after",
+)
+ArchivedEntry = namedtuple("ArchivedEntry", SEGMENT_FIELDS)
+
+_ENCODE = {
+    "amount": str,
+    "timestamp": lambda v: v.isoformat(),
+    "balance_after": lambda v: None if v is None else str(v),
+}
+_DECODE = {
+    "amount": Decimal,
+    "timestamp": datetime.fromisoformat,
+    "balance_after": lambda v: None if v is None else Decimal(v),
+}
+
+
+def write_segment(path: Path, *, bot_id: int, entries: list[ArchivedEntry]) -> tuple[str, int]:
+    """Write ``entries`` as a segment file. Returns (sha256 hex, byte size)."""
+    blocks: list[bytes] = []
+    columns: dict[str, list[int]] = {}
+    offset = 0
+    for i, field in enumerate(SEGMENT_FIELDS):
+        encode = _ENCODE.get(field, lambda v: v)
+        raw = json.dumps([encode(e[i]) for e in entries], separators=(",", ":")).encode()
+        block = zlib.compress(raw, 9)
+        columns[field] = [offset, len(block)]
+        offset += len(block)
+        blocks.append(block)
+
+    header = json.dumps({
+        "version": 1,
+        "codec": "zlib",
+        "bot_id": bot_id,
+        "first_sequence": entries[0].sequence,
+        "last_sequence": entries[-1].sequence,
+        "rows": len(entries),
+        "columns": columns,
+    }).encode()
+    data = SEGMENT_MAGIC + struct.pack("<I", len(header)) + header + b"".join(blocks)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return hashlib.sha256(data).hexdigest(), len(data)
+
+
+class SegmentReader:
+    """Memory-mapped reader for one segment file.
+
+    Use as a context manager. Columns are decompressed on first access.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a ledger segment")
+        pos = len(SEGMENT_MAGIC)
+        (header_len,) = struct.unpack_from("<I", self._mm, pos)
+        pos += 4
+        self.header: dict[str, Any] = json.loads(self._mm[pos:pos + header_len])
+        self._data_start = pos + header_len
+        self._columns: dict[str, list] = {}
+
+    def __enter__(self) -> "SegmentReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def sha256(self) -> str:
+        return hashlib.sha256(self._mm).hexdigest()
+
+    def column(self, field: str) -> list:
+        if field not in self._columns:
+            offset, length = self.header["columns"][field]
+            start = self._data_start + offset
+            raw = zlib.decompress(memoryview(self._mm)[start:start + length])
+            decode = _DECODE.get(field)
+            values = json.loads(raw)
+            self._columns[field] = [decode(v) for v in values] if decode else values
+        return self._columns[field]
+
+    def entries(self) -> list[ArchivedEntry]:
+        return [ArchivedEntry(*row) for row in zip(*(self.column(f) for f in SEGMENT_FIELDS))]
+
+
+def segment_path(segment: LedgerSegment, archive_dir: Optional[Path] = None) -> Path:
+    return (archive_dir or ARCHIVE_DIR) / segment.path
+
+
+def read_segment(segment: LedgerSegment, archive_dir: Optional[Path] = None) -> list[ArchivedEntry]:
+    """All entries of an indexed segment; raises ValueError if the file was altered."""
+    with SegmentReader(segment_path(segment, archive_dir)) as reader:
+        if reader.sha256() != segment.file_sha256:
+            raise ValueError(f"segment {segment.path} does not match its recorded SHA256")
+        return reader.entries()
+
+
+def read_segment_id_range(
+    segment: LedgerSegment,
+    first_id: int,
+    last_id: int,
+    archive_dir: Optional[Path] = None,
+) -> list[ArchivedEntry]:
+    """Entries of an indexed segment whose ledger id lies in [first_id, last_id].
+
+    Per-bot segments overlap heavily in ``Ledger.id``, so most segments a
+    lookup by id touches hold none of the ids. Only the (sorted) id column
+    is inflated to find out; the SHA256 check and the other columns are
+    paid only by a segment that does hold some.
+    """
+    with SegmentReader(segment_path(segment, archive_dir)) as reader:
+        ids = reader.column("id")
+        lo = bisect.bisect_left(ids, first_id)
+        hi = bisect.bisect_right(ids, last_id)
+        if lo == hi:
+            return []
+        if reader.sha256() != segment.file_sha256:
+            raise ValueError(f"segment {segment.path} does not match its recorded SHA256")
+        columns = [reader.column(f)[lo:hi] for f in SEGMENT_FIELDS]
+        return [ArchivedEntry(*row) for row in zip(*columns)]
+
+
+async def list_segments(bot_id: int, session: AsyncSession) -> list[LedgerSegment]:
+    """A bot's archived segments in chain order."""
+    result = await session.execute(
+        select(LedgerSegment)
+        .where(LedgerSegment.bot_id == bot_id)
+        .order_by(LedgerSegment.first_sequence.asc())
+    )
+    return list(result.scalars().all())
+
+
+async def find_archived_entry(
+    session: AsyncSession,
+    *,
+    bot_id: Optional[int] = None,
+    sequence: Optional[int] = None,
+    ledger_id: Optional[int] = None,
+    archive_dir: Optional[Path] = None,
+) -> Optional[tuple[LedgerSegment, ArchivedEntry]]:
+    """Look up one archived entry by (bot_id, sequence) or by ledger id.
+
+    Returns the entry together with the segment it was read from.
+    """
+    stmt = select(LedgerSegment)
+    if ledger_id is not None:
+        stmt = stmt.where(
+            LedgerSegment.first_ledger_id <= ledger_id, LedgerSegment.last_ledger_id >= ledger_id,
+        )
+        for segment in (await session.execute(stmt)).scalars().all():
+            found = await asyncio.to_thread(
+                read_segment_id_range, segment, ledger_id, ledger_id, archive_dir,
+            )
+            if found:
+                return segment, found[0]
+        return None
+
+    stmt = stmt.where(
+        LedgerSegment.bot_id == bot_id,
+        LedgerSegment.first_sequence <= sequence,
+        LedgerSegment.last_sequence >= sequence,
+    )
+    for segment in (await session.execute(stmt)).scalars().all():
+        for entry in await asyncio.to_thread(read_segment, segment, archive_dir):
+            if entry.sequence == sequence:
+                return segment, entry
+    return None
+
+
+async def archived_hashes_in_id_range(
+    session: AsyncSession,
+    first_id: int,
+    last_id: int,
+    archive_dir: Optional[Path] = None,
+) -> list[tuple[int, str]]:
+    """(id, hash) of archived entries whose ledger id lies in [first_id, last_id]."""
+    segments = (await session.execute(
+        select(LedgerSegment).where(
+            LedgerSegment.first_ledger_id <= last_id, LedgerSegment.last_ledger_id >= first_id,
+        )
+    )).scalars().all()
+    found = []
+    for segment in segments:
+        entries = await asyncio.to_thread(
+            read_segment_id_range, segment, first_id, last_id, archive_dir,
+        )
+        found += [(entry.id, entry.hash) for entry in entries]
+    return found
+
+
+async def _epochs_hold_sealed_leaves(
+    session: AsyncSession,
+    first_id: int,
+    last_id: int,
+    archive_dir: Optional[Path] = None,
+    checked: Optional[dict[int, bool]] = None,
+) -> bool:
+    """Whether every epoch overlapping [first_id, last_id] still holds exactly
+    the entries it was sealed over.
+
+    An entry that committed into an already sealed window is inside the id
+    range but not a leaf; archiving it would hide it from reseal_epoch().
+    ``checked`` caches results by epoch id across bots in one run.
+    """
+    checked = {} if checked is None else checked
+    epochs = (await session.execute(
+        select(LedgerEpoch).where(
+            LedgerEpoch.first_ledger_id <= last_id, LedgerEpoch.last_ledger_id >= first_id,
+        )
+    )).scalars().all()
+    for epoch in epochs:
+        if epoch.id not in checked:
+            held = await session.scalar(
+                select(sa_func.count(Ledger.id)).where(
+                    Ledger.id >= epoch.first_ledger_id, Ledger.id <= epoch.last_ledger_id,
+                )
+            )
+            if held < epoch.leaf_count:
+                held += len(await archived_hashes_in_id_range(
+                    session, epoch.first_ledger_id, epoch.last_ledger_id, archive_dir,
+                ))
+            checked[epoch.id] = held == epoch.leaf_count
+            if not checked[epoch.id]:
+                logger.error(
+                    "Epoch %d: sealed %d leaves but ledger ids %d..%d now hold %d",
+                    epoch.id, epoch.leaf_count, epoch.first_ledger_id, epoch.last_ledger_id, held,
+                )
+        if not checked[epoch.id]:
+            return False
+    return True
+
+
+async def archive_bot(
+    bot_id: int,
+    session: AsyncSession,
+    *,
+    min_rows: int = ARCHIVE_MIN_ROWS,
+    max_rows: int = ARCHIVE_MAX_ROWS,
+    archive_dir: Optional[Path] = None,
+    _checked_epochs: Optional[dict[int, bool]] = None,
+) -> Optional[LedgerSegment]:
+    """Move one bot's sealed history into a new segment, if there is enough of it.
+
+    Sealed means: at or below the latest checkpoint that the verifier has
+    reached, and every entry already a leaf of a Merkle epoch. The segment
+    ends at the latest such checkpoint within ``max_rows`` entries of the
+    previous one. Returns the new index row, or None. Writes the file, then stages the index insert
+    and the row deletes — does NOT commit.
+    """
+    verified = await session.get(LedgerVerification, bot_id)
+    if verified is None:
+        return None
+
+    previous = (await session.execute(
+        select(LedgerSegment)
+        .where(LedgerSegment.bot_id == bot_id)
+        .order_by(LedgerSegment.last_sequence.desc())
+        .limit(1)
+    )).scalar_one_or_none()
+    archived_to = previous.last_sequence if previous else 0
+
+    checkpoint = (await session.execute(
+        select(LedgerCheckpoint)
+        .where(
+            LedgerCheckpoint.bot_id == bot_id,
+            LedgerCheckpoint.sequence <= verified.verified_sequence,
+            LedgerCheckpoint.sequence > archived_to,
+            LedgerCheckpoint.sequence <= archived_to + max_rows,
+        )
+        .order_by(LedgerCheckpoint.sequence.desc())
+        .limit(1)
+    )).scalar_one_or_none()
+    if checkpoint is None or checkpoint.sequence - archived_to < min_rows:
+        return None
+
+    rows = (await session.execute(
+        select(
+            Ledger.id, Ledger.sequence, Ledger.amount, Ledger.transaction_type,
+            Ledger.reference_id, Ledger.timestamp, Ledger.previous_hash, Ledger.hash,
+            Ledger.balance_after,
+        )
+        .where(
+            Ledger.bot_id == bot_id,
+            Ledger.sequence > archived_to,
+            Ledger.sequence <= checkpoint.sequence,
+        )
+        .order_by(Ledger.sequence.asc())
+    )).all()
+    entries = [ArchivedEntry(*row) for row in rows]
+
+    expected_start = previous.last_hash if previous else None
+    if (
+        len(entries) != checkpoint.sequence - archived_to
+        or entries[-1].hash != checkpoint.hash
+        or (expected_start is not None and entries[0].previous_hash != expected_start)
+    ):
+        logger.error(
+            "Bot %d: live rows %d..%d do not line up with checkpoint/previous segment; not archiving",
+            bot_id, archived_to + 1, checkpoint.sequence,
+        )
+        return None
+
+    anchored_to = (await session.execute(
+        select(sa_func.max(LedgerEpoch.last_ledger_id))
+    )).scalar_one_or_none() or 0
+    if max(e.id for e in entries) > anchored_to:
+        logger.debug("Bot %d: range not fully anchored yet; skipping", bot_id)
+        return None
+    if not await _epochs_hold_sealed_leaves(
+        session, min(e.id for e in entries), max(e.id for e in entries),
+        archive_dir, _checked_epochs,
+    ):
+        logger.error("Bot %d: range overlaps an epoch that needs resealing; not archiving", bot_id)
+        return None
+
+    rel = Path(f"bot_{bot_id}") / f"seg_{entries[0].sequence:010d}_{entries[-1].sequence:010d}.clxseg"
+    digest, size = await asyncio.to_thread(
+        write_segment, (archive_dir or ARCHIVE_DIR) / rel, bot_id=bot_id, entries=entries,
+    )
+
+    segment = LedgerSegment(
+        bot_id=bot_id,
+        first_sequence=entries[0].sequence,
+        last_sequence=entries[-1].sequence,
+        first_ledger_id=min(e.id for e in entries),
+        last_ledger_id=max(e.id for e in entries),
+        row_count=len(entries),
+        previous_hash=entries[0].previous_hash,
+        last_hash=entries[-1].hash,
+        end_balance=checkpoint.balance,
+        path=str(rel),
+        file_sha256=digest,
+        byte_size=size,
+    )
+    session.add(segment)
+    await session.execute(
+        delete(Ledger).where(
+            Ledger.bot_id == bot_id,
+            Ledger.sequence > archived_to,
+            Ledger.sequence <= checkpoint.sequence,
+        )
+    )
+    await session.flush()
+    logger.info(
+        "Bot %d: archived seq %d..%d (%d rows, %d bytes) to %s",
+        bot_id, segment.first_sequence, segment.last_sequence, len(entries), size, rel,
+    )
+    return segment
+
+
+async def archive_cold_segments(
+    session: AsyncSession,
+    *,
+    min_rows: int = ARCHIVE_MIN_ROWS,
+    max_rows: int = ARCHIVE_MAX_ROWS,
+    archive_dir: Optional[Path] = None,
+) -> list[LedgerSegment]:
+    """Run archive_bot() for every verified bot. Does NOT commit."""
+    bot_ids = (await session.execute(select(LedgerVerification.bot_id))).scalars().all()
+    segments = []
+    checked_epochs: dict[int, bool] = {}
+    for bot_id in bot_ids:
+        segment = await archive_bot(
+            bot_id, session, min_rows=min_rows, max_rows=max_rows, archive_dir=archive_dir,
+            _checked_epochs=checked_epochs,
+        )
+        if segment is not None:
+            segments.append(segment)
+    return segments
@@ -0,0 +1,159 @@
+"""
+ledger_export.py — Constant-memory iteration over a bot's full ledger.
+
+Backs ``GET /bots/{bot_id}/ledger``. Archived segments (ledger_archive) are
+read one file at a time, off the event loop, and each holds at most
+LEDGER_ARCHIVE_MAX_ROWS entries; live rows are read in keyset pages on
+``(bot_id, sequence)`` — the uq_ledger_bot_sequence index — each page
+through a server-side cursor, so memory stays flat however long the
+history is. Clients resume with the last ``sequence`` they received.
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
+"""
+
+import asyncio
+import os
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from sqlalchemy import func as sa_func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Ledger, LedgerSegment
+from services.ledger_archive import read_segment
+
+EXPORT_PAGE_SIZE = int(os.environ.get("LEDGER_EXPORT_PAGE_SIZE", "1000"))
+
+EXPORT_COLUMNS = (
+    Ledger.id, Ledger.sequence, Ledger.amount, Ledger.transaction_type,
+    Ledger.reference_id, Ledger.timestamp, Ledger.previous_hash, Ledger.hash,
+    Ledger.balance_after,
+)
+
+
+def _utc(ts: datetime) -> datetime:
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def entry_to_json(bot_id: int, row: Any) -> dict[str, Any]:
+    """JSON-safe dict for one ledger row or archived entry. Money is a string."""
+    return {
+        "id": row.id,
+        "bot_id": bot_id,
+        "sequence": row.sequence,
+        "transaction_type": row.transaction_type,
+        "amount": str(row.amount),
+        "balance_after": None if row.balance_after is None else str(row.balance_after),
+        "reference_id": row.reference_id,
+        "timestamp": _utc(row.timestamp).isoformat(),
+        "previous_hash": row.previous_hash,
+        "hash": row.hash,
+    }
+
+
+async def _segments_after(session: AsyncSession, bot_id: int, after_sequence: int) -> Sequence[LedgerSegment]:
+    return (await session.execute(
+        select(LedgerSegment)
+        .where(LedgerSegment.bot_id == bot_id, LedgerSegment.last_sequence > after_sequence)
+        .order_by(LedgerSegment.first_sequence.asc())
+    )).scalars().all()
+
+
+async def iter_ledger_entries(
+    session: AsyncSession,
+    *,
+    bot_id: int,
+    after_sequence: int = 0,
+    transaction_types: Optional[Sequence[str]] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    page_size: int = EXPORT_PAGE_SIZE,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield a bot's ledger entries with ``sequence > after_sequence`` in order.
+
+    ``transaction_types`` keeps only those types; ``since`` (inclusive) and
+    ``until`` (exclusive) bound the timestamp. Stops after ``limit``
+    entries if given. Raises ValueError if an archived segment no longer
+    matches its recorded SHA256 or the history has a sequence gap, OSError
+    if a segment file is missing.
+
+    Filters run in SQL for live rows; archived segments are read whole and
+    filtered here. Live pages are separate statements, so an archive run
+    may commit between them and delete the next rows. Each page therefore
+    also reads the lowest unfiltered live sequence in the same statement:
+    if it does not continue from ``after_sequence``, segments are listed
+    again and the export resumes from the newly archived entries.
+    """
+    types = set(transaction_types or ())
+    since = _utc(since) if since else None
+    until = _utc(until) if until else None
+    remaining = limit
+
+    def wanted(row: Any) -> bool:
+        if types and row.transaction_type not in types:
+            return False
+        ts = _utc(row.timestamp)
+        return (since is None or ts >= since) and (until is None or ts < until)
+
+    segments = await _segments_after(session, bot_id, after_sequence)
+    while True:
+        for segment in segments:
+            for entry in await asyncio.to_thread(read_segment, segment):
+                if entry.sequence <= after_sequence or not wanted(entry):
+                    continue
+                yield entry_to_json(bot_id, entry)
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining <= 0:
+                        return
+            after_sequence = max(after_sequence, segment.last_sequence)
+
+        archived_since_listed = False
+        while True:
+            first_live = (
+                select(sa_func.min(Ledger.sequence))
+                .where(Ledger.bot_id == bot_id, Ledger.sequence > after_sequence)
+                .scalar_subquery()
+                .label("first_live")
+            )
+            stmt = select(*EXPORT_COLUMNS, first_live).where(
+                Ledger.bot_id == bot_id, Ledger.sequence > after_sequence,
+            )
+            if types:
+                stmt = stmt.where(Ledger.transaction_type.in_(types))
+            if since is not None:
+                stmt = stmt.where(Ledger.timestamp >= since)
+            if until is not None:
+                stmt = stmt.where(Ledger.timestamp < until)
+            batch = page_size if remaining is None else min(page_size, remaining)
+            stmt = stmt.order_by(Ledger.sequence.asc()).limit(batch)
+
+            seen = 0
+            result = await session.stream(stmt.execution_options(yield_per=batch))
+            try:
+                async for row in result:
+                    if seen == 0 and row.first_live != after_sequence + 1:
+                        archived_since_listed = True
+                        break
+                    seen += 1
+                    after_sequence = row.sequence
+                    yield entry_to_json(bot_id, row)
+            finally:
+                await result.close()  # client may disconnect mid-page
+            if remaining is not None:
+                remaining -= seen
+                if remaining <= 0:
+                    return
+            if archived_since_listed or seen < batch:
+                break
+
+        # A short or empty page may also have followed an archive run
+        segments = await _segments_after(session, bot_id, after_sequence)
+        if archived_since_listed and (not segments or segments[0].first_sequence > after_sequence + 1):
+            raise ValueError(
+                f"Ledger for bot {bot_id} has a gap after sequence {after_sequence}"
+            )
+        if not segments:
+            return
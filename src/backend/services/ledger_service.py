@@ -6,25 +6,267 @@ Imports Ledger strictly from models.py (Single Source of Truth).
 Constitutional references:
   - CLAUDE.md Invariant #4: "Irreversible loss is real"
   - Ledger.sequence is strictly monotonic per bot_id — enforced by
-    UniqueConstraint('bot_id', 'sequence') and this service's SELECT...ORDER BY
-  - Hash chain: SHA256(bot_id|amount|type|ref|timestamp|previous_hash|sequence)
+    UniqueConstraint('bot_id', 'sequence') and the per-bot ``ledger_heads``
+    row, which every append locks (SELECT ... FOR UPDATE) and advances in
+    the same transaction
+  - Hash chain: SHA256(bot_id|amount|type|ref|timestamp|previous_hash|sequence|balance_after)
+    with amount and balance_after fixed at 8 decimal places. Rows written
+    before ``balance_after`` existed (NULL) hash without it, amount as passed.
   - If sequence is ever non-monotonic, the ledger is corrupted.
 
+Balances:
+  ``ledger_heads.balance`` is the running sum and ``get_balance`` reads it
+  directly. Every entry also carries ``balance_after``, and every
+  ``LEDGER_CHECKPOINT_INTERVAL`` entries a ``ledger_checkpoints`` row pins
+  (sequence, hash, balance) so ``verify_balance`` only sums the tail.
+
+Idle streak:
+  ``ledger_heads.idle_streak`` counts the HEARTBEAT entries at the tip of the
+  chain and is advanced by every append. ``count_idle_streak`` recomputes it
+  from the ledger (reaching into archived segments if the run does) and
+  ``rebuild_idle_streak`` writes that back to the head.
+
 v2.0 — Observability layer:
   ``narrative_fields`` is an optional dict of cost/ROI/waste data written to
   the companion ``agent_metrics`` table in the same transaction. It is NOT
   included in the SHA256 payload — the hash chain is unchanged.
 """
 
+import asyncio
 import hashlib
+import os
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Optional
 
-from sqlalchemy import func as sa_func, select
+from sqlalchemy import func as sa_func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import Ledger
+from models import Ledger, LedgerCheckpoint, LedgerHead, LedgerSegment
+from services.ledger_archive import read_segment
+
+GENESIS_HASH = "0" * 64
+IDLE_TRANSACTION_TYPE = "HEARTBEAT"  # any other type ends an idle streak
+LEDGER_CHECKPOINT_INTERVAL = int(os.environ.get("LEDGER_CHECKPOINT_INTERVAL", "1000"))
+_MONEY_QUANTUM = Decimal("0.00000001")  # matches Numeric(18, 8)
+
+
+async def _lock_chain_head(bot_id: int, session: AsyncSession) -> LedgerHead:
+    """Return the bot's ``LedgerHead`` row, locked for the rest of the transaction.
+
+    The head row is created on first use. For bots whose ledger predates
+    ``ledger_heads`` it is bootstrapped from a one-time scan of the tip and
+    sum; every later append is a single primary-key read.
+    """
+    # populate_existing: sessions use expire_on_commit=False, so a head loaded
+    # in an earlier transaction would otherwise be served stale from the
+    # identity map.
+    stmt = (
+        select(LedgerHead)
+        .where(LedgerHead.bot_id == bot_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    head = (await session.execute(stmt)).scalar_one_or_none()
+    if head is not None:
+        return head
+
+    # Checkpoint-relative, so archived history (ledger_archive) is covered:
+    # archived rows always sit at or below a checkpoint.
+    tip = (await session.execute(
+        select(Ledger.hash, Ledger.sequence)
+        .where(Ledger.bot_id == bot_id)
+        .order_by(Ledger.sequence.desc())
+        .limit(1)
+    )).one_or_none()
+    if tip is None:
+        tip = (await session.execute(
+            select(LedgerCheckpoint.hash, LedgerCheckpoint.sequence)
+            .where(LedgerCheckpoint.bot_id == bot_id)
+            .order_by(LedgerCheckpoint.sequence.desc())
+            .limit(1)
+        )).one_or_none()
+    values = {
+        "bot_id": bot_id,
+        "last_hash": tip.hash if tip else GENESIS_HASH,
+        "last_sequence": tip.sequence if tip else 0,
+        "balance": await _sum_from_checkpoint(bot_id, session),
+        "idle_streak": await count_idle_streak(bot_id, session),
+    }
+
+    if session.get_bind().dialect.name == "postgresql":
+        # Two first-time appenders may race here; ON CONFLICT lets the loser
+        # fall through to the lock and read the winner's row.
+        await session.execute(
+            pg_insert(LedgerHead).values(**values).on_conflict_do_nothing(
+                index_elements=[LedgerHead.bot_id]
+            )
+        )
+        return (await session.execute(stmt)).scalar_one()
+
+    head = LedgerHead(**values)
+    session.add(head)
+    return head
+
+
+def compute_ledger_hash(
+    *,
+    bot_id: int,
+    amount: "float | Decimal",
+    transaction_type: str,
+    reference_id: str,
+    timestamp: datetime,
+    previous_hash: str,
+    sequence: int,
+    balance_after: Optional[Decimal] = None,
+) -> str:
+    """SHA256 link for one entry (deterministic field ordering).
+
+    Pure function — verifiers call it with a stored row's values. With
+    ``balance_after`` the payload uses fixed 8-dp money fields so a row read
+    back from Numeric(18, 8) re-hashes identically, and the timestamp is
+    normalized to UTC (naive values are taken as UTC) so the database's
+    session time zone does not matter.
+    """
+    if balance_after is None:
+        amount_str = f"{amount}"
+        ts_str = timestamp.isoformat()
+    else:
+        amount_str = f"{Decimal(str(amount)):.8f}"
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        ts_str = timestamp.astimezone(timezone.utc).isoformat()
+    payload = (
+        f"{bot_id}|"
+        f"{amount_str}|"
+        f"{transaction_type}|"
+        f"{reference_id}|"
+        f"{ts_str}|"
+        f"{previous_hash}|"
+        f"{sequence}"
+    )
+    if balance_after is not None:
+        payload += f"|{Decimal(str(balance_after)):.8f}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _metrics_companion(
+    *,
+    bot_id: int,
+    transaction_type: str,
+    reference_id: str,
+    narrative_fields: dict[str, Any],
+):
+    """Build the ``AgentMetricsEntry`` shadow row for a ledger entry."""
+    from models import AgentMetricsEntry
+
+    return AgentMetricsEntry(
+        bot_id=bot_id,
+        tick_id=narrative_fields.get("tick_id", reference_id),
+        enforcement_mode=narrative_fields.get("enforcement_mode", "observe"),
+        tick_outcome=narrative_fields.get("tick_outcome", transaction_type),
+        phantom_entropy_fee=Decimal(
+            str(narrative_fields.get("phantom_entropy_fee", 0))
+        ),
+        would_have_been_liquidated=bool(
+            narrative_fields.get("would_have_been_liquidated", False)
+        ),
+        balance_snapshot=Decimal(
+            str(narrative_fields.get("balance_snapshot", 0))
+        ),
+        metrics_json=narrative_fields,
+    )
+
+
+async def append_ledger_entries(
+    *,
+    bot_id: int,
+    entries: list[dict[str, Any]],
+    session: AsyncSession,
+) -> list[Ledger]:
+    """
+    Append several entries to one bot's chain with a single tip read.
+
+    Each item in ``entries`` takes the keyword arguments of
+    ``append_ledger_entry``: ``amount``, ``transaction_type``,
+    ``reference_id`` and optionally ``narrative_fields``. Hashes are chained
+    in memory from the locked head and all rows go out as one multi-row
+    INSERT ... RETURNING. Returns the persisted entries in input order.
+
+    The caller MUST hold a transactional session — this function does NOT commit.
+    """
+    if not entries:
+        return []
+
+    # 1. Lock the tip of the chain (O(1) — no scan of the bot's history)
+    head = await _lock_chain_head(bot_id, session)
+    previous_hash = head.last_hash
+    sequence = head.last_sequence
+    balance = Decimal(str(head.balance))
+    idle_streak = head.idle_streak or 0
+
+    # 2. Chain every entry in memory
+    rows: list[dict[str, Any]] = []
+    for spec in entries:
+        sequence += 1
+        timestamp = datetime.now(timezone.utc)
+        amount = Decimal(str(spec["amount"])).quantize(_MONEY_QUANTUM)
+        balance += amount
+        entry_hash = compute_ledger_hash(
+            bot_id=bot_id,
+            amount=amount,
+            transaction_type=spec["transaction_type"],
+            reference_id=spec["reference_id"],
+            timestamp=timestamp,
+            previous_hash=previous_hash,
+            sequence=sequence,
+            balance_after=balance,
+        )
+        rows.append({
+            "bot_id": bot_id,
+            "amount": amount,
+            "transaction_type": spec["transaction_type"],
+            "reference_id": spec["reference_id"],
+            "previous_hash": previous_hash,
+            "hash": entry_hash,
+            "sequence": sequence,
+            "timestamp": timestamp,
+            "balance_after": balance,
+        })
+        previous_hash = entry_hash
+        idle_streak = idle_streak + 1 if spec["transaction_type"] == IDLE_TRANSACTION_TYPE else 0
+
+        if sequence % LEDGER_CHECKPOINT_INTERVAL == 0:
+            session.add(LedgerCheckpoint(
+                bot_id=bot_id, sequence=sequence, hash=entry_hash, balance=balance,
+            ))
+
+    # 3. One round trip for the whole batch
+    result = await session.scalars(
+        insert(Ledger).returning(Ledger, sort_by_parameter_order=True),
+        rows,
+    )
+    written = list(result.all())
+
+    # 4. Advance the head in the same transaction
+    head.last_hash = previous_hash
+    head.last_sequence = sequence
+    head.balance = balance
+    head.idle_streak = idle_streak
+
+    # --- Observability companion rows (v2.0) ---
+    # Written in the same transaction but NOT part of the hash chain.
+    for spec in entries:
+        if spec.get("narrative_fields") is not None:
+            session.add(_metrics_companion(
+                bot_id=bot_id,
+                transaction_type=spec["transaction_type"],
+                reference_id=spec["reference_id"],
+                narrative_fields=spec["narrative_fields"],
+            ))
+
+    return written
 
 
 async def append_ledger_entry(
@@ -45,88 +287,175 @@ async def append_ledger_entry(
     If ``narrative_fields`` is provided, a companion ``AgentMetricsEntry`` row
     is also added to the session (same transaction, NOT part of the hash chain).
     """
-    # 1. Get the tip of the chain (last entry for this bot)
-    result = await session.execute(
-        select(Ledger)
-        .where(Ledger.bot_id == bot_id)
-        .order_by(Ledger.sequence.desc())
-        .limit(1)
+    (entry,) = await append_ledger_entries(
+        bot_id=bot_id,
+        entries=[{
+            "amount": amount,
+            "transaction_type": transaction_type,
+            "reference_id": reference_id,
+            "narrative_fields": narrative_fields,
+        }],
+        session=session,
     )
-    last_entry: Optional[Ledger] = result.scalar_one_or_none()
+    return entry
 
-    # 2. Calculate next link in the chain
-    previous_hash = last_entry.hash if last_entry else "0" * 64
-    next_sequence = (last_entry.sequence + 1) if last_entry else 1
 
-    timestamp = datetime.now(timezone.utc)
+class LedgerBatch:
+    """Entries for one bot collected during a tick, written in one append.
 
-    # 3. Construct hash payload (deterministic ordering)
-    payload = (
-        f"{bot_id}|"
-        f"{amount}|"
-        f"{transaction_type}|"
-        f"{reference_id}|"
-        f"{timestamp.isoformat()}|"
-        f"{previous_hash}|"
-        f"{next_sequence}"
-    )
+    Services that would otherwise call ``append_ledger_entry`` accept an
+    optional batch and queue onto it instead, so a whole tick costs one tip
+    read and one INSERT. ``pending_total`` lets callers track the balance
+    before the batch is flushed.
+    """
 
-    # 4. Hash
-    entry_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    def __init__(self, bot_id: int) -> None:
+        self.bot_id = bot_id
+        self.entries: list[dict[str, Any]] = []
 
-    # 5. Create entry
-    entry = Ledger(
-        bot_id=bot_id,
-        amount=amount,
-        transaction_type=transaction_type,
-        reference_id=reference_id,
-        previous_hash=previous_hash,
-        hash=entry_hash,
-        sequence=next_sequence,
-        timestamp=timestamp,
-    )
+    def __len__(self) -> int:
+        return len(self.entries)
 
-    session.add(entry)
+    def add(
+        self,
+        *,
+        amount: "float | Decimal",
+        transaction_type: str,
+        reference_id: str,
+        narrative_fields: Optional[dict[str, Any]] = None,
+    ) -> None:
+        self.entries.append({
+            "amount": amount,
+            "transaction_type": transaction_type,
+            "reference_id": reference_id,
+            "narrative_fields": narrative_fields,
+        })
 
-    # --- Observability companion row (v2.0) ---
-    # Written in the same transaction but NOT part of the hash chain.
-    if narrative_fields is not None:
-        from models import AgentMetricsEntry
+    @property
+    def pending_total(self) -> Decimal:
+        return sum((Decimal(str(e["amount"])) for e in self.entries), Decimal("0"))
 
-        session.add(
-            AgentMetricsEntry(
-                bot_id=bot_id,
-                tick_id=narrative_fields.get("tick_id", reference_id),
-                enforcement_mode=narrative_fields.get("enforcement_mode", "observe"),
-                tick_outcome=narrative_fields.get("tick_outcome", transaction_type),
-                phantom_entropy_fee=Decimal(
-                    str(narrative_fields.get("phantom_entropy_fee", 0))
-                ),
-                would_have_been_liquidated=bool(
-                    narrative_fields.get("would_have_been_liquidated", False)
-                ),
-                balance_snapshot=Decimal(
-                    str(narrative_fields.get("balance_snapshot", 0))
-                ),
-                metrics_json=narrative_fields,
-            )
+    async def flush(self, session: AsyncSession) -> list[Ledger]:
+        """Write the queued entries (does NOT commit) and empty the batch."""
+        written = await append_ledger_entries(
+            bot_id=self.bot_id, entries=self.entries, session=session,
         )
-
-    return entry
+        self.entries = []
+        return written
 
 
-async def get_balance(*, bot_id: int, session: AsyncSession) -> Decimal:
-    """Compute authoritative balance by summing all ledger entries for a bot.
+async def get_balance(*, bot_id: int, session: AsyncSession, lock: bool = False) -> Decimal:
+    """Return the authoritative ledger balance for a bot.
 
     This is the ONLY source of balance truth. Bot.balance is a denormalized
     cache that MUST NOT be used for financial decisions.
 
-    Returns Decimal('0') if no ledger entries exist.
+    Reads the running balance on the bot's ``ledger_heads`` row (one
+    primary-key lookup). Bots without a head yet fall back to summing from
+    the latest checkpoint. Returns Decimal('0') if no ledger entries exist.
+
+    With ``lock`` the head row is locked (and created if missing) for the
+    rest of the transaction, so no other append can move the balance
+    before the caller's own appends — use it to re-validate right before
+    writing.
     """
-    result = await session.execute(
-        select(sa_func.sum(Ledger.amount)).where(Ledger.bot_id == bot_id)
-    )
-    raw = result.scalar_one_or_none()
+    if lock:
+        return Decimal(str((await _lock_chain_head(bot_id, session)).balance))
+    head_balance = (await session.execute(
+        select(LedgerHead.balance).where(LedgerHead.bot_id == bot_id)
+    )).scalar_one_or_none()
+    if head_balance is not None:
+        return Decimal(str(head_balance))
+    return await _sum_from_checkpoint(bot_id, session)
+
+
+async def _sum_from_checkpoint(bot_id: int, session: AsyncSession) -> Decimal:
+    """Latest checkpoint balance + SUM(amount) of the entries after it."""
+    checkpoint = (await session.execute(
+        select(LedgerCheckpoint)
+        .where(LedgerCheckpoint.bot_id == bot_id)
+        .order_by(LedgerCheckpoint.sequence.desc())
+        .limit(1)
+    )).scalar_one_or_none()
+    base = Decimal(str(checkpoint.balance)) if checkpoint else Decimal('0')
+    after = checkpoint.sequence if checkpoint else 0
+
+    raw = (await session.execute(
+        select(sa_func.sum(Ledger.amount))
+        .where(Ledger.bot_id == bot_id, Ledger.sequence > after)
+    )).scalar_one_or_none()
     if raw is None:
-        return Decimal('0')
-    return Decimal(str(raw))
+        return base
+    return base + Decimal(str(raw))
+
+
+async def verify_balance(*, bot_id: int, session: AsyncSession) -> tuple[bool, Decimal, Decimal]:
+    """Check the O(1) head balance against the ledger sum.
+
+    Sums only the entries after the latest checkpoint. Returns
+    ``(ok, head_balance, summed_balance)``.
+    """
+    head_balance = await get_balance(bot_id=bot_id, session=session)
+    summed = await _sum_from_checkpoint(bot_id, session)
+    return head_balance == summed, head_balance, summed
+
+
+async def get_idle_streak(*, bot_id: int, session: AsyncSession) -> int:
+    """Consecutive HEARTBEAT entries at the tip of the bot's chain.
+
+    One primary-key read of ``ledger_heads``; bots without a head yet are
+    counted from the ledger.
+    """
+    streak = (await session.execute(
+        select(LedgerHead.idle_streak).where(LedgerHead.bot_id == bot_id)
+    )).scalar_one_or_none()
+    if streak is not None:
+        return streak
+    return await count_idle_streak(bot_id, session)
+
+
+async def count_idle_streak(bot_id: int, session: AsyncSession) -> int:
+    """Recount the idle streak from the ledger itself.
+
+    Counts live HEARTBEAT rows after the last non-HEARTBEAT row. If every
+    live row is a HEARTBEAT, the run continues into archived segments,
+    newest first (each read off the event loop), so the count is exact at
+    any length.
+    """
+    last_active = (await session.execute(
+        select(sa_func.max(Ledger.sequence))
+        .where(Ledger.bot_id == bot_id, Ledger.transaction_type != IDLE_TRANSACTION_TYPE)
+    )).scalar_one_or_none()
+    streak = (await session.execute(
+        select(sa_func.count(Ledger.id)).where(
+            Ledger.bot_id == bot_id,
+            Ledger.transaction_type == IDLE_TRANSACTION_TYPE,
+            Ledger.sequence > (last_active or 0),
+        )
+    )).scalar_one()
+    if last_active is not None:
+        return streak
+
+    segments = (await session.execute(
+        select(LedgerSegment)
+        .where(LedgerSegment.bot_id == bot_id)
+        .order_by(LedgerSegment.first_sequence.desc())
+    )).scalars().all()
+    for segment in segments:
+        for entry in reversed(await asyncio.to_thread(read_segment, segment)):
+            if entry.transaction_type != IDLE_TRANSACTION_TYPE:
+                return streak
+            streak += 1
+    return streak
+
+
+async def rebuild_idle_streak(*, bot_id: int, session: AsyncSession) -> tuple[int, int]:
+    """Recount a bot's idle streak and store it on its head.
+
+    Locks the head like an append does. Returns ``(stored, recounted)``.
+    Does NOT commit.
+    """
+    head = await _lock_chain_head(bot_id, session)
+    stored = head.idle_streak
+    head.idle_streak = await count_idle_streak(bot_id, session)
+    return stored, head.idle_streak
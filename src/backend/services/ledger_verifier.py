@@ -0,0 +1,343 @@
+"""
+ledger_verifier.py — Incremental, checkpointed hash-chain verification.
+
+Each bot's ``ledger_verifications`` row records the last (sequence, hash,
+balance) that was re-hashed and accepted. A routine run starts from there
+and only walks entries appended since, so the cost tracks new activity
+rather than total history. ``full=True`` ignores the checkpoint and walks
+from genesis.
+
+Per entry:
+  - sequence is exactly previous + 1
+  - previous_hash equals the prior entry's hash
+  - balance_after equals the running sum (when recorded)
+  - hash re-computes from the row (rows with balance_after only; legacy
+    rows hashed the caller's raw amount string, which Numeric storage does
+    not preserve, so those are link-checked only)
+
+Before resuming, the stored hash at the checkpoint sequence is compared
+with the checkpoint, so a rewrite of already-verified history is caught.
+
+verify_chains_parallel() streams chains through server-side cursors and
+spreads the SHA256 work over a process pool; verify_chain_rows() is the
+pure, picklable unit of work both paths share.
+
+Full verification also walks archived segments (ledger_archive), seeding
+each from the index row before it so every seam is link-checked.
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
+  - lessons.md: All economic state changes must be hash-chained
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Ledger, LedgerHead, LedgerSegment, LedgerVerification
+from services.ledger_archive import SegmentReader, find_archived_entry, list_segments, segment_path
+from services.ledger_service import GENESIS_HASH, compute_ledger_hash
+
+VERIFY_CHUNK_SIZE = int(os.environ.get("LEDGER_VERIFY_CHUNK_SIZE", "10000"))
+
+# Column order of the row tuples fed to verify_chain_rows().
+CHAIN_COLUMNS = (
+    Ledger.sequence,
+    Ledger.amount,
+    Ledger.transaction_type,
+    Ledger.reference_id,
+    Ledger.timestamp,
+    Ledger.previous_hash,
+    Ledger.hash,
+    Ledger.balance_after,
+)
+
+
+def verify_chain_rows(
+    bot_id: int,
+    rows: Sequence[tuple],
+    *,
+    sequence: int = 0,
+    last_hash: str = GENESIS_HASH,
+    balance: Decimal = Decimal("0"),
+) -> dict[str, Any]:
+    """Walk ``rows`` (CHAIN_COLUMNS tuples, ascending sequence) from a known tip.
+
+    Pure function over plain values — no session, safe to run in another
+    process. Returns ``{"ok", "sequence", "hash", "balance", "rows", "errors"}``
+    where sequence/hash/balance are the new tip.
+    """
+    errors: list[str] = []
+    balance = Decimal(str(balance))
+
+    for seq, amount, tx_type, ref, timestamp, previous_hash, entry_hash, balance_after in rows:
+        balance += Decimal(str(amount))
+
+        if seq != sequence + 1:
+            errors.append(f"seq {seq}: expected sequence {sequence + 1}")
+        if previous_hash != last_hash:
+            errors.append(f"seq {seq}: previous_hash does not match prior entry")
+        if balance_after is not None:
+            if Decimal(str(balance_after)) != balance:
+                errors.append(f"seq {seq}: balance_after {balance_after} != running sum {balance}")
+            expected = compute_ledger_hash(
+                bot_id=bot_id,
+                amount=amount,
+                transaction_type=tx_type,
+                reference_id=ref,
+                timestamp=timestamp,
+                previous_hash=previous_hash,
+                sequence=seq,
+                balance_after=balance_after,
+            )
+            if expected != entry_hash:
+                errors.append(f"seq {seq}: stored hash does not match entry contents")
+
+        sequence = seq
+        last_hash = entry_hash
+
+    return {
+        "ok": not errors,
+        "sequence": sequence,
+        "hash": last_hash,
+        "balance": balance,
+        "rows": len(rows),
+        "errors": errors,
+    }
+
+
+async def verify_bot_chain(
+    *,
+    bot_id: int,
+    session: AsyncSession,
+    full: bool = False,
+) -> dict[str, Any]:
+    """Verify one bot's chain from its checkpoint (or genesis when ``full``).
+
+    On success the checkpoint advances to the verified tip. Does NOT commit
+    — the caller manages the transaction.
+    """
+    state, report = await _begin(bot_id, session, full)
+    if not report["ok"]:
+        return report
+
+    if full:
+        for args in _segment_tasks(bot_id, await list_segments(bot_id, session)):
+            _merge(report, await asyncio.to_thread(verify_segment_file, *args))
+
+    rows = (await session.execute(_chain_query(bot_id, report["sequence"]))).all()
+    _merge(report, verify_chain_rows(
+        bot_id, rows,
+        sequence=report["sequence"], last_hash=report["hash"], balance=report["balance"],
+    ))
+    await _finish(bot_id, report, state, session)
+    return report
+
+
+def verify_segment_file(
+    path: str,
+    file_sha256: str,
+    bot_id: int,
+    sequence: int,
+    last_hash: str,
+    balance: Decimal,
+    end_hash: str,
+    end_balance: Decimal,
+) -> dict[str, Any]:
+    """verify_chain_rows() over an archived segment (see ledger_archive).
+
+    Seeded with the tip before the segment; also checks the file digest and
+    that the segment ends on its recorded boundary hash and balance.
+    Picklable, so it can run in a worker process.
+    """
+    with SegmentReader(Path(path)) as reader:
+        if reader.sha256() != file_sha256:
+            return {"ok": False, "sequence": sequence, "hash": last_hash, "balance": balance,
+                    "rows": 0, "errors": [f"segment {path}: file does not match its recorded SHA256"]}
+        rows = [tuple(e)[1:] for e in reader.entries()]
+    part = verify_chain_rows(bot_id, rows, sequence=sequence, last_hash=last_hash, balance=balance)
+    if part["hash"] != end_hash or part["balance"] != Decimal(str(end_balance)):
+        part["errors"].append(f"segment {path}: does not end on its recorded boundary hash/balance")
+        part["ok"] = False
+    return part
+
+
+def _segment_tasks(bot_id: int, segments: Sequence[LedgerSegment]) -> list[tuple]:
+    """verify_segment_file() arguments per segment, each seeded from the index
+    row before it, so every seam (segment → segment → live) is link-checked."""
+    tasks = []
+    seq, last_hash, balance = 0, GENESIS_HASH, Decimal("0")
+    for seg in segments:
+        tasks.append((
+            str(segment_path(seg)), seg.file_sha256, bot_id,
+            seq, last_hash, balance, seg.last_hash, Decimal(str(seg.end_balance)),
+        ))
+        seq, last_hash, balance = seg.last_sequence, seg.last_hash, Decimal(str(seg.end_balance))
+    return tasks
+
+
+def _merge(report: dict[str, Any], part: dict[str, Any]) -> None:
+    """Fold one verified stretch of the chain into a bot's report."""
+    report["errors"].extend(part["errors"])
+    report["rows"] += part["rows"]
+    report.update(
+        ok=not report["errors"],
+        sequence=part["sequence"], hash=part["hash"], balance=part["balance"],
+    )
+
+
+async def verify_chains_parallel(
+    *,
+    bot_ids: Sequence[int],
+    session: AsyncSession,
+    executor: Executor,
+    full: bool = False,
+    chunk_size: int = VERIFY_CHUNK_SIZE,
+    max_pending: Optional[int] = None,
+) -> list[dict[str, Any]]:
+    """Verify many chains, re-hashing in ``executor`` (normally a ProcessPoolExecutor).
+
+    Each chain is read through a server-side cursor ``chunk_size`` rows at a
+    time. Every chunk is submitted to the executor as soon as it is read,
+    seeded with the last stored (sequence, hash) of the chunk before it and
+    the running balance, so links across chunk boundaries are still checked
+    and the event loop only does I/O while workers hash. At most
+    ``max_pending`` chunks (default 2 x CPUs) are in flight, which bounds
+    memory on multi-million-row chains. Checkpoints are applied exactly as
+    in verify_bot_chain(). Does NOT commit.
+    """
+    loop = asyncio.get_running_loop()
+    max_pending = max_pending or 2 * (os.cpu_count() or 1)
+    in_flight: set[asyncio.Future] = set()
+    pending: list[tuple[Optional[LedgerVerification], dict[str, Any], list[asyncio.Future]]] = []
+
+    for bot_id in bot_ids:
+        state, report = await _begin(bot_id, session, full)
+        futures: list[asyncio.Future] = []
+        if report["ok"]:
+            seq, last_hash, balance = report["sequence"], report["hash"], report["balance"]
+            if full:
+                segments = await list_segments(bot_id, session)
+                for args in _segment_tasks(bot_id, segments):
+                    futures.append(loop.run_in_executor(executor, verify_segment_file, *args))
+                if segments:
+                    last = segments[-1]
+                    seq, last_hash = last.last_sequence, last.last_hash
+                    balance = Decimal(str(last.end_balance))
+            stream = await session.stream(
+                _chain_query(bot_id, seq).execution_options(yield_per=chunk_size)
+            )
+            async for partition in stream.partitions():
+                chunk = [tuple(row) for row in partition]
+                if len(in_flight) >= max_pending:
+                    _, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                futures.append(loop.run_in_executor(
+                    executor,
+                    functools.partial(
+                        verify_chain_rows, bot_id, chunk,
+                        sequence=seq, last_hash=last_hash, balance=balance,
+                    ),
+                ))
+                in_flight.add(futures[-1])
+                seq, last_hash = chunk[-1][0], chunk[-1][6]
+                balance += sum((Decimal(str(row[1])) for row in chunk), Decimal("0"))
+        pending.append((state, report, futures))
+
+    reports = []
+    for state, report, futures in pending:
+        if report["ok"]:
+            for part in await asyncio.gather(*futures):
+                _merge(report, part)
+            await _finish(report["bot_id"], report, state, session)
+        reports.append(report)
+    return reports
+
+
+def _chain_query(bot_id: int, after_sequence: int):
+    return (
+        select(*CHAIN_COLUMNS)
+        .where(Ledger.bot_id == bot_id, Ledger.sequence > after_sequence)
+        .order_by(Ledger.sequence.asc())
+    )
+
+
+async def _begin(
+    bot_id: int,
+    session: AsyncSession,
+    full: bool,
+) -> tuple[Optional[LedgerVerification], dict[str, Any]]:
+    """Load the starting tip and check the checkpoint anchor.
+
+    Returns the checkpoint row (if any) and a report seeded with the start
+    tip; ``report["ok"]`` is False when the anchor no longer matches.
+    """
+    state: Optional[LedgerVerification] = await session.get(LedgerVerification, bot_id)
+    if state is not None and not full:
+        start_seq = state.verified_sequence
+        start_hash = state.verified_hash
+        start_balance = Decimal(str(state.verified_balance))
+    else:
+        start_seq, start_hash, start_balance = 0, GENESIS_HASH, Decimal("0")
+
+    report: dict[str, Any] = {
+        "bot_id": bot_id, "from_sequence": start_seq, "full": full, "ok": True,
+        "sequence": start_seq, "hash": start_hash, "balance": start_balance,
+        "rows": 0, "errors": [],
+    }
+
+    if start_seq > 0:
+        anchor = (await session.execute(
+            select(Ledger.hash).where(Ledger.bot_id == bot_id, Ledger.sequence == start_seq)
+        )).scalar_one_or_none()
+        if anchor is None:
+            # The checkpoint may sit in archived history.
+            anchor = (await session.execute(
+                select(LedgerSegment.last_hash)
+                .where(LedgerSegment.bot_id == bot_id, LedgerSegment.last_sequence == start_seq)
+            )).scalar_one_or_none()
+        if anchor is None:
+            found = await find_archived_entry(session, bot_id=bot_id, sequence=start_seq)
+            anchor = found[1].hash if found else None
+        if anchor != start_hash:
+            report["ok"] = False
+            report["errors"].append(f"seq {start_seq}: verified checkpoint no longer matches the ledger")
+    return state, report
+
+
+async def _finish(
+    bot_id: int,
+    report: dict[str, Any],
+    state: Optional[LedgerVerification],
+    session: AsyncSession,
+) -> None:
+    """Cross-check ledger_heads and advance the checkpoint if all is well."""
+    head = await session.get(LedgerHead, bot_id)
+    if head is not None and head.last_sequence == report["sequence"]:
+        if head.last_hash != report["hash"] or Decimal(str(head.balance)) != report["balance"]:
+            report["errors"].append("ledger_heads does not match the verified tip")
+            report["ok"] = False
+
+    if report["ok"]:
+        _save_checkpoint(bot_id, report, state, session)
+
+
+def _save_checkpoint(
+    bot_id: int,
+    report: dict[str, Any],
+    state: Optional[LedgerVerification],
+    session: AsyncSession,
+) -> None:
+    """Advance (or create) the bot's verification checkpoint."""
+    if state is None:
+        state = LedgerVerification(bot_id=bot_id)
+        session.add(state)
+    state.verified_sequence = report["sequence"]
+    state.verified_hash = report["hash"]
+    state.verified_balance = report["balance"]
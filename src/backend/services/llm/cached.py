@@ -0,0 +1,261 @@
+"""Prompt-keyed LLM response cache wrapper.
+
+Many LLM calls are deterministic functions of their inputs (the same
+research question at temperature 0.3, the same strategy prompt for the
+same balance/idle/market counts). ``CachedProvider`` answers repeats from
+two tiers, keyed by a SHA-256 of (namespace, messages, model, max_tokens,
+temperature, response_format):
+
+  1. an in-process LRU (LLM_CACHE_SIZE entries)
+  2. Redis, shared by every worker:
+
+       llm:cache:{sha256}   STR  JSON [content, prompt_tokens, completion_tokens]
+
+Concurrent identical requests share one upstream call (single-flight).
+Failed or empty completions are never cached.
+
+TTLs are chosen per call site with ``llm_cache(site, ttl)`` around the
+call; ``ttl=0`` opts the site out. Calls outside any ``llm_cache`` block
+use LLM_CACHE_TTL. Hits report zero token usage (nothing was spent) and
+are counted on the active MetricsCollector via TrackedProvider.
+
+The factory applies the wrapper when LLM_CACHE_TTL > 0. Redis is
+best-effort: if it is unavailable the LRU still works.
+
+Constitutional references:
+  - CLAUDE.md Invariant #6: "Continuous real-time, not turn-based" —
+    a repeat prompt costs a dict lookup, not a network round trip.
+  - lessons.md Rule #3: "Test Fixtures Must Guarantee Isolation" —
+    disabled unless LLM_CACHE_TTL is set.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Iterator
+
+from services.llm.interface import LLMProvider
+from thread_memory import get_redis_client
+
+logger = logging.getLogger("llm.cached")
+
+LLM_CACHE_TTL = float(os.environ.get("LLM_CACHE_TTL", "0") or 0)
+LLM_CACHE_SIZE = int(os.environ.get("LLM_CACHE_SIZE", "1024"))
+
+_Completion = tuple[str | None, int, int]
+
+# (site, ttl) for calls made inside an ``llm_cache`` block
+_cache_policy: contextvars.ContextVar[tuple[str, float | None] | None] = contextvars.ContextVar(
+    "llm_cache_policy", default=None,
+)
+# Outcome of the last lookup in this context, read by TrackedProvider
+_cache_outcome: contextvars.ContextVar[str | None] = contextvars.ContextVar("llm_cache_outcome", default=None)
+
+
+@contextlib.contextmanager
+def llm_cache(site: str, ttl: float | None = None) -> Iterator[None]:
+    """Cache LLM calls made in this block for ``ttl`` seconds under ``site``.
+
+    ``ttl=None`` uses LLM_CACHE_TTL; ``ttl=0`` bypasses the cache.
+    """
+    token = _cache_policy.set((site, ttl))
+    try:
+        yield
+    finally:
+        _cache_policy.reset(token)
+
+
+def pop_cache_outcome() -> str | None:
+    """The last lookup's outcome ("hit_local", "miss", ...) in this context, then clear it."""
+    outcome = _cache_outcome.get()
+    if outcome is not None:
+        _cache_outcome.set(None)
+    return outcome
+
+
+def cache_key(namespace: str, messages: list[dict[str, str]], **params: Any) -> str:
+    blob = json.dumps(
+        {"ns": namespace, "messages": messages, **params}, sort_keys=True, separators=(",", ":"),
+    )
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _redis_key(key: str) -> str:
+    return f"llm:cache:{key}"
+
+
+class CachedProvider(LLMProvider):
+    """``LLMProvider`` that serves repeated prompts from an LRU + Redis cache."""
+
+    def __init__(
+        self,
+        base: LLMProvider,
+        *,
+        namespace: str = "",
+        default_ttl: float = LLM_CACHE_TTL,
+        size: int = LLM_CACHE_SIZE,
+        redis=None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._base = base
+        self.namespace = namespace   # provider + model, so switching backends never hits stale entries
+        self.default_ttl = default_ttl
+        self.size = size
+        self.redis = redis   # None: use the shared client (thread_memory)
+        self.clock = clock
+        self._local: OrderedDict[str, tuple[float, _Completion]] = OrderedDict()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.counts: Counter = Counter()
+        self.site_counts: dict[str, Counter] = {}
+
+    async def complete(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> _Completion:
+        params = {
+            "model": model, "max_tokens": max_tokens,
+            "temperature": temperature, "response_format": response_format,
+        }
+        site, ttl = _cache_policy.get() or ("-", None)
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            self._count(site, "bypass")
+            return await self._base.complete(messages, **params)
+
+        key = cache_key(self.namespace, messages, **params)
+        entry = self._local_get(key)
+        if entry is not None:
+            self._count(site, "hit_local")
+            return entry[0], 0, 0
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._inflight = loop, {}
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = loop.create_task(self._fill(key, ttl, messages, params))
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # shield: a caller giving up must not cancel the call the others await
+            outcome, result = await asyncio.shield(flight)
+            self._count(site, outcome)
+            return result if outcome == "miss" else (result[0], 0, 0)
+        outcome, result = await asyncio.shield(flight)
+        self._count(site, "hit_inflight")
+        return result[0], 0, 0
+
+    async def _fill(
+        self, key: str, ttl: float, messages: list[dict[str, str]], params: dict[str, Any],
+    ) -> tuple[str, _Completion]:
+        redis = self.redis or await get_redis_client()
+        if redis is not None:
+            try:
+                raw = await redis.get(_redis_key(key))
+            except Exception as exc:
+                logger.debug("LLM cache read failed: %s", exc)
+                raw = None
+            if raw is not None:
+                result = tuple(json.loads(raw))
+                self._local_put(key, ttl, result)
+                return "hit_redis", result
+
+        result = await self._base.complete(messages, **params)
+        if result[0]:
+            self._local_put(key, ttl, result)
+            if redis is not None:
+                try:
+                    await redis.set(_redis_key(key), json.dumps(list(result)), ex=max(1, int(ttl)))
+                except Exception as exc:
+                    logger.debug("LLM cache write failed: %s", exc)
+        return "miss", result
+
+    def _local_get(self, key: str) -> _Completion | None:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= self.clock():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return result
+
+    def _local_put(self, key: str, ttl: float, result: _Completion) -> None:
+        self._local[key] = (self.clock() + ttl, result)
+        self._local.move_to_end(key)
+        while len(self._local) > self.size:
+            self._local.popitem(last=False)
+
+    def _count(self, site: str, outcome: str) -> None:
+        self.counts[outcome] += 1
+        self.site_counts.setdefault(site, Counter())[outcome] += 1
+        _cache_outcome.set(outcome)
+
+    @staticmethod
+    def _hit_rate(counts: Counter) -> float:
+        hits = counts["hit_local"] + counts["hit_redis"] + counts["hit_inflight"]
+        total = hits + counts["miss"]
+        return round(hits / total, 3) if total else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Lookup counters since start, overall and per call site."""
+        return {
+            **{k: self.counts[k] for k in ("hit_local", "hit_redis", "hit_inflight", "miss", "bypass")},
+            "hit_rate": self._hit_rate(self.counts),
+            "entries": len(self._local),
+            "sites": {site: self._hit_rate(c) for site, c in self.site_counts.items()},
+        }
+
+    # --- LLMProvider -----------------------------------------------------
+
+    async def generate_tracked(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> _Completion:
+        """Cached completion; returns (None, 0, 0) on failure — never raises."""
+        try:
+            return await self.complete(
+                messages,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                response_format=response_format,
+            )
+        except Exception as exc:
+            logger.error("LLM generation failed: %s", exc)
+            return None, 0, 0
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> str | None:
+        content, _, _ = await self.generate_tracked(
+            messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            response_format=response_format,
+        )
+        return content
@@ -10,6 +10,25 @@ v2.0 — ClawX token tracking:
   This preserves all existing ``type(provider).__name__`` test assertions
   because those tests run outside any ``@observe`` context.
 
+Rate limiting:
+  When any of LLM_RPM, LLM_TPM or LLM_MAX_CONCURRENCY is set, real
+  providers are wrapped once in ``RateLimitedProvider`` (token buckets,
+  AIMD concurrency, fair queue across bots). Mock is never wrapped.
+
+Hedging:
+  LLM_PROVIDERS="grok,openai,local" (two or more names) replaces
+  LLM_PROVIDER with a ``HedgedProvider`` over those backends: requests
+  hedge to the next backend after the current one's p95 and fail over
+  on errors. Per-backend keys/models/URLs come only from LLM_API_KEY_GROK,
+  LLM_MODEL_OPENAI, LLM_BASE_URL_LOCAL, ... and the provider defaults —
+  never the unsuffixed variables, which would send one vendor's key to
+  another. A non-local backend without its own key fails at startup.
+
+Response cache:
+  When LLM_CACHE_TTL > 0, the (possibly rate-limited) provider is wrapped
+  in ``CachedProvider`` so cache hits never queue for budget. Call sites
+  choose their TTL or opt out with ``llm_cache(site, ttl)``.
+
 Constitutional references:
   - CLAUDE.md P0 debt: "Broken test suite" — mock default means tests
     never fail due to missing LLM credentials.
@@ -53,19 +72,23 @@ def get_llm_provider() -> LLMProvider:
     global _cached_provider, _cached_provider_name
 
     provider_name = os.environ.get("LLM_PROVIDER", "mock").lower()
+    backends = [n.strip().lower() for n in os.environ.get("LLM_PROVIDERS", "").split(",") if n.strip()]
+    if len(backends) > 1:
+        provider_name = ",".join(backends)
 
     # Build or reuse the cached base provider.
     if _cached_provider is None or _cached_provider_name != provider_name:
-        if provider_name == "mock":
-            from services.llm.mock import MockLLMProvider
-            _cached_provider = MockLLMProvider()
-        elif provider_name in ("openai", "grok", "kimi", "local", "ollama"):
-            from services.llm.openai_compatible import OpenAICompatibleProvider
-            _cached_provider = OpenAICompatibleProvider(provider_name)
+        if len(backends) > 1:
+            from services.llm.hedged import HedgedProvider
+            _cached_provider = HedgedProvider([(name, _build_backend(name, own_env=True)) for name in backends])
         else:
-            raise ValueError(
-                f"Unknown LLM_PROVIDER='{provider_name}'. "
-                f"Valid options: mock, openai, grok, kimi, local, ollama"
+            _cached_provider = _build_backend(provider_name)
+        if float(os.environ.get("LLM_CACHE_TTL", "0") or 0) > 0:
+            from services.llm.cached import CachedProvider
+            _cached_provider = CachedProvider(
+                _cached_provider,
+                namespace=f"{provider_name}:{os.environ.get('LLM_MODEL', '')}",
+                default_ttl=float(os.environ["LLM_CACHE_TTL"]),
             )
         _cached_provider_name = provider_name
         logger.info("LLM provider selected: %s", provider_name)
@@ -85,6 +108,44 @@ def get_llm_provider() -> LLMProvider:
     return _cached_provider
 
 
+def _build_backend(provider_name: str, *, own_env: bool = False) -> LLMProvider:
+    """One provider by name, rate-limited when a budget is configured.
+
+    ``own_env``: configure from the provider-suffixed variables only (hedging).
+    """
+    if provider_name == "mock":
+        from services.llm.mock import MockLLMProvider
+        return MockLLMProvider()
+    if provider_name not in ("openai", "grok", "kimi", "local", "ollama"):
+        raise ValueError(
+            f"Unknown LLM_PROVIDER='{provider_name}'. "
+            f"Valid options: mock, openai, grok, kimi, local, ollama"
+        )
+    from services.llm.openai_compatible import OpenAICompatibleProvider
+    provider: LLMProvider = OpenAICompatibleProvider(provider_name, own_env=own_env)
+    if any(os.environ.get(k) for k in ("LLM_RPM", "LLM_TPM", "LLM_MAX_CONCURRENCY")):
+        # Shared by every caller in the process, so budgets are process-wide
+        # (per backend when hedging — each upstream has its own limits)
+        from services.llm.rate_limited import RateLimitedProvider
+        provider = RateLimitedProvider(provider)
+    return provider
+
+
+def llm_provider_stats() -> dict:
+    """``stats()`` of each wrapper around the cached base provider, by class name.
+
+    Behind a HedgedProvider only the hedging stats are reported; each
+    backend's limiter is summarised there by latency and error rate.
+    """
+    stats = {}
+    provider = _cached_provider
+    while provider is not None:
+        if hasattr(provider, "stats"):
+            stats[type(provider).__name__] = provider.stats()
+        provider = getattr(provider, "_base", None)
+    return stats
+
+
 def reset_llm_provider() -> None:
     """Clear the cached provider. Used in tests to switch providers mid-run."""
     global _cached_provider, _cached_provider_name
@@ -0,0 +1,267 @@
+"""Hedged, multi-backend LLM provider.
+
+One slow or degraded backend should not set the tick latency for the whole
+fleet. ``HedgedProvider`` holds an ordered list of backends (LLM_PROVIDERS,
+e.g. ``grok,openai,local``) and for each request:
+
+  1. sends it to the best-ranked backend;
+  2. if no answer has arrived by that backend's observed p95 latency, sends
+     a hedge to the next backend (at most LLM_HEDGE_MAX_PARALLEL requests
+     in flight at once);
+  3. if an attempt fails or returns an unusable answer, fails over to the
+     next backend at once;
+  4. returns the first valid answer and cancels the attempts still running.
+
+Backends are ranked by p95 latency scaled up by their recent error rate,
+so a backend that slows down or starts failing drops down the list and
+one that recovers climbs back. Until a backend has LLM_HEDGE_MIN_SAMPLES
+latencies it keeps its configured place and is hedged after LLM_HEDGE_DELAY_S.
+
+A cancelled attempt's elapsed time is recorded as a latency sample (a
+lower bound), so a backend that always loses still shows its slowness.
+Tokens spent by a cancelled attempt are not reported to TrackedProvider.
+
+Constitutional references:
+  - CLAUDE.md Invariant #6: "Continuous real-time, not turn-based" —
+    tail latency is cut by racing backends, not by waiting longer.
+  - lessons.md Rule #2: "Fail Fast on Missing Configuration" — every
+    listed backend is constructed (and validated) up front.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Callable
+
+from services.llm.interface import LLMProvider
+
+logger = logging.getLogger("llm.hedged")
+
+LLM_HEDGE_DELAY_S = float(os.environ.get("LLM_HEDGE_DELAY_S", "2.0"))
+LLM_HEDGE_MIN_SAMPLES = int(os.environ.get("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_MAX_PARALLEL = int(os.environ.get("LLM_HEDGE_MAX_PARALLEL", "2"))
+
+_LATENCY_WINDOW = 200      # latency samples kept per backend
+_ERROR_DECAY = 0.1         # EWMA weight of the newest outcome in error_rate
+_ERROR_PENALTY = 4.0       # score = p95 * (1 + penalty * error_rate)
+_MIN_HEDGE_DELAY_S = 0.05
+
+
+class InvalidResponse(Exception):
+    """The backend answered, but with nothing usable (empty, or not JSON when JSON was asked for)."""
+
+
+class BackendStats:
+    """Latency window and error rate for one backend."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self.error_rate = 0.0
+        self.counts = {"requests": 0, "wins": 0, "errors": 0, "cancelled": 0}
+
+    def percentile(self, q: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def record(self, latency: float, ok: bool | None) -> None:
+        """Add a latency sample; ``ok=None`` (cancelled) leaves the error rate alone."""
+        self.latencies.append(latency)
+        if ok is None:
+            return
+        self.error_rate += _ERROR_DECAY * ((0.0 if ok else 1.0) - self.error_rate)
+        if not ok:
+            self.counts["errors"] += 1
+
+    def warmed_up(self, min_samples: int) -> bool:
+        return len(self.latencies) >= min_samples
+
+    def score(self) -> float:
+        return (self.percentile(0.95) or 0.0) * (1 + _ERROR_PENALTY * self.error_rate)
+
+    def summary(self) -> dict[str, Any]:
+        p50, p95 = self.percentile(0.5), self.percentile(0.95)
+        return {
+            **self.counts,
+            "p50_s": round(p50, 3) if p50 is not None else None,
+            "p95_s": round(p95, 3) if p95 is not None else None,
+            "error_rate": round(self.error_rate, 3),
+        }
+
+
+def _check(content: str | None, response_format: dict | None) -> None:
+    if not content:
+        raise InvalidResponse("empty response")
+    if response_format and response_format.get("type") == "json_object":
+        try:
+            json.loads(content)
+        except ValueError as exc:
+            raise InvalidResponse(f"not JSON: {exc}") from exc
+
+
+class HedgedProvider(LLMProvider):
+    """``LLMProvider`` that races an ordered list of backends, hedging at p95."""
+
+    def __init__(
+        self,
+        backends: list[tuple[str, LLMProvider]],
+        *,
+        hedge_delay_s: float = LLM_HEDGE_DELAY_S,
+        min_samples: int = LLM_HEDGE_MIN_SAMPLES,
+        max_parallel: int = LLM_HEDGE_MAX_PARALLEL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not backends:
+            raise ValueError("HedgedProvider needs at least one backend")
+        self.backends = dict(backends)
+        self.configured = [name for name, _ in backends]
+        self.hedge_delay_s = hedge_delay_s
+        self.min_samples = min_samples
+        self.max_parallel = max(1, max_parallel)
+        self.clock = clock
+        self.backend_stats = {name: BackendStats(name) for name in self.configured}
+        self.counts = {"requests": 0, "hedged": 0, "failovers": 0, "failed": 0}
+
+    # --- ranking ---------------------------------------------------------
+
+    def ranking(self) -> list[str]:
+        """Backends best-first: warmed-up ones sorted by score within their slots,
+        any still warming up kept in their configured place."""
+        warm = [n for n in self.configured if self.backend_stats[n].warmed_up(self.min_samples)]
+        ranked = iter(sorted(warm, key=lambda n: self.backend_stats[n].score()))
+        return [next(ranked) if n in warm else n for n in self.configured]
+
+    def hedge_delay(self, name: str) -> float:
+        """How long to wait on ``name`` before hedging: its p95 once warmed up."""
+        stats = self.backend_stats[name]
+        if not stats.warmed_up(self.min_samples):
+            return self.hedge_delay_s
+        return max(_MIN_HEDGE_DELAY_S, stats.percentile(0.95))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.counts,
+            "order": self.ranking(),
+            "backends": {name: s.summary() for name, s in self.backend_stats.items()},
+        }
+
+    # --- racing ----------------------------------------------------------
+
+    async def _attempt(self, name: str, messages: list[dict[str, str]], params: dict) -> tuple[str | None, int, int]:
+        stats = self.backend_stats[name]
+        stats.counts["requests"] += 1
+        started = self.clock()
+        try:
+            result = await self.backends[name].complete(messages, **params)
+            _check(result[0], params.get("response_format"))
+        except asyncio.CancelledError:
+            stats.counts["cancelled"] += 1
+            stats.record(self.clock() - started, ok=None)
+            raise
+        except Exception:
+            stats.record(self.clock() - started, ok=False)
+            raise
+        stats.record(self.clock() - started, ok=True)
+        return result
+
+    async def complete(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> tuple[str | None, int, int]:
+        params = {
+            "model": model, "max_tokens": max_tokens,
+            "temperature": temperature, "response_format": response_format,
+        }
+        self.counts["requests"] += 1
+        waiting = deque(self.ranking())
+        running: dict[asyncio.Task, str] = {}
+        last_exc: Exception | None = None
+
+        def launch() -> str:
+            name = waiting.popleft()
+            running[asyncio.create_task(self._attempt(name, messages, params))] = name
+            return name
+
+        newest = launch()
+        try:
+            while running:
+                can_hedge = waiting and len(running) < self.max_parallel
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=self.hedge_delay(newest) if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    self.counts["hedged"] += 1
+                    logger.debug("LLM hedge: %s slower than %.2fs", newest, self.hedge_delay(newest))
+                    newest = launch()
+                    continue
+                for task in done:
+                    name = running.pop(task)
+                    if task.exception() is None:
+                        self.backend_stats[name].counts["wins"] += 1
+                        return task.result()
+                    last_exc = task.exception()
+                    logger.info("LLM backend %s failed: %s", name, last_exc)
+                if waiting and len(running) < self.max_parallel:
+                    self.counts["failovers"] += 1
+                    newest = launch()
+        finally:
+            for task in running:
+                task.cancel()
+        if isinstance(last_exc, InvalidResponse):
+            return None, 0, 0
+        raise last_exc
+
+    # --- LLMProvider -----------------------------------------------------
+
+    async def generate_tracked(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> tuple[str | None, int, int]:
+        """First valid answer across backends; returns (None, 0, 0) if all fail — never raises."""
+        try:
+            return await self.complete(
+                messages,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                response_format=response_format,
+            )
+        except Exception as exc:
+            self.counts["failed"] += 1
+            logger.error("LLM generation failed on every backend: %s", exc)
+            return None, 0, 0
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> str | None:
+        content, _, _ = await self.generate_tracked(
+            messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            response_format=response_format,
+        )
+        return content
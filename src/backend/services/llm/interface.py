@@ -75,3 +75,27 @@ class LLMProvider(ABC):
             response_format=response_format,
         )
         return content, 0, 0
+
+    async def complete(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> tuple[str | None, int, int]:
+        """Like generate_tracked(), but raises on failure instead of returning None.
+
+        Wrapping providers (RateLimitedProvider) use this to tell a rate
+        limit or timeout from an empty answer. The default delegates to
+        generate_tracked() and so never raises; OpenAICompatibleProvider
+        overrides it to surface the API's exceptions.
+        """
+        return await self.generate_tracked(
+            messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            response_format=response_format,
+        )
@@ -9,8 +9,8 @@ Constitutional references:
   - lessons.md Rule #2: "Fail Fast on Missing Configuration" —
     raises ValueError if API key is missing for non-local providers.
   - lessons.md External API Rate Limits: "Never retry at fixed interval" —
-    max_retries=1 to prevent thundering herd; exponential backoff is the
-    caller's responsibility.
+    max_retries=1 to prevent thundering herd; rate budgets and backoff
+    live in RateLimitedProvider (services/llm/rate_limited.py).
 """
 
 import logging
@@ -47,27 +47,45 @@ _DEFAULTS: dict[str, dict[str, str]] = {
 }
 
 
+def _env(name: str, provider_name: str, default: str = "", *, own_only: bool = False) -> str:
+    """``{name}_{PROVIDER}`` if set (e.g. LLM_API_KEY_GROK), else ``name``, else ``default``.
+
+    The suffixed form lets several backends be configured side by side
+    for HedgedProvider (LLM_PROVIDERS). With ``own_only`` the unsuffixed
+    ``name`` is skipped, so one vendor's key or model never reaches another.
+    """
+    suffixed = os.environ.get(f"{name}_{provider_name.upper()}")
+    if own_only:
+        return suffixed or default
+    return suffixed or os.environ.get(name) or default
+
+
 class OpenAICompatibleProvider(LLMProvider):
-    """Adapter for any OpenAI-compatible chat completions API."""
+    """Adapter for any OpenAI-compatible chat completions API.
 
-    def __init__(self, provider_name: str = "openai") -> None:
+    ``own_env`` (set for LLM_PROVIDERS backends) reads only the
+    provider-suffixed variables plus ``_DEFAULTS``.
+    """
+
+    def __init__(self, provider_name: str = "openai", *, own_env: bool = False) -> None:
         defaults = _DEFAULTS.get(provider_name, _DEFAULTS["openai"])
+        key_var = f"LLM_API_KEY_{provider_name.upper()}" if own_env else "LLM_API_KEY"
 
         # Kimi uses MOONSHOT_API_KEY; all others use LLM_API_KEY
         if provider_name == "kimi":
-            api_key = os.environ.get("MOONSHOT_API_KEY", "") or os.environ.get("LLM_API_KEY", "")
+            api_key = os.environ.get("MOONSHOT_API_KEY", "") or _env("LLM_API_KEY", provider_name, own_only=own_env)
         else:
-            api_key = os.environ.get("LLM_API_KEY", "")
+            api_key = _env("LLM_API_KEY", provider_name, own_only=own_env)
 
         if not api_key and provider_name not in ("local", "ollama"):
             raise ValueError(
-                f"LLM_API_KEY environment variable required for provider '{provider_name}'. "
+                f"{key_var} environment variable required for provider '{provider_name}'. "
                 f"See lessons.md Rule #2: Fail Fast on Missing Configuration."
             )
 
         self._provider_name = provider_name
-        self._default_model = os.environ.get("LLM_MODEL", defaults["model"])
-        base_url = os.environ.get("LLM_BASE_URL", defaults["base_url"])
+        self._default_model = _env("LLM_MODEL", provider_name, defaults["model"], own_only=own_env)
+        base_url = _env("LLM_BASE_URL", provider_name, defaults["base_url"], own_only=own_env)
 
         self._client = AsyncOpenAI(
             api_key=api_key or "not-needed",
@@ -144,6 +162,29 @@ class OpenAICompatibleProvider(LLMProvider):
             logger.error("LLM generation failed: %s", exc)
             return None
 
+    async def complete(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> tuple[str | None, int, int]:
+        """(content, prompt_tokens, completion_tokens); raises the API's exceptions.
+
+        openai.RateLimitError (429) carries the response, whose
+        ``retry-after`` header RateLimitedProvider honours.
+        """
+        response = await self._create_completion(
+            messages, model, max_tokens, temperature, response_format
+        )
+        content = response.choices[0].message.content
+        usage = getattr(response, "usage", None)
+        prompt_tokens: int = getattr(usage, "prompt_tokens", 0) or 0
+        completion_tokens: int = getattr(usage, "completion_tokens", 0) or 0
+        return content.strip() if content else None, prompt_tokens, completion_tokens
+
     async def generate_tracked(
         self,
         messages: list[dict[str, str]],
@@ -159,14 +200,13 @@ class OpenAICompatibleProvider(LLMProvider):
         Returns (None, 0, 0) on any failure — never raises.
         """
         try:
-            response = await self._create_completion(
-                messages, model, max_tokens, temperature, response_format
+            return await self.complete(
+                messages,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                response_format=response_format,
             )
-            content = response.choices[0].message.content
-            usage = getattr(response, "usage", None)
-            prompt_tokens: int = getattr(usage, "prompt_tokens", 0) or 0
-            completion_tokens: int = getattr(usage, "completion_tokens", 0) or 0
-            return content.strip() if content else None, prompt_tokens, completion_tokens
         except Exception as exc:
             logger.error("LLM generation (tracked) failed: %s", exc)
             return None, 0, 0
@@ -0,0 +1,338 @@
+"""Rate-limited, adaptively concurrent LLM provider wrapper.
+
+Wraps any ``LLMProvider`` so a whole process stays inside the upstream
+API's budgets instead of discovering them through bursts of 429s:
+
+  - Requests-per-minute and tokens-per-minute token buckets (LLM_RPM,
+    LLM_TPM; 0 = unlimited). A request's token cost is estimated from its
+    prompt length plus ``max_tokens`` and corrected from the reported usage.
+  - An AIMD concurrency limit between 1 and LLM_MAX_CONCURRENCY: +1/limit
+    per fast success, halved on a 429 or a call slower than
+    LLM_LATENCY_TARGET_S (at most once per second).
+  - A fair queue: each caller (the bot whose tick is running, see
+    ``set_llm_caller``) has its own FIFO and callers are served round-robin,
+    so one chatty bot cannot starve the rest.
+  - 429s are retried up to LLM_RATE_RETRIES times, after the response's
+    ``retry-after`` (or an exponential backoff) during which nothing is sent.
+
+``queue_depth`` and ``stats()`` expose the backlog. The factory applies the
+wrapper when any of LLM_RPM / LLM_TPM / LLM_MAX_CONCURRENCY is set.
+
+Constitutional references:
+  - CLAUDE.md Invariant #6: "Continuous real-time, not turn-based" —
+    waiting for budget is an async sleep, never a blocking one.
+  - lessons.md External API Rate Limits: "Never retry at fixed interval" —
+    429 retries back off exponentially and honour retry-after.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from services.llm.interface import LLMProvider
+
+logger = logging.getLogger("llm.rate_limited")
+
+LLM_RPM = float(os.environ.get("LLM_RPM", "0") or 0)
+LLM_TPM = float(os.environ.get("LLM_TPM", "0") or 0)
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", "0") or 0)
+LLM_LATENCY_TARGET_S = float(os.environ.get("LLM_LATENCY_TARGET_S", "8"))
+LLM_RATE_RETRIES = int(os.environ.get("LLM_RATE_RETRIES", "2"))
+
+_DEFAULT_MAX_CONCURRENCY = 32
+_DECREASE_COOLDOWN_S = 1.0
+_BACKOFF_BASE_S = 1.0
+
+_llm_caller: contextvars.ContextVar[str | None] = contextvars.ContextVar("llm_caller", default=None)
+
+
+def set_llm_caller(caller: str) -> contextvars.Token:
+    """Name the caller (e.g. the ticking bot) that LLM calls in this context queue under."""
+    return _llm_caller.set(caller)
+
+
+def current_llm_caller() -> str:
+    caller = _llm_caller.get()
+    if caller is not None:
+        return caller
+    try:
+        from clawx.metrics import get_current_collector
+        collector = get_current_collector()
+        if collector is not None:
+            return collector.snapshot().agent_id
+    except ImportError:
+        pass
+    return "-"
+
+
+def estimate_tokens(messages: list[dict[str, str]], max_tokens: int) -> int:
+    """Rough token cost of a request: ~4 characters per prompt token plus the completion cap."""
+    return sum(len(m.get("content") or "") for m in messages) // 4 + max_tokens
+
+
+def _status_code(exc: Exception) -> int | None:
+    return getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+
+
+def _retry_after(exc: Exception) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Refills ``per_minute`` units per minute up to one minute's worth.
+
+    ``reserve`` always takes the units, going into debt if needed, and
+    returns how long the caller must wait for the debt to clear.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = per_minute / 60.0
+        self.capacity = per_minute
+        self.clock = clock
+        self.tokens = per_minute
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, units: float) -> float:
+        if self.rate <= 0:
+            return 0.0
+        self._refill()
+        self.tokens -= units
+        return max(0.0, -self.tokens / self.rate)
+
+    def adjust(self, units: float) -> None:
+        """Correct an earlier reservation (positive refunds, negative charges)."""
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + units)
+
+
+@dataclass
+class _Ticket:
+    tokens: int
+    granted: asyncio.Future = field(repr=False)
+
+
+class RateLimitedProvider(LLMProvider):
+    """``LLMProvider`` that queues calls fairly and sends them within budget."""
+
+    def __init__(
+        self,
+        base: LLMProvider,
+        *,
+        rpm: float = LLM_RPM,
+        tpm: float = LLM_TPM,
+        max_concurrency: int = LLM_MAX_CONCURRENCY or _DEFAULT_MAX_CONCURRENCY,
+        latency_target_s: float = LLM_LATENCY_TARGET_S,
+        retries: int = LLM_RATE_RETRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._base = base
+        self.clock = clock
+        self.rpm = TokenBucket(rpm, clock)
+        self.tpm = TokenBucket(tpm, clock)
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)
+        self.latency_target_s = latency_target_s
+        self.retries = retries
+        self.in_flight = 0
+        self.counts = {"requests": 0, "throttled": 0, "slow": 0, "failed": 0}
+        self._queues: OrderedDict[str, deque[_Ticket]] = OrderedDict()
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._dispatcher: asyncio.Task | None = None
+
+    # --- queue -----------------------------------------------------------
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.counts,
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "queued_callers": len(self._queues),
+        }
+
+    def _ensure_dispatcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The queue's futures belong to one loop; start over in a new one
+            self._loop, self._queues, self.in_flight = loop, OrderedDict(), 0
+            self._wake = asyncio.Event()
+            self._dispatcher = None
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._dispatch())
+
+    async def _acquire(self, caller: str, tokens: int) -> None:
+        """Wait in ``caller``'s queue until the request may be sent."""
+        self._ensure_dispatcher()
+        ticket = _Ticket(tokens, self._loop.create_future())
+        self._queues.setdefault(caller, deque()).append(ticket)
+        self._wake.set()
+        try:
+            await ticket.granted
+        except asyncio.CancelledError:
+            if ticket.granted.done() and not ticket.granted.cancelled():
+                self._release()  # granted just as the caller gave up
+            raise
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._wake.set()
+
+    def _next_ticket(self) -> _Ticket | None:
+        """Round-robin: the head of the first caller's queue, which moves to the back."""
+        while self._queues:
+            caller, queue = self._queues.popitem(last=False)
+            ticket = queue.popleft()
+            if queue:
+                self._queues[caller] = queue
+            if not ticket.granted.done():  # skip callers that gave up
+                return ticket
+        return None
+
+    async def _dispatch(self) -> None:
+        while True:
+            if not self._queues or self.in_flight >= int(self.limit):
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+            ticket = self._next_ticket()
+            if ticket is None:
+                continue
+            wait = max(
+                self._paused_until - self.clock(),
+                self.rpm.reserve(1),
+                self.tpm.reserve(ticket.tokens),
+            )
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if ticket.granted.done():
+                self.rpm.adjust(1)
+                self.tpm.adjust(ticket.tokens)
+                continue
+            self.in_flight += 1
+            ticket.granted.set_result(None)
+
+    # --- AIMD ------------------------------------------------------------
+
+    def _on_success(self, latency: float) -> None:
+        if latency > self.latency_target_s:
+            self.counts["slow"] += 1
+            self._decrease(f"latency {latency:.1f}s")
+        else:
+            self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+
+    def _decrease(self, reason: str) -> None:
+        now = self.clock()
+        if now - self._last_decrease < _DECREASE_COOLDOWN_S:
+            return
+        self._last_decrease = now
+        self.limit = max(1.0, self.limit / 2)
+        logger.warning(
+            "LLM concurrency limit -> %d (%s); queue depth %d", int(self.limit), reason, self.queue_depth,
+        )
+
+    # --- LLMProvider -----------------------------------------------------
+
+    async def complete(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> tuple[str | None, int, int]:
+        caller = current_llm_caller()
+        estimate = estimate_tokens(messages, max_tokens)
+        attempt = 0
+        while True:
+            await self._acquire(caller, estimate)
+            started = self.clock()
+            try:
+                content, prompt_tokens, completion_tokens = await self._base.complete(
+                    messages,
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    response_format=response_format,
+                )
+            except Exception as exc:
+                if _status_code(exc) != 429:
+                    raise
+                self.counts["throttled"] += 1
+                self._decrease("429")
+                pause = _retry_after(exc) or _BACKOFF_BASE_S * 2 ** attempt
+                self._paused_until = max(self._paused_until, self.clock() + pause)
+                if attempt == self.retries:
+                    raise
+                attempt += 1
+                logger.info("LLM 429 for caller %s — retry %d/%d in %.1fs", caller, attempt, self.retries, pause)
+                continue
+            finally:
+                self._release()
+            self.counts["requests"] += 1
+            self._on_success(self.clock() - started)
+            if prompt_tokens or completion_tokens:
+                self.tpm.adjust(estimate - prompt_tokens - completion_tokens)
+            return content, prompt_tokens, completion_tokens
+
+    async def generate_tracked(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> tuple[str | None, int, int]:
+        """Queue, send within budget; returns (None, 0, 0) on failure — never raises."""
+        try:
+            return await self.complete(
+                messages,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                response_format=response_format,
+            )
+        except Exception as exc:
+            self.counts["failed"] += 1
+            logger.error("LLM generation failed: %s", exc)
+            return None, 0, 0
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: str | None = None,
+        max_tokens: int = 150,
+        temperature: float = 0.7,
+        response_format: dict | None = None,
+    ) -> str | None:
+        content, _, _ = await self.generate_tracked(
+            messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            response_format=response_format,
+        )
+        return content
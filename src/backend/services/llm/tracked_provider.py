@@ -9,6 +9,8 @@ Design principles:
   - ``generate_tracked()`` on the base provider supplies real usage; the default
     fallback in ``LLMProvider`` returns (content, 0, 0) for providers that don't
     expose usage (e.g. mock).
+  - Response-cache hits (``CachedProvider``) report zero usage and are counted
+    via ``MetricsCollector.record_cache_lookup()``.
   - clawx is imported lazily inside generate() so this module is safe to import
     even if the repo root is not on PYTHONPATH (graceful degradation to passthrough).
 
@@ -22,6 +24,7 @@ import logging
 import os
 from typing import TYPE_CHECKING
 
+from services.llm.cached import pop_cache_outcome
 from services.llm.interface import LLMProvider
 
 if TYPE_CHECKING:
@@ -99,6 +102,11 @@ class TrackedProvider(LLMProvider):
             response_format=response_format,
         )
 
+        # Set by CachedProvider in this context when a response cache is in the chain
+        outcome = pop_cache_outcome()
+        if outcome is not None and outcome != "bypass":
+            collector.record_cache_lookup(hit=outcome != "miss")
+
         cost = _estimate_cost(prompt_tokens, completion_tokens)
         collector.increment_tokens(
             input_tokens=prompt_tokens,
@@ -72,14 +72,16 @@ _MARKET_SOURCE_WEIGHTS: dict[MarketSourceType, int] = {
 
 # ── RESEARCH market generator ─────────────────────────────────────────────────
 
-async def generate_research_market(session: AsyncSession) -> Market | None:
+async def generate_research_market(
+    session: AsyncSession, ingestor: AsyncFeedIngestor | None = None,
+) -> Market | None:
     """Generate one RESEARCH market from a random Wikipedia article.
 
     The question asks for the pageid. The answer_hash is SHA256(str(pageid)).
     Returns the created Market, or None if fetch/creation fails.
     Does NOT commit — caller manages transaction.
     """
-    ingestor = AsyncFeedIngestor()
+    ingestor = ingestor or AsyncFeedIngestor()
     summary = await ingestor.fetch_random_wikipedia_summary()
 
     if not summary or not summary.get("pageid"):
@@ -125,7 +127,9 @@ async def generate_research_market(session: AsyncSession) -> Market | None:
 
 # ── WEATHER market generator ──────────────────────────────────────────────────
 
-async def generate_weather_market(session: AsyncSession) -> Market | None:
+async def generate_weather_market(
+    session: AsyncSession, ingestor: AsyncFeedIngestor | None = None,
+) -> Market | None:
     """Generate a YES/NO market on whether a city's temperature exceeds a
     threshold at market close (Open-Meteo — no API key required).
 
@@ -134,7 +138,7 @@ async def generate_weather_market(session: AsyncSession) -> Market | None:
     Does NOT commit — caller manages transaction.
     """
     city     = random.choice(WEATHER_CITIES)
-    ingestor = AsyncFeedIngestor()
+    ingestor = ingestor or AsyncFeedIngestor()
     weather  = await ingestor.fetch_weather(city["lat"], city["lon"])
 
     if not weather or weather.get("temperature_c") is None:
@@ -187,7 +191,9 @@ async def generate_weather_market(session: AsyncSession) -> Market | None:
 
 # ── GITHUB market generator ───────────────────────────────────────────────────
 
-async def generate_github_market(session: AsyncSession) -> Market | None:
+async def generate_github_market(
+    session: AsyncSession, ingestor: AsyncFeedIngestor | None = None,
+) -> Market | None:
     """Generate a YES/NO star-milestone market for a repo from GITHUB_WATCHLIST.
 
     Milestone = next 500-star multiple above the current star count, so the
@@ -203,7 +209,7 @@ async def generate_github_market(session: AsyncSession) -> Market | None:
         return None
 
     repo     = random.choice(repos)
-    ingestor = AsyncFeedIngestor()
+    ingestor = ingestor or AsyncFeedIngestor()
     data     = await ingestor.fetch_github_stars(repo)
 
     if not data:
@@ -255,7 +261,9 @@ async def generate_github_market(session: AsyncSession) -> Market | None:
 
 # ── NEWS market generator ─────────────────────────────────────────────────────
 
-async def generate_news_market(session: AsyncSession) -> Market | None:
+async def generate_news_market(
+    session: AsyncSession, ingestor: AsyncFeedIngestor | None = None,
+) -> Market | None:
     """Generate a YES/NO market on whether a keyword appears in tech headlines.
 
     Data source priority:
@@ -271,7 +279,7 @@ async def generate_news_market(session: AsyncSession) -> Market | None:
         return None
 
     keyword  = random.choice(keywords)
-    ingestor = AsyncFeedIngestor()
+    ingestor = ingestor or AsyncFeedIngestor()
     headlines: list[str] = []
 
     # Try NewsAPI first
@@ -352,7 +360,8 @@ async def ensure_open_markets(
       RESEARCH 40 % · WEATHER 25 % · GITHUB 20 % · NEWS 15 %
 
     On API failure a generator returns None; the orchestrator retries with a
-    different source (up to min_open * 3 attempts total).
+    different source (up to min_open * 3 attempts total). All generators
+    share one ingestor (and its pooled HTTP client).
     Returns the number of markets created.
     """
     result = await session.execute(
@@ -363,6 +372,7 @@ async def ensure_open_markets(
     _types   = list(_MARKET_SOURCE_WEIGHTS.keys())
     _weights = list(_MARKET_SOURCE_WEIGHTS.values())
 
+    ingestor    = AsyncFeedIngestor()
     created     = 0
     attempts    = 0
     max_attempts = min_open * 3  # guard against infinite loop on API failures
@@ -370,7 +380,7 @@ async def ensure_open_markets(
     while current_count + created < min_open and attempts < max_attempts:
         attempts += 1
         source    = random.choices(_types, weights=_weights, k=1)[0]
-        market    = await _GENERATORS[source](session)
+        market    = await _GENERATORS[source](session, ingestor)
         if market:
             created += 1
 
@@ -390,7 +400,8 @@ async def ensure_research_markets(
 ) -> int:
     """Ensure at least `min_open` RESEARCH markets are OPEN.
 
-    Retained for backward compatibility — called by run_ticker.py.
+    Called by run_ticker.py; the rest of the board is kept stocked by
+    run_market_maker.py through ensure_open_markets().
     Generates new markets from Wikipedia until the minimum is reached.
     Returns the number of markets created.
     """
@@ -402,13 +413,14 @@ async def ensure_research_markets(
     )
     current_count = result.scalar() or 0
 
+    ingestor     = AsyncFeedIngestor()
     created      = 0
     attempts     = 0
     max_attempts = min_open * 3
 
     while current_count + created < min_open and attempts < max_attempts:
         attempts += 1
-        market = await generate_research_market(session)
+        market = await generate_research_market(session, ingestor)
         if market:
             created += 1
 
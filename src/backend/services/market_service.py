@@ -16,15 +16,54 @@ import logging
 import uuid
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import Market, MarketPrediction, MarketSourceType, MarketStatus, PredictionStatus
-from services.ledger_service import append_ledger_entry
+from services.ledger_service import LedgerBatch, append_ledger_entry
+from services.research_pool import RESEARCH_POOL, get_research_pool
 
 logger = logging.getLogger("market_service")
 
 
+async def _record_entry(
+    *,
+    bot_id: int,
+    amount: Decimal,
+    transaction_type: str,
+    reference_id: str,
+    session: AsyncSession,
+    ledger_batch: LedgerBatch | None,
+) -> None:
+    """Queue on the caller's batch if there is one, else append right away."""
+    if ledger_batch is not None:
+        ledger_batch.add(
+            amount=amount,
+            transaction_type=transaction_type,
+            reference_id=reference_id,
+        )
+        return
+    await append_ledger_entry(
+        bot_id=bot_id,
+        amount=amount,
+        transaction_type=transaction_type,
+        reference_id=reference_id,
+        session=session,
+    )
+
+
+def market_context(m: Market) -> dict:
+    """LLM-facing dict for one market (``id`` as a string)."""
+    return {
+        "id": str(m.id),
+        "description": m.description,
+        "source_type": m.source_type.value,
+        "resolution_criteria": m.resolution_criteria,
+        "bounty": str(m.bounty),
+        "deadline": m.deadline.isoformat(),
+    }
+
+
 async def get_active_markets_for_agent(
     *,
     bot_id: int,
@@ -52,19 +91,20 @@ async def get_active_markets_for_agent(
         .order_by(Market.deadline.asc())
         .limit(limit)
     )
-    markets = result.scalars().all()
+    return [market_context(m) for m in result.scalars().all()]
 
-    return [
-        {
-            "id": str(m.id),
-            "description": m.description,
-            "source_type": m.source_type.value,
-            "resolution_criteria": m.resolution_criteria,
-            "bounty": str(m.bounty),
-            "deadline": m.deadline.isoformat(),
-        }
-        for m in markets
-    ]
+
+async def get_open_market_board(*, session: AsyncSession, limit: int) -> list[dict]:
+    """Every bot's view of the OPEN markets before exclusions, ordered by
+    deadline — ``get_active_markets_for_agent`` minus the already-bet filter.
+    """
+    result = await session.execute(
+        select(Market)
+        .where(Market.status == MarketStatus.OPEN)
+        .order_by(Market.deadline.asc())
+        .limit(limit)
+    )
+    return [market_context(m) for m in result.scalars().all()]
 
 
 async def place_market_bet(
@@ -75,17 +115,22 @@ async def place_market_bet(
     stake: Decimal,
     tick_id: str,
     session: AsyncSession,
+    ledger_batch: LedgerBatch | None = None,
 ) -> MarketPrediction:
     """Place a bet on a market. Writes MarketPrediction + MARKET_STAKE ledger entry.
 
     Does NOT commit — caller manages the transaction.
     Does NOT update Bot.balance — caller must do that.
+    If ``ledger_batch`` is given, the MARKET_STAKE entry is queued on it
+    instead of appended immediately (caller flushes the batch).
 
     Raises ValueError if market is not OPEN or stake <= 0.
+    The market row is share-locked until the caller commits, so it cannot
+    be closed or resolved under the bet; concurrent bets do not block each other.
     """
     mid = uuid.UUID(market_id)
     result = await session.execute(
-        select(Market).where(Market.id == mid)
+        select(Market).where(Market.id == mid).with_for_update(read=True)
     )
     market = result.scalar_one_or_none()
 
@@ -107,12 +152,13 @@ async def place_market_bet(
     session.add(prediction)
 
     # Write MARKET_STAKE ledger entry (negative = money leaving bot)
-    await append_ledger_entry(
+    await _record_entry(
         bot_id=bot_id,
         amount=Decimal(str(-stake)),
         transaction_type="MARKET_STAKE",
         reference_id=f"TICK:{tick_id}:MARKET:{market_id}",
         session=session,
+        ledger_batch=ledger_batch,
     )
 
     logger.info(
@@ -134,12 +180,18 @@ async def submit_research_answer(
     stake: Decimal,
     tick_id: str,
     session: AsyncSession,
+    ledger_batch: LedgerBatch | None = None,
 ) -> tuple[MarketPrediction | None, str]:
     """Submit a text answer to a RESEARCH market. Resolves instantly if correct.
 
     Returns (prediction, result) where result is "CORRECT", "WRONG", or "CLOSED".
     Does NOT commit — caller manages the transaction.
     Does NOT update Bot.balance — caller must do that.
+    If ``ledger_batch`` is given, MARKET_STAKE and RESEARCH_PAYOUT entries are
+    queued on it instead of appended immediately (caller flushes the batch).
+    A market found or left non-OPEN is dropped from the research answer pool.
+    Concurrent correct answers race on one conditional UPDATE: only the
+    winner is staked and paid, the others get "CLOSED".
     """
     mid = uuid.UUID(market_id)
     result = await session.execute(
@@ -150,6 +202,8 @@ async def submit_research_answer(
     if not market:
         raise ValueError(f"Market {market_id} not found")
     if market.status != MarketStatus.OPEN:
+        if RESEARCH_POOL:
+            await get_research_pool().invalidate(market_id)
         return (None, "CLOSED")
     if market.source_type != MarketSourceType.RESEARCH:
         raise ValueError(f"Market {market_id} is not RESEARCH type")
@@ -157,6 +211,23 @@ async def submit_research_answer(
         raise ValueError(f"Stake must be positive, got {stake}")
 
     clean_answer = answer.strip()
+    expected_hash = market.resolution_criteria.get("answer_hash", "")
+    user_hash = hashlib.sha256(clean_answer.encode()).hexdigest()
+    correct = user_hash == expected_hash
+
+    if correct:
+        # Claim the market: the OPEN read above is unlocked, and pooled
+        # answers reach several concurrent ticks at once. Only the write
+        # that moves it out of OPEN resolves it; the rest find it CLOSED.
+        claimed = await session.execute(
+            update(Market)
+            .where(Market.id == mid, Market.status == MarketStatus.OPEN)
+            .values(status=MarketStatus.RESOLVED, outcome=clean_answer)
+        )
+        if RESEARCH_POOL:
+            await get_research_pool().invalidate(market_id)
+        if claimed.rowcount == 0:
+            return (None, "CLOSED")
 
     # Create MarketPrediction with the text answer as outcome
     prediction = MarketPrediction(
@@ -169,33 +240,29 @@ async def submit_research_answer(
     session.add(prediction)
 
     # Write MARKET_STAKE ledger entry (negative = money leaving bot)
-    await append_ledger_entry(
+    await _record_entry(
         bot_id=bot_id,
         amount=Decimal(str(-stake)),
         transaction_type="MARKET_STAKE",
         reference_id=f"TICK:{tick_id}:RESEARCH:{market_id}",
         session=session,
+        ledger_batch=ledger_batch,
     )
 
     # === INSTANT RESOLUTION: SHA256 hash comparison ===
-    expected_hash = market.resolution_criteria.get("answer_hash", "")
-    user_hash = hashlib.sha256(clean_answer.encode()).hexdigest()
-
-    if user_hash == expected_hash:
-        # CORRECT — resolve market, pay bounty
-        market.status = MarketStatus.RESOLVED
-        market.outcome = clean_answer
-
+    if correct:
+        # CORRECT — market already claimed above, pay bounty
         payout = market.bounty + prediction.stake
         prediction.status = PredictionStatus.WIN
         prediction.payout = payout
 
-        await append_ledger_entry(
+        await _record_entry(
             bot_id=bot_id,
             amount=Decimal(str(payout)),
             transaction_type="RESEARCH_PAYOUT",
             reference_id=f"TICK:{tick_id}:RESEARCH_WIN:{market_id}",
             session=session,
+            ledger_batch=ledger_batch,
         )
 
         logger.info(
@@ -0,0 +1,280 @@
+"""
+merkle_service.py — Merkle epochs over ledger entry hashes.
+
+The anchoring job seals every committed ledger entry into an epoch: a
+contiguous ``Ledger.id`` window whose entry hashes form the leaves of a
+Merkle tree, and whose root is stored in ``ledger_epochs``. An auditor who
+trusts a root can then check a single entry with O(log n) hashes instead of
+walking the bot's whole ``previous_hash`` chain.
+
+Tree layout (RFC 6962-style domain separation):
+  leaf = SHA256(0x00 || entry_hash_bytes)
+  node = SHA256(0x01 || left || right)
+  An odd node at the end of a level is promoted unchanged.
+
+Windows end at a commit watermark (commit_watermark): an id below which
+no transaction can still commit a row. Ids come from a sequence, so a
+window cut by timestamp or by "highest visible id" could later gain a
+lower-id entry that was still in flight. Epochs sealed before the
+watermark existed can be repaired with reseal_epoch().
+
+Proof format: a list of ``{"hash": <hex>, "side": "left"|"right"}`` steps
+from the leaf up, where ``side`` is the sibling's position.
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
+  - lessons.md: All economic state changes must be hash-chained
+"""
+
+import hashlib
+import logging
+import os
+from types import SimpleNamespace
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import func as sa_func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Ledger, LedgerEpoch
+from services.ledger_archive import archived_hashes_in_id_range, find_archived_entry
+
+logger = logging.getLogger("merkle_service")
+
+EPOCH_MAX_LEAVES = int(os.environ.get("LEDGER_EPOCH_MAX_LEAVES", "65536"))
+# How long commit_watermark() waits for in-flight ledger writers before the
+# run gives up and retries next cycle.
+EPOCH_LOCK_TIMEOUT_MS = int(os.environ.get("LEDGER_EPOCH_LOCK_TIMEOUT_MS", "5000"))
+
+
+class EpochMismatchError(Exception):
+    """An epoch's id window no longer holds the leaves it was sealed over."""
+
+
+def _leaf(entry_hash: str) -> bytes:
+    return hashlib.sha256(b"\x00" + bytes.fromhex(entry_hash)).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _levels(entry_hashes: Sequence[str]) -> list[list[bytes]]:
+    """All tree levels, leaves first, root last."""
+    level = [_leaf(h) for h in entry_hashes]
+    levels = [level]
+    while len(level) > 1:
+        nxt = [_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            nxt.append(level[-1])
+        levels.append(nxt)
+        level = nxt
+    return levels
+
+
+def merkle_root(entry_hashes: Sequence[str]) -> str:
+    """Hex root over ``entry_hashes`` in order. Requires at least one leaf."""
+    return _levels(entry_hashes)[-1][0].hex()
+
+
+def merkle_proof(entry_hashes: Sequence[str], index: int) -> list[dict[str, str]]:
+    """Inclusion proof for ``entry_hashes[index]``."""
+    proof = []
+    for level in _levels(entry_hashes)[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append({
+                "hash": level[sibling].hex(),
+                "side": "left" if sibling < index else "right",
+            })
+        index //= 2
+    return proof
+
+
+def verify_inclusion(entry_hash: str, proof: Sequence[dict[str, str]], root: str) -> bool:
+    """Recompute the root from one entry hash and its proof."""
+    acc = _leaf(entry_hash)
+    for step in proof:
+        sibling = bytes.fromhex(step["hash"])
+        acc = _node(sibling, acc) if step["side"] == "left" else _node(acc, sibling)
+    return acc.hex() == root
+
+
+async def commit_watermark(session: AsyncSession) -> int:
+    """Highest ``Ledger.id`` below which every entry has committed (or never will).
+
+    On Postgres this takes ``SHARE`` on ``ledger`` — it waits for every
+    transaction that has inserted a ledger row to finish and holds off new
+    inserts — then reads ``max(id)``. Sequence ids handed out afterwards are
+    all higher, so the window up to the returned id can no longer change.
+    The lock lasts until the caller's transaction ends: take the watermark
+    in its own short transaction (see scripts/run_anchor.py). Raises if
+    in-flight writers outlast EPOCH_LOCK_TIMEOUT_MS.
+
+    Other dialects (SQLite in tests) serialize writers, so ``max(id)`` of
+    what is visible already is the watermark.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        await session.execute(text(f"SET LOCAL lock_timeout = {int(EPOCH_LOCK_TIMEOUT_MS)}"))
+        await session.execute(text(f"LOCK TABLE {Ledger.__tablename__} IN SHARE MODE"))
+    return (await session.execute(select(sa_func.max(Ledger.id)))).scalar_one_or_none() or 0
+
+
+async def anchor_epochs(
+    session: AsyncSession,
+    *,
+    max_leaves: int = EPOCH_MAX_LEAVES,
+    up_to_id: Optional[int] = None,
+) -> list[LedgerEpoch]:
+    """Seal every committed, unanchored ledger entry into new epochs.
+
+    Resumes after the last sealed ``Ledger.id``, so each run only hashes
+    entries appended since the previous one. Windows hold at most
+    ``max_leaves`` entries and never pass ``up_to_id``, which must be a
+    commit_watermark(); when omitted, the watermark is taken in ``session``
+    (holding its lock until the caller commits). Does NOT commit — the
+    caller manages the transaction.
+    """
+    if up_to_id is None:
+        up_to_id = await commit_watermark(session)
+    last_id = (await session.execute(
+        select(sa_func.max(LedgerEpoch.last_ledger_id))
+    )).scalar_one_or_none() or 0
+
+    sealed: list[LedgerEpoch] = []
+    while last_id < up_to_id:
+        window = (await session.execute(
+            select(Ledger.id, Ledger.hash)
+            .where(Ledger.id > last_id, Ledger.id <= up_to_id)
+            .order_by(Ledger.id.asc())
+            .limit(max_leaves)
+        )).all()
+        if not window:
+            break
+
+        epoch = LedgerEpoch(
+            first_ledger_id=window[0].id,
+            last_ledger_id=window[-1].id,
+            leaf_count=len(window),
+            merkle_root=merkle_root([r.hash for r in window]),
+        )
+        session.add(epoch)
+        await session.flush()
+        sealed.append(epoch)
+        logger.info(
+            "Sealed epoch %d: ledger ids %d..%d (%d leaves) root=%s",
+            epoch.id, epoch.first_ledger_id, epoch.last_ledger_id,
+            epoch.leaf_count, epoch.merkle_root[:16],
+        )
+
+        last_id = window[-1].id
+        if len(window) < max_leaves:
+            break
+    return sealed
+
+
+async def epoch_leaves(session: AsyncSession, epoch: LedgerEpoch) -> list[tuple[int, str]]:
+    """(id, hash) of every entry in the epoch's id window, live or archived, by id."""
+    leaves = [tuple(row) for row in (await session.execute(
+        select(Ledger.id, Ledger.hash)
+        .where(Ledger.id >= epoch.first_ledger_id, Ledger.id <= epoch.last_ledger_id)
+    )).all()]
+    if len(leaves) < epoch.leaf_count:
+        leaves += await archived_hashes_in_id_range(
+            session, epoch.first_ledger_id, epoch.last_ledger_id,
+        )
+    leaves.sort()
+    return leaves
+
+
+async def reseal_epoch(epoch_id: int, session: AsyncSession) -> Optional[LedgerEpoch]:
+    """Recompute an epoch over the entries its id window holds now.
+
+    Repairs epochs sealed before commit_watermark(), when an entry that
+    committed late landed inside an already sealed window. The old root
+    stops verifying, so it is logged for auditors who kept it. Returns
+    None if the epoch does not exist. Does NOT commit.
+    """
+    epoch = await session.get(LedgerEpoch, epoch_id)
+    if epoch is None:
+        return None
+    leaves = await epoch_leaves(session, epoch)
+    root = merkle_root([leaf_hash for _, leaf_hash in leaves])
+    if (len(leaves), root) == (epoch.leaf_count, epoch.merkle_root):
+        return epoch
+
+    logger.warning(
+        "Resealing epoch %d (ledger ids %d..%d): %d leaves root=%s -> %d leaves root=%s",
+        epoch.id, epoch.first_ledger_id, epoch.last_ledger_id,
+        epoch.leaf_count, epoch.merkle_root, len(leaves), root,
+    )
+    epoch.leaf_count = len(leaves)
+    epoch.merkle_root = root
+    await session.flush()
+    return epoch
+
+
+async def get_inclusion_proof(ledger_id: int, session: AsyncSession) -> Optional[dict[str, Any]]:
+    """Inclusion proof for one ledger entry against its epoch root.
+
+    Returns None if the entry does not exist. ``"epoch"`` is None if the
+    entry has not been anchored yet. Archived entries (ledger_archive) are
+    read back from their segment files.
+
+    An epoch sealed before commit_watermark() may have gained an entry that
+    committed after its window was sealed. Raises EpochMismatchError rather
+    than return a proof that cannot verify; reseal_epoch() repairs it.
+    """
+    entry = await session.get(Ledger, ledger_id)
+    if entry is None:
+        found = await find_archived_entry(session, ledger_id=ledger_id)
+        if found is None:
+            return None
+        segment, archived = found
+        entry = SimpleNamespace(
+            id=archived.id, bot_id=segment.bot_id, sequence=archived.sequence, hash=archived.hash,
+        )
+
+    result: dict[str, Any] = {
+        "ledger_id": entry.id,
+        "bot_id": entry.bot_id,
+        "sequence": entry.sequence,
+        "entry_hash": entry.hash,
+        "epoch": None,
+        "leaf_index": None,
+        "proof": [],
+    }
+
+    epoch = (await session.execute(
+        select(LedgerEpoch).where(
+            LedgerEpoch.first_ledger_id <= ledger_id,
+            LedgerEpoch.last_ledger_id >= ledger_id,
+        )
+    )).scalar_one_or_none()
+    if epoch is None:
+        return result
+
+    leaves = await epoch_leaves(session, epoch)
+    if len(leaves) != epoch.leaf_count:
+        logger.error(
+            "Epoch %d: sealed %d leaves but ledger ids %d..%d now hold %d",
+            epoch.id, epoch.leaf_count, epoch.first_ledger_id, epoch.last_ledger_id, len(leaves),
+        )
+        raise EpochMismatchError(
+            f"Epoch {epoch.id} was sealed over {epoch.leaf_count} entries "
+            f"but its id window now holds {len(leaves)}; reseal it"
+        )
+    index = next(i for i, (leaf_id, _) in enumerate(leaves) if leaf_id == ledger_id)
+
+    result.update(
+        epoch={
+            "id": epoch.id,
+            "merkle_root": epoch.merkle_root,
+            "first_ledger_id": epoch.first_ledger_id,
+            "last_ledger_id": epoch.last_ledger_id,
+            "leaf_count": epoch.leaf_count,
+            "created_at": epoch.created_at.isoformat() if epoch.created_at else None,
+        },
+        leaf_index=index,
+        proof=merkle_proof([leaf_hash for _, leaf_hash in leaves], index),
+    )
+    return result
@@ -0,0 +1,205 @@
+"""
+partition_service.py — Maintenance for Postgres-partitioned tables.
+
+``ledger`` is HASH-partitioned by bot_id into a fixed number of partitions,
+so it needs no upkeep. ``agent_metrics`` is RANGE-partitioned by month on
+created_at: this module creates upcoming months before rows arrive (so the
+DEFAULT partition stays empty) and detaches — optionally drops — months
+past retention. Detaching is a catalog update, not a DELETE. Rows that did
+land in DEFAULT (maintenance not running for a while) are moved into their
+month's partition when it is created.
+
+Which tables are partitioned, and how, is read from each table's ``info``
+in models.py (``partition_interval``, ``partition_months_ahead``).
+Monthly partitions are named ``<table>_yYYYYmMM``. Every function is a
+no-op on other dialects or when the table is not partitioned (e.g. a
+database built with create_all).
+
+Constitutional references:
+  - lessons.md Rule #1: Schema changes go through alembic migrations
+"""
+
+import logging
+import re
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import Table, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Base
+
+logger = logging.getLogger("partition_service")
+
+_MONTH_SUFFIX = re.compile(r"_y(\d{4})m(\d{2})$")
+_RANGE_KEY = re.compile(r"^RANGE \((\w+)\)$")
+
+
+def add_months(month: date, n: int) -> date:
+    """First day of the month ``n`` months after ``month``'s month."""
+    idx = month.year * 12 + (month.month - 1) + n
+    return date(idx // 12, idx % 12 + 1, 1)
+
+
+def month_partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def month_partitioned_tables() -> list[Table]:
+    """Tables whose ``info`` declares monthly RANGE partitions."""
+    return [t for t in Base.metadata.sorted_tables if t.info.get("partition_interval") == "month"]
+
+
+async def is_partitioned(session: AsyncSession, table: str) -> bool:
+    """True if ``table`` is a declaratively partitioned Postgres table."""
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    found = await session.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+        ),
+        {"table": table},
+    )
+    return found.scalar_one_or_none() is not None
+
+
+async def list_partitions(session: AsyncSession, table: str) -> list[str]:
+    """Names of the partitions currently attached to ``table``."""
+    result = await session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :table AND pg_table_is_visible(parent.oid) "
+            "ORDER BY child.relname"
+        ),
+        {"table": table},
+    )
+    return list(result.scalars().all())
+
+
+async def default_partition(session: AsyncSession, table: str) -> Optional[str]:
+    """Name of ``table``'s DEFAULT partition, if it has one."""
+    result = await session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :table AND pg_table_is_visible(parent.oid) "
+            "AND pg_get_expr(child.relpartbound, child.oid) = 'DEFAULT'"
+        ),
+        {"table": table},
+    )
+    return result.scalar_one_or_none()
+
+
+async def _create_month_partition(
+    session: AsyncSession, table: str, name: str, start: date, default: Optional[str],
+) -> int:
+    """Create one monthly partition; returns how many rows moved out of DEFAULT.
+
+    Postgres refuses to create a partition while the DEFAULT partition
+    holds rows in its range, so DEFAULT is detached, the month's rows are
+    moved into the new partition, and DEFAULT is attached again.
+    """
+    key = _RANGE_KEY.match(Base.metadata.tables[table].info["partition_by"]).group(1)
+    end = add_months(start, 1)
+    bounds = f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    in_month = f"\"{key}\" >= '{start.isoformat()}' AND \"{key}\" < '{end.isoformat()}'"
+
+    stranded = 0
+    if default is not None:
+        stranded = (await session.execute(text(
+            f'SELECT count(*) FROM "{default}" WHERE {in_month}'
+        ))).scalar_one()
+    if not stranded:
+        await session.execute(text(f'CREATE TABLE "{name}" PARTITION OF "{table}" {bounds}'))
+        return 0
+
+    await session.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{default}"'))
+    await session.execute(text(f'CREATE TABLE "{name}" PARTITION OF "{table}" {bounds}'))
+    await session.execute(text(f'INSERT INTO "{name}" SELECT * FROM "{default}" WHERE {in_month}'))
+    await session.execute(text(f'DELETE FROM "{default}" WHERE {in_month}'))
+    await session.execute(text(f'ALTER TABLE "{table}" ATTACH PARTITION "{default}" DEFAULT'))
+    return stranded
+
+
+async def ensure_month_partitions(
+    session: AsyncSession,
+    table: str,
+    *,
+    months_ahead: Optional[int] = None,
+    today: Optional[date] = None,
+) -> list[str]:
+    """Create missing monthly partitions from this month to ``months_ahead`` out.
+
+    ``months_ahead`` defaults to the table's ``partition_months_ahead``.
+    A month whose rows already sit in the DEFAULT partition has them moved
+    over. Each month runs in a savepoint: one that still fails is logged
+    and skipped, so it does not stop the others. Returns the names
+    created. Does NOT commit.
+    """
+    if not await is_partitioned(session, table):
+        return []
+    if months_ahead is None:
+        months_ahead = Base.metadata.tables[table].info["partition_months_ahead"]
+
+    existing = set(await list_partitions(session, table))
+    default = await default_partition(session, table)
+    this_month = (today or datetime.now(timezone.utc).date()).replace(day=1)
+    created = []
+    for n in range(months_ahead + 1):
+        start = add_months(this_month, n)
+        name = month_partition_name(table, start)
+        if name in existing:
+            continue
+        try:
+            async with session.begin_nested():
+                moved = await _create_month_partition(session, table, name, start, default)
+        except DBAPIError as exc:
+            logger.error("Could not create partition %s, skipping: %s", name, exc)
+            continue
+        created.append(name)
+        if moved:
+            logger.warning("Created partition %s, moved %d rows out of %s", name, moved, default)
+        else:
+            logger.info("Created partition %s", name)
+    return created
+
+
+async def retire_month_partitions(
+    session: AsyncSession,
+    table: str,
+    *,
+    retain_months: int,
+    drop: bool = False,
+    today: Optional[date] = None,
+) -> list[str]:
+    """Detach (or drop) monthly partitions that end before the retention window.
+
+    The current month plus ``retain_months`` previous months are kept.
+    Detached partitions stay behind as ordinary tables for archival.
+    Returns the names retired. Does NOT commit.
+    """
+    if not await is_partitioned(session, table):
+        return []
+
+    this_month = (today or datetime.now(timezone.utc).date()).replace(day=1)
+    oldest_kept = add_months(this_month, -retain_months)
+    retired = []
+    for name in await list_partitions(session, table):
+        match = _MONTH_SUFFIX.search(name)
+        if not match:
+            continue  # DEFAULT partition or hand-made ones
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        if month >= oldest_kept:
+            continue
+        await session.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+        if drop:
+            await session.execute(text(f'DROP TABLE "{name}"'))
+        retired.append(name)
+        logger.info("%s partition %s", "Dropped" if drop else "Detached", name)
+    return retired
@@ -0,0 +1,200 @@
+"""
+research_pool.py — Shared per-market research answers.
+
+Every bot that picks the same RESEARCH market asks the same question, and
+each used to pay for its own LLM call and Wikipedia lookup. The pool keeps
+the first bot's result (answer, confidence, tool use) per market and hands
+it to later bots from two tiers:
+
+  1. an in-process dict
+  2. Redis, shared by every ticker worker:
+
+       research:pool:{market_id}   STR  JSON answer dict, RESEARCH_POOL_TTL
+
+Concurrent bots on one market share a single computation (single-flight).
+A failed computation (None) is not pooled.
+
+Each bot sees the pooled confidence shifted by a persona-dependent amount
+of up to ±RESEARCH_POOL_NOISE, deterministic per (persona, market), so the
+fleet does not all clear or all miss the confidence floor together. The
+answer itself is never perturbed — it is compared by hash.
+
+A pooled answer still carries ``tool_fee_charged``: reusing a Wikipedia
+answer costs the same lookup fee as fetching it, so pooling saves compute,
+not game economics.
+
+market_service invalidates an entry where its market leaves OPEN (a
+correct answer resolves it) or is found already closed; bot_runner drops
+an entry whose answer was judged wrong so the next bot computes afresh.
+Anything else — e.g. a worker that missed the invalidation keeping its
+in-process copy — goes stale for at most RESEARCH_POOL_TTL.
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: External Truth — answers are still resolved
+    against the market's hash; pooling never changes a verdict.
+  - CLAUDE.md Invariant #6: Continuous real-time — one computation per
+    market instead of one per bot.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable
+
+from thread_memory import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+RESEARCH_POOL = os.environ.get("RESEARCH_POOL", "1") != "0"
+RESEARCH_POOL_TTL = int(os.environ.get("RESEARCH_POOL_TTL", "3600"))
+RESEARCH_POOL_NOISE = float(os.environ.get("RESEARCH_POOL_NOISE", "0.05"))
+
+Compute = Callable[[], Awaitable[dict | None]]
+
+
+def _redis_key(market_id: str) -> str:
+    return f"research:pool:{market_id}"
+
+
+def persona_noise(persona: str, market_id: str, amplitude: float) -> float:
+    """A stable offset in [-amplitude, +amplitude] for this persona on this market."""
+    digest = hashlib.sha256(f"{persona}|{market_id}".encode()).digest()
+    unit = int.from_bytes(digest[:8], "big") / 2**64   # [0, 1)
+    return (2 * unit - 1) * amplitude
+
+
+class ResearchAnswerPool:
+    """Two-tier (dict + Redis) pool of research answers keyed by market id."""
+
+    def __init__(
+        self,
+        *,
+        redis=None,
+        ttl: int = RESEARCH_POOL_TTL,
+        noise: float = RESEARCH_POOL_NOISE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.redis = redis   # None: use the shared client (thread_memory)
+        self.ttl = ttl
+        self.noise = noise
+        self.clock = clock
+        self._local: dict[str, tuple[float, dict]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.counts: Counter = Counter()
+
+    async def answer(self, market_id: str, persona: str, compute: Compute) -> dict | None:
+        """The pooled answer for ``market_id`` as seen by ``persona``.
+
+        Awaits ``compute()`` when no bot has answered the market yet.
+        Returns a fresh dict the caller may modify, or None.
+        """
+        entry = self._local_get(market_id)
+        if entry is not None:
+            self.counts["hit_local"] += 1
+            return self._for(persona, market_id, entry)
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._inflight = loop, {}
+        flight = self._inflight.get(market_id)
+        if flight is None:
+            flight = loop.create_task(self._fill(market_id, compute))
+            self._inflight[market_id] = flight
+            flight.add_done_callback(lambda _: self._inflight.pop(market_id, None))
+            computed, entry = await asyncio.shield(flight)
+            if computed:
+                # the computing bot gets the answer as it computed it — no noise
+                return dict(entry) if entry is not None else None
+        else:
+            self.counts["hit_inflight"] += 1
+            _, entry = await asyncio.shield(flight)
+        return self._for(persona, market_id, entry) if entry is not None else None
+
+    async def _fill(self, market_id: str, compute: Compute) -> tuple[bool, dict | None]:
+        """(computed here, entry) — from Redis if another worker pooled it."""
+        redis = self.redis or await get_redis_client()
+        if redis is not None:
+            try:
+                raw = await redis.get(_redis_key(market_id))
+            except Exception as exc:
+                logger.debug("Research pool read failed for %s: %s", market_id, exc)
+                raw = None
+            if raw is not None:
+                self.counts["hit_redis"] += 1
+                entry = json.loads(raw)
+                self._local[market_id] = (self.clock() + self.ttl, entry)
+                return False, entry
+
+        self.counts["miss"] += 1
+        entry = await compute()
+        if entry is None:
+            return True, None
+        self._local[market_id] = (self.clock() + self.ttl, entry)
+        if redis is not None:
+            try:
+                await redis.set(_redis_key(market_id), json.dumps(entry), ex=self.ttl)
+            except Exception as exc:
+                logger.debug("Research pool write failed for %s: %s", market_id, exc)
+        return True, entry
+
+    def _local_get(self, market_id: str) -> dict | None:
+        entry = self._local.get(market_id)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._local[market_id]
+            return None
+        return value
+
+    def _for(self, persona: str, market_id: str, entry: dict) -> dict:
+        shared = dict(entry)
+        confidence = float(shared.get("confidence", 0))
+        if self.noise and confidence > 0:
+            confidence += persona_noise(persona, market_id, self.noise)
+            shared["confidence"] = round(min(0.99, max(0.01, confidence)), 4)
+        shared["pooled"] = True
+        return shared
+
+    async def invalidate(self, market_id: str) -> None:
+        """Forget the market's answer (it resolved or closed)."""
+        self._local.pop(market_id, None)
+        self.counts["invalidated"] += 1
+        redis = self.redis or await get_redis_client()
+        if redis is not None:
+            try:
+                await redis.delete(_redis_key(market_id))
+            except Exception as exc:
+                logger.debug("Research pool delete failed for %s: %s", market_id, exc)
+
+    async def discard(self, market_id: str, answer: str) -> None:
+        """Drop the pooled answer if it is ``answer``, which was judged wrong."""
+        entry = self._local_get(market_id)
+        if entry is None or str(entry.get("answer", "")).strip() == answer.strip():
+            await self.invalidate(market_id)
+
+    def stats(self) -> dict[str, Any]:
+        """Pool counters since start; ``reuse_rate`` is the share of answers not computed here."""
+        hits = self.counts["hit_local"] + self.counts["hit_redis"] + self.counts["hit_inflight"]
+        total = hits + self.counts["miss"]
+        return {
+            **{k: self.counts[k] for k in ("hit_local", "hit_redis", "hit_inflight", "miss", "invalidated")},
+            "reuse_rate": round(hits / total, 3) if total else 0.0,
+            "markets": len(self._local),
+        }
+
+
+_research_pool: ResearchAnswerPool | None = None
+
+
+def get_research_pool() -> ResearchAnswerPool:
+    """The process-wide pool used by bot_runner's research step."""
+    global _research_pool
+    if _research_pool is None:
+        _research_pool = ResearchAnswerPool()
+    return _research_pool
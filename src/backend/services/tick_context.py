@@ -0,0 +1,117 @@
+"""
+tick_context.py — Bulk read-side state for a batch of ticks.
+
+``execute_tick`` needs, per bot: the Bot row, the ledger balance, the idle
+streak and the OPEN markets it has not bet on yet. Loaded one bot at a time
+that is 6–8 reads per tick. The ticker instead loads the open-market board
+once per roster refresh and, for each batch of due bots, everything else in
+one aggregate query over ``bots``, ``ledger_heads`` and ``market_predictions``.
+Each tick gets an immutable ``TickContext`` and does no reads of its own
+before it writes.
+
+Balance and idle streak come from the ledger head (the same values
+``get_balance`` / ``get_idle_streak`` return). Appends still lock the head
+and chain from it, so a context that went stale between hydration and the
+write can misjudge a decision but never corrupt the ledger.
+
+Constitutional references:
+  - CLAUDE.md Invariant #3: Decimal Purity — balances stay Decimal
+  - lessons.md: All money through ledger
+"""
+
+import os
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Collection, Sequence
+
+from sqlalchemy import String, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Bot, LedgerHead, Market, MarketPrediction, MarketStatus
+from services.ledger_service import count_idle_streak, get_balance
+from services.market_service import get_open_market_board
+
+# Upper bound on the shared board. A bot sees the first markets on it that
+# it has not bet on, so this must comfortably exceed any bot's open bets + 10.
+TICK_BOARD_SIZE = int(os.environ.get("TICK_BOARD_SIZE", "200"))
+
+
+@dataclass(frozen=True)
+class TickContext:
+    """Read-only state for one bot's tick, as of hydration."""
+
+    bot_id: int
+    status: str
+    balance: Decimal            # ledger balance (authoritative)
+    cached_balance: Decimal     # Bot.balance cache, for reconciliation
+    idle_streak: int
+    bet_market_ids: frozenset[str]
+    board: tuple[dict, ...]     # shared across the batch — never mutate
+
+    def markets(self, limit: int = 10) -> list[dict]:
+        """OPEN markets not yet bet on, by deadline — as get_active_markets_for_agent."""
+        picked = [dict(m) for m in self.board if m["id"] not in self.bet_market_ids]
+        return picked[:limit]
+
+
+async def load_board(session: AsyncSession, *, size: int = TICK_BOARD_SIZE) -> tuple[dict, ...]:
+    """The open-market board shared by every context until the next refresh."""
+    return tuple(await get_open_market_board(session=session, limit=size))
+
+
+async def hydrate_tick_contexts(
+    session: AsyncSession,
+    *,
+    bot_ids: Collection[int],
+    board: Sequence[dict],
+) -> dict[int, TickContext]:
+    """Contexts for ``bot_ids`` in one query. Missing bots are left out.
+
+    Bots whose ledger has no head row yet (no entry appended since
+    ``ledger_heads`` existed) fall back to the per-bot reads.
+    """
+    if not bot_ids:
+        return {}
+    board = tuple(board)
+
+    open_bets = (
+        select(MarketPrediction.bot_id, MarketPrediction.market_id)
+        .join(Market, Market.id == MarketPrediction.market_id)
+        .where(Market.status == MarketStatus.OPEN, MarketPrediction.bot_id.in_(bot_ids))
+        .subquery()
+    )
+    rows = (await session.execute(
+        select(
+            Bot.id, Bot.status, Bot.balance,
+            LedgerHead.balance.label("head_balance"),
+            LedgerHead.idle_streak,
+            func.aggregate_strings(cast(open_bets.c.market_id, String), ",").label("bet_ids"),
+        )
+        .outerjoin(LedgerHead, LedgerHead.bot_id == Bot.id)
+        .outerjoin(open_bets, open_bets.c.bot_id == Bot.id)
+        .where(Bot.id.in_(bot_ids))
+        .group_by(Bot.id, Bot.status, Bot.balance, LedgerHead.balance, LedgerHead.idle_streak)
+    )).all()
+
+    contexts: dict[int, TickContext] = {}
+    for row in rows:
+        if row.head_balance is None:
+            balance = await get_balance(bot_id=row.id, session=session)
+            idle_streak = await count_idle_streak(row.id, session)
+        else:
+            balance = Decimal(str(row.head_balance))
+            idle_streak = row.idle_streak
+        contexts[row.id] = TickContext(
+            bot_id=row.id,
+            status=row.status,
+            balance=balance,
+            cached_balance=Decimal(str(row.balance)),
+            idle_streak=idle_streak,
+            # SQLite stores UUIDs as bare hex, Postgres casts with dashes
+            bet_market_ids=frozenset(
+                str(uuid.UUID(m)) for m in (row.bet_ids or "").split(",") if m
+            ),
+            board=board,
+        )
+    return contexts
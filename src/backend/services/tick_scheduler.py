@@ -0,0 +1,179 @@
+"""
+tick_scheduler.py — Deadline-driven tick scheduling for the ticker daemon.
+
+Every scheduled bot has a next-due time on a min-heap. The ticker pops the
+bots that are due, ticks them, and reschedules each one
+``interval_seconds`` after its previous deadline (± jitter) once its tick
+finishes, so a slow bot only delays itself and a bot is never in flight
+twice. Intervals come from the bot's ``persona_yaml``
+(``schedule.interval_seconds``, as in BotConfig).
+
+Lag — actual start minus scheduled start — is recorded per tick; a
+growing lag means the worker pool cannot keep up with the schedule.
+
+Constitutional references:
+  - CLAUDE.md Invariant #1: Inaction is costly — every bot keeps ticking
+  - CLAUDE.md Invariant #6: Continuous real-time, not turn-based
+"""
+
+import heapq
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import yaml
+
+TICK_JITTER = float(os.environ.get("TICK_JITTER", "0.1"))
+MIN_INTERVAL_SECONDS = 1.0
+
+
+def interval_from_persona(persona_yaml: Optional[str], default: float) -> float:
+    """``schedule.interval_seconds`` from a bot's persona YAML, else ``default``.
+
+    Plain-text personas and malformed values fall back to the default.
+    """
+    try:
+        data = yaml.safe_load(persona_yaml or "")
+        interval = float(data["schedule"]["interval_seconds"])
+    except (yaml.YAMLError, TypeError, KeyError, ValueError):
+        return default
+    return max(interval, MIN_INTERVAL_SECONDS)
+
+
+@dataclass
+class _Entry:
+    interval: float
+    due: Optional[float]  # None while the bot's tick is in flight
+
+
+class TickScheduler:
+    """Min-heap of (next_due, bot_id) with lazy deletion.
+
+    Times are on ``clock`` (monotonic seconds). Not thread-safe; the ticker
+    drives it from one event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        jitter: float = TICK_JITTER,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        self.jitter = jitter
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self._heap: list[tuple[float, int]] = []
+        self._entries: dict[int, _Entry] = {}
+        self._lags: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, bot_id: int) -> bool:
+        return bot_id in self._entries
+
+    def interval(self, bot_id: int) -> float:
+        return self._entries[bot_id].interval
+
+    def _push(self, bot_id: int, due: float) -> None:
+        self._entries[bot_id].due = due
+        heapq.heappush(self._heap, (due, bot_id))
+
+    def _jittered(self, interval: float) -> float:
+        return interval * (1 + self.rng.uniform(-self.jitter, self.jitter))
+
+    def add(self, bot_id: int, interval: float, *, first_due: Optional[float] = None) -> None:
+        """Schedule a new bot. Without ``first_due`` its first tick lands at a
+        random point within one interval, so a fresh roster does not burst."""
+        if bot_id in self._entries:
+            self._entries[bot_id].interval = interval
+            return
+        self._entries[bot_id] = _Entry(interval=interval, due=None)
+        if first_due is None:
+            first_due = self.clock() + self.rng.uniform(0, interval)
+        self._push(bot_id, first_due)
+
+    def remove(self, bot_id: int) -> None:
+        self._entries.pop(bot_id, None)  # heap slot is skipped when popped
+
+    def sync(self, intervals: dict[int, float], first_due: Optional[dict[int, float]] = None) -> tuple[int, int]:
+        """Make the schedule match ``intervals`` (bot_id -> seconds).
+
+        New bots are added (at ``first_due[bot_id]`` if given), known bots
+        pick up interval changes at their next reschedule, missing bots are
+        dropped. Returns ``(added, removed)``.
+        """
+        first_due = first_due or {}
+        removed = [b for b in self._entries if b not in intervals]
+        for bot_id in removed:
+            self.remove(bot_id)
+        added = 0
+        for bot_id, interval in intervals.items():
+            if bot_id not in self._entries:
+                added += 1
+            self.add(bot_id, interval, first_due=first_due.get(bot_id))
+        return added, len(removed)
+
+    def next_due(self) -> Optional[float]:
+        """Earliest pending deadline, or None if nothing is waiting."""
+        while self._heap:
+            due, bot_id = self._heap[0]
+            entry = self._entries.get(bot_id)
+            if entry is not None and entry.due == due:
+                return due
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: Optional[float] = None, limit: Optional[int] = None) -> list[tuple[int, float]]:
+        """Take up to ``limit`` bots whose deadline has passed, earliest first.
+
+        Returns ``(bot_id, scheduled)`` pairs; each bot stays out of the heap
+        until ``reschedule`` is called for it.
+        """
+        now = self.clock() if now is None else now
+        taken: list[tuple[int, float]] = []
+        while limit is None or len(taken) < limit:
+            due = self.next_due()
+            if due is None or due > now:
+                break
+            _, bot_id = heapq.heappop(self._heap)
+            self._entries[bot_id].due = None
+            taken.append((bot_id, due))
+        return taken
+
+    def record_lag(self, lag: float) -> None:
+        self._lags.append(max(lag, 0.0))
+
+    def reschedule(self, bot_id: int, scheduled: float) -> Optional[float]:
+        """Queue the bot's next tick one jittered interval after ``scheduled``.
+
+        A bot that overran its interval is due immediately but does not
+        accumulate a backlog. Returns the new deadline (None if the bot was
+        removed meanwhile).
+        """
+        entry = self._entries.get(bot_id)
+        if entry is None:
+            return None
+        due = max(scheduled + self._jittered(entry.interval), self.clock())
+        self._push(bot_id, due)
+        return due
+
+    def pending(self, now: Optional[float] = None) -> int:
+        """Bots already past their deadline but not started (backlog)."""
+        now = self.clock() if now is None else now
+        return sum(1 for e in self._entries.values() if e.due is not None and e.due <= now)
+
+    def lag_report(self) -> dict[str, float]:
+        """Lag stats since the previous report, then reset."""
+        lags = sorted(self._lags)
+        self._lags = []
+        if not lags:
+            return {"ticks": 0, "lag_p50_s": 0.0, "lag_max_s": 0.0}
+        return {
+            "ticks": len(lags),
+            "lag_p50_s": round(lags[len(lags) // 2], 3),
+            "lag_max_s": round(lags[-1], 3),
+        }
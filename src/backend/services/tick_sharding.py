@@ -0,0 +1,254 @@
+"""
+tick_sharding.py — Split the ticker's bot set across worker processes.
+
+Bots map to ``shard_count`` shards by consistent hashing on bot_id (a hash
+ring with virtual nodes, so changing the shard count moves ~1/n of bots).
+Workers own shards through Redis leases:
+
+  ticker:workers         ZSET  worker_id -> heartbeat expiry (unix time)
+  ticker:lease:{shard}   STR   owning worker_id, PX = lease TTL
+  ticker:bot:{bot_id}    STR   worker_id while that bot's tick is in flight
+  ticker:status          HASH  shard:{n} / worker:{id} -> JSON status
+
+Each shard's preferred owner is picked by rendezvous hashing over the live
+workers. A worker claims the shards it prefers, renews what it holds, and
+hands off shards that now prefer someone else once none of their bots
+has a tick in flight. When a worker dies its heartbeat and leases lapse
+after one TTL and the survivors claim its shards on their next keepalive.
+
+No bot is ever ticked twice at once: a worker only starts a tick while its
+shard lease is locally valid, and holds the per-bot key for the duration.
+
+Constitutional references:
+  - CLAUDE.md Invariant #6: Continuous real-time, not turn-based
+  - lessons.md Rule #2: Fail fast on missing config
+"""
+
+import asyncio
+import bisect
+import hashlib
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Collection, Sequence
+
+logger = logging.getLogger("tick_sharding")
+
+TICK_SHARD_COUNT = int(os.environ.get("TICK_SHARD_COUNT", "1"))
+TICK_LEASE_TTL = float(os.environ.get("TICK_LEASE_TTL", "10"))
+RING_VNODES = 64
+
+WORKERS_KEY = "ticker:workers"
+STATUS_KEY = "ticker:status"
+
+# Compare-and-set on the owner so a worker never extends or deletes a
+# lease that has already passed to someone else.
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.sha1(value.encode()).digest()[:8], "big")
+
+
+def lease_key(shard: int) -> str:
+    return f"ticker:lease:{shard}"
+
+
+def bot_lock_key(bot_id: int) -> str:
+    return f"ticker:bot:{bot_id}"
+
+
+class ShardRing:
+    """Consistent-hash ring mapping bot ids onto ``shard_count`` shards."""
+
+    def __init__(self, shard_count: int, vnodes: int = RING_VNODES):
+        if shard_count < 1:
+            raise ValueError("shard_count must be >= 1")
+        self.shard_count = shard_count
+        points = sorted(
+            (_hash64(f"shard:{shard}:{v}"), shard)
+            for shard in range(shard_count)
+            for v in range(vnodes)
+        )
+        self._keys = [p for p, _ in points]
+        self._shards = [s for _, s in points]
+
+    def shard_for(self, bot_id: int) -> int:
+        idx = bisect.bisect(self._keys, _hash64(f"bot:{bot_id}")) % len(self._keys)
+        return self._shards[idx]
+
+
+def preferred_owner(shard: int, workers: Sequence[str]) -> str:
+    """Rendezvous (highest-random-weight) choice of one worker for ``shard``."""
+    return max(workers, key=lambda w: _hash64(f"{w}:{shard}"))
+
+
+class ShardCoordinator:
+    """One ticker worker's view of shard ownership, backed by Redis leases."""
+
+    def __init__(
+        self,
+        redis,
+        *,
+        worker_id: str,
+        shard_count: int = TICK_SHARD_COUNT,
+        lease_ttl: float = TICK_LEASE_TTL,
+    ):
+        self.redis = redis
+        self.worker_id = worker_id
+        self.ring = ShardRing(shard_count)
+        self.lease_ttl = lease_ttl
+        self._leases: dict[int, float] = {}   # shard -> local monotonic expiry
+        self._bot_locks: set[int] = set()
+
+    @property
+    def shard_count(self) -> int:
+        return self.ring.shard_count
+
+    @property
+    def _ttl_ms(self) -> int:
+        return int(self.lease_ttl * 1000)
+
+    def owns(self, shard: int) -> bool:
+        """True while the lease on ``shard`` is valid with a safety margin."""
+        expiry = self._leases.get(shard)
+        return expiry is not None and expiry - time.monotonic() > self.lease_ttl * 0.25
+
+    @property
+    def owned_shards(self) -> list[int]:
+        return sorted(s for s in self._leases if self.owns(s))
+
+    def owns_bot(self, bot_id: int) -> bool:
+        return self.owns(self.ring.shard_for(bot_id))
+
+    async def _live_workers(self) -> list[str]:
+        now = time.time()
+        await self.redis.zadd(WORKERS_KEY, {self.worker_id: now + self.lease_ttl})
+        await self.redis.zremrangebyscore(WORKERS_KEY, "-inf", now)
+        workers = list(await self.redis.zrangebyscore(WORKERS_KEY, now, "+inf"))
+        if self.worker_id not in workers:
+            workers.append(self.worker_id)
+        return workers
+
+    async def _hold(self, shard: int) -> bool:
+        """Claim ``shard`` if free, or renew it if already ours."""
+        started = time.monotonic()
+        if shard in self._leases:
+            ok = await self.redis.eval(_RENEW_SCRIPT, 1, lease_key(shard), self.worker_id, self._ttl_ms)
+        else:
+            ok = await self.redis.set(lease_key(shard), self.worker_id, nx=True, px=self._ttl_ms)
+        if ok:
+            if shard not in self._leases:
+                logger.info("Worker %s acquired shard %d", self.worker_id, shard)
+            self._leases[shard] = started + self.lease_ttl
+            return True
+        if self._leases.pop(shard, None) is not None:
+            logger.warning("Worker %s lost shard %d", self.worker_id, shard)
+        return False
+
+    async def _release(self, shard: int) -> None:
+        self._leases.pop(shard, None)
+        await self.redis.eval(_RELEASE_SCRIPT, 1, lease_key(shard), self.worker_id)
+        logger.info("Worker %s released shard %d", self.worker_id, shard)
+
+    async def refresh(self, *, handoff: bool = False, busy: Collection[int] = ()) -> list[int]:
+        """Heartbeat, renew held leases and claim preferred free shards.
+
+        With ``handoff``, held shards that now prefer another live worker
+        are released — except those in ``busy`` (shards with a tick in
+        flight), which are kept until a later refresh. Returns the shards
+        owned afterwards.
+        """
+        workers = await self._live_workers()
+        for shard in range(self.shard_count):
+            mine = preferred_owner(shard, workers) == self.worker_id
+            if shard in self._leases and not mine and handoff and shard not in busy:
+                await self._release(shard)
+            elif mine or shard in self._leases:
+                await self._hold(shard)
+        for bot_id in list(self._bot_locks):
+            await self.redis.eval(_RENEW_SCRIPT, 1, bot_lock_key(bot_id), self.worker_id, self._ttl_ms)
+        return self.owned_shards
+
+    async def keepalive(self) -> None:
+        """Refresh every third of a TTL until cancelled. Errors let leases lapse."""
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            try:
+                await self.refresh()
+            except Exception as exc:
+                logger.warning("Worker %s lease refresh failed: %s", self.worker_id, exc)
+
+    @asynccontextmanager
+    async def bot_lock(self, bot_id: int) -> AsyncIterator[bool]:
+        """Hold ``bot_id``'s tick key; yields False if it is owned elsewhere."""
+        acquired = bool(await self.redis.set(
+            bot_lock_key(bot_id), self.worker_id, nx=True, px=self._ttl_ms,
+        ))
+        if acquired:
+            self._bot_locks.add(bot_id)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self._bot_locks.discard(bot_id)
+                await self.redis.eval(_RELEASE_SCRIPT, 1, bot_lock_key(bot_id), self.worker_id)
+
+    async def publish_status(
+        self,
+        *,
+        bots: dict[int, int],
+        ticked: dict[int, int],
+        window_s: float,
+        schedule: dict[str, Any],
+    ) -> None:
+        """Write this worker's shard assignments and per-shard tick rates.
+
+        ``ticked`` counts ticks per shard over the last ``window_s``
+        seconds; ``cycles_per_min`` is how often the average bot in the
+        shard ticked. ``schedule`` (lag, backlog) is stored on the worker.
+        """
+        stamp = datetime.now(timezone.utc).isoformat()
+        owned = self.owned_shards
+        fields: dict[str, str] = {}
+        for shard in owned:
+            per_min = ticked.get(shard, 0) * 60.0 / window_s if window_s > 0 else 0.0
+            fields[f"shard:{shard}"] = json.dumps({
+                "worker": self.worker_id,
+                "bots": bots.get(shard, 0),
+                "ticked": ticked.get(shard, 0),
+                "window_s": round(window_s, 3),
+                "ticks_per_min": round(per_min, 2),
+                "cycles_per_min": round(per_min / bots[shard], 3) if bots.get(shard) else 0.0,
+                "updated_at": stamp,
+            })
+        fields[f"worker:{self.worker_id}"] = json.dumps({
+            "shards": owned, "shard_count": self.shard_count, **schedule, "updated_at": stamp,
+        })
+        await self.redis.hset(STATUS_KEY, mapping=fields)
+
+    async def close(self) -> None:
+        """Release every lease and leave the worker set so peers take over now."""
+        for shard in list(self._leases):
+            await self._release(shard)
+        await self.redis.zrem(WORKERS_KEY, self.worker_id)
+
+
+async def read_status(redis) -> dict[str, Any]:
+    """Decoded ``ticker:status`` hash, keyed by ``shard:{n}`` / ``worker:{id}``."""
+    raw = await redis.hgetall(STATUS_KEY)
+    return {k: json.loads(v) for k, v in sorted(raw.items())}
@@ -0,0 +1,181 @@
+"""
+wiki_cache.py — Shared title → article cache for research lookups.
+
+Every bot attacking the same RESEARCH market looks up the same title. The
+cache answers repeats from two tiers:
+
+  1. an in-process LRU (WIKI_CACHE_SIZE entries)
+  2. Redis, shared by every ticker worker:
+
+       wiki:title:{normalized title}   STR  JSON lookup, or "null" for a
+                                            page that does not exist
+
+A title's pageid almost never changes, so hits live WIKI_CACHE_TTL seconds;
+misses (the page does not exist) are cached for the shorter
+WIKI_NEGATIVE_TTL so a newly created article is picked up. Failed lookups
+(timeouts, rate limits) are never cached.
+
+Concurrent misses on one title share a single fetch (single-flight): the
+first caller loads it and every other caller awaits that result, so a
+fleet pays one network call per article rather than one per bot.
+
+Redis is best-effort: if it is unavailable the LRU still works.
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: External Truth — all data from verifiable APIs
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable
+
+from thread_memory import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+WIKI_CACHE_SIZE = int(os.environ.get("WIKI_CACHE_SIZE", "2048"))
+WIKI_CACHE_TTL = int(os.environ.get("WIKI_CACHE_TTL", "86400"))
+WIKI_NEGATIVE_TTL = int(os.environ.get("WIKI_NEGATIVE_TTL", "600"))
+
+_MISS = object()
+
+Loader = Callable[[str], Awaitable[dict | None]]
+
+
+def normalize_title(title: str) -> str:
+    """The title as MediaWiki stores it: spaces not underscores, first letter capitalized."""
+    title = re.sub(r"[\s_]+", " ", title).strip()
+    return title[:1].upper() + title[1:]
+
+
+def _redis_key(key: str) -> str:
+    return f"wiki:title:{key}"
+
+
+class WikiTitleCache:
+    """Two-tier (LRU + Redis) cache of title lookups with single-flight loads."""
+
+    def __init__(
+        self,
+        *,
+        redis=None,
+        size: int = WIKI_CACHE_SIZE,
+        ttl: int = WIKI_CACHE_TTL,
+        negative_ttl: int = WIKI_NEGATIVE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.redis = redis   # None: use the shared client (thread_memory)
+        self.size = size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self._local: OrderedDict[str, tuple[float, dict | None]] = OrderedDict()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.counts: Counter = Counter()
+
+    async def get(self, title: str, load: Loader) -> dict | None:
+        """The lookup for ``title``, from cache or by awaiting ``load(title)``.
+
+        Returns None both for a page that does not exist and for a failed
+        load; only the former is cached.
+        """
+        key = normalize_title(title)
+        value = self._local_get(key)
+        if value is not _MISS:
+            self.counts["hit_local"] += 1
+            return value
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._inflight = loop, {}
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = loop.create_task(self._fill(key, title, load))
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.counts["hit_inflight"] += 1
+        # shield: a caller giving up must not cancel the fetch the others await
+        return await asyncio.shield(flight)
+
+    async def _fill(self, key: str, title: str, load: Loader) -> dict | None:
+        redis = self.redis or await get_redis_client()
+        if redis is not None:
+            try:
+                raw = await redis.get(_redis_key(key))
+            except Exception as exc:
+                logger.debug("Wiki cache read failed for '%s': %s", key, exc)
+                raw = None
+            if raw is not None:
+                value = json.loads(raw)
+                self.counts["hit_redis"] += 1
+                self._local_put(key, value)
+                return value
+
+        self.counts["miss"] += 1
+        try:
+            value = await load(title)
+        except Exception as exc:
+            self.counts["error"] += 1
+            logger.warning("Wikipedia lookup failed for '%s' (not cached): %s", title, exc)
+            return None
+
+        if value is None:
+            self.counts["negative"] += 1
+        self._local_put(key, value)
+        if redis is not None:
+            try:
+                await redis.set(
+                    _redis_key(key), json.dumps(value),
+                    ex=self.ttl if value is not None else self.negative_ttl,
+                )
+            except Exception as exc:
+                logger.debug("Wiki cache write failed for '%s': %s", key, exc)
+        return value
+
+    def _local_get(self, key: str) -> Any:
+        entry = self._local.get(key)
+        if entry is None:
+            return _MISS
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._local[key]
+            return _MISS
+        self._local.move_to_end(key)
+        return value
+
+    def _local_put(self, key: str, value: dict | None) -> None:
+        ttl = self.ttl if value is not None else self.negative_ttl
+        self._local[key] = (self.clock() + ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.size:
+            self._local.popitem(last=False)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters since start; ``hit_rate`` counts every tier."""
+        hits = self.counts["hit_local"] + self.counts["hit_redis"] + self.counts["hit_inflight"]
+        total = hits + self.counts["miss"]
+        return {
+            **{k: self.counts[k] for k in (
+                "hit_local", "hit_redis", "hit_inflight", "miss", "negative", "error",
+            )},
+            "hit_rate": round(hits / total, 3) if total else 0.0,
+            "entries": len(self._local),
+        }
+
+
+_title_cache: WikiTitleCache | None = None
+
+
+def get_title_cache() -> WikiTitleCache:
+    """The process-wide cache behind AsyncFeedIngestor.resolve_title."""
+    global _title_cache
+    if _title_cache is None:
+        _title_cache = WikiTitleCache()
+    return _title_cache
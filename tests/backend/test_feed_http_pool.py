@@ -0,0 +1,84 @@
+"""Tests for the shared feed HTTP pool.
+
+Proves:
+  1. Every ingestor in a process reuses one httpx client
+  2. Requests per host are capped; the excess queue and are counted
+  3. Pool stats report requests per host, and closing the pool closes the client
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: External Truth — all data from verifiable APIs
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from services.feed_ingestor import AsyncFeedIngestor, FeedHttpPool
+
+_RealClient = httpx.AsyncClient
+
+
+def _mock_clients(handler):
+    """Patch client construction to route through ``handler``; returns the created clients."""
+    created = []
+
+    def factory(**kwargs):
+        client = _RealClient(transport=httpx.MockTransport(handler), timeout=kwargs["timeout"])
+        created.append(client)
+        return client
+
+    return patch("services.feed_ingestor.httpx.AsyncClient", side_effect=factory), created
+
+
+def _weather(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"current_weather": {"temperature": 12.5}})
+
+
+class TestFeedHttpPool:
+    @pytest.mark.asyncio
+    async def test_ingestors_share_one_client(self):
+        pool = FeedHttpPool()
+        patcher, created = _mock_clients(_weather)
+        with patcher:
+            for _ in range(3):
+                assert (await AsyncFeedIngestor(pool).fetch_weather(51.5, -0.1))["temperature_c"] == 12.5
+        assert len(created) == 1
+        stats = pool.stats()
+        assert stats["requests"] == 3 and stats["in_flight"] == 0
+        assert stats["hosts"] == {"api.open-meteo.com": {"requests": 3, "waited": 0, "in_flight": 0}}
+        await pool.aclose()
+        assert created[0].is_closed
+
+    @pytest.mark.asyncio
+    async def test_per_host_cap(self):
+        running = peak = 0
+
+        async def slow(request: httpx.Request) -> httpx.Response:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return _weather(request)
+
+        pool = FeedHttpPool(per_host=2)
+        patcher, _ = _mock_clients(slow)
+        with patcher:
+            ingestor = AsyncFeedIngestor(pool)
+            results = await asyncio.gather(*(ingestor.fetch_weather(0, 0) for _ in range(5)))
+        assert all(r is not None for r in results)
+        assert peak == 2
+        assert pool.stats()["waited"] == 3
+        await pool.aclose()
+
+    def test_http2_falls_back_without_h2(self):
+        with patch("services.feed_ingestor.importlib.util.find_spec", return_value=None):
+            assert FeedHttpPool(http2=True).http2 is False
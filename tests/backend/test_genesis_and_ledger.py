@@ -213,3 +213,225 @@ class TestLedgerChainIntegrity:
         assert entry_a.sequence == 1
         assert entry_b.sequence == 1
         assert entry_a.hash != entry_b.hash  # Different bots, different hashes
+
+
+class TestLedgerHead:
+    @pytest.mark.asyncio
+    async def test_head_tracks_chain_tip(self, session):
+        """ledger_heads mirrors the last entry's hash, sequence and running sum."""
+        from decimal import Decimal
+        from models import LedgerHead
+
+        bot, _, _ = await _create_bot(session, balance=100.0)
+        last = None
+        for i in range(3):
+            last = await append_ledger_entry(
+                bot_id=bot.id,
+                amount=Decimal("-2.50"),
+                transaction_type="HEARTBEAT",
+                reference_id=f"TICK_{i}",
+                session=session,
+            )
+        await session.commit()
+
+        head = await session.get(LedgerHead, bot.id)
+        assert head.last_hash == last.hash
+        assert head.last_sequence == 4
+        assert Decimal(str(head.balance)) == Decimal("92.50")
+
+    @pytest.mark.asyncio
+    async def test_head_bootstraps_from_existing_ledger(self, session):
+        """A bot whose ledger predates ledger_heads continues its chain correctly."""
+        from sqlalchemy import delete
+        from models import LedgerHead
+
+        bot, grant, _ = await _create_bot(session)
+        await session.execute(delete(LedgerHead).where(LedgerHead.bot_id == bot.id))
+        await session.commit()
+        session.expunge_all()
+
+        entry = await append_ledger_entry(
+            bot_id=bot.id,
+            amount=-1.0,
+            transaction_type="WAGER",
+            reference_id="AFTER_MIGRATION",
+            session=session,
+        )
+        await session.commit()
+
+        assert entry.previous_hash == grant.hash
+        assert entry.sequence == 2
+        head = await session.get(LedgerHead, bot.id)
+        assert head.last_sequence == 2
+
+
+class TestBatchedAppend:
+    @pytest.mark.asyncio
+    async def test_append_ledger_entries_chains_in_order(self, session):
+        """A batch continues the chain from the tip and links each entry to the last."""
+        from services.ledger_service import append_ledger_entries
+
+        bot, grant, _ = await _create_bot(session)
+        entries = await append_ledger_entries(
+            bot_id=bot.id,
+            entries=[
+                {"amount": -1.0, "transaction_type": "MARKET_STAKE", "reference_id": "T:1"},
+                {"amount": -0.5, "transaction_type": "RESEARCH_LOOKUP_FEE", "reference_id": "T:2"},
+                {"amount": 26.0, "transaction_type": "RESEARCH_PAYOUT", "reference_id": "T:3"},
+            ],
+            session=session,
+        )
+        await session.commit()
+
+        assert [e.sequence for e in entries] == [2, 3, 4]
+        assert entries[0].previous_hash == grant.hash
+        assert entries[1].previous_hash == entries[0].hash
+        assert entries[2].previous_hash == entries[1].hash
+
+    @pytest.mark.asyncio
+    async def test_ledger_batch_tracks_pending_and_flushes(self, session):
+        """LedgerBatch queues without writing until flush()."""
+        from decimal import Decimal
+        from sqlalchemy import select, func
+        from services.ledger_service import LedgerBatch, get_balance
+
+        bot, _, _ = await _create_bot(session, balance=100.0)
+        batch = LedgerBatch(bot.id)
+        batch.add(amount=Decimal("-3.00"), transaction_type="MARKET_STAKE", reference_id="T:1")
+        batch.add(amount=Decimal("-2.00"), transaction_type="HEARTBEAT", reference_id="T:2")
+
+        assert batch.pending_total == Decimal("-5.00")
+        count = await session.execute(select(func.count(Ledger.id)).where(Ledger.bot_id == bot.id))
+        assert count.scalar() == 1
+
+        written = await batch.flush(session)
+        await session.commit()
+
+        assert len(written) == 2
+        assert len(batch) == 0
+        assert await get_balance(bot_id=bot.id, session=session) == Decimal("95.00")
+
+
+class TestRunningBalance:
+    @pytest.mark.asyncio
+    async def test_balance_after_recorded_and_hashed(self, session):
+        """Each entry stores its running balance, and the stored row re-hashes."""
+        from decimal import Decimal
+        from services.ledger_service import compute_ledger_hash
+
+        bot, grant, _ = await _create_bot(session, balance=100.0)
+        wager = await append_ledger_entry(
+            bot_id=bot.id,
+            amount=-12.5,
+            transaction_type="WAGER",
+            reference_id="W:1",
+            session=session,
+        )
+        await session.commit()
+
+        assert Decimal(str(grant.balance_after)) == Decimal("100")
+        assert Decimal(str(wager.balance_after)) == Decimal("87.5")
+        assert wager.hash == compute_ledger_hash(
+            bot_id=bot.id,
+            amount=wager.amount,
+            transaction_type=wager.transaction_type,
+            reference_id=wager.reference_id,
+            timestamp=wager.timestamp,
+            previous_hash=wager.previous_hash,
+            sequence=wager.sequence,
+            balance_after=wager.balance_after,
+        )
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_written_at_interval(self, session, monkeypatch):
+        """A checkpoint pins (sequence, hash, balance) every N entries."""
+        from decimal import Decimal
+        from sqlalchemy import select
+        from models import LedgerCheckpoint
+        from services import ledger_service
+
+        monkeypatch.setattr(ledger_service, "LEDGER_CHECKPOINT_INTERVAL", 2)
+        bot, _, _ = await _create_bot(session, balance=10.0)
+        entries = await ledger_service.append_ledger_entries(
+            bot_id=bot.id,
+            entries=[
+                {"amount": -1.0, "transaction_type": "HEARTBEAT", "reference_id": f"T:{i}"}
+                for i in range(3)
+            ],
+            session=session,
+        )
+        await session.commit()
+
+        checkpoints = (await session.execute(
+            select(LedgerCheckpoint).where(LedgerCheckpoint.bot_id == bot.id)
+            .order_by(LedgerCheckpoint.sequence)
+        )).scalars().all()
+        assert [c.sequence for c in checkpoints] == [2, 4]
+        assert checkpoints[-1].hash == entries[2].hash
+        assert Decimal(str(checkpoints[-1].balance)) == Decimal("7")
+
+        ok, head_balance, summed = await ledger_service.verify_balance(bot_id=bot.id, session=session)
+        assert ok and head_balance == summed == Decimal("7")
+
+
+class TestIdleStreak:
+    @pytest.mark.asyncio
+    async def test_streak_advances_and_resets_on_append(self, session):
+        """The head counts trailing HEARTBEATs past the old 100-row window."""
+        from services.ledger_service import append_ledger_entries, get_idle_streak
+
+        bot, _, _ = await _create_bot(session, balance=1000.0)
+        assert await get_idle_streak(bot_id=bot.id, session=session) == 0
+
+        await append_ledger_entries(
+            bot_id=bot.id,
+            entries=[
+                {"amount": -0.01, "transaction_type": "HEARTBEAT", "reference_id": f"T:{i}"}
+                for i in range(150)
+            ],
+            session=session,
+        )
+        await session.commit()
+        assert await get_idle_streak(bot_id=bot.id, session=session) == 150
+
+        await append_ledger_entries(
+            bot_id=bot.id,
+            entries=[
+                {"amount": -1.0, "transaction_type": "WAGER", "reference_id": "W:1"},
+                {"amount": -0.01, "transaction_type": "HEARTBEAT", "reference_id": "T:after"},
+            ],
+            session=session,
+        )
+        await session.commit()
+        assert await get_idle_streak(bot_id=bot.id, session=session) == 1
+
+    @pytest.mark.asyncio
+    async def test_streak_rebuilds_from_ledger(self, session):
+        """A drifted or missing head streak is recounted from the ledger."""
+        from sqlalchemy import delete
+        from models import LedgerHead
+        from services.ledger_service import (
+            append_ledger_entries, get_idle_streak, rebuild_idle_streak,
+        )
+
+        bot, _, _ = await _create_bot(session, balance=100.0)
+        await append_ledger_entries(
+            bot_id=bot.id,
+            entries=[
+                {"amount": -1.0, "transaction_type": "HEARTBEAT", "reference_id": f"T:{i}"}
+                for i in range(3)
+            ],
+            session=session,
+        )
+        head = await session.get(LedgerHead, bot.id)
+        head.idle_streak = 42
+        await session.commit()
+
+        assert await rebuild_idle_streak(bot_id=bot.id, session=session) == (42, 3)
+        await session.commit()
+        assert await get_idle_streak(bot_id=bot.id, session=session) == 3
+
+        await session.execute(delete(LedgerHead).where(LedgerHead.bot_id == bot.id))
+        await session.commit()
+        session.expunge_all()
+        assert await get_idle_streak(bot_id=bot.id, session=session) == 3
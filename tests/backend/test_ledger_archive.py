@@ -0,0 +1,246 @@
+"""Tests for cold-segment ledger archival.
+
+Proves:
+  1. Sealed history moves to a segment file and reads back identically
+  2. Balance and chain appends are unaffected by archival
+  3. Incremental and full verification span the archived/live seam
+  4. A modified segment file is detected
+  5. Merkle proofs still resolve for archived entries
+  6. Un-anchored history is not archived, nor history whose epoch gained
+     an entry after it was sealed
+  7. A segment never exceeds max_rows; longer history is split across runs
+  8. Lookups by ledger id inflate only the id column of other bots' segments
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
+  - lessons.md Rule #3: Test fixtures must guarantee isolation
+"""
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from sqlalchemy import func, select
+
+from models import Bot, Ledger
+from services import ledger_archive, ledger_service
+from services.ledger_service import append_ledger_entries, get_balance
+from services.ledger_verifier import verify_bot_chain
+from services.merkle_service import anchor_epochs, get_inclusion_proof, reseal_epoch, verify_inclusion
+
+
+@pytest.fixture
+async def session():
+    """Create an isolated async SQLite session for testing."""
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from models import Base
+
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as s:
+        yield s
+
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def archive_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ledger_archive, "ARCHIVE_DIR", tmp_path)
+    monkeypatch.setattr(ledger_service, "LEDGER_CHECKPOINT_INTERVAL", 5)
+    return tmp_path
+
+
+async def _append(session, bot_id: int, count: int, start: int = 0):
+    entries = await append_ledger_entries(
+        bot_id=bot_id,
+        entries=[
+            {"amount": Decimal("-1"), "transaction_type": "HEARTBEAT", "reference_id": f"T:{start + i}"}
+            for i in range(count)
+        ],
+        session=session,
+    )
+    await session.commit()
+    return entries
+
+
+async def _sealed_bot(session, count: int = 7, anchor: bool = True) -> tuple[Bot, list]:
+    """Bot with ``count`` entries, verified (and anchored) up to the tip."""
+    bot = Bot(handle="ColdBot", persona_yaml="p", balance=Decimal("100"), status="ALIVE")
+    session.add(bot)
+    await session.flush()
+    entries = await append_ledger_entries(
+        bot_id=bot.id,
+        entries=[{"amount": Decimal("100"), "transaction_type": "GRANT", "reference_id": "G"}],
+        session=session,
+    )
+    entries += await _append(session, bot.id, count - 1)
+    await verify_bot_chain(bot_id=bot.id, session=session)
+    if anchor:
+        await anchor_epochs(session)
+    await session.commit()
+    return bot, entries
+
+
+async def _live_count(session, bot_id: int) -> int:
+    return await session.scalar(select(func.count(Ledger.id)).where(Ledger.bot_id == bot_id))
+
+
+class TestArchival:
+    @pytest.mark.asyncio
+    async def test_sealed_range_moves_to_segment(self, session, archive_dir):
+        bot, entries = await _sealed_bot(session)
+
+        segment = await ledger_archive.archive_bot(bot.id, session, min_rows=1)
+        await session.commit()
+
+        assert (segment.first_sequence, segment.last_sequence) == (1, 5)
+        assert segment.last_hash == entries[4].hash
+        assert await _live_count(session, bot.id) == 2
+        archived = ledger_archive.read_segment(segment)
+        assert [e.hash for e in archived] == [e.hash for e in entries[:5]]
+        assert archived[3].amount == Decimal("-1")
+        assert (archive_dir / segment.path).exists()
+
+        assert await get_balance(bot_id=bot.id, session=session) == Decimal("94")
+        # The idle run reaches back into the segment (GRANT is sequence 1).
+        assert await ledger_service.count_idle_streak(bot.id, session) == 6
+        [nxt] = await _append(session, bot.id, 1, start=100)
+        assert nxt.sequence == 8 and nxt.previous_hash == entries[-1].hash
+
+    @pytest.mark.asyncio
+    async def test_verification_spans_archive_seam(self, session):
+        bot, _ = await _sealed_bot(session)
+        await ledger_archive.archive_bot(bot.id, session, min_rows=1)
+        await session.commit()
+        await _append(session, bot.id, 2, start=100)
+
+        incremental = await verify_bot_chain(bot_id=bot.id, session=session)
+        assert incremental["ok"], incremental["errors"]
+        full = await verify_bot_chain(bot_id=bot.id, session=session, full=True)
+        assert full["ok"], full["errors"]
+        assert (full["rows"], full["sequence"]) == (9, 9)
+
+    @pytest.mark.asyncio
+    async def test_modified_segment_detected(self, session, archive_dir):
+        bot, _ = await _sealed_bot(session)
+        segment = await ledger_archive.archive_bot(bot.id, session, min_rows=1)
+        await session.commit()
+
+        path = archive_dir / segment.path
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        full = await verify_bot_chain(bot_id=bot.id, session=session, full=True)
+        assert not full["ok"]
+        assert any("SHA256" in e for e in full["errors"])
+
+    @pytest.mark.asyncio
+    async def test_proof_for_archived_entry(self, session):
+        bot, entries = await _sealed_bot(session)
+        await ledger_archive.archive_bot(bot.id, session, min_rows=1)
+        await session.commit()
+
+        proof = await get_inclusion_proof(entries[2].id, session)
+        assert proof["bot_id"] == bot.id
+        assert proof["entry_hash"] == entries[2].hash
+        assert verify_inclusion(proof["entry_hash"], proof["proof"], proof["epoch"]["merkle_root"])
+
+    @pytest.mark.asyncio
+    async def test_unanchored_history_stays_live(self, session):
+        bot, _ = await _sealed_bot(session, anchor=False)
+        assert await ledger_archive.archive_bot(bot.id, session, min_rows=1) is None
+        assert await _live_count(session, bot.id) == 7
+
+    @pytest.mark.asyncio
+    async def test_orphan_in_sealed_epoch_stays_live(self, session):
+        from sqlalchemy.orm import make_transient
+
+        bot = Bot(handle="OrphanBot", persona_yaml="p", balance=Decimal("100"), status="ALIVE")
+        session.add(bot)
+        await session.flush()
+        entries = await append_ledger_entries(
+            bot_id=bot.id,
+            entries=[{"amount": Decimal("100"), "transaction_type": "GRANT", "reference_id": "G"}],
+            session=session,
+        )
+        entries += await _append(session, bot.id, 6)
+        await verify_bot_chain(bot_id=bot.id, session=session)
+
+        # Entry 3 committed after its window was sealed (pre-watermark epoch)
+        late = entries[2]
+        await session.delete(late)
+        await session.commit()
+        [epoch] = await anchor_epochs(session)
+        await session.commit()
+        make_transient(late)
+        session.add(late)
+        await session.commit()
+
+        assert await ledger_archive.archive_bot(bot.id, session, min_rows=1) is None
+        assert await _live_count(session, bot.id) == 7
+
+        await reseal_epoch(epoch.id, session)
+        await session.commit()
+        segment = await ledger_archive.archive_bot(bot.id, session, min_rows=1)
+        assert segment is not None and segment.row_count == 5
+
+    @pytest.mark.asyncio
+    async def test_segment_size_is_bounded(self, session):
+        bot, entries = await _sealed_bot(session, count=12)
+
+        first = await ledger_archive.archive_bot(bot.id, session, min_rows=1, max_rows=7)
+        await session.commit()
+        assert (first.first_sequence, first.last_sequence, first.row_count) == (1, 5, 5)
+
+        second = await ledger_archive.archive_bot(bot.id, session, min_rows=1, max_rows=7)
+        await session.commit()
+        assert (second.first_sequence, second.last_sequence) == (6, 10)
+        assert second.previous_hash == first.last_hash == entries[4].hash
+        assert await _live_count(session, bot.id) == 2
+
+        full = await verify_bot_chain(bot_id=bot.id, session=session, full=True)
+        assert full["ok"], full["errors"]
+
+    @pytest.mark.asyncio
+    async def test_id_lookup_skips_other_bots_segments(self, session, archive_dir, monkeypatch):
+        bots = [Bot(handle=f"Cold{i}", persona_yaml="p", balance=Decimal("100"), status="ALIVE") for i in range(2)]
+        session.add_all(bots)
+        await session.flush()
+        # Interleave appends so both bots' segments span the same id range
+        entries = {bot.id: [] for bot in bots}
+        for i in range(5):
+            for bot in bots:
+                entries[bot.id] += await _append(session, bot.id, 1, start=i)
+        for bot in bots:
+            await verify_bot_chain(bot_id=bot.id, session=session)
+        await anchor_epochs(session)
+        segments = {bot.id: await ledger_archive.archive_bot(bot.id, session, min_rows=1) for bot in bots}
+        await session.commit()
+
+        inflated = []
+        column = ledger_archive.SegmentReader.column
+
+        def recording(reader, field):
+            inflated.append((reader.path.name, field))
+            return column(reader, field)
+
+        monkeypatch.setattr(ledger_archive.SegmentReader, "column", recording)
+        target = entries[bots[0].id][2]
+        segment, entry = await ledger_archive.find_archived_entry(session, ledger_id=target.id)
+
+        assert segment.bot_id == bots[0].id and entry.hash == target.hash
+        other = segments[bots[1].id].path.rsplit("/", 1)[-1]
+        assert [f for name, f in inflated if name == other] in ([], ["id"])
+
+        hashes = await ledger_archive.archived_hashes_in_id_range(session, target.id, target.id)
+        assert hashes == [(target.id, target.hash)]
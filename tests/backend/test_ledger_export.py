@@ -0,0 +1,203 @@
+"""Tests for the streaming ledger export.
+
+Proves:
+  1. Keyset pages return every entry once, in sequence order
+  2. after / type / since / until / limit filters apply
+  3. Archived segments and live rows stream as one history
+  4. GET /bots/{id}/ledger returns NDJSON and 404s for unknown bots
+  5. An archive run between segment listing and live pages loses no
+     entries; a sequence gap raises instead of ending the stream short
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
+  - lessons.md Rule #3: Test fixtures must guarantee isolation
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, update
+
+from database import get_session
+from models import Bot, Ledger
+from routers import ledger as ledger_router
+from services import ledger_archive, ledger_export, ledger_service
+from services.ledger_export import iter_ledger_entries
+from services.ledger_service import append_ledger_entries
+from services.ledger_verifier import verify_bot_chain
+from services.merkle_service import anchor_epochs
+
+
+@pytest.fixture
+async def session():
+    """Create an isolated async SQLite session for testing."""
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from models import Base
+
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as s:
+        yield s
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def bot(session):
+    """Bot with a GRANT followed by alternating HEARTBEAT / WAGER entries (9 total)."""
+    bot = Bot(handle="ExportBot", persona_yaml="p", balance=Decimal("100"), status="ALIVE")
+    session.add(bot)
+    await session.flush()
+    entries = [{"amount": Decimal("100"), "transaction_type": "GRANT", "reference_id": "G"}]
+    for i in range(8):
+        kind = "HEARTBEAT" if i % 2 == 0 else "WAGER"
+        entries.append({"amount": Decimal("-1"), "transaction_type": kind, "reference_id": f"R:{i}"})
+    await append_ledger_entries(bot_id=bot.id, entries=entries, session=session)
+    await session.commit()
+    return bot
+
+
+async def _collect(session, **kwargs) -> list[dict]:
+    return [e async for e in iter_ledger_entries(session, **kwargs)]
+
+
+class TestIterLedgerEntries:
+    @pytest.mark.asyncio
+    async def test_pages_cover_history_in_order(self, session, bot):
+        entries = await _collect(session, bot_id=bot.id, page_size=2)
+        assert [e["sequence"] for e in entries] == list(range(1, 10))
+        assert entries[0]["amount"] == "100.00000000"
+        assert entries[-1]["balance_after"] == "92.00000000"
+        assert entries[1]["previous_hash"] == entries[0]["hash"]
+
+    @pytest.mark.asyncio
+    async def test_filters(self, session, bot):
+        after = await _collect(session, bot_id=bot.id, after_sequence=6, page_size=2)
+        assert [e["sequence"] for e in after] == [7, 8, 9]
+
+        wagers = await _collect(session, bot_id=bot.id, transaction_types=["WAGER"], page_size=3)
+        assert [e["sequence"] for e in wagers] == [3, 5, 7, 9]
+
+        limited = await _collect(session, bot_id=bot.id, limit=3, page_size=2)
+        assert [e["sequence"] for e in limited] == [1, 2, 3]
+
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for seq in range(1, 10):
+            await session.execute(
+                update(Ledger)
+                .where(Ledger.bot_id == bot.id, Ledger.sequence == seq)
+                .values(timestamp=base + timedelta(hours=seq))
+            )
+        await session.commit()
+        window = await _collect(
+            session, bot_id=bot.id,
+            since=base + timedelta(hours=3), until=base + timedelta(hours=5),
+        )
+        assert [e["sequence"] for e in window] == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_archived_and_live_stream_together(self, session, bot, tmp_path, monkeypatch):
+        monkeypatch.setattr(ledger_archive, "ARCHIVE_DIR", tmp_path)
+        monkeypatch.setattr(ledger_service, "LEDGER_CHECKPOINT_INTERVAL", 5)
+        # Checkpoints land at sequences 10 and 15; 16..17 stay live.
+        await append_ledger_entries(
+            bot_id=bot.id,
+            entries=[
+                {"amount": Decimal("-1"), "transaction_type": "HEARTBEAT", "reference_id": f"X:{i}"}
+                for i in range(8)
+            ],
+            session=session,
+        )
+        await session.commit()
+        await verify_bot_chain(bot_id=bot.id, session=session)
+        await anchor_epochs(session)
+        segment = await ledger_archive.archive_bot(bot.id, session, min_rows=1)
+        await session.commit()
+        assert segment.last_sequence == 15
+
+        entries = await _collect(session, bot_id=bot.id, page_size=4)
+        assert [e["sequence"] for e in entries] == list(range(1, 18))
+        resumed = await _collect(session, bot_id=bot.id, after_sequence=13, page_size=4)
+        assert [e["sequence"] for e in resumed] == [14, 15, 16, 17]
+        wagers = await _collect(session, bot_id=bot.id, transaction_types=["WAGER"], limit=2)
+        assert [e["sequence"] for e in wagers] == [3, 5]
+
+    @pytest.mark.asyncio
+    async def test_archive_during_export_is_picked_up(self, session, bot, tmp_path, monkeypatch):
+        monkeypatch.setattr(ledger_archive, "ARCHIVE_DIR", tmp_path)
+        monkeypatch.setattr(ledger_service, "LEDGER_CHECKPOINT_INTERVAL", 5)
+        await append_ledger_entries(
+            bot_id=bot.id,
+            entries=[
+                {"amount": Decimal("-1"), "transaction_type": "HEARTBEAT", "reference_id": f"X:{i}"}
+                for i in range(8)
+            ],
+            session=session,
+        )
+        await session.commit()
+        await verify_bot_chain(bot_id=bot.id, session=session)
+        await anchor_epochs(session)
+        await ledger_archive.archive_bot(bot.id, session, min_rows=1)
+        await session.commit()
+
+        # The export listed segments before the archive run committed
+        real = ledger_export._segments_after
+        calls = []
+
+        async def stale_first(*args):
+            calls.append(args)
+            return [] if len(calls) == 1 else await real(*args)
+
+        monkeypatch.setattr(ledger_export, "_segments_after", stale_first)
+        entries = await _collect(session, bot_id=bot.id, page_size=4)
+        assert [e["sequence"] for e in entries] == list(range(1, 18))
+        assert len(calls) == 3  # stale list, re-list on the gap, end-of-stream check
+
+    @pytest.mark.asyncio
+    async def test_sequence_gap_raises(self, session, bot):
+        await session.execute(delete(Ledger).where(Ledger.bot_id == bot.id, Ledger.sequence == 5))
+        await session.commit()
+        with pytest.raises(ValueError, match="gap after sequence 4"):
+            await _collect(session, bot_id=bot.id, page_size=2)
+
+
+class TestLedgerEndpoint:
+    @pytest.fixture
+    async def client(self, session):
+        app = FastAPI()
+        app.include_router(ledger_router.router)
+
+        async def _session_override():
+            yield session
+
+        app.dependency_overrides[get_session] = _session_override
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            yield ac
+
+    @pytest.mark.asyncio
+    async def test_streams_ndjson(self, client, bot):
+        resp = await client.get(f"/bots/{bot.id}/ledger", params={"after": 1, "type": ["HEARTBEAT"]})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [e["sequence"] for e in lines] == [2, 4, 6, 8]
+        assert all(e["bot_id"] == bot.id for e in lines)
+
+    @pytest.mark.asyncio
+    async def test_unknown_bot(self, client, bot):
+        resp = await client.get("/bots/9999/ledger")
+        assert resp.status_code == 404
@@ -0,0 +1,167 @@
+"""Tests for incremental hash-chain verification.
+
+Proves:
+  1. A clean chain verifies and the checkpoint advances to the tip
+  2. A second run only walks entries appended since the checkpoint
+  3. Tampering with an entry after the checkpoint is detected
+  4. Rewriting already-verified history is caught by the checkpoint anchor
+  5. full=True re-walks from genesis
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
+  - lessons.md Rule #3: Test fixtures must guarantee isolation
+"""
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from sqlalchemy import update
+
+from models import Bot, Ledger, LedgerVerification
+from services.ledger_service import append_ledger_entries
+from services.ledger_verifier import verify_bot_chain
+
+
+@pytest.fixture
+async def session():
+    """Create an isolated async SQLite session for testing."""
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from models import Base
+
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as s:
+        yield s
+
+    await engine.dispose()
+
+
+async def _bot_with_entries(session, count: int) -> Bot:
+    bot = Bot(handle="VerifyBot", persona_yaml="p", balance=Decimal("100"), status="ALIVE")
+    session.add(bot)
+    await session.flush()
+    await _append(session, bot.id, [("GRANT", Decimal("100"))] + [("HEARTBEAT", Decimal("-1"))] * (count - 1))
+    return bot
+
+
+async def _append(session, bot_id: int, specs) -> None:
+    await append_ledger_entries(
+        bot_id=bot_id,
+        entries=[
+            {"amount": amount, "transaction_type": tx, "reference_id": f"{tx}:{i}"}
+            for i, (tx, amount) in enumerate(specs)
+        ],
+        session=session,
+    )
+    await session.commit()
+
+
+class TestIncrementalVerification:
+    @pytest.mark.asyncio
+    async def test_clean_chain_advances_checkpoint(self, session):
+        bot = await _bot_with_entries(session, 4)
+
+        report = await verify_bot_chain(bot_id=bot.id, session=session)
+        await session.commit()
+
+        assert report["ok"], report["errors"]
+        assert report["rows"] == 4
+        state = await session.get(LedgerVerification, bot.id)
+        assert state.verified_sequence == 4
+        assert Decimal(str(state.verified_balance)) == Decimal("97")
+
+    @pytest.mark.asyncio
+    async def test_second_run_only_walks_new_entries(self, session):
+        bot = await _bot_with_entries(session, 4)
+        await verify_bot_chain(bot_id=bot.id, session=session)
+        await session.commit()
+
+        await _append(session, bot.id, [("HEARTBEAT", Decimal("-1"))] * 2)
+        report = await verify_bot_chain(bot_id=bot.id, session=session)
+
+        assert report["ok"], report["errors"]
+        assert report["from_sequence"] == 4
+        assert report["rows"] == 2
+        assert report["sequence"] == 6
+
+    @pytest.mark.asyncio
+    async def test_tampered_new_entry_detected(self, session):
+        bot = await _bot_with_entries(session, 3)
+        await verify_bot_chain(bot_id=bot.id, session=session)
+        await session.commit()
+
+        await _append(session, bot.id, [("HEARTBEAT", Decimal("-1"))])
+        await session.execute(
+            update(Ledger).where(Ledger.bot_id == bot.id, Ledger.sequence == 4)
+            .values(reference_id="FORGED")
+        )
+        await session.commit()
+
+        report = await verify_bot_chain(bot_id=bot.id, session=session)
+        assert not report["ok"]
+        assert any("seq 4" in e for e in report["errors"])
+        state = await session.get(LedgerVerification, bot.id)
+        assert state.verified_sequence == 3
+
+    @pytest.mark.asyncio
+    async def test_rewritten_history_caught_and_full_rewalks(self, session):
+        bot = await _bot_with_entries(session, 3)
+        await verify_bot_chain(bot_id=bot.id, session=session)
+        await session.commit()
+
+        await session.execute(
+            update(Ledger).where(Ledger.bot_id == bot.id, Ledger.sequence == 3)
+            .values(hash="f" * 64)
+        )
+        await session.commit()
+
+        report = await verify_bot_chain(bot_id=bot.id, session=session)
+        assert not report["ok"]
+        assert report["rows"] == 0
+
+        full = await verify_bot_chain(bot_id=bot.id, session=session, full=True)
+        assert not full["ok"]
+        assert full["from_sequence"] == 0
+        assert full["rows"] == 3
+
+
+class TestParallelVerification:
+    @pytest.mark.asyncio
+    async def test_parallel_matches_sequential_across_chunks(self, session):
+        """Chunked process-pool verification reaches the same tip and catches a
+        break that falls on a chunk boundary."""
+        from concurrent.futures import ProcessPoolExecutor
+        from services.ledger_verifier import verify_chains_parallel
+
+        bot = await _bot_with_entries(session, 7)
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            [report] = await verify_chains_parallel(
+                bot_ids=[bot.id], session=session, executor=pool, full=True, chunk_size=3,
+            )
+        assert report["ok"], report["errors"]
+        assert (report["rows"], report["sequence"]) == (7, 7)
+        assert report["balance"] == Decimal("94")
+
+        await session.execute(
+            update(Ledger).where(Ledger.bot_id == bot.id, Ledger.sequence == 4)
+            .values(previous_hash="0" * 64)
+        )
+        await session.commit()
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            [report] = await verify_chains_parallel(
+                bot_ids=[bot.id], session=session, executor=pool, full=True, chunk_size=3,
+            )
+        assert not report["ok"]
+        assert any("seq 4" in e for e in report["errors"])
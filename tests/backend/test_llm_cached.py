@@ -0,0 +1,182 @@
+"""Tests for the prompt-keyed LLM response cache wrapper.
+
+Proves:
+  1. A repeated prompt is served from cache with zero token usage
+  2. Any change to messages or parameters is a different key
+  3. Concurrent identical requests share one upstream call (single-flight)
+  4. A second process is served from Redis without calling the provider
+  5. Per-site TTLs expire entries; ttl=0 opts a site out; failures are not cached
+  6. Hits are counted on the active MetricsCollector via TrackedProvider
+  7. The factory wraps the provider only when LLM_CACHE_TTL is set
+  8. Research answers bypass the cache while the research pool is on, so
+     an answer the pool discarded as wrong is not served again
+
+Constitutional references:
+  - lessons.md Rule #3: "Test Fixtures Must Guarantee Isolation" —
+    no network; Redis and providers are in-process fakes.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from services.llm.cached import CachedProvider, llm_cache
+from services.llm.interface import LLMProvider
+from services.llm.tracked_provider import TrackedProvider
+
+_MSG = [{"role": "user", "content": "What is the pageid of 'Python'?"}]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.ttls[key] = ex
+
+
+class CountingProvider(LLMProvider):
+    """Answers after a short delay so concurrent callers overlap."""
+
+    def __init__(self, content="answer"):
+        self.content = content
+        self.calls = 0
+
+    async def generate(self, messages, **kwargs):
+        return (await self.complete(messages, **kwargs))[0]
+
+    async def complete(self, messages, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.content, 40, 10
+
+
+def _cached(base, **kwargs) -> CachedProvider:
+    kwargs.setdefault("redis", FakeRedis())
+    kwargs.setdefault("default_ttl", 60)
+    return CachedProvider(base, namespace="test:", **kwargs)
+
+
+class TestCachedProvider:
+    @pytest.mark.asyncio
+    async def test_repeat_served_from_cache(self):
+        base = CountingProvider()
+        provider = _cached(base)
+        assert await provider.generate_tracked(_MSG, temperature=0.3) == ("answer", 40, 10)
+        assert await provider.generate_tracked(_MSG, temperature=0.3) == ("answer", 0, 0)
+        assert base.calls == 1
+
+        await provider.generate(_MSG, temperature=0.4)
+        await provider.generate([{"role": "user", "content": "other"}], temperature=0.3)
+        assert base.calls == 3
+        stats = provider.stats()
+        assert (stats["miss"], stats["hit_local"]) == (3, 1)
+        assert stats["hit_rate"] == 0.25
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self):
+        base = CountingProvider()
+        provider = _cached(base)
+        results = await asyncio.gather(*(provider.generate_tracked(_MSG) for _ in range(5)))
+        assert base.calls == 1
+        assert results.count(("answer", 40, 10)) == 1
+        assert results.count(("answer", 0, 0)) == 4
+        assert provider.stats()["hit_inflight"] == 4
+
+    @pytest.mark.asyncio
+    async def test_shared_through_redis(self):
+        redis = FakeRedis()
+        with llm_cache("research", ttl=600):
+            await _cached(CountingProvider(), redis=redis).generate(_MSG)
+            base = CountingProvider()
+            other = _cached(base, redis=redis)
+            assert await other.generate(_MSG) == "answer"
+        assert base.calls == 0 and other.stats()["hit_redis"] == 1
+        assert list(redis.ttls.values()) == [600]
+        assert other.stats()["sites"] == {"research": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_site_ttl_opt_out_and_failures(self):
+        now = [0.0]
+        base = CountingProvider()
+        provider = _cached(base, clock=lambda: now[0])
+        with llm_cache("strategy", ttl=30):
+            await provider.generate(_MSG)
+            now[0] = 31
+            await provider.generate(_MSG)
+        # expired locally; the fake Redis never expires, so it answers the repeat
+        assert base.calls == 1 and provider.stats()["hit_redis"] == 1
+
+        with llm_cache("post", ttl=0):
+            await provider.generate(_MSG)
+            await provider.generate(_MSG)
+        assert base.calls == 3 and provider.stats()["bypass"] == 2
+
+        failing = CountingProvider(content=None)
+        provider = _cached(failing)
+        assert await provider.generate(_MSG) is None
+        assert await provider.generate(_MSG) is None
+        assert failing.calls == 2 and provider.redis.data == {}
+
+    @pytest.mark.asyncio
+    async def test_hits_counted_on_collector(self):
+        from clawx.metrics import _current_metrics, MetricsCollector, set_current_collector
+
+        collector = MetricsCollector(agent_id="7", tick_id="tick-1")
+        token = set_current_collector(collector)
+        try:
+            tracked = TrackedProvider(_cached(CountingProvider()))
+            for _ in range(3):
+                await tracked.generate(_MSG)
+        finally:
+            _current_metrics.reset(token)
+        snap = collector.snapshot()
+        assert snap.extra["llm_cache_hits"] == 2 and snap.extra["llm_cache_misses"] == 1
+        assert snap.input_tokens == 40  # hits cost nothing
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pool, calls", [(True, 2), (False, 1)])
+    async def test_research_site_defers_to_pool(self, pool, calls):
+        base = CountingProvider(content='{"answer": "12345", "confidence": 0.9}')
+        provider = _cached(base)
+        with patch("llm_client.get_llm_provider", return_value=provider), \
+             patch("llm_client.RESEARCH_POOL", pool):
+            from llm_client import generate_research_answer
+            for _ in range(2):
+                answer = await generate_research_answer("p", "RESEARCH: q?", 10.0)
+                assert answer["answer"] == "12345"
+        assert base.calls == calls
+
+
+class TestFactoryWrapping:
+    def setup_method(self):
+        from services.llm.factory import reset_llm_provider
+        reset_llm_provider()
+
+    teardown_method = setup_method
+
+    def test_wrapped_when_ttl_set(self):
+        with patch.dict(os.environ, {"LLM_PROVIDER": "mock", "LLM_CACHE_TTL": "300"}):
+            from services.llm.factory import get_llm_provider, llm_provider_stats
+            provider = get_llm_provider()
+            assert type(provider).__name__ == "CachedProvider"
+            assert provider.namespace.startswith("mock:")
+            assert "CachedProvider" in llm_provider_stats()
+
+    def test_not_wrapped_by_default(self):
+        with patch.dict(os.environ, {"LLM_PROVIDER": "mock", "LLM_CACHE_TTL": "0"}):
+            from services.llm.factory import get_llm_provider
+            assert type(get_llm_provider()).__name__ == "MockLLMProvider"
@@ -0,0 +1,167 @@
+"""Tests for the hedged, multi-backend LLM provider.
+
+Proves:
+  1. A fast primary answers alone — no hedge is sent
+  2. A primary slower than the hedge delay is raced and the loser cancelled
+  3. Errors and unusable answers fail over to the next backend at once
+  4. Every backend failing returns None without raising
+  5. Warmed-up backends are re-ordered by p95 latency and error rate;
+     the hedge delay tracks the primary's p95
+  6. The factory builds a HedgedProvider from LLM_PROVIDERS
+  7. Hedged backends read only their own suffixed key/model/URL
+
+Constitutional references:
+  - lessons.md Rule #3: "Test Fixtures Must Guarantee Isolation" —
+    no network; backends are in-process fakes.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from services.llm.hedged import HedgedProvider
+from services.llm.interface import LLMProvider
+
+_MSG = [{"role": "user", "content": "hello"}]
+
+
+class Backend(LLMProvider):
+    """Answers ``content`` after ``delay`` seconds, or raises ``error``."""
+
+    def __init__(self, content='{"ok": true}', delay=0.0, error=None):
+        self.content = content
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(self, messages, **kwargs):
+        return (await self.complete(messages, **kwargs))[0]
+
+    async def complete(self, messages, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.content, 10, 5
+
+
+def _hedged(**backends) -> HedgedProvider:
+    return HedgedProvider(list(backends.items()), hedge_delay_s=0.05, min_samples=3)
+
+
+class TestHedgedProvider:
+    @pytest.mark.asyncio
+    async def test_fast_primary_no_hedge(self):
+        a, b = Backend(), Backend()
+        provider = _hedged(a=a, b=b)
+        assert await provider.generate_tracked(_MSG) == ('{"ok": true}', 10, 5)
+        assert (a.calls, b.calls) == (1, 0)
+        assert provider.stats()["hedged"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_hedged_and_cancelled(self):
+        a, b = Backend('{"from": "a"}', delay=1.0), Backend('{"from": "b"}', delay=0.01)
+        provider = _hedged(a=a, b=b)
+        assert await provider.generate(_MSG) == '{"from": "b"}'
+        await asyncio.sleep(0)  # let the cancellation land
+        assert a.cancelled == 1
+        stats = provider.stats()
+        assert stats["hedged"] == 1
+        assert stats["backends"]["b"]["wins"] == 1 and stats["backends"]["a"]["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failover_on_error_and_invalid(self):
+        broken = Backend(error=RuntimeError("503"))
+        not_json = Backend(content="sorry, I can't")
+        good = Backend()
+        provider = _hedged(a=broken, b=not_json, c=good)
+        content = await provider.generate(_MSG, response_format={"type": "json_object"})
+        assert content == '{"ok": true}'
+        assert provider.stats()["failovers"] == 2
+        assert provider.stats()["backends"]["a"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_all_failing_returns_none(self):
+        provider = _hedged(a=Backend(error=RuntimeError("down")), b=Backend(error=TimeoutError()))
+        assert await provider.generate(_MSG) is None
+        assert provider.stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_ranking_follows_latency_and_errors(self):
+        provider = _hedged(a=Backend(), b=Backend())
+        stats = provider.backend_stats
+        for _ in range(3):
+            stats["a"].record(0.3, ok=True)
+            stats["b"].record(0.1, ok=True)
+        assert provider.ranking() == ["b", "a"]
+        assert provider.hedge_delay("b") == pytest.approx(0.1)
+
+        for _ in range(10):  # error rate ~0.65: 0.1s * (1 + 4 * 0.65) > 0.3s
+            stats["b"].record(0.1, ok=False)
+        assert provider.ranking() == ["a", "b"]
+
+    def test_unwarmed_backend_keeps_its_place(self):
+        provider = _hedged(a=Backend(), b=Backend(), c=Backend())
+        for _ in range(3):
+            provider.backend_stats["a"].record(0.9, ok=True)
+            provider.backend_stats["c"].record(0.1, ok=True)
+        assert provider.ranking() == ["c", "b", "a"]
+        assert provider.hedge_delay("b") == 0.05
+
+
+class TestFactoryHedging:
+    def setup_method(self):
+        from services.llm.factory import reset_llm_provider
+        reset_llm_provider()
+
+    teardown_method = setup_method
+
+    def test_hedged_from_provider_list(self):
+        with patch.dict(os.environ, {"LLM_PROVIDERS": "local, mock"}):
+            from services.llm.factory import get_llm_provider
+            provider = get_llm_provider()
+            assert type(provider).__name__ == "HedgedProvider"
+            assert provider.configured == ["local", "mock"]
+
+    def test_single_name_is_not_hedged(self):
+        with patch.dict(os.environ, {"LLM_PROVIDER": "mock", "LLM_PROVIDERS": "mock"}):
+            from services.llm.factory import get_llm_provider
+            assert type(get_llm_provider()).__name__ == "MockLLMProvider"
+
+    def test_backends_ignore_unsuffixed_env(self):
+        env = {
+            "LLM_PROVIDERS": "grok,openai",
+            "LLM_API_KEY": "xai-shared",
+            "LLM_MODEL": "grok-3",
+            "LLM_API_KEY_GROK": "xai-own",
+            "LLM_API_KEY_OPENAI": "sk-own",
+        }
+        with patch.dict(os.environ, env):
+            from services.llm.openai_compatible import OpenAICompatibleProvider
+            grok = OpenAICompatibleProvider("grok", own_env=True)
+            openai = OpenAICompatibleProvider("openai", own_env=True)
+        assert grok._client.api_key == "xai-own"
+        assert openai._client.api_key == "sk-own"
+        assert openai._default_model == "gpt-4o-mini"
+        assert str(openai._client.base_url).startswith("https://api.openai.com")
+
+    def test_backend_without_own_key_fails_at_startup(self):
+        with patch.dict(os.environ, {"LLM_PROVIDERS": "grok,openai", "LLM_API_KEY": "xai-shared",
+                                     "LLM_API_KEY_GROK": "xai-own"}):
+            os.environ.pop("LLM_API_KEY_OPENAI", None)
+            from services.llm.factory import get_llm_provider
+            with pytest.raises(ValueError, match="LLM_API_KEY_OPENAI"):
+                get_llm_provider()
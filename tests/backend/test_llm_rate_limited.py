@@ -0,0 +1,169 @@
+"""Tests for the rate-limited, adaptively concurrent LLM provider wrapper.
+
+Proves:
+  1. Token buckets allow a minute's burst, then make callers wait for refill
+  2. Callers are served round-robin, not FIFO, when requests queue
+  3. Queue depth is visible while requests wait
+  4. A 429 halves the concurrency limit, pauses for retry-after and retries
+  5. Fast successes raise the limit; slow calls lower it
+  6. Other failures are not retried and still return None
+  7. The factory wraps real providers only when a budget is configured
+
+Constitutional references:
+  - lessons.md Rule #3: "Test Fixtures Must Guarantee Isolation" —
+    no network; providers are in-process fakes.
+  - lessons.md External API Rate Limits: "Never retry at fixed interval"
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from services.llm.interface import LLMProvider
+from services.llm.rate_limited import RateLimitedProvider, TokenBucket, set_llm_caller
+
+_MSG = [{"role": "user", "content": "hello"}]
+
+
+class RateLimitError(Exception):
+    """Shaped like openai.RateLimitError: status_code plus the HTTP response."""
+
+    status_code = 429
+
+    def __init__(self, retry_after: str | None = None):
+        super().__init__("429 Too Many Requests")
+        self.response = SimpleNamespace(status_code=429, headers={"retry-after": retry_after} if retry_after else {})
+
+
+class ScriptedProvider(LLMProvider):
+    """Records who called, in order; raises or sleeps per script."""
+
+    def __init__(self, script=None, delay: float = 0.0):
+        self.script = list(script or [])
+        self.delay = delay
+        self.calls: list[str] = []
+        self.gate: asyncio.Event | None = None
+
+    async def generate(self, messages, **kwargs):
+        return (await self.complete(messages, **kwargs))[0]
+
+    async def complete(self, messages, **kwargs):
+        self.calls.append(messages[0]["content"])
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.script:
+            step = self.script.pop(0)
+            if isinstance(step, Exception):
+                raise step
+        return "ok", 10, 5
+
+
+async def _call(provider, caller: str, tag: str):
+    set_llm_caller(caller)  # runs in its own task, so the caller is per-call
+    return await provider.generate([{"role": "user", "content": tag}])
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        now = [0.0]
+        bucket = TokenBucket(60, clock=lambda: now[0])  # 1 per second
+        assert all(bucket.reserve(1) == 0 for _ in range(60))
+        assert bucket.reserve(1) == pytest.approx(1.0)
+        assert bucket.reserve(1) == pytest.approx(2.0)
+        now[0] = 2.0
+        assert bucket.reserve(1) == pytest.approx(1.0)
+        bucket.adjust(5)  # refund
+        assert bucket.reserve(1) == 0
+
+    def test_unlimited(self):
+        assert TokenBucket(0).reserve(10_000) == 0
+
+
+class TestRateLimitedProvider:
+    @pytest.mark.asyncio
+    async def test_round_robin_across_callers(self):
+        base = ScriptedProvider()
+        base.gate = asyncio.Event()
+        provider = RateLimitedProvider(base, max_concurrency=1)
+
+        tasks = [asyncio.create_task(_call(provider, "a", "a1"))]
+        await asyncio.sleep(0.01)  # a1 is in flight, holding the only slot
+        tasks += [asyncio.create_task(_call(provider, "a", t)) for t in ("a2", "a3")]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(_call(provider, "b", "b1")))
+        await asyncio.sleep(0.01)
+        assert provider.queue_depth == 3
+        assert provider.stats()["queued_callers"] == 2
+
+        base.gate.set()
+        assert await asyncio.gather(*tasks) == ["ok"] * 4
+        assert base.calls == ["a1", "a2", "b1", "a3"]
+        assert provider.queue_depth == 0 and provider.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_429_backs_off_and_retries(self):
+        base = ScriptedProvider(script=[RateLimitError(retry_after="0.1")])
+        provider = RateLimitedProvider(base, max_concurrency=8, retries=2)
+
+        started = time.monotonic()
+        assert await provider.generate(_MSG) == "ok"
+        assert time.monotonic() - started >= 0.1
+        assert len(base.calls) == 2
+        assert provider.limit < 8 and provider.stats()["throttled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_429_gives_up_after_retries(self):
+        base = ScriptedProvider(script=[RateLimitError("0.01")] * 3)
+        provider = RateLimitedProvider(base, retries=1)
+        assert await provider.generate(_MSG) is None
+        assert len(base.calls) == 2
+        assert provider.stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_aimd_on_latency(self):
+        provider = RateLimitedProvider(ScriptedProvider(delay=0.05), max_concurrency=8, latency_target_s=0.02)
+        await provider.generate(_MSG)
+        assert provider.limit == 4
+
+        provider.latency_target_s = 10
+        for _ in range(8):
+            await provider.generate(_MSG)
+        assert 5 <= provider.limit <= 8
+
+    @pytest.mark.asyncio
+    async def test_other_errors_not_retried(self):
+        base = ScriptedProvider(script=[ValueError("bad request")])
+        provider = RateLimitedProvider(base, max_concurrency=4)
+        assert await provider.generate(_MSG) is None
+        assert len(base.calls) == 1
+        assert provider.limit == 4 and provider.in_flight == 0
+
+
+class TestFactoryWrapping:
+    def setup_method(self):
+        from services.llm.factory import reset_llm_provider
+        reset_llm_provider()
+
+    teardown_method = setup_method
+
+    def test_wrapped_when_budget_set(self):
+        with patch.dict(os.environ, {"LLM_PROVIDER": "local", "LLM_RPM": "500"}):
+            from services.llm.factory import get_llm_provider
+            assert type(get_llm_provider()).__name__ == "RateLimitedProvider"
+
+    def test_mock_never_wrapped(self):
+        with patch.dict(os.environ, {"LLM_PROVIDER": "mock", "LLM_RPM": "500"}):
+            from services.llm.factory import get_llm_provider
+            assert type(get_llm_provider()).__name__ == "MockLLMProvider"
@@ -0,0 +1,100 @@
+"""Tests for the local OpenAI-compatible LLM stub server.
+
+Proves:
+  1. OpenAICompatibleProvider talks to it unchanged and gets canned JSON in
+     the strategy schema, with token usage
+  2. Latency specs parse for every distribution and reject bad input
+  3. Injected 429s carry retry-after and surface as status 429 to the
+     provider (so RateLimitedProvider backs off)
+  4. Injected 500s and the STUB_RPM limit are counted in /stats
+
+Constitutional references:
+  - lessons.md Rule #3: "Test Fixtures Must Guarantee Isolation" —
+    the app is served in-process over an ASGI transport; no sockets.
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from scripts.llm_stub_server import StubConfig, create_app, parse_latency
+from services.llm.openai_compatible import OpenAICompatibleProvider
+
+_STRATEGY = [
+    {"role": "system", "content": "You are an AI survival strategist."},
+    {"role": "user", "content": "Idle Streak: 3 ticks\nAvailable RESEARCH markets: 2\nAvailable PORTFOLIO markets: 4"},
+]
+
+
+def _provider(app) -> OpenAICompatibleProvider:
+    provider = OpenAICompatibleProvider("local")
+    provider._client = AsyncOpenAI(
+        api_key="not-needed",
+        base_url="http://stub/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app)),
+    )
+    return provider
+
+
+async def _stats(app) -> dict:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://stub") as client:
+        return (await client.get("/stats")).json()
+
+
+class TestLatencySpec:
+    def test_distributions(self):
+        rng = random.Random(7)
+        assert parse_latency("fixed:0.25")(rng) == 0.25
+        assert 0.1 <= parse_latency("uniform:0.1,0.2")(rng) <= 0.2
+        for spec in ("normal:0.5,0.1", "lognormal:0.8,0.5", "exponential:0.3"):
+            assert parse_latency(spec)(rng) >= 0
+
+    @pytest.mark.parametrize("spec", ["gamma:1,2", "uniform:0.1", "fixed"])
+    def test_rejects_bad_specs(self, spec):
+        with pytest.raises(ValueError):
+            parse_latency(spec)
+
+
+class TestStubServer:
+    @pytest.mark.asyncio
+    async def test_provider_gets_canned_json_and_usage(self):
+        app = create_app(StubConfig(latency="fixed:0", seed=1))
+        content, prompt_tokens, completion_tokens = await _provider(app).complete(
+            _STRATEGY, max_tokens=100, response_format={"type": "json_object"},
+        )
+        assert json.loads(content)["action"] == "RESEARCH"
+        assert prompt_tokens > 0 and 0 < completion_tokens <= 100
+        assert (await _stats(app))["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_injected_429_has_retry_after(self):
+        app = create_app(StubConfig(latency="fixed:0", rate_429=1.0, retry_after_s=3))
+        with pytest.raises(Exception) as excinfo:
+            await _provider(app).complete(_STRATEGY)
+        assert excinfo.value.status_code == 429
+        assert excinfo.value.response.headers["retry-after"] == "3"
+
+        # generate() keeps the never-raise contract
+        assert await _provider(app).generate(_STRATEGY) is None
+
+    @pytest.mark.asyncio
+    async def test_errors_and_rpm_counted(self):
+        app = create_app(StubConfig(latency="fixed:0", rate_error=1.0))
+        assert await _provider(app).generate(_STRATEGY) is None
+        assert (await _stats(app))["injected_error"] == 1
+
+        app = create_app(StubConfig(latency="fixed:0", rpm=2))
+        provider = _provider(app)
+        results = [await provider.generate(_STRATEGY) for _ in range(3)]
+        assert results[0] and results[1] and results[2] is None
+        assert (await _stats(app))["rate_limited"] == 1
@@ -0,0 +1,158 @@
+"""Tests for Merkle epoch anchoring and inclusion proofs.
+
+Proves:
+  1. Every leaf of trees of any size (incl. odd) proves against the root
+  2. A proof does not verify a different entry hash
+  3. anchor_epochs seals only new entries on each run
+  4. get_inclusion_proof returns a proof that verifies against the epoch root
+  5. Windows never pass the commit watermark they are given
+  6. An entry that committed into a sealed window raises instead of
+     returning a proof that cannot verify, until the epoch is resealed
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: Irreversible loss — ledger is append-only, monotonic
+  - lessons.md Rule #3: Test fixtures must guarantee isolation
+"""
+
+import hashlib
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from models import Bot
+from services.ledger_service import append_ledger_entries
+from services.merkle_service import (
+    EpochMismatchError,
+    anchor_epochs,
+    commit_watermark,
+    get_inclusion_proof,
+    merkle_proof,
+    merkle_root,
+    reseal_epoch,
+    verify_inclusion,
+)
+
+
+@pytest.fixture
+async def session():
+    """Create an isolated async SQLite session for testing."""
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from models import Base
+
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as s:
+        yield s
+
+    await engine.dispose()
+
+
+async def _append(session, bot_id: int, count: int):
+    entries = await append_ledger_entries(
+        bot_id=bot_id,
+        entries=[
+            {"amount": Decimal("-1"), "transaction_type": "HEARTBEAT", "reference_id": f"T:{i}"}
+            for i in range(count)
+        ],
+        session=session,
+    )
+    await session.commit()
+    return entries
+
+
+class TestMerkleTree:
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 9])
+    def test_every_leaf_proves(self, size):
+        hashes = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(size)]
+        root = merkle_root(hashes)
+        for i, h in enumerate(hashes):
+            assert verify_inclusion(h, merkle_proof(hashes, i), root)
+
+    def test_proof_rejects_other_entry(self):
+        hashes = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(4)]
+        root = merkle_root(hashes)
+        assert not verify_inclusion(hashes[1], merkle_proof(hashes, 0), root)
+
+
+class TestAnchoring:
+    @pytest.mark.asyncio
+    async def test_incremental_epochs_and_proof(self, session):
+        bot = Bot(handle="MerkleBot", persona_yaml="p", balance=Decimal("0"), status="ALIVE")
+        session.add(bot)
+        await session.flush()
+
+        first = await _append(session, bot.id, 5)
+        [epoch1] = await anchor_epochs(session)
+        await session.commit()
+        assert (epoch1.first_ledger_id, epoch1.last_ledger_id, epoch1.leaf_count) == (
+            first[0].id, first[-1].id, 5,
+        )
+        assert await anchor_epochs(session) == []
+
+        second = await _append(session, bot.id, 3)
+        [epoch2] = await anchor_epochs(session)
+        await session.commit()
+        assert epoch2.first_ledger_id == second[0].id
+        assert epoch2.leaf_count == 3
+
+        proof = await get_inclusion_proof(first[2].id, session)
+        assert proof["epoch"]["id"] == epoch1.id
+        assert proof["leaf_index"] == 2
+        assert verify_inclusion(proof["entry_hash"], proof["proof"], epoch1.merkle_root)
+
+    @pytest.mark.asyncio
+    async def test_window_stops_at_watermark(self, session):
+        bot = Bot(handle="FreshBot", persona_yaml="p", balance=Decimal("0"), status="ALIVE")
+        session.add(bot)
+        await session.flush()
+        entries = await _append(session, bot.id, 2)
+        assert await commit_watermark(session) == entries[-1].id
+
+        assert await anchor_epochs(session, up_to_id=entries[0].id - 1) == []
+        [epoch] = await anchor_epochs(session, up_to_id=entries[0].id)
+        await session.commit()
+        assert (epoch.last_ledger_id, epoch.leaf_count) == (entries[0].id, 1)
+        proof = await get_inclusion_proof(entries[1].id, session)
+        assert proof["epoch"] is None
+
+    @pytest.mark.asyncio
+    async def test_late_commit_into_sealed_epoch(self, session):
+        from sqlalchemy.orm import make_transient
+
+        bot = Bot(handle="LateBot", persona_yaml="p", balance=Decimal("0"), status="ALIVE")
+        session.add(bot)
+        await session.flush()
+        entries = await _append(session, bot.id, 5)
+
+        # Entry 3 took its id but had not committed when the window was
+        # sealed — possible for epochs sealed before the commit watermark
+        late = entries[2]
+        await session.delete(late)
+        await session.commit()
+        [epoch] = await anchor_epochs(session)
+        await session.commit()
+        assert (epoch.first_ledger_id, epoch.last_ledger_id, epoch.leaf_count) == (
+            entries[0].id, entries[-1].id, 4,
+        )
+
+        make_transient(late)
+        session.add(late)
+        await session.commit()
+        with pytest.raises(EpochMismatchError, match="sealed over 4 entries"):
+            await get_inclusion_proof(entries[0].id, session)
+
+        resealed = await reseal_epoch(epoch.id, session)
+        await session.commit()
+        assert resealed.leaf_count == 5
+        proof = await get_inclusion_proof(late.id, session)
+        assert proof["leaf_index"] == 2
+        assert verify_inclusion(proof["entry_hash"], proof["proof"], resealed.merkle_root)
@@ -0,0 +1,88 @@
+"""Tests for partition maintenance helpers.
+
+Proves:
+  1. Month arithmetic crosses year boundaries
+  2. Monthly partition names follow <table>_yYYYYmMM
+  3. Maintenance is a no-op on non-partitioned (SQLite / create_all) databases
+  4. The partition specs in the models' table ``info`` drive maintenance and
+     agree with the migration's frozen copy, and the migration's column
+     types match the model
+
+Postgres partition creation, moving rows out of DEFAULT and detach are
+covered by the migration; they need a partitioned Postgres database to
+exercise.
+"""
+
+import importlib.util
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from models import AgentMetricsEntry, Ledger
+from services.partition_service import (
+    add_months,
+    ensure_month_partitions,
+    month_partition_name,
+    month_partitioned_tables,
+    retire_month_partitions,
+)
+
+_MIGRATION = (
+    Path(__file__).resolve().parents[2]
+    / "alembic" / "versions" / "c5e1a7d93f40_partition_ledger_and_agent_metrics.py"
+)
+
+
+class TestMonthHelpers:
+    def test_add_months_wraps_years(self):
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partition_name(self):
+        assert month_partition_name("agent_metrics", date(2026, 3, 1)) == "agent_metrics_y2026m03"
+
+
+class TestNonPartitioned:
+    @pytest.mark.asyncio
+    async def test_noop_on_sqlite(self):
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        from models import Base
+
+        engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine)() as session:
+            assert await ensure_month_partitions(session, "agent_metrics", months_ahead=3) == []
+            assert await retire_month_partitions(session, "agent_metrics", retain_months=1) == []
+        await engine.dispose()
+
+
+class TestPartitionSpecs:
+    def test_monthly_tables_come_from_info(self):
+        assert [t.name for t in month_partitioned_tables()] == ["agent_metrics"]
+
+    def test_migration_matches_models(self):
+        spec = importlib.util.spec_from_file_location("partition_migration", _MIGRATION)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+
+        assert migration.LEDGER_MODULUS == Ledger.__table__.info["partition_modulus"]
+        assert migration.MONTHS_AHEAD == AgentMetricsEntry.__table__.info["partition_months_ahead"]
+
+    def test_migration_metrics_json_type_matches_model(self):
+        from sqlalchemy.dialects import postgresql
+
+        model_type = AgentMetricsEntry.__table__.c.metrics_json.type.compile(dialect=postgresql.dialect())
+        assert f"metrics_json {model_type}," in _MIGRATION.read_text()
+
+    def test_range_key_from_info(self):
+        from services.partition_service import _RANGE_KEY
+
+        spec = AgentMetricsEntry.__table__.info["partition_by"]
+        assert _RANGE_KEY.match(spec).group(1) == "created_at"
@@ -9,6 +9,8 @@ Proves:
   6. execute_tick with RESEARCH market → attempts research
   7. Max 1 research attempt per tick enforced
   8. Entropy fee still charged after research attempt
+  9. Resolving a market drops its pooled research answer
+ 10. Two concurrent correct answers pay the bounty exactly once
 
 Constitutional references:
   - CLAUDE.md Invariant #2: Write or Die — every research attempt produces ledger entries
@@ -36,6 +38,7 @@ from models import (
 )
 from services.ledger_service import append_ledger_entry, get_balance
 from services.market_service import submit_research_answer
+from services.research_pool import ResearchAnswerPool
 
 
 # ============================================================================
@@ -169,6 +172,105 @@ class TestCorrectAnswer:
         assert balance == Decimal("1015")
 
 
+    @pytest.mark.asyncio
+    async def test_resolution_drops_pooled_answer(self, session, bot_with_grant, research_market, monkeypatch):
+        """RESOLVED → the market's research pool entry is gone, locally and in Redis."""
+        market, correct_answer = research_market
+        redis = AsyncMock(get=AsyncMock(return_value=None))
+        pool = ResearchAnswerPool(redis=redis)
+        monkeypatch.setattr("services.market_service.get_research_pool", lambda: pool)
+        pooled = {"answer": correct_answer, "confidence": 0.9}
+        await pool.answer(str(market.id), "solver", AsyncMock(return_value=pooled))
+
+        _, result = await submit_research_answer(
+            bot_id=bot_with_grant.id,
+            market_id=str(market.id),
+            answer=correct_answer,
+            stake=Decimal("1.00"),
+            tick_id="test-tick-pool",
+            session=session,
+        )
+
+        assert result == "CORRECT"
+        redis.delete.assert_awaited_once_with(f"research:pool:{market.id}")
+        assert pool.stats()["markets"] == 0
+
+
+    @pytest.mark.asyncio
+    async def test_concurrent_correct_answers_pay_once(self, tmp_path):
+        """Two ticks both read the market OPEN, both answer correctly → one payout."""
+        import secrets
+        from sqlalchemy import func, select
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        # File-backed so each session has its own connection and transaction
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'race.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        Session = async_sessionmaker(engine, expire_on_commit=False)
+
+        answer = "12345"
+        market_id = uuid.uuid4()
+        async with Session() as setup:
+            bots = [
+                Bot(
+                    handle=f"Racer{i}",
+                    persona_yaml="race",
+                    hashed_api_key=secrets.token_hex(16),
+                    api_secret=secrets.token_hex(32),
+                    balance=100.0,
+                    status="ALIVE",
+                )
+                for i in range(2)
+            ]
+            setup.add_all(bots)
+            setup.add(Market(
+                id=market_id,
+                description="RESEARCH: race",
+                source_type=MarketSourceType.RESEARCH,
+                resolution_criteria={"answer_hash": hashlib.sha256(answer.encode()).hexdigest()},
+                bounty=Decimal("15.00"),
+                deadline=datetime.now(timezone.utc) + timedelta(minutes=30),
+            ))
+            await setup.flush()
+            for bot in bots:
+                await append_ledger_entry(
+                    bot_id=bot.id, amount=100.0, transaction_type="GRANT",
+                    reference_id="GENESIS_GRANT", session=setup,
+                )
+            await setup.commit()
+
+        async with Session() as first, Session() as second:
+            # Both WRITE phases read the market while it is still OPEN
+            for s in (first, second):
+                market = (await s.execute(select(Market).where(Market.id == market_id))).scalar_one()
+                assert market.status == MarketStatus.OPEN
+
+            results = []
+            for s, bot in ((first, bots[0]), (second, bots[1])):
+                pred, result = await submit_research_answer(
+                    bot_id=bot.id,
+                    market_id=str(market_id),
+                    answer=answer,
+                    stake=Decimal("1.00"),
+                    tick_id=f"race-{bot.id}",
+                    session=s,
+                )
+                await s.commit()
+                results.append(result)
+
+        assert results == ["CORRECT", "CLOSED"]
+        async with Session() as check:
+            payouts = (await check.execute(
+                select(func.count()).select_from(Ledger)
+                .where(Ledger.transaction_type == "RESEARCH_PAYOUT")
+            )).scalar_one()
+            assert payouts == 1
+            # The loser was not staked either
+            assert await get_balance(bot_id=bots[1].id, session=check) == Decimal("100")
+        await engine.dispose()
+
+
 # ============================================================================
 # Test 2: Wrong answer → LOSS, market stays OPEN
 # ============================================================================
@@ -0,0 +1,117 @@
+"""Tests for the shared per-market research answer pool.
+
+Proves:
+  1. Concurrent bots on one market share a single computation
+  2. Later bots reuse the answer with stable, bounded persona noise on
+     confidence; the answer itself is never changed
+  3. Another worker is served from Redis without computing
+  4. Resolution invalidates the market; a wrong answer is dropped
+  5. Failed computations are not pooled
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: External Truth — answers still resolve by hash
+  - lessons.md Rule #3: "Test Fixtures Must Guarantee Isolation"
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from services.research_pool import ResearchAnswerPool, persona_noise
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+class Research:
+    """Counts computations; each takes a moment so concurrent bots overlap."""
+
+    def __init__(self, result=None):
+        self.result = result
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return dict(self.result) if self.result is not None else None
+
+
+_ANSWER = {"answer": "23862", "confidence": 0.6, "used_tool": True, "tool_fee_charged": True}
+
+
+class TestResearchAnswerPool:
+    @pytest.mark.asyncio
+    async def test_concurrent_bots_share_one_computation(self):
+        pool = ResearchAnswerPool(redis=FakeRedis())
+        research = Research(_ANSWER)
+        personas = [f"bot-{i}" for i in range(5)]
+        results = await asyncio.gather(*(pool.answer("m1", p, research) for p in personas))
+
+        assert research.calls == 1
+        assert results[0] == _ANSWER  # the computing bot sees it unchanged
+        assert all(r["answer"] == "23862" and r["tool_fee_charged"] for r in results)
+        assert all(r["pooled"] for r in results[1:])
+        assert pool.stats()["hit_inflight"] == 4 and pool.stats()["reuse_rate"] == 0.8
+
+    @pytest.mark.asyncio
+    async def test_persona_noise_is_stable_and_bounded(self):
+        pool = ResearchAnswerPool(redis=FakeRedis(), noise=0.1)
+        await pool.answer("m1", "first", Research(_ANSWER))
+        a = await pool.answer("m1", "contrarian", Research())
+        b = await pool.answer("m1", "contrarian", Research())
+        c = await pool.answer("m1", "cautious", Research())
+        assert a["confidence"] == b["confidence"] != c["confidence"]
+        assert all(abs(r["confidence"] - 0.6) <= 0.1 for r in (a, c))
+        assert abs(persona_noise("x", "m1", 0.1)) <= 0.1
+
+    @pytest.mark.asyncio
+    async def test_shared_through_redis(self):
+        redis = FakeRedis()
+        await ResearchAnswerPool(redis=redis).answer("m1", "a", Research(_ANSWER))
+        other = ResearchAnswerPool(redis=redis, noise=0)
+        research = Research()
+        assert (await other.answer("m1", "b", research))["answer"] == "23862"
+        assert research.calls == 0 and other.stats()["hit_redis"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidated_on_resolve_and_wrong_answer(self):
+        redis = FakeRedis()
+        pool = ResearchAnswerPool(redis=redis)
+        research = Research(_ANSWER)
+        await pool.answer("m1", "a", research)
+        await pool.invalidate("m1")
+        assert redis.data == {}
+        await pool.answer("m1", "a", research)
+        assert research.calls == 2
+
+        await pool.discard("m1", "99999")  # a different answer was wrong — keep ours
+        await pool.answer("m1", "b", research)
+        assert research.calls == 2
+        await pool.discard("m1", "23862")
+        await pool.answer("m1", "b", research)
+        assert research.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_not_pooled(self):
+        pool = ResearchAnswerPool(redis=FakeRedis())
+        research = Research(None)
+        assert await pool.answer("m1", "a", research) is None
+        assert await pool.answer("m1", "b", research) is None
+        assert research.calls == 2
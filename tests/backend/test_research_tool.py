@@ -202,7 +202,7 @@ class TestToolUsedOnLowConfidence:
         with patch("llm_client.generate_research_answer", new_callable=AsyncMock, return_value=mock_llm_result), \
              patch("services.feed_ingestor.AsyncFeedIngestor") as mock_ingestor_cls:
             mock_ingestor = AsyncMock()
-            mock_ingestor.wikipedia_lookup = AsyncMock(return_value=mock_lookup)
+            mock_ingestor.resolve_title = AsyncMock(return_value=mock_lookup)
             mock_ingestor_cls.return_value = mock_ingestor
 
             result = await generate_research_with_tool(
@@ -215,7 +215,7 @@ class TestToolUsedOnLowConfidence:
         assert result["answer"] == "67890"
         assert result["confidence"] == 0.95
         assert result["used_tool"] is True
-        mock_ingestor.wikipedia_lookup.assert_called_once_with("Python (programming language)")
+        mock_ingestor.resolve_title.assert_called_once_with("Python (programming language)")
 
 
 # ============================================================================
@@ -246,7 +246,7 @@ class TestToolSkippedOnHighConfidence:
         assert result["confidence"] == 0.85
         assert result["used_tool"] is False
         # Tool should NOT have been called
-        mock_ingestor.wikipedia_lookup.assert_not_called()
+        mock_ingestor.resolve_title.assert_not_called()
 
 
 # ============================================================================
@@ -264,7 +264,7 @@ class TestToolFailureFallback:
         with patch("llm_client.generate_research_answer", new_callable=AsyncMock, return_value=mock_llm_result), \
              patch("services.feed_ingestor.AsyncFeedIngestor") as mock_ingestor_cls:
             mock_ingestor = AsyncMock()
-            mock_ingestor.wikipedia_lookup = AsyncMock(return_value=None)
+            mock_ingestor.resolve_title = AsyncMock(return_value=None)
             mock_ingestor_cls.return_value = mock_ingestor
 
             result = await generate_research_with_tool(
@@ -348,7 +348,7 @@ class TestUsedToolFlag:
         with patch("llm_client.generate_research_answer", new_callable=AsyncMock, return_value=mock_llm_result), \
              patch("services.feed_ingestor.AsyncFeedIngestor") as mock_ingestor_cls:
             mock_ingestor = AsyncMock()
-            mock_ingestor.wikipedia_lookup = AsyncMock(return_value=mock_lookup)
+            mock_ingestor.resolve_title = AsyncMock(return_value=mock_lookup)
             mock_ingestor_cls.return_value = mock_ingestor
 
             result = await generate_research_with_tool(
@@ -427,7 +427,7 @@ class TestToolFeeChargedFlag:
         with patch("llm_client.generate_research_answer", new_callable=AsyncMock, return_value=mock_llm_result), \
              patch("services.feed_ingestor.AsyncFeedIngestor") as mock_cls:
             mock_inst = AsyncMock()
-            mock_inst.wikipedia_lookup = AsyncMock(return_value=mock_lookup)
+            mock_inst.resolve_title = AsyncMock(return_value=mock_lookup)
             mock_cls.return_value = mock_inst
 
             result = await generate_research_with_tool(
@@ -463,7 +463,7 @@ class TestToolFeeChargedFlag:
         with patch("llm_client.generate_research_answer", new_callable=AsyncMock, return_value=mock_llm_result), \
              patch("services.feed_ingestor.AsyncFeedIngestor") as mock_cls:
             mock_inst = AsyncMock()
-            mock_inst.wikipedia_lookup = AsyncMock(return_value=None)
+            mock_inst.resolve_title = AsyncMock(return_value=None)
             mock_cls.return_value = mock_inst
 
             result = await generate_research_with_tool(
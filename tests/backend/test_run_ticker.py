@@ -0,0 +1,209 @@
+"""Tests for the ticker daemon's deadline-driven worker pool.
+
+Proves:
+  1. At most TICK_CONCURRENCY ticks are in flight, and they overlap
+  2. One bot's crash does not stop the others being ticked
+  3. Shutdown starts no new ticks but drains the in-flight ones
+  4. A bot's persona interval and hydrated context reach execute_tick, and
+     overdue bots tick first
+  5. Market maintenance runs on its own cadence, survives failures, and a
+     hung feed never delays ticks; by default it keeps only the research
+     floor and leaves the full board to the market-maker service
+
+Constitutional references:
+  - CLAUDE.md Invariant #6: Continuous real-time, not turn-based
+  - lessons.md Rule #3: Test isolation (in-memory SQLite)
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from models import Base, Bot
+from scripts import run_ticker
+from services.tick_scheduler import TickScheduler
+
+
+@pytest.fixture
+async def session_maker(monkeypatch):
+    """In-memory SQLite session factory, wired into the ticker."""
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(run_ticker, "async_session_maker", Session)
+    monkeypatch.setattr(run_ticker, "_shutdown_requested", False)
+    monkeypatch.setattr(run_ticker, "TICK_RATE", 0.2)
+    yield Session
+
+    await engine.dispose()
+
+
+async def _add_bots(Session, count: int, persona_yaml: str = "p", last_action_at=None, prefix: str = "tick") -> None:
+    async with Session() as s:
+        for i in range(count):
+            s.add(Bot(
+                handle=f"{prefix}_{i}", persona_yaml=persona_yaml, balance=Decimal("100"),
+                status="ALIVE", last_action_at=last_action_at,
+            ))
+        await s.commit()
+
+
+async def _run(concurrency: int, stop) -> int:
+    return await asyncio.wait_for(
+        run_ticker.run_schedule(TickScheduler(), concurrency=concurrency, roster_interval=0.2, stop=stop),
+        timeout=10,
+    )
+
+
+class TestRunSchedule:
+    @pytest.mark.asyncio
+    async def test_ticks_overlap_up_to_limit(self, session_maker, monkeypatch):
+        # Long-overdue bots are all due within one TICK_RATE
+        await _add_bots(session_maker, 6, last_action_at=datetime.now(timezone.utc) - timedelta(hours=1))
+        in_flight = 0
+        peak = 0
+        seen = set()
+
+        async def fake_tick(*, bot_id, config, balance, context=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            seen.add(bot_id)
+            await asyncio.sleep(0.3)
+            in_flight -= 1
+            return "HEARTBEAT"
+
+        monkeypatch.setattr("bot_runner.execute_tick", fake_tick)
+        assert await _run(3, stop=lambda: len(seen) == 6) >= 6
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_crash_is_isolated(self, session_maker, monkeypatch):
+        await _add_bots(session_maker, 4)
+        seen = []
+
+        async def fake_tick(*, bot_id, config, balance, context=None):
+            seen.append(bot_id)
+            if bot_id == 2:
+                raise RuntimeError("boom")
+            return "HEARTBEAT"
+
+        monkeypatch.setattr("bot_runner.execute_tick", fake_tick)
+        await _run(2, stop=lambda: seen.count(2) >= 2)
+        assert set(seen) == {1, 2, 3, 4}
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_in_flight(self, session_maker, monkeypatch):
+        await _add_bots(session_maker, 5, last_action_at=datetime.now(timezone.utc) - timedelta(hours=1))
+        started = []
+        finished = []
+
+        async def fake_tick(*, bot_id, config, balance, context=None):
+            started.append(bot_id)
+            if len(started) == 2:  # both workers are busy by now
+                run_ticker._shutdown_requested = True
+            await asyncio.sleep(0.05)
+            finished.append(bot_id)
+            return "HEARTBEAT"
+
+        monkeypatch.setattr("bot_runner.execute_tick", fake_tick)
+        assert await _run(2, stop=lambda: run_ticker._shutdown_requested) == 2
+        assert sorted(finished) == sorted(started)
+        assert len(finished) == 2
+
+    @pytest.mark.asyncio
+    async def test_persona_interval_and_liquidation(self, session_maker, monkeypatch):
+        now = datetime.now(timezone.utc)
+        await _add_bots(session_maker, 1, persona_yaml="schedule:\n  interval_seconds: 45\n",
+                        last_action_at=now - timedelta(seconds=50))
+        await _add_bots(session_maker, 1, persona_yaml="schedule:\n  interval_seconds: 45\n",
+                        last_action_at=now, prefix="fresh")
+        configs = {}
+        contexts = {}
+
+        async def fake_tick(*, bot_id, config, balance, context=None):
+            configs[bot_id] = config
+            contexts[bot_id] = context
+            return "LIQUIDATION"
+
+        monkeypatch.setattr("bot_runner.execute_tick", fake_tick)
+        # Bot 1 is 5s overdue; bot 2 is not due for 45s
+        assert await _run(2, stop=lambda: 1 in configs) == 1
+        assert list(configs) == [1]
+        assert configs[1]["schedule"]["interval_seconds"] == 45.0
+        assert contexts[1].bot_id == 1 and contexts[1].status == "ALIVE"
+
+
+class TestMaintainMarkets:
+    @pytest.mark.asyncio
+    async def test_cadence_and_error_boundary(self, session_maker, monkeypatch):
+        calls = []
+
+        async def fake_research(session, min_open=3):
+            calls.append(("research", min_open))
+            if len(calls) == 1:
+                raise RuntimeError("feed down")
+            return 1
+
+        async def fake_board(session, min_open=6):
+            calls.append(("board", min_open))
+            return 0
+
+        monkeypatch.setattr(run_ticker, "ensure_research_markets", fake_research)
+        monkeypatch.setattr(run_ticker, "ensure_open_markets", fake_board)
+        task = asyncio.create_task(run_ticker.maintain_markets(interval=0.05, research_min_open=4, min_open=9))
+        await asyncio.sleep(0.18)
+        task.cancel()
+        assert len(calls) >= 3 and set(calls) == {("research", 4), ("board", 9)}
+
+    @pytest.mark.asyncio
+    async def test_full_board_left_to_market_maker_by_default(self, session_maker, monkeypatch):
+        calls = []
+
+        async def fake_research(session, min_open=3):
+            calls.append(("research", min_open))
+            return 0
+
+        async def fake_board(session, min_open=6):
+            calls.append(("board", min_open))
+            return 0
+
+        monkeypatch.setattr(run_ticker, "ensure_research_markets", fake_research)
+        monkeypatch.setattr(run_ticker, "ensure_open_markets", fake_board)
+        task = asyncio.create_task(run_ticker.maintain_markets(interval=0.05))
+        await asyncio.sleep(0.08)
+        task.cancel()
+        assert calls and set(calls) == {("research", 3)}
+
+    @pytest.mark.asyncio
+    async def test_hung_feed_does_not_delay_ticks(self, session_maker, monkeypatch):
+        await _add_bots(session_maker, 3, last_action_at=datetime.now(timezone.utc) - timedelta(hours=1))
+        seen = set()
+
+        async def hung_ensure(session, min_open=6):
+            await asyncio.sleep(30)
+
+        async def fake_tick(*, bot_id, config, balance, context=None):
+            seen.add(bot_id)
+            return "HEARTBEAT"
+
+        monkeypatch.setattr(run_ticker, "ensure_research_markets", hung_ensure)
+        monkeypatch.setattr("bot_runner.execute_tick", fake_tick)
+        board = asyncio.create_task(run_ticker.maintain_markets())
+        try:
+            await _run(3, stop=lambda: len(seen) == 3)
+        finally:
+            board.cancel()
+        assert seen == {1, 2, 3}
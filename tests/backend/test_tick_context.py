@@ -0,0 +1,179 @@
+"""Tests for cycle-level tick context hydration.
+
+Proves:
+  1. One query yields balance, idle streak, status and open bets per bot
+  2. A context's markets match get_active_markets_for_agent
+  3. Bots without a ledger head fall back to the per-bot reads
+  4. execute_tick with a context reads nothing but the chain head it locks
+     to write, and writes the same ledger as without one
+
+Constitutional references:
+  - CLAUDE.md Invariant #2: Write or Die — at least one ledger entry per tick
+  - CLAUDE.md Invariant #3: Decimal Purity — all money uses Decimal
+  - lessons.md Rule #3: Test isolation (in-memory SQLite)
+"""
+
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import event, select
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from models import Base, Bot, Ledger, Market, MarketPrediction, MarketSourceType, MarketStatus
+from services.ledger_service import append_ledger_entry, get_balance, get_idle_streak
+from services.market_service import get_active_markets_for_agent
+from services.tick_context import hydrate_tick_contexts, load_board
+
+
+@pytest.fixture
+async def engine():
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as s:
+        yield s
+
+
+def _statements(engine) -> list[str]:
+    """Record every SQL statement the engine executes from now on."""
+    seen: list[str] = []
+    event.listen(
+        engine.sync_engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: seen.append(statement),
+    )
+    return seen
+
+
+async def _bot(session, handle: str, grant: float | None = 1000.0, heartbeats: int = 0) -> Bot:
+    bot = Bot(handle=handle, persona_yaml="p", balance=Decimal("1000"), status="ALIVE")
+    session.add(bot)
+    await session.flush()
+    if grant is not None:
+        await append_ledger_entry(
+            bot_id=bot.id, amount=grant, transaction_type="GRANT",
+            reference_id="GENESIS_GRANT", session=session,
+        )
+    for i in range(heartbeats):
+        await append_ledger_entry(
+            bot_id=bot.id, amount=-1.0, transaction_type="HEARTBEAT",
+            reference_id=f"HB:{i}", session=session,
+        )
+    return bot
+
+
+async def _market(session, hours: int, status=MarketStatus.OPEN) -> Market:
+    m = Market(
+        id=uuid.uuid4(),
+        description=f"Market due in {hours}h",
+        source_type=MarketSourceType.GITHUB,
+        resolution_criteria={"repo_name": "a/b", "metric": "merged_prs_24h", "operator": "gt", "value": 5},
+        status=status,
+        bounty=Decimal("10.00"),
+        deadline=datetime.now(timezone.utc) + timedelta(hours=hours),
+    )
+    session.add(m)
+    await session.flush()
+    return m
+
+
+async def _bet(session, bot: Bot, market: Market) -> None:
+    session.add(MarketPrediction(
+        bot_id=bot.id, market_id=market.id, outcome="YES", stake=Decimal("1"),
+    ))
+    await session.flush()
+
+
+class TestHydration:
+    @pytest.mark.asyncio
+    async def test_one_query_matches_per_bot_reads(self, engine, session):
+        a = await _bot(session, "ctx_a", heartbeats=3)
+        b = await _bot(session, "ctx_b")
+        markets = [await _market(session, h) for h in (3, 1, 2)]
+        closed = await _market(session, 4, status=MarketStatus.RESOLVED)
+        await _bet(session, a, markets[1])
+        await _bet(session, a, closed)
+        await session.commit()
+
+        board = await load_board(session)
+        seen = _statements(engine)
+        contexts = await hydrate_tick_contexts(session, bot_ids=[a.id, b.id, 999], board=board)
+        assert len(seen) == 1
+        assert set(contexts) == {a.id, b.id}
+
+        for bot in (a, b):
+            ctx = contexts[bot.id]
+            assert ctx.status == "ALIVE"
+            assert ctx.balance == await get_balance(bot_id=bot.id, session=session)
+            assert ctx.idle_streak == await get_idle_streak(bot_id=bot.id, session=session)
+            assert ctx.markets(limit=10) == await get_active_markets_for_agent(
+                bot_id=bot.id, session=session, limit=10,
+            )
+        assert contexts[a.id].idle_streak == 3
+        assert contexts[a.id].bet_market_ids == {str(markets[1].id)}
+        assert [m["id"] for m in contexts[b.id].markets(limit=2)] == [str(markets[1].id), str(markets[2].id)]
+
+    @pytest.mark.asyncio
+    async def test_bot_without_head_falls_back(self, session):
+        bot = await _bot(session, "ctx_new", grant=None)
+        await session.commit()
+        ctx = (await hydrate_tick_contexts(session, bot_ids=[bot.id], board=()))[bot.id]
+        assert ctx.balance == Decimal("0")
+        assert ctx.idle_streak == 0
+
+
+class TestExecuteTickWithContext:
+    @pytest.mark.asyncio
+    async def test_no_reads_before_write(self, engine, session):
+        bot = await _bot(session, "ctx_tick", heartbeats=2)
+        await session.commit()
+        ctx = (await hydrate_tick_contexts(session, bot_ids=[bot.id], board=()))[bot.id]
+
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=session)
+        mock_session.__aexit__ = AsyncMock(return_value=False)
+
+        seen = _statements(engine)
+        with patch("bot_runner.async_session_maker", return_value=mock_session), \
+             patch("bot_runner.ENFORCEMENT_MODE", "enforce"), \
+             patch("bot_runner.generate_tick_strategy", new_callable=AsyncMock, return_value=None), \
+             patch("bot_runner.generate_prediction", new_callable=AsyncMock, return_value=None), \
+             patch("bot_runner.get_redis_client", new_callable=AsyncMock, return_value=None):
+            from bot_runner import calculate_entropy_fee, execute_tick
+            tx_type = await execute_tick(
+                bot_id=bot.id, config={"persona": "test"}, balance=float(ctx.balance), context=ctx,
+            )
+
+        assert tx_type == "HEARTBEAT"
+        reads = [s for s in seen if s.lstrip().upper().startswith("SELECT")]
+        # Only the WRITE phase's locked reads: the chain head and the bot's current status
+        assert reads and all("ledger_heads" in s or s.startswith("SELECT bots.status") for s in reads)
+        assert sum(s.startswith("SELECT bots.status") for s in reads) == 1
+        # Lock order bots → chain head, the same as liquidations and the gateway
+        assert reads[0].startswith("SELECT bots.status")
+
+        fee = calculate_entropy_fee(2)
+        hb = (await session.execute(
+            select(Ledger).where(Ledger.bot_id == bot.id).order_by(Ledger.sequence.desc()).limit(1)
+        )).scalar_one()
+        assert hb.transaction_type == "HEARTBEAT" and hb.amount == -fee
+        await session.refresh(bot)
+        assert bot.balance == ctx.balance - fee == await get_balance(bot_id=bot.id, session=session)
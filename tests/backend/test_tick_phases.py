@@ -0,0 +1,273 @@
+"""Tests for execute_tick's READ / THINK / WRITE phases.
+
+Proves:
+  1. No DB session is open while any LLM call runs
+  2. The WRITE phase re-validates the balance: a bot drained while it was
+     thinking is liquidated (enforce), not charged as if still solvent
+  3. The WRITE phase re-validates markets: a bet on a market resolved
+     during THINK is rejected and the tick still writes its HEARTBEAT
+  4. Connection hold times are reported as db_read_ms / db_write_ms
+  5. A tick that overruns TICK_BUDGET_S cancels its LLM call, still writes
+     its heartbeat, and is recorded as TIMEOUT
+  6. In observe mode a READ overrun writes the same heartbeat, as TIMEOUT
+  7. A bot that died after hydration is not written (no second LIQUIDATION)
+  8. When every planned bet is rejected at write, the tick falls back to
+     its wager, as before the phase split
+
+Constitutional references:
+  - CLAUDE.md Invariant #2: Write or Die — at least one ledger entry per tick
+  - CLAUDE.md Invariant #3: Decimal Purity — all money uses Decimal
+  - lessons.md Rule #3: Test isolation (in-memory SQLite)
+"""
+
+import asyncio
+import logging
+import sys
+import time
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from models import Base, Bot, Ledger, Market, MarketSourceType, MarketStatus
+from services.ledger_service import append_ledger_entry, get_balance
+from services.tick_context import hydrate_tick_contexts
+
+
+class CountingSessions:
+    """async_session_maker stand-in that tracks how many sessions are open."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.open = 0
+
+    @asynccontextmanager
+    async def _session(self):
+        self.open += 1
+        try:
+            async with self.factory() as session:
+                yield session
+        finally:
+            self.open -= 1
+
+    def __call__(self):
+        return self._session()
+
+
+@pytest.fixture
+async def sessions():
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield CountingSessions(async_sessionmaker(engine, expire_on_commit=False))
+    await engine.dispose()
+
+
+async def _bot(sessions, balance: float = 1000.0) -> int:
+    async with sessions.factory() as s:
+        bot = Bot(handle="PhaseBot", persona_yaml="p", balance=Decimal(str(balance)), status="ALIVE")
+        s.add(bot)
+        await s.flush()
+        await append_ledger_entry(
+            bot_id=bot.id, amount=balance, transaction_type="GRANT",
+            reference_id="GENESIS_GRANT", session=s,
+        )
+        await s.commit()
+        return bot.id
+
+
+async def _market(sessions) -> str:
+    async with sessions.factory() as s:
+        m = Market(
+            id=uuid.uuid4(),
+            description="Will the phase test pass?",
+            source_type=MarketSourceType.GITHUB,
+            resolution_criteria={"repo_name": "a/b", "metric": "merged_prs_24h", "operator": "gt", "value": 5},
+            status=MarketStatus.OPEN,
+            bounty=Decimal("10.00"),
+            deadline=datetime.now(timezone.utc) + timedelta(hours=24),
+        )
+        s.add(m)
+        await s.commit()
+        return str(m.id)
+
+
+def _llm(sessions, result=None, during=None):
+    """LLM mock that fails the test if a session is open when it is called."""
+    async def call(*args, **kwargs):
+        assert sessions.open == 0, "DB session held across an LLM call"
+        if during is not None:
+            await during()
+        return result
+    return AsyncMock(side_effect=call)
+
+
+async def _tick(sessions, bot_id, mode="observe", context=None, **llm):
+    with patch("bot_runner.async_session_maker", sessions), \
+         patch("bot_runner.ENFORCEMENT_MODE", mode), \
+         patch("bot_runner.get_redis_client", new_callable=AsyncMock, return_value=None), \
+         patch("bot_runner.generate_tick_strategy", llm.get("strategy", _llm(sessions))), \
+         patch("bot_runner.generate_research_with_tool", llm.get("research", _llm(sessions))), \
+         patch("bot_runner.generate_portfolio_decision", llm.get("portfolio", _llm(sessions))), \
+         patch("bot_runner.generate_prediction", llm.get("prediction", _llm(sessions))):
+        from bot_runner import execute_tick
+        return await execute_tick(bot_id=bot_id, config={"persona": "test"}, balance=1000.0, context=context)
+
+
+async def _ledger_types(sessions, bot_id) -> list[str]:
+    async with sessions.factory() as s:
+        return list((await s.execute(
+            select(Ledger.transaction_type).where(Ledger.bot_id == bot_id).order_by(Ledger.sequence)
+        )).scalars())
+
+
+class TestTickPhases:
+    @pytest.mark.asyncio
+    async def test_no_session_during_llm_calls(self, sessions):
+        bot_id = await _bot(sessions)
+        market_id = await _market(sessions)
+        portfolio = _llm(sessions, [{"market_id": market_id, "outcome": "YES", "confidence": 0.9}])
+        strategy = _llm(sessions)
+
+        assert await _tick(sessions, bot_id, strategy=strategy, portfolio=portfolio) == "PORTFOLIO"
+        assert strategy.await_count == 1 and portfolio.await_count == 1
+        assert await _ledger_types(sessions, bot_id) == ["GRANT", "MARKET_STAKE", "HEARTBEAT_OBSERVE"]
+
+    @pytest.mark.asyncio
+    async def test_balance_revalidated_at_write(self, sessions):
+        bot_id = await _bot(sessions)
+
+        async def drain():
+            async with sessions.factory() as s:
+                await append_ledger_entry(
+                    bot_id=bot_id, amount=-999.5, transaction_type="WAGER",
+                    reference_id="ELSEWHERE", session=s,
+                )
+                await s.commit()
+
+        outcome = await _tick(
+            sessions, bot_id, mode="enforce",
+            strategy=_llm(sessions, during=drain),
+            prediction=_llm(sessions, {"wager_amount": 50, "direction": "UP", "reasoning": "r"}),
+        )
+        assert outcome == "LIQUIDATION"
+        async with sessions.factory() as s:
+            assert await get_balance(bot_id=bot_id, session=s) == Decimal("0")
+            assert (await s.get(Bot, bot_id)).status == "DEAD"
+
+    @pytest.mark.asyncio
+    async def test_market_revalidated_at_write(self, sessions):
+        bot_id = await _bot(sessions)
+        market_id = await _market(sessions)
+
+        async def resolve():
+            async with sessions.factory() as s:
+                (await s.get(Market, uuid.UUID(market_id))).status = MarketStatus.RESOLVED
+                await s.commit()
+
+        portfolio = _llm(
+            sessions, [{"market_id": market_id, "outcome": "YES", "confidence": 0.9}], during=resolve,
+        )
+        assert await _tick(sessions, bot_id, portfolio=portfolio) == "HEARTBEAT"
+        assert await _ledger_types(sessions, bot_id) == ["GRANT", "HEARTBEAT_OBSERVE"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_bets_fall_back_to_wager(self, sessions):
+        bot_id = await _bot(sessions)
+        market_id = await _market(sessions)
+
+        async def resolve():
+            async with sessions.factory() as s:
+                (await s.get(Market, uuid.UUID(market_id))).status = MarketStatus.RESOLVED
+                await s.commit()
+
+        portfolio = _llm(
+            sessions, [{"market_id": market_id, "outcome": "YES", "confidence": 0.9}], during=resolve,
+        )
+        prediction = _llm(sessions, {"wager_amount": 5, "direction": "UP", "reasoning": "r"})
+        assert await _tick(sessions, bot_id, portfolio=portfolio, prediction=prediction) == "WAGER"
+        assert prediction.await_count == 1
+        assert await _ledger_types(sessions, bot_id) == ["GRANT", "WAGER"]
+
+    @pytest.mark.asyncio
+    async def test_hold_times_reported(self, sessions, caplog):
+        bot_id = await _bot(sessions)
+        with caplog.at_level(logging.DEBUG, logger="bot_runner"):
+            assert await _tick(sessions, bot_id) == "HEARTBEAT"
+        hold = next(r for r in caplog.records if "db hold" in r.getMessage())
+        assert "db_read_ms" in hold.getMessage() and "db_write_ms" in hold.getMessage()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode,entry", [("observe", "HEARTBEAT_OBSERVE"), ("enforce", "HEARTBEAT")])
+    async def test_budget_overrun_writes_heartbeat(self, sessions, caplog, monkeypatch, mode, entry):
+        monkeypatch.setattr("bot_runner.TICK_BUDGET_S", 0.2)
+        bot_id = await _bot(sessions)
+        cancelled = []
+
+        async def hang():
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        started = time.monotonic()
+        with caplog.at_level(logging.INFO, logger="clawx.metrics"):
+            outcome = await _tick(sessions, bot_id, mode=mode, strategy=_llm(sessions, during=hang))
+        assert time.monotonic() - started < 2
+        assert outcome == "HEARTBEAT" and cancelled == [True]
+        assert await _ledger_types(sessions, bot_id) == ["GRANT", entry]
+        assert any("outcome=TIMEOUT" in r.getMessage() for r in caplog.records)
+
+    @pytest.mark.asyncio
+    async def test_bot_killed_after_hydration_not_written(self, sessions):
+        bot_id = await _bot(sessions)
+        async with sessions.factory() as s:
+            context = (await hydrate_tick_contexts(s, bot_ids=[bot_id], board=()))[bot_id]
+        assert context.status == "ALIVE"
+
+        async def kill():
+            async with sessions.factory() as s:
+                await append_ledger_entry(
+                    bot_id=bot_id, amount=-1000.0, transaction_type="LIQUIDATION",
+                    reference_id="ELSEWHERE:LIQUIDATION", session=s,
+                )
+                (await s.get(Bot, bot_id)).status = "DEAD"
+                await s.commit()
+
+        outcome = await _tick(sessions, bot_id, mode="enforce", context=context, strategy=_llm(sessions, during=kill))
+        assert outcome == "HEARTBEAT"
+        assert await _ledger_types(sessions, bot_id) == ["GRANT", "LIQUIDATION"]
+
+    @pytest.mark.asyncio
+    async def test_read_overrun_writes_heartbeat_observe(self, sessions, caplog, monkeypatch):
+        monkeypatch.setattr("bot_runner.TICK_BUDGET_S", 0.2)
+        bot_id = await _bot(sessions)
+        import bot_runner
+        read = bot_runner._read_tick_state
+        calls = []
+
+        async def slow_first_read(bot_id, session):
+            calls.append(True)
+            if len(calls) == 1:
+                await asyncio.sleep(30)
+            return await read(bot_id, session)
+
+        monkeypatch.setattr("bot_runner._read_tick_state", slow_first_read)
+        strategy = _llm(sessions)
+        with caplog.at_level(logging.INFO, logger="clawx.metrics"):
+            assert await _tick(sessions, bot_id, strategy=strategy) == "HEARTBEAT"
+        assert strategy.await_count == 0
+        assert await _ledger_types(sessions, bot_id) == ["GRANT", "HEARTBEAT_OBSERVE"]
+        assert any("outcome=TIMEOUT" in r.getMessage() for r in caplog.records)
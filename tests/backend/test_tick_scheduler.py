@@ -0,0 +1,125 @@
+"""Tests for the deadline-driven tick scheduler.
+
+Proves:
+  1. interval_seconds is read from persona YAML, with a safe default
+  2. Due bots pop earliest first, up to the limit, and stay out while in flight
+  3. Rescheduling stays within the jitter bounds and never builds a backlog
+  4. A slow bot does not delay a fast one
+  5. sync adds/removes bots; a bot removed mid-tick is not rescheduled
+  6. Lag is reported and reset
+
+Constitutional references:
+  - CLAUDE.md Invariant #6: Continuous real-time, not turn-based
+"""
+
+import random
+import sys
+from pathlib import Path
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from services.tick_scheduler import TickScheduler, interval_from_persona
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _scheduler(jitter: float = 0.0) -> tuple[TickScheduler, FakeClock]:
+    clock = FakeClock()
+    return TickScheduler(jitter=jitter, clock=clock, rng=random.Random(7)), clock
+
+
+class TestIntervalFromPersona:
+    def test_reads_schedule(self):
+        assert interval_from_persona("schedule:\n  interval_seconds: 30\n", 10) == 30.0
+
+    def test_defaults(self):
+        assert interval_from_persona(None, 10) == 10
+        assert interval_from_persona("Arena agent", 10) == 10
+        assert interval_from_persona("schedule:\n  interval_seconds: soon\n", 10) == 10
+        assert interval_from_persona("a: [unclosed", 10) == 10
+
+    def test_clamped(self):
+        assert interval_from_persona("schedule:\n  interval_seconds: 0\n", 10) == 1.0
+
+
+class TestTickScheduler:
+    def test_pop_order_and_limit(self):
+        sched, clock = _scheduler()
+        sched.add(1, 10, first_due=1003)
+        sched.add(2, 10, first_due=1001)
+        sched.add(3, 10, first_due=1002)
+        sched.add(4, 10, first_due=1050)
+        clock.now = 1005
+
+        assert sched.pop_due(limit=2) == [(2, 1001), (3, 1002)]
+        assert sched.pending() == 1
+        assert sched.pop_due() == [(1, 1003)]
+        assert sched.pop_due() == []  # in flight, not popped again
+        assert sched.next_due() == 1050
+
+    def test_reschedule_jitter_bounds(self):
+        sched, clock = _scheduler(jitter=0.1)
+        sched.add(1, 10, first_due=1000)
+        for _ in range(50):
+            (bot_id, scheduled), = sched.pop_due()
+            due = sched.reschedule(bot_id, scheduled)
+            assert 9.0 <= due - scheduled <= 11.0
+            clock.now = due
+
+    def test_overrun_does_not_backlog(self):
+        sched, clock = _scheduler()
+        sched.add(1, 10, first_due=1000)
+        (_, scheduled), = sched.pop_due()
+        clock.now = 1035  # tick took 3.5 intervals
+        assert sched.reschedule(1, scheduled) == 1035
+        assert sched.pop_due() == [(1, 1035)]
+        assert sched.pop_due() == []
+
+    def test_slow_bot_does_not_delay_fast_bot(self):
+        sched, clock = _scheduler()
+        sched.add(1, 5, first_due=1000)   # slow: its tick never finishes here
+        sched.add(2, 5, first_due=1000)
+        ticks = []
+        for _ in range(4):
+            for bot_id, scheduled in sched.pop_due():
+                ticks.append(bot_id)
+                if bot_id == 2:
+                    sched.reschedule(bot_id, scheduled)
+            clock.now += 5
+        assert ticks.count(1) == 1
+        assert ticks.count(2) == 4
+
+    def test_sync_and_removed_in_flight(self):
+        sched, clock = _scheduler()
+        assert sched.sync({1: 10, 2: 10}, {1: 1000, 2: 1000}) == (2, 0)
+        taken = sched.pop_due()
+        assert sorted(b for b, _ in taken) == [1, 2]
+
+        assert sched.sync({1: 20, 3: 10}) == (1, 1)
+        assert 2 not in sched and len(sched) == 2
+        assert sched.reschedule(2, 1000) is None
+        assert sched.reschedule(1, 1000) == 1020  # new interval applies
+
+    def test_new_bots_spread_over_interval(self):
+        sched, clock = _scheduler()
+        for bot_id in range(100):
+            sched.add(bot_id, 10)
+        dues = [d for d, _ in sched._heap]
+        assert min(dues) >= 1000 and max(dues) <= 1010
+        assert len(sched.pop_due(now=1005)) < 100
+
+    def test_lag_report(self):
+        sched, _ = _scheduler()
+        assert sched.lag_report() == {"ticks": 0, "lag_p50_s": 0.0, "lag_max_s": 0.0}
+        for lag in (0.1, 0.2, 3.0, -0.5):
+            sched.record_lag(lag)
+        assert sched.lag_report() == {"ticks": 4, "lag_p50_s": 0.2, "lag_max_s": 3.0}
+        assert sched.lag_report()["ticks"] == 0
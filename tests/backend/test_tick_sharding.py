@@ -0,0 +1,212 @@
+"""Tests for sharded ticker ownership.
+
+Proves:
+  1. The hash ring spreads bots over every shard and is stable when resized
+  2. Live workers split the shards without overlap
+  3. A dead worker's shards are claimed once its leases lapse
+  4. A bot's tick key excludes a second concurrent tick
+  5. run_schedule only ticks bots in owned shards and publishes status
+
+Uses a small in-memory stand-in for the Redis commands the coordinator
+issues (SET NX PX, EVAL of its two compare-and-set scripts, ZSET, HASH).
+
+Constitutional references:
+  - CLAUDE.md Invariant #6: Continuous real-time, not turn-based
+  - lessons.md Rule #3: Test isolation (in-memory SQLite)
+"""
+
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from models import Base, Bot
+from scripts import run_ticker
+from services import tick_sharding
+from services.tick_scheduler import TickScheduler
+from services.tick_sharding import ShardCoordinator, ShardRing, read_status
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for ShardCoordinator."""
+
+    def __init__(self):
+        self.values: dict[str, tuple[str, float]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    def _get(self, key):
+        item = self.values.get(key)
+        if item is None or item[1] <= time.monotonic():
+            self.values.pop(key, None)
+            return None
+        return item[0]
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and self._get(key) is not None:
+            return None
+        self.values[key] = (value, time.monotonic() + px / 1000)
+        return True
+
+    async def get(self, key):
+        return self._get(key)
+
+    async def eval(self, script, numkeys, key, owner, *args):
+        if self._get(key) != owner:
+            return 0
+        if script == tick_sharding._RENEW_SCRIPT:
+            self.values[key] = (owner, time.monotonic() + int(args[0]) / 1000)
+        else:
+            del self.values[key]
+        return 1
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    async def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score <= float(high)]:
+            del zset[member]
+
+    async def zrangebyscore(self, key, low, high):
+        return sorted(m for m, score in self.zsets.get(key, {}).items() if score >= float(low))
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+class TestShardRing:
+    def test_every_shard_used_and_resize_is_stable(self):
+        ring = ShardRing(8)
+        before = {bot_id: ring.shard_for(bot_id) for bot_id in range(1, 2001)}
+        assert set(before.values()) == set(range(8))
+        assert ring.shard_for(42) == ShardRing(8).shard_for(42)
+
+        grown = ShardRing(9)
+        moved = sum(1 for bot_id, shard in before.items() if grown.shard_for(bot_id) != shard)
+        assert moved < 2000 * 0.25  # ~1/9 expected; naive modulo would move ~8/9
+
+
+class TestShardCoordinator:
+    @pytest.mark.asyncio
+    async def test_workers_split_shards(self):
+        redis = FakeRedis()
+        a = ShardCoordinator(redis, worker_id="a", shard_count=8, lease_ttl=5)
+        b = ShardCoordinator(redis, worker_id="b", shard_count=8, lease_ttl=5)
+        await a.refresh()
+        await b.refresh()
+        # a joined first and holds everything until it hands off between cycles
+        await a.refresh(handoff=True)
+        await b.refresh()
+
+        assert a.owned_shards and b.owned_shards
+        assert set(a.owned_shards).isdisjoint(b.owned_shards)
+        assert set(a.owned_shards) | set(b.owned_shards) == set(range(8))
+
+    @pytest.mark.asyncio
+    async def test_dead_worker_shards_taken_over(self):
+        redis = FakeRedis()
+        a = ShardCoordinator(redis, worker_id="a", shard_count=4, lease_ttl=0.2)
+        b = ShardCoordinator(redis, worker_id="b", shard_count=4, lease_ttl=0.2)
+        await a.refresh()
+        await b.refresh()
+        assert set(a.owned_shards) | set(b.owned_shards) == set(range(4))
+
+        # a stops renewing (crash); b keeps refreshing
+        for _ in range(5):
+            await asyncio.sleep(0.07)
+            await b.refresh()
+        assert b.owned_shards == [0, 1, 2, 3]
+        assert not a.owned_shards
+
+    @pytest.mark.asyncio
+    async def test_close_hands_off_immediately(self):
+        redis = FakeRedis()
+        a = ShardCoordinator(redis, worker_id="a", shard_count=4, lease_ttl=30)
+        b = ShardCoordinator(redis, worker_id="b", shard_count=4, lease_ttl=30)
+        await a.refresh()
+        await a.close()
+        assert await b.refresh() == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_bot_lock_is_exclusive(self):
+        redis = FakeRedis()
+        a = ShardCoordinator(redis, worker_id="a", shard_count=2, lease_ttl=5)
+        b = ShardCoordinator(redis, worker_id="b", shard_count=2, lease_ttl=5)
+        async with a.bot_lock(7) as got_a:
+            async with b.bot_lock(7) as got_b:
+                assert got_a and not got_b
+        async with b.bot_lock(7) as got_b:
+            assert got_b
+
+
+class TestShardedTick:
+    @pytest.fixture
+    async def session_maker(self, monkeypatch):
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        Session = async_sessionmaker(engine, expire_on_commit=False)
+        monkeypatch.setattr(run_ticker, "async_session_maker", Session)
+        monkeypatch.setattr(run_ticker, "_shutdown_requested", False)
+        monkeypatch.setattr(run_ticker, "TICK_RATE", 0.2)
+        yield Session
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_ticks_only_owned_bots(self, session_maker, monkeypatch):
+        async with session_maker() as s:
+            for i in range(20):
+                s.add(Bot(handle=f"shard_{i}", persona_yaml="p", balance=Decimal("100"), status="ALIVE"))
+            await s.commit()
+
+        ticked_ids = []
+
+        async def fake_tick(*, bot_id, config, balance, context=None):
+            ticked_ids.append(bot_id)
+            return "HEARTBEAT"
+
+        monkeypatch.setattr("bot_runner.execute_tick", fake_tick)
+        redis = FakeRedis()
+        a = ShardCoordinator(redis, worker_id="a", shard_count=4, lease_ttl=5)
+        b = ShardCoordinator(redis, worker_id="b", shard_count=4, lease_ttl=5)
+        await a.refresh()
+        await b.refresh()
+        await a.refresh(handoff=True)
+        await b.refresh()
+        owned_a = {i for i in range(1, 21) if a.owns_bot(i)}
+        assert 0 < len(owned_a) < 20
+
+        async def run(coordinator, expected):
+            return await asyncio.wait_for(run_ticker.run_schedule(
+                TickScheduler(), concurrency=4, coordinator=coordinator, roster_interval=10,
+                stop=lambda: expected <= set(ticked_ids),
+            ), timeout=10)
+
+        ticked_a = await run(a, owned_a)
+        assert set(ticked_ids) == owned_a
+        ticked_b = await run(b, set(range(1, 21)))
+        assert set(ticked_ids) == set(range(1, 21))
+        assert ticked_a + ticked_b == len(ticked_ids)
+
+        status = await read_status(redis)
+        shards = {k: v for k, v in status.items() if k.startswith("shard:")}
+        assert len(shards) == 4
+        assert sum(v["ticked"] for v in shards.values()) == len(ticked_ids)
+        assert all(v["ticks_per_min"] > 0 for v in shards.values())
+        assert status["worker:a"]["shards"] == a.owned_shards
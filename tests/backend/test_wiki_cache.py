@@ -0,0 +1,117 @@
+"""Tests for the shared research title cache.
+
+Proves:
+  1. Titles are keyed by their MediaWiki normal form
+  2. Concurrent misses on one title trigger a single fetch (single-flight)
+  3. A second process is served from Redis without fetching
+  4. Missing pages are cached with the negative TTL; failed fetches are not cached
+  5. The in-process tier is an LRU with per-entry expiry
+  6. Hit/miss counters and hit rate are reported
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: External Truth — all data from verifiable APIs
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from services.wiki_cache import WikiTitleCache, normalize_title
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.ttls[key] = ex
+
+
+class Loader:
+    """Counts fetches; each takes a moment so concurrent callers overlap."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls: list[str] = []
+
+    async def __call__(self, title: str):
+        self.calls.append(title)
+        await asyncio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+_PYTHON = {"title": "Python (programming language)", "pageid": 23862, "extract": "..."}
+
+
+class TestWikiTitleCache:
+    def test_normalize_title(self):
+        assert normalize_title("  python_(programming   language) ") == "Python (programming language)"
+        assert normalize_title("iPhone") == "IPhone"
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self):
+        cache = WikiTitleCache(redis=FakeRedis())
+        load = Loader(_PYTHON)
+        titles = ["Python (programming language)", "python_(programming language)"] * 5
+        results = await asyncio.gather(*(cache.get(t, load) for t in titles))
+        assert all(r == _PYTHON for r in results)
+        assert len(load.calls) == 1
+        assert await cache.get("Python (programming language)", load) == _PYTHON
+        stats = cache.stats()
+        assert (stats["miss"], stats["hit_inflight"], stats["hit_local"]) == (1, 9, 1)
+        assert stats["hit_rate"] == round(10 / 11, 3)
+
+    @pytest.mark.asyncio
+    async def test_shared_through_redis(self):
+        redis = FakeRedis()
+        await WikiTitleCache(redis=redis).get("Python (programming language)", Loader(_PYTHON))
+        other = WikiTitleCache(redis=redis)
+        load = Loader()
+        assert await other.get("Python (programming language)", load) == _PYTHON
+        assert load.calls == [] and other.stats()["hit_redis"] == 1
+        assert redis.ttls["wiki:title:Python (programming language)"] == other.ttl
+
+    @pytest.mark.asyncio
+    async def test_negative_cached_failures_not(self):
+        redis = FakeRedis()
+        cache = WikiTitleCache(redis=redis, negative_ttl=60)
+        missing = Loader(None)
+        assert await cache.get("No such page", missing) is None
+        assert await cache.get("No such page", missing) is None
+        assert len(missing.calls) == 1
+        assert redis.ttls["wiki:title:No such page"] == 60
+
+        failing = Loader(error=RuntimeError("429"))
+        assert await cache.get("Flaky", failing) is None
+        assert await cache.get("Flaky", failing) is None
+        assert len(failing.calls) == 2
+        assert "wiki:title:Flaky" not in redis.data
+        assert cache.stats()["error"] == 2 and cache.stats()["negative"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_and_expiry(self):
+        now = [0.0]
+        cache = WikiTitleCache(redis=FakeRedis(), size=2, ttl=100, clock=lambda: now[0])
+        load = Loader(_PYTHON)
+        for title in ("A", "B", "A", "C"):  # C evicts B, the least recently used
+            await cache.get(title, load)
+        assert load.calls == ["A", "B", "C"]
+        assert list(cache._local) == ["A", "C"]
+
+        now[0] = 101  # expired locally, still in Redis
+        await cache.get("A", load)
+        assert cache.stats()["hit_redis"] == 1 and len(load.calls) == 3
@@ -0,0 +1,111 @@
+"""Tests for batched Wikipedia title resolution.
+
+Proves:
+  1. Concurrent lookups share one multi-title MediaWiki query; each caller
+     gets its own title's result
+  2. Normalized titles, redirects and missing pages resolve per title
+  3. A batch is sent early once max_titles distinct titles are waiting
+  4. A failed request raises WikiLookupError in every waiting caller
+  5. More titles than TextExtracts serves per request (20) are split so
+     every page comes back with its extract
+
+Constitutional references:
+  - CLAUDE.md Invariant #4: External Truth — all data from verifiable APIs
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+_backend = str(Path(__file__).resolve().parents[2] / "src" / "backend")
+if _backend not in sys.path:
+    sys.path.insert(0, _backend)
+
+from services.feed_ingestor import (
+    WIKI_BATCH_MAX,
+    AsyncFeedIngestor,
+    FeedHttpPool,
+    WikiLookupError,
+    WikiTitleBatcher,
+)
+
+_RealClient = httpx.AsyncClient
+
+_QUERY = {
+    "normalized": [{"from": "python (programming language)", "to": "Python (programming language)"}],
+    "redirects": [{"from": "UK", "to": "United Kingdom"}],
+    "pages": {
+        "23862": {"pageid": 23862, "title": "Python (programming language)", "extract": "Python is..."},
+        "31717": {"pageid": 31717, "title": "United Kingdom", "extract": "The UK is..."},
+        "-1": {"title": "Nonexistent XYZ", "missing": ""},
+    },
+}
+
+
+def _batcher(monkeypatch, handler, **kwargs) -> tuple[WikiTitleBatcher, list[httpx.Request]]:
+    sent: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return handler(request)
+
+    def factory(**kw):
+        return _RealClient(transport=httpx.MockTransport(record), timeout=kw["timeout"])
+
+    monkeypatch.setattr("services.feed_ingestor.httpx.AsyncClient", factory)
+    return WikiTitleBatcher(AsyncFeedIngestor(FeedHttpPool()), **kwargs), sent
+
+
+class TestWikiTitleBatcher:
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(self, monkeypatch):
+        batcher, sent = _batcher(monkeypatch, lambda r: httpx.Response(200, json={"query": _QUERY}), window_s=0.01)
+        titles = ["python (programming language)", "UK", "Nonexistent XYZ", "UK"]
+
+        results = await asyncio.gather(*(batcher.resolve(t) for t in titles))
+
+        assert len(sent) == 1
+        assert sent[0].url.params["titles"].split("|") == ["python (programming language)", "UK", "Nonexistent XYZ"]
+        assert [r and r["pageid"] for r in results] == [23862, 31717, None, 31717]
+        assert results[0]["title"] == "Python (programming language)"
+        assert batcher.stats() == {"lookups": 4, "requests": 1, "lookups_per_request": 4.0}
+
+    @pytest.mark.asyncio
+    async def test_full_batch_sent_early(self, monkeypatch):
+        batcher, sent = _batcher(monkeypatch, lambda r: httpx.Response(200, json={"query": _QUERY}), window_s=10, max_titles=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.resolve("UK"), batcher.resolve("Nonexistent XYZ")), timeout=1,
+        )
+        assert len(sent) == 1
+        assert results[0]["pageid"] == 31717 and results[1] is None
+
+    @pytest.mark.asyncio
+    async def test_failed_request_raises(self, monkeypatch):
+        batcher, sent = _batcher(monkeypatch, lambda r: httpx.Response(429), window_s=0.01)
+        results = await asyncio.gather(batcher.resolve("UK"), batcher.resolve("Python"), return_exceptions=True)
+        assert all(isinstance(r, WikiLookupError) for r in results)
+        assert len(sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_large_batch_keeps_every_extract(self, monkeypatch):
+        def extracts_api(request: httpx.Request) -> httpx.Response:
+            # Like TextExtracts with exlimit=max: only the first 20 pages get an extract
+            titles = request.url.params["titles"].split("|")
+            pages = {
+                str(1000 + i): {"pageid": 1000 + i, "title": t, **({"extract": f"{t} is..."} if i < 20 else {})}
+                for i, t in enumerate(titles)
+            }
+            return httpx.Response(200, json={"query": {"pages": pages}})
+
+        batcher, sent = _batcher(monkeypatch, extracts_api, window_s=0.01)
+        titles = [f"Topic {i}" for i in range(45)]
+
+        results = await asyncio.gather(*(batcher.resolve(t) for t in titles))
+
+        assert WIKI_BATCH_MAX <= 20
+        assert len(sent) == 3
+        assert all(len(r.url.params["titles"].split("|")) <= 20 for r in sent)
+        assert [r["extract"] for r in results] == [f"{t} is..." for t in titles]